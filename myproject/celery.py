@@ -90,6 +90,39 @@ app.conf.beat_schedule = {
             "expires": 3600,
         },
     },
+    # 카테고리 상품 수 카운터 정합성 검사 - 매일 03:30
+    "verify-category-product-counts": {
+        "task": "shopping.tasks.product_tasks.verify_category_product_counts_task",
+        "schedule": crontab(hour=3, minute=30),
+        "options": {
+            "expires": 3600,
+        },
+    },
+    # 상품 조회수 반영 + 인기 급상승 점수 감쇠 - 1분마다 (ProductViewService.FLUSH_INTERVAL)
+    "flush-product-view-counts": {
+        "task": "shopping.tasks.product_tasks.flush_product_view_counts_task",
+        "schedule": 60.0,
+        "options": {
+            "expires": 60,
+        },
+    },
+    # 처리 중 멈춘 주문 배치 복구 - 1분마다 (OrderBatchService.recover_stale)
+    "recover-order-batch": {
+        "task": "shopping.tasks.order_tasks.recover_order_batch",
+        "schedule": 60.0,
+        "options": {
+            "expires": 60,
+        },
+    },
+    # 결제 관련 태스크
+    # 대기/정체된 반품 PG 환불 재등록 - 10분마다
+    "retry-pending-refunds": {
+        "task": "shopping.tasks.payment_tasks.retry_pending_refunds_task",
+        "schedule": crontab(minute="*/10"),
+        "options": {
+            "expires": 600,
+        },
+    },
     # 테스트용: 5분마다 실행 (개발 환경에서만 사용)
     # 'test-periodic-task': {
     #     'task': 'shopping.tasks.test_periodic_task',
@@ -99,14 +132,50 @@ app.conf.beat_schedule = {
     # 실행 시간표:
     # - 02:00 - 만료된 토큰 정리
     # - 03:00 - 미인증 계정 삭제
+    # - 03:30 - 카테고리 상품 수 정합성 검사
     # - 04:00 - 이메일 로그 정리 (일요일만)
     # - 04:30 - 사용된 토큰 정리 (일요일만)
+    # - 1분마다 - 상품 조회수 반영
     # - */5분 - 실패한 이메일 재시도
+    # - */10분 - 대기 중인 반품 PG 환불 재등록
     # 새벽 시간대에 정리 작업을 몰아서 처리하여
     # 서버 부하를 최소화합니다.
 }
 
 
+# 태스크 우선순위 (0: 가장 높음 ~ 9: 가장 낮음)
+TASK_PRIORITIES = {
+    "payment": 0,
+    "order": 2,
+    "default": 5,
+    "notification": 6,
+    "batch": 8,
+}
+
+# 워커 프로필: 큐 성격에 맞춰 풀 타입과 동시성을 분리
+# (docker-compose.yml의 celery_worker_* 서비스와 동일하게 유지)
+# - critical: 결제/주문 (DB 트랜잭션 + 행 락) → prefork, 적은 동시성으로 락 경합 최소화
+# - io: 외부 API/알림/이메일 (네트워크 대기) → threads, 높은 동시성
+# - background: 기본/포인트/정리 작업 (야간 배치) → prefork, 낮은 동시성
+WORKER_PROFILES = {
+    "critical": {
+        "queues": ["payment_critical", "order_processing"],
+        "pool": "prefork",
+        "concurrency": 4,
+    },
+    "io": {
+        "queues": ["external_api", "notifications"],
+        "pool": "threads",
+        "concurrency": 32,
+    },
+    "background": {
+        "queues": ["default", "points"],
+        "pool": "prefork",
+        "concurrency": 2,
+    },
+}
+
+
 # Celery 설정
 app.conf.update(
     # 작업 결과 만료 시간 (초)
@@ -122,7 +191,16 @@ app.conf.update(
     task_time_limit=600,  # 10분
     # 워커 설정
     worker_max_tasks_per_child=1000,  # 메모리 누수 방지
-    worker_prefetch_multiplier=4,
+    # 프로세스/스레드당 1개만 미리 가져옴 (긴 작업 뒤에 짧은 작업이 묶여 대기하는 것 방지)
+    # 워커 프로필(WORKER_PROFILES)의 --prefetch-multiplier 옵션과 동일한 값 유지
+    worker_prefetch_multiplier=1,
+    # 우선순위 (Redis 브로커: 0이 가장 높음, 큐마다 우선순위별 리스트를 만들어 높은 것부터 소비)
+    task_default_priority=TASK_PRIORITIES["default"],
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    },
     # 큐 설정
     task_default_queue="default",
     task_queues={
@@ -157,27 +235,67 @@ app.conf.update(
             "routing_key": "notifications",
         },
     },
-    # 라우팅 설정
+    # 라우팅 설정 (priority: 같은 큐 안에서의 처리 순서)
     task_routes={
         # 결제 관련 (최우선)
         "shopping.tasks.payment_tasks.*": {
             "queue": "payment_critical",
             "routing_key": "payment.critical",
+            "priority": TASK_PRIORITIES["payment"],
         },
         # 주문 처리
         "shopping.tasks.order_tasks.*": {
             "queue": "order_processing",
             "routing_key": "order.process",
+            "priority": TASK_PRIORITIES["order"],
         },
         # 외부 API 호출
         "shopping.tasks.external_api_tasks.*": {
             "queue": "external_api",
             "routing_key": "external.api",
+            "priority": TASK_PRIORITIES["payment"],
+        },
+        # 이메일 발송 (SMTP I/O → 스레드 풀 워커에서 처리)
+        "shopping.tasks.email_tasks.*": {
+            "queue": "notifications",
+            "routing_key": "notifications",
+            "priority": TASK_PRIORITIES["notification"],
+        },
+        # 대량 알림 발송 청크 (캠페인성 → 이메일보다 낮은 우선순위)
+        "shopping.tasks.notification_tasks.*": {
+            "queue": "notifications",
+            "routing_key": "notifications",
+            "priority": TASK_PRIORITIES["batch"],
         },
         # 포인트 (낮은 우선순위)
         "shopping.tasks.point_tasks.*": {
             "queue": "points",
             "routing_key": "points.earn",
+            "priority": TASK_PRIORITIES["batch"],
+        },
+        # 정리 작업 (야간 배치)
+        "shopping.tasks.cleanup_tasks.*": {
+            "queue": "default",
+            "routing_key": "default",
+            "priority": TASK_PRIORITIES["batch"],
+        },
+        # 상품 이미지 변형 생성 (업로드 직후 → 야간 배치보다 먼저 처리, CPU 작업이라 prefork 워커)
+        "shopping.tasks.product_tasks.generate_product_image_variants": {
+            "queue": "default",
+            "routing_key": "default",
+            "priority": TASK_PRIORITIES["default"],
+        },
+        # 상품 조회수 반영 (1분마다, 늦어지면 조회수/인기 점수 갱신이 밀림)
+        "shopping.tasks.product_tasks.flush_product_view_counts_task": {
+            "queue": "default",
+            "routing_key": "default",
+            "priority": TASK_PRIORITIES["default"],
+        },
+        # 상품/카테고리 정합성 검사 (야간 배치)
+        "shopping.tasks.product_tasks.*": {
+            "queue": "default",
+            "routing_key": "default",
+            "priority": TASK_PRIORITIES["batch"],
         },
         # 기존 태스크 라우팅 (하위호환성)
         "shopping.tasks.expire_points_task": {"queue": "points"},
@@ -201,9 +319,15 @@ def debug_task(self) -> None:
     print(f"Request: {self.request!r}")
 
 
-from celery.signals import task_failure
+from celery.signals import before_task_publish, task_failure, task_prerun
 from celery.utils.log import get_task_logger
 
+from shopping.utils.queue_metrics import record_queue_latency, stamp_enqueued_at
+
+# 큐 대기 시간 측정 (발행 시각 헤더 → 실행 직전 대기 시간 기록)
+before_task_publish.connect(stamp_enqueued_at, weak=False)
+task_prerun.connect(record_queue_latency, weak=False)
+
 logger = get_task_logger(__name__)
 
 
@@ -72,11 +72,15 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = "shopping.User"
 
 MIDDLEWARE = [
+    # 요청 단위 성능 계측 (다른 미들웨어의 쿼리까지 포함하도록 맨 앞)
+    "shopping.middleware.PerformanceMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # 쓰기 이후 읽기를 primary로 고정 (request.user 사용, 인증 미들웨어 다음)
+    "shopping.middleware.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -101,6 +105,15 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "myproject.wsgi.application"
 
+# 읽기 replica 라우팅 (DATABASES에 "replica"가 있을 때만 동작, 없으면 모두 default)
+DATABASE_ROUTERS = ["shopping.db_router.ReplicaRouter"]
+# 쓰기한 사용자의 읽기를 primary로 고정하는 시간 (초, 복제 지연보다 길게)
+REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", 5))
+# 이 지연(초)을 넘으면 replica 대신 primary에서 읽기
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get("REPLICA_MAX_LAG_SECONDS", 10))
+# replica 지연/연결 확인 주기 (초, 프로세스 단위)
+REPLICA_CHECK_INTERVAL = float(os.environ.get("REPLICA_CHECK_INTERVAL", 5))
+
 # ==========================================================================
 # Password validation
 # ==========================================================================
@@ -148,6 +161,21 @@ ENCRYPTION_KEY = os.environ.get("ENCRYPTION_KEY", "")
 
 RETURN_REQUEST_DEADLINE_DAYS = int(os.environ.get("RETURN_REQUEST_DEADLINE_DAYS", 7))
 
+# ==========================================================================
+# Order Batch Processing Settings
+# ==========================================================================
+
+# 하이브리드 주문의 재고 확보를 마이크로 배치로 처리 (Redis 캐시 백엔드 필요)
+ORDER_BATCH_ENABLED = os.environ.get("ORDER_BATCH_ENABLED", "FALSE") == "TRUE"
+# 배치 수집 대기 시간 (ms)
+ORDER_BATCH_WINDOW_MS = int(os.environ.get("ORDER_BATCH_WINDOW_MS", 20))
+# 한 배치에 포함할 최대 주문 수
+ORDER_BATCH_MAX_SIZE = int(os.environ.get("ORDER_BATCH_MAX_SIZE", 100))
+# 컨슈머가 꺼낸 뒤 이 시간(초) 안에 처리되지 않은 주문은 대기열로 되돌림 (recover_order_batch)
+ORDER_BATCH_PROCESSING_TIMEOUT = int(os.environ.get("ORDER_BATCH_PROCESSING_TIMEOUT", 60))
+# 주문 상태 롱폴링(?wait=)으로 동시에 대기할 수 있는 요청 수 (프로세스당, gunicorn --threads보다 작게)
+ORDER_STATUS_MAX_WAITERS = int(os.environ.get("ORDER_STATUS_MAX_WAITERS", 2))
+
 # ==========================================================================
 # REST Framework
 # ==========================================================================
@@ -156,13 +184,19 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # 권한 판단 필드만 캐시에서 조회하는 JWT 인증 (shopping.services.user_auth_cache_service)
+        "shopping.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": [
+        # 응답 직렬화 시간 계측 (PerformanceMetricsMiddleware, shopping.utils.request_metrics)
+        "shopping.utils.renderers.TimedJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
 # drf-spectacular 설정
@@ -256,6 +290,36 @@ if EMAIL_BACKEND == "django.core.mail.backends.smtp.EmailBackend":
     EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
     DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@shopping.com")
 
+# 이메일 배치 발송 (EmailDispatchService)
+# 컨슈머가 한 번에 꺼내 같은 SMTP 연결로 보낼 최대 메일 수
+EMAIL_BATCH_SIZE = int(os.environ.get("EMAIL_BATCH_SIZE", 50))
+# 워커(스레드)당 초당 최대 발송 수 (0이면 제한 없음, 제공자 한도 ÷ 워커 수로 설정)
+EMAIL_RATE_LIMIT_PER_SECOND = float(os.environ.get("EMAIL_RATE_LIMIT_PER_SECOND", 10))
+# SMTP 연결 재사용 최대 시간 (초) - 서버 idle 타임아웃보다 짧게
+EMAIL_CONNECTION_MAX_AGE = int(os.environ.get("EMAIL_CONNECTION_MAX_AGE", 60))
+
+# 상품 이미지 변형 (ImageVariantService)
+# 업로드 후 미리 생성할 너비(px)와 포맷 (포맷은 앞쪽이 우선, 뒤쪽은 대체용)
+PRODUCT_IMAGE_VARIANT_WIDTHS = [int(w) for w in os.environ.get("PRODUCT_IMAGE_VARIANT_WIDTHS", "200,400,800").split(",")]
+PRODUCT_IMAGE_VARIANT_FORMATS = os.environ.get("PRODUCT_IMAGE_VARIANT_FORMATS", "webp,jpeg").split(",")
+# 워커 프로세스당 Pillow 렌더링 프로세스 수 (0이면 워커 프로세스에서 직접 렌더링)
+PRODUCT_IMAGE_VARIANT_PROCESSES = int(os.environ.get("PRODUCT_IMAGE_VARIANT_PROCESSES", 2))
+
+# 인기 급상승 점수 반감기 (초, ProductViewService) - 이 시간 전 조회는 점수의 절반만 반영
+PRODUCT_TRENDING_HALF_LIFE = int(os.environ.get("PRODUCT_TRENDING_HALF_LIFE", 60 * 60 * 6))
+
+# 로깅 설정 적용 함수 (dictConfig + QueueListener, LOGGING은 환경별 설정 파일에서 지정)
+LOGGING_CONFIG = "shopping.utils.structured_logging.configure_logging"
+
+# 요청 성능 계측 (shopping.middleware.PerformanceMetricsMiddleware)
+REQUEST_METRICS_ENABLED = os.environ.get("REQUEST_METRICS_ENABLED", "TRUE") == "TRUE"
+# 이 시간(ms)을 넘는 요청은 DB/직렬화/캐시 구성과 함께 WARNING 로깅
+REQUEST_METRICS_SLOW_MS = int(os.environ.get("REQUEST_METRICS_SLOW_MS", 500))
+# 응답에 Server-Timing 헤더 추가 (운영에서는 내부 구성 노출 방지를 위해 끔)
+REQUEST_METRICS_SERVER_TIMING = os.environ.get("REQUEST_METRICS_SERVER_TIMING", "FALSE") == "TRUE"
+# /api/metrics/ 스크레이퍼 인증 토큰 (Authorization: Bearer <token>, 비우면 관리자 세션만 허용)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
 # Frontend URL (이메일 링크, 결제 리다이렉트 등)
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "http://localhost:3000")
 
@@ -0,0 +1,126 @@
+"""
+Database Configuration
+PostgreSQL 연결 방식과 프로세스 역할(role)별 연결 수를 관리합니다.
+
+gunicorn gthread(워커 × 스레드)와 Celery 워커가 스레드마다 영구 연결(CONN_MAX_AGE)을 잡으면
+파드를 늘릴 때마다 max_connections가 빠르게 소진됩니다.
+
+연결 방식 (DB_CONNECTION_MODE):
+- persistent: 스레드별 영구 연결 (기존 방식, CONN_MAX_AGE)
+- pool: Django 5.1+ psycopg 3 내장 연결 풀 (OPTIONS["pool"], 프로세스당 max_size개까지만 연결)
+  → pip install "psycopg[binary,pool]" 필요
+- pgbouncer: PgBouncer transaction pooling 호환 모드
+  - 서버 측 커서 비활성화 (DISABLE_SERVER_SIDE_CURSORS, .iterator()가 트랜잭션 밖에서 커서를 유지하지 않음)
+  - 시작 파라미터 options(statement_timeout) 제거 → ALTER ROLE ... SET statement_timeout으로 지정
+  - psycopg 3 사용 시 prepared statement 비활성화 (prepare_threshold=None)
+  - DB 서버 TimeZone은 UTC로 설정 (세션 단위 SET TIME ZONE이 다른 클라이언트로 새지 않도록)
+
+프로세스 역할 (DJANGO_PROCESS_ROLE, ROLE_PRESETS):
+- web: gunicorn gthread - 풀 크기는 스레드 수(GUNICORN_THREADS)까지
+- worker: Celery 워커 - prefork는 자식 프로세스당 연결 1개, threads 풀은 동시성보다 작은 풀을 공유
+- beat: Celery beat - 스케줄 조회용 연결 1개
+
+select_for_update를 쓰는 흐름은 모두 transaction.atomic 안에서 실행되므로 (Django가 트랜잭션 밖의
+select_for_update를 TransactionManagementError로 막음) transaction pooling에서도 락이 한 트랜잭션에 묶입니다.
+"""
+
+import importlib.util
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+CONNECTION_MODES = ("persistent", "pool", "pgbouncer")
+
+# 역할별 기본값 (DB_CONN_MAX_AGE, DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE 환경변수로 덮어쓰기)
+ROLE_PRESETS = {
+    "web": {
+        "conn_max_age": 120,
+        "pool_min_size": 2,
+        "pool_max_size": int(os.environ.get("GUNICORN_THREADS", 4)),
+    },
+    "worker": {
+        "conn_max_age": 300,
+        "pool_min_size": 1,
+        "pool_max_size": 4,
+    },
+    "beat": {
+        "conn_max_age": 300,
+        "pool_min_size": 1,
+        "pool_max_size": 1,
+    },
+}
+
+# 풀에서 연결을 기다리는 최대 시간 (초) - 초과 시 PoolTimeout
+POOL_TIMEOUT = 10
+# 풀 연결 재생성 주기 (초) - 장기 연결의 서버 메모리 누적 방지
+POOL_MAX_LIFETIME = 1800
+
+
+def psycopg3_available() -> bool:
+    """psycopg 3 + psycopg_pool 설치 여부 (Django 내장 연결 풀 사용 조건)"""
+    return importlib.util.find_spec("psycopg") is not None and importlib.util.find_spec("psycopg_pool") is not None
+
+
+def get_database_config(
+    role: str | None = None,
+    mode: str | None = None,
+    host: str | None = None,
+    port: str | None = None,
+) -> dict:
+    """
+    역할과 연결 방식에 맞는 DATABASES 항목을 반환합니다.
+
+    Args:
+        role: 프로세스 역할 (web, worker, beat, 기본: DJANGO_PROCESS_ROLE 환경변수 또는 web)
+        mode: 연결 방식 (persistent, pool, pgbouncer, 기본: DB_CONNECTION_MODE 환경변수 또는 persistent)
+        host: 접속 호스트 (기본: DATABASE_HOST, replica 구성 시 지정)
+        port: 접속 포트 (기본: DATABASE_PORT)
+
+    Raises:
+        ImproperlyConfigured: 알 수 없는 역할/방식, 또는 psycopg 3 없이 pool 방식 지정
+    """
+    role = role or os.environ.get("DJANGO_PROCESS_ROLE", "web")
+    mode = mode or os.environ.get("DB_CONNECTION_MODE", "persistent")
+    if role not in ROLE_PRESETS:
+        raise ImproperlyConfigured(f"DJANGO_PROCESS_ROLE은 {', '.join(ROLE_PRESETS)} 중 하나여야 합니다: {role}")
+    if mode not in CONNECTION_MODES:
+        raise ImproperlyConfigured(f"DB_CONNECTION_MODE는 {', '.join(CONNECTION_MODES)} 중 하나여야 합니다: {mode}")
+
+    preset = ROLE_PRESETS[role]
+    config = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.getenv("DATABASE_NAME"),
+        "USER": os.getenv("DATABASE_USER"),
+        "PASSWORD": os.getenv("DATABASE_PASSWORD"),
+        "HOST": host or os.getenv("DATABASE_HOST"),
+        "PORT": port or os.getenv("DATABASE_PORT", "5432"),
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", preset["conn_max_age"])),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "connect_timeout": 10,
+            # pg_stat_activity에서 역할별 연결 수 확인용
+            "application_name": f"shopping-{role}",
+            "options": "-c statement_timeout=30000",
+        },
+    }
+
+    if mode == "pool":
+        if not psycopg3_available():
+            raise ImproperlyConfigured('DB_CONNECTION_MODE=pool은 psycopg 3가 필요합니다: pip install "psycopg[binary,pool]"')
+        # 풀 사용 시 연결 반환은 풀이 관리 (Django는 CONN_MAX_AGE=0만 허용)
+        config["CONN_MAX_AGE"] = 0
+        config["CONN_HEALTH_CHECKS"] = False
+        config["OPTIONS"]["pool"] = {
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", preset["pool_min_size"])),
+            "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", preset["pool_max_size"])),
+            "timeout": POOL_TIMEOUT,
+            "max_lifetime": POOL_MAX_LIFETIME,
+        }
+
+    elif mode == "pgbouncer":
+        config["DISABLE_SERVER_SIDE_CURSORS"] = True
+        del config["OPTIONS"]["options"]
+        if psycopg3_available():
+            config["OPTIONS"]["prepare_threshold"] = None
+
+    return config
@@ -1,24 +1,41 @@
 """
 Logging Configuration
 로깅 관련 모든 설정을 관리합니다.
+
+- 파일 로그는 JSON 한 줄 형식 (shopping.utils.structured_logging.JSONFormatter)
+- queued_handlers의 핸들러는 QueueListener 스레드에서 기록 (요청 스레드는 큐 적재만)
+- extra=SAMPLED로 표시한 고빈도 INFO 로그는 sample_rate 비율만 기록
 """
 
+import os
 from pathlib import Path
 
 # BASE_DIR은 base.py에서 import
 BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
 
 
-def get_logging_config(debug: bool = False) -> dict:
+def get_logging_config(debug: bool = False, sample_rate: float | None = None) -> dict:
     """
     환경에 맞는 로깅 설정을 반환합니다.
 
     Args:
         debug: DEBUG 모드 여부
+        sample_rate: 샘플링 대상 INFO 로그를 남길 비율 (기본: DEBUG면 1.0, 아니면 LOG_SAMPLE_RATE 환경변수 또는 0.1)
     """
+    if sample_rate is None:
+        sample_rate = 1.0 if debug else float(os.environ.get("LOG_SAMPLE_RATE", 0.1))
+
     return {
         "version": 1,
         "disable_existing_loggers": False,
+        # QueueListener 스레드로 옮길 핸들러 (개발 환경 콘솔은 출력 순서 유지를 위해 동기)
+        "queued_handlers": ["file"] if debug else ["console", "file"],
+        "filters": {
+            "sampling": {
+                "()": "shopping.utils.structured_logging.SamplingFilter",
+                "rate": sample_rate,
+            },
+        },
         "formatters": {
             "verbose": {
                 "format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
@@ -28,18 +45,23 @@ def get_logging_config(debug: bool = False) -> dict:
                 "format": "{levelname} {message}",
                 "style": "{",
             },
+            "json": {
+                "()": "shopping.utils.structured_logging.JSONFormatter",
+            },
         },
         "handlers": {
             "console": {
                 "level": "DEBUG" if debug else "INFO",
                 "class": "logging.StreamHandler",
                 "formatter": "simple",
+                "filters": ["sampling"],
             },
             "file": {
                 "level": "INFO",
                 "class": "logging.FileHandler",
                 "filename": BASE_DIR / "logs" / "payment.log",
-                "formatter": "verbose",
+                "formatter": "json",
+                "filters": ["sampling"],
             },
         },
         "loggers": {
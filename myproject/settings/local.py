@@ -23,6 +23,9 @@ INSTALLED_APPS += ["debug_toolbar"]  # noqa: F405
 
 MIDDLEWARE.insert(0, "debug_toolbar.middleware.DebugToolbarMiddleware")  # noqa: F405
 
+# 응답에 Server-Timing 헤더 추가 (브라우저 개발자 도구 Network 탭에서 DB/직렬화 시간 확인)
+REQUEST_METRICS_SERVER_TIMING = True
+
 INTERNAL_IPS = [
     "127.0.0.1",
     "localhost",
@@ -59,7 +62,8 @@ DATABASES = {
 
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        # django_redis RedisCache + 요청 계측 캐시 히트/미스 집계 (shopping.utils.cache_backends)
+        "BACKEND": "shopping.utils.cache_backends.InstrumentedRedisCache",
         "LOCATION": os.environ.get("REDIS_URL", "redis://127.0.0.1:6379/1"),
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
@@ -12,6 +12,7 @@ Django Production Settings
 import os
 
 from myproject.settings.base import *  # noqa: F401, F403
+from myproject.settings.components.database import get_database_config
 from myproject.settings.components.logging import get_logging_config
 
 # ==========================================================================
@@ -43,22 +44,18 @@ CSRF_TRUSTED_ORIGINS = os.environ.get("CSRF_TRUSTED_ORIGINS", "https://yourdomai
 # Database (PostgreSQL - Production)
 # ==========================================================================
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.getenv("DATABASE_NAME"),
-        "USER": os.getenv("DATABASE_USER"),
-        "PASSWORD": os.getenv("DATABASE_PASSWORD"),
-        "HOST": os.getenv("DATABASE_HOST"),
-        "PORT": os.getenv("DATABASE_PORT", "5432"),
-        "CONN_MAX_AGE": 120,
-        "CONN_HEALTH_CHECKS": True,
-        "OPTIONS": {
-            "connect_timeout": 10,
-            "options": "-c statement_timeout=30000",
-        },
-    }
-}
+# 연결 방식(DB_CONNECTION_MODE)과 프로세스 역할(DJANGO_PROCESS_ROLE)은 components/database.py 참고
+DATABASES = {"default": get_database_config()}
+
+# 읽기 replica (DATABASE_REPLICA_HOST 지정 시, 나머지 접속 정보는 primary와 동일)
+# 상품/카테고리 조회, 포인트 이력, 결제 목록, 알림 목록이 replica를 사용 (shopping.db_router)
+if os.getenv("DATABASE_REPLICA_HOST"):
+    DATABASES["replica"] = get_database_config(
+        host=os.getenv("DATABASE_REPLICA_HOST"),
+        port=os.getenv("DATABASE_REPLICA_PORT"),
+    )
+    # replica 장애 시 빠르게 primary로 전환
+    DATABASES["replica"]["OPTIONS"]["connect_timeout"] = 3
 
 # ==========================================================================
 # Cache (Redis - Production)
@@ -66,7 +63,8 @@ DATABASES = {
 
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        # django_redis RedisCache + 요청 계측 캐시 히트/미스 집계 (shopping.utils.cache_backends)
+        "BACKEND": "shopping.utils.cache_backends.InstrumentedRedisCache",
         "LOCATION": os.environ.get("REDIS_URL"),
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
@@ -57,6 +57,9 @@ CELERY_TASK_EAGER_PROPAGATES = True
 CELERY_BROKER_URL = "memory://"
 CELERY_RESULT_BACKEND = "cache+memory://"
 
+# 이미지 변형은 테스트 프로세스에서 직접 렌더링 (프로세스 풀 미사용)
+PRODUCT_IMAGE_VARIANT_PROCESSES = 0
+
 # ==========================================================================
 # Rate Limiting - 테스트에서는 비활성화
 # ==========================================================================
@@ -82,7 +85,7 @@ REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"] = {  # noqa: F405
 # Logging (Quiet mode for tests)
 # ==========================================================================
 
-LOGGING = get_logging_config(debug=False)
+LOGGING = get_logging_config(debug=False, sample_rate=1.0)  # 테스트에서는 샘플링 없이 모든 로그 기록
 
 # ==========================================================================
 # Password Hashing (빠른 해싱 - 테스트 속도 향상)
@@ -97,3 +100,4 @@ PASSWORD_HASHERS = [
 # ==========================================================================
 
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+EMAIL_RATE_LIMIT_PER_SECOND = 0  # 테스트에서는 발송 속도 제한 없음
@@ -0,0 +1,22 @@
+"""
+Django Test Settings - 읽기 replica 라우팅 검증용
+primary/replica를 서로 다른 SQLite 데이터베이스로 구성 (복제 없음, 테스트 DB는 별칭별 인메모리 DB)
+
+replica에 데이터가 복제되지 않으므로, 어느 DB에서 읽었는지 응답 내용으로 확인할 수 있습니다.
+
+사용 예시:
+    pytest --ds=myproject.settings.test_replica shopping/tests/test_db_router.py
+"""
+
+from myproject.settings.test import *  # noqa: F401, F403
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "test_primary.sqlite3",  # noqa: F405
+    },
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "test_replica.sqlite3",  # noqa: F405
+    },
+}
@@ -15,6 +15,8 @@ from .models.notification import Notification
 from .models.payment import Payment, PaymentLog
 from .models.point import PointHistory
 from .models.product_qa import ProductAnswer, ProductQuestion
+from .models.wishlist import WishlistItem
+from .services.order_status_service import OrderStatusService
 
 # ==========================================
 # 소셜 로그인 Admin 설정
@@ -23,6 +25,17 @@ from .models.product_qa import ProductAnswer, ProductQuestion
 # Admin 페이지 → Social accounts 메뉴에서 확인 가능
 
 
+class WishlistItemInline(admin.TabularInline):
+    """사용자 편집 페이지에서 찜 목록 확인 (찜한 일시 포함)"""
+
+    model = WishlistItem
+    extra = 0
+    fields = ["product", "added_at"]
+    readonly_fields = ["added_at"]
+    raw_id_fields = ["product"]
+    ordering = ["-added_at"]
+
+
 # User Admin
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
@@ -55,7 +68,10 @@ class UserAdmin(admin.ModelAdmin):
     ordering = ["-date_joined"]
 
     # ManyToMany 필드용 위젯
-    filter_horizontal = ("wishlist_products", "groups", "user_permissions")
+    filter_horizontal = ("groups", "user_permissions")
+
+    # 찜한 상품은 중간 모델(WishlistItem) 인라인으로 관리
+    inlines = [WishlistItemInline]
 
     # 상세 페이지 필드 구성 (fieldsets)
     fieldsets = (
@@ -79,7 +95,6 @@ class UserAdmin(admin.ModelAdmin):
                     "points",
                     "membership_level",
                     "is_email_verified",
-                    "wishlist_products",  # 찜한 상품
                 ),
                 "classes": ("wide",),  # 넓게 표시
             },
@@ -181,15 +196,28 @@ class CategoryAdmin(DraggableMPTTAdmin):
     # 읽기 전용 필드
     readonly_fields = ["created_at", "updated_at"]
 
+    def get_queryset(self, request):
+        """
+        직접/누적 제품 수를 목록 쿼리에서 함께 계산
+
+        행마다 COUNT를 실행하지 않고 MPTT add_related_count로
+        tree_id/lft/rght 범위 서브쿼리를 목록 쿼리 하나에 붙입니다.
+        """
+        queryset = super().get_queryset(request)
+        queryset = Category.objects.add_related_count(
+            queryset, Product, "category", "products_cumulative_count", cumulative=True
+        )
+        return Category.objects.add_related_count(queryset, Product, "category", "products_direct_count", cumulative=False)
+
     def related_products_count(self, obj):
         """현재 카테고리의 제품 수"""
-        return obj.products.count()
+        return obj.products_direct_count
 
     related_products_count.short_description = "직접 제품 수"
 
     def related_products_cumulative_count(self, obj):
         """현재 카테고리와 하위 카테고리의 모든 제품 수"""
-        return Product.objects.filter(category__in=obj.get_descendants(include_self=True)).count()
+        return obj.products_cumulative_count
 
     related_products_cumulative_count.short_description = "전체 제품 수"
 
@@ -372,6 +400,7 @@ class OrderAdmin(admin.ModelAdmin):
 
     def mark_as_paid(self, request, queryset):
         """선택된 주문을 결제완료로 변경"""
+        OrderStatusService.invalidate(queryset.values_list("pk", flat=True))
         queryset.update(status="paid")
         self.message_user(request, f"{queryset.count()}개 주문이 결제완료로 변경되었습니다.")
 
@@ -379,6 +408,7 @@ class OrderAdmin(admin.ModelAdmin):
 
     def mark_as_shipped(self, request, queryset):
         """선택된 주문을 배송중으로 변경"""
+        OrderStatusService.invalidate(queryset.values_list("pk", flat=True))
         queryset.update(status="shipped")
         self.message_user(request, f"{queryset.count()}개 주문이 배송중으로 변경되었습니다.")
 
@@ -386,6 +416,7 @@ class OrderAdmin(admin.ModelAdmin):
 
     def mark_as_delivered(self, request, queryset):
         """선택된 주문을 배송완료로 변경"""
+        OrderStatusService.invalidate(queryset.values_list("pk", flat=True))
         queryset.update(status="delivered")
         self.message_user(request, f"{queryset.count()}개 주문이 배송완료로 변경되었습니다.")
 
@@ -1136,6 +1167,7 @@ class ReturnAdmin(admin.ModelAdmin):
     list_filter = [
         "type",
         "status",
+        "refund_status",
         "reason",
         "created_at",
     ]
@@ -1157,6 +1189,9 @@ class ReturnAdmin(admin.ModelAdmin):
         "updated_at",
         "approved_at",
         "completed_at",
+        "refund_attempts",
+        "refund_error",
+        "refunded_at",
     ]
 
     # 상세 페이지 필드 구성
@@ -1201,6 +1236,11 @@ class ReturnAdmin(admin.ModelAdmin):
                     "refund_account_bank",
                     "refund_account_number",
                     "refund_account_holder",
+                    # PG 환불 (failed 건은 원인 확인 후 pending으로 바꾸면 정기 태스크가 재시도)
+                    "refund_status",
+                    "refund_attempts",
+                    "refund_error",
+                    "refunded_at",
                 ),
                 "classes": ("collapse",),
             },
@@ -1395,6 +1435,21 @@ class ReturnItemAdmin(admin.ModelAdmin):
         """직접 추가 방지"""
         return False
 
+    def delete_model(self, request, obj):
+        """삭제 후 교환/환불 목록용 요약 갱신"""
+        from shopping.services.return_service import ReturnService
+
+        super().delete_model(request, obj)
+        ReturnService.refresh_summary([obj.return_request_id])
+
+    def delete_queryset(self, request, queryset):
+        """일괄 삭제 후 교환/환불 목록용 요약 갱신"""
+        from shopping.services.return_service import ReturnService
+
+        return_ids = list(queryset.values_list("return_request_id", flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        ReturnService.refresh_summary(return_ids)
+
 
 # Admin 사이트 설정
 admin.site.site_header = "쇼핑몰 관리자"
@@ -0,0 +1,48 @@
+"""
+API 인증 클래스
+
+CachedJWTAuthentication:
+    simplejwt JWTAuthentication과 동일하게 토큰을 검증하되,
+    사용자는 UserAuthCacheService의 캐시(권한 판단 필드만)에서 조회합니다.
+    캐시 히트 시 인증에 DB 쿼리가 발생하지 않으며,
+    뷰가 다른 필드에 접근할 때만 사용자 행 전체를 한 번 로드합니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from shopping.services.user_auth_cache_service import UserAuthCacheService
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    캐시 기반 JWT 인증
+
+    settings.REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"]에 등록해서 사용합니다.
+    CHECK_REVOKE_TOKEN(비밀번호 해시 비교)을 켜면 비밀번호 해시를 캐시하지 않기 위해
+    기본 JWTAuthentication 조회로 동작합니다.
+    """
+
+    def get_user(self, validated_token: Any) -> Any:
+        if api_settings.CHECK_REVOKE_TOKEN or api_settings.USER_ID_FIELD != "id":
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        user = UserAuthCacheService.get(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
@@ -0,0 +1,236 @@
+"""
+읽기 전용 복제본(read replica) 라우팅
+
+기본 동작:
+- 쓰기와 일반 읽기는 모두 default(primary)
+- use_replica() 범위(ReplicaReadMixin 뷰, @use_replica 서비스 메서드) 안의 읽기만 replica
+
+replica로 보내지 않는 경우 (primary로 읽음):
+- DATABASES에 replica가 없음 (개발/테스트 기본 설정)
+- primary 트랜잭션(atomic) 안의 읽기 (같은 트랜잭션의 쓰기를 봐야 함)
+- 현재 요청이 이미 쓰기를 했거나, 사용자가 최근 REPLICA_STICKY_SECONDS 안에 쓰기를 함
+  (read-your-writes: 복제 지연 동안 자신이 쓴 데이터가 안 보이는 문제 방지)
+- replica 지연이 REPLICA_MAX_LAG_SECONDS를 넘거나 연결 실패 (REPLICA_CHECK_INTERVAL초 동안 primary 사용)
+
+설정:
+    DATABASES["replica"] = {...}
+    DATABASE_ROUTERS = ["shopping.db_router.ReplicaRouter"]
+    MIDDLEWARE += ["shopping.middleware.ReplicaRoutingMiddleware"]  # 쓰기 후 sticky 기록
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+REPLICA_ALIAS = "replica"
+STICKY_KEY = "db_sticky_primary:{user_id}"
+
+# PostgreSQL 스트리밍 복제 지연 (초), standby가 아니면 0
+# 수신한 WAL을 모두 재생했으면 마지막 트랜잭션 이후 시간이 지나도 지연 0으로 판단
+PG_LAG_SQL = """
+SELECT CASE WHEN pg_is_in_recovery() THEN COALESCE(
+    CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END, 0)
+ELSE 0 END
+"""
+
+
+@dataclass
+class RoutingState:
+    """요청(또는 use_replica 블록) 단위 라우팅 상태"""
+
+    request: Any = None
+    replica_depth: int = 0
+    wrote: bool = False
+    used_replica: bool = False
+    pinned: bool = False
+    sticky_checked: bool = False
+
+    def is_pinned(self) -> bool:
+        """쓰기 이후 primary 고정 여부 (현재 요청의 쓰기 또는 사용자의 최근 쓰기)"""
+        if self.wrote or self.pinned:
+            return True
+
+        if not self.sticky_checked:
+            # 인증 전(익명)에는 확인하지 않고 인증 후 요청당 한 번만 캐시 조회
+            user = getattr(self.request, "user", None)
+            if user is not None and user.is_authenticated:
+                self.pinned = cache.get(STICKY_KEY.format(user_id=user.pk)) is not None
+                self.sticky_checked = True
+        return self.pinned
+
+
+_state: ContextVar[RoutingState | None] = ContextVar("db_routing_state", default=None)
+
+
+def current_state() -> RoutingState | None:
+    return _state.get()
+
+
+def begin_request(request: Any) -> Any:
+    """요청 시작 시 라우팅 상태 생성 (반환한 토큰으로 end_request 호출)"""
+    return _state.set(RoutingState(request=request))
+
+
+def end_request(token: Any) -> RoutingState:
+    """요청 종료: 라우팅 상태 제거 후 반환"""
+    state = _state.get()
+    _state.reset(token)
+    return state
+
+
+def pin_primary(user_id: int) -> None:
+    """사용자의 읽기를 REPLICA_STICKY_SECONDS 동안 primary로 고정"""
+    cache.set(STICKY_KEY.format(user_id=user_id), 1, getattr(settings, "REPLICA_STICKY_SECONDS", 5))
+
+
+class use_replica(ContextDecorator):
+    """
+    블록(또는 데코레이트한 함수) 안의 읽기를 replica로 보냄
+
+    사용 예시:
+        with use_replica():
+            products = list(Product.objects.filter(is_active=True))
+
+        @use_replica()
+        def get_statistics(user): ...
+
+    미들웨어 밖(Celery 작업, 셸)에서는 블록 동안만 라우팅 상태를 만듭니다.
+    """
+
+    def __init__(self, request: Any = None):
+        self.request = request
+
+    def __enter__(self) -> RoutingState:
+        state = _state.get()
+        self._token = None
+        if state is None:
+            self._token = _state.set(state := RoutingState(request=self.request))
+        state.replica_depth += 1
+        return state
+
+    def __exit__(self, *exc: Any) -> bool:
+        _state.get().replica_depth -= 1
+        if self._token is not None:
+            _state.reset(self._token)
+        return False
+
+    def _recreate_cm(self) -> use_replica:
+        # 데코레이터로 쓸 때 호출마다 새 인스턴스 (재귀/동시 호출에서 토큰 공유 방지)
+        return type(self)(self.request)
+
+
+def replica_reads(cls: type) -> type:
+    """클래스의 모든 staticmethod를 use_replica()로 감싸는 클래스 데코레이터 (조회 전용 서비스용)"""
+    for name, attr in list(vars(cls).items()):
+        if isinstance(attr, staticmethod) and not name.startswith("_"):
+            setattr(cls, name, staticmethod(use_replica()(attr.__func__)))
+    return cls
+
+
+class ReplicaHealth:
+    """
+    replica 가용성 (프로세스 단위로 CHECK_INTERVAL마다 확인)
+
+    지연 초과 또는 연결 실패 시 다음 확인까지 primary를 사용합니다.
+    """
+
+    _lock = threading.Lock()
+    _available = True
+    _checked_at = float("-inf")
+
+    @classmethod
+    def is_available(cls) -> bool:
+        interval = getattr(settings, "REPLICA_CHECK_INTERVAL", 5)
+        if time.monotonic() - cls._checked_at < interval:
+            return cls._available
+
+        with cls._lock:
+            if time.monotonic() - cls._checked_at >= interval:
+                cls._available = cls._check()
+                cls._checked_at = time.monotonic()
+        return cls._available
+
+    @classmethod
+    def mark_down(cls) -> None:
+        """쿼리 실패 등으로 replica를 다음 확인 시점까지 제외"""
+        with cls._lock:
+            cls._available = False
+            cls._checked_at = time.monotonic()
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._available = True
+            cls._checked_at = float("-inf")
+
+    @staticmethod
+    def get_lag() -> float:
+        """replica 복제 지연 (초), PostgreSQL이 아니면 연결 확인만 하고 0"""
+        connection = connections[REPLICA_ALIAS]
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(PG_LAG_SQL)
+                return float(cursor.fetchone()[0] or 0)
+            cursor.execute("SELECT 1")
+            return 0.0
+
+    @classmethod
+    def _check(cls) -> bool:
+        try:
+            lag = cls.get_lag()
+        except DatabaseError as e:
+            logger.warning(f"replica 연결 실패, primary로 읽기: {e}")
+            return False
+
+        max_lag = getattr(settings, "REPLICA_MAX_LAG_SECONDS", 10)
+        if lag > max_lag:
+            logger.warning(f"replica 복제 지연 {lag:.1f}s > {max_lag}s, primary로 읽기")
+            return False
+        return True
+
+
+def replica_configured() -> bool:
+    """DATABASES에 replica 별칭이 있는지 여부"""
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+class ReplicaRouter:
+    """DATABASE_ROUTERS에 등록하는 라우터"""
+
+    def db_for_read(self, model: type, **hints: Any) -> str | None:
+        state = _state.get()
+        if state is None or not state.replica_depth or not replica_configured():
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block or state.is_pinned():
+            return None
+        if not ReplicaHealth.is_available():
+            return None
+
+        state.used_replica = True
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model: type, **hints: Any) -> str | None:
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool | None:
+        # replica는 primary와 같은 데이터이므로 두 별칭 사이의 관계 허용
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
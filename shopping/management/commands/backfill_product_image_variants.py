@@ -0,0 +1,92 @@
+"""
+상품 이미지 변형 백필 Management Command
+
+변형 기능 도입 전에 업로드된 이미지(또는 설정의 너비/포맷이 바뀐 뒤 빠진 변형)를
+찾아 변형 생성 태스크를 발행하거나 직접 생성합니다.
+이미 만든 변형은 건너뛰므로 여러 번 실행해도 안전합니다.
+
+사용 예시:
+    python manage.py backfill_product_image_variants            # 태스크 발행
+    python manage.py backfill_product_image_variants --sync     # 현재 프로세스에서 생성
+    python manage.py backfill_product_image_variants --force --product 42
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, Q
+
+from shopping.models import ProductImage
+from shopping.services.image_variant_service import ImageVariantService
+from shopping.tasks.product_tasks import generate_product_image_variants
+
+
+class Command(BaseCommand):
+    help = "변형이 없거나 부족한 상품 이미지의 변형(썸네일)을 생성합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 읽을 이미지 수 (기본: 500)",
+        )
+        parser.add_argument(
+            "--product",
+            type=int,
+            default=None,
+            help="특정 상품의 이미지만 처리",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="기존 변형을 지우고 모두 다시 생성",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="태스크를 발행하지 않고 현재 프로세스에서 생성",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="실제 처리하지 않고 대상 수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        expected = len(ImageVariantService.get_widths()) * len(ImageVariantService.get_formats())
+
+        queryset = ProductImage.objects.exclude(image="")
+        if options["product"]:
+            queryset = queryset.filter(product_id=options["product"])
+        if not options["force"]:
+            # 현재 원본으로 만든 변형 수가 설정 조합 수보다 적은 이미지만
+            # (원본보다 큰 너비는 만들지 않으므로 작은 원본은 매번 대상이 되지만 생성은 건너뜀)
+            queryset = queryset.annotate(
+                current_variants=Count("variants", filter=Q(variants__source_name=F("image")))
+            ).filter(current_variants__lt=expected)
+
+        image_ids = queryset.order_by("pk").values_list("pk", flat=True)
+        total = image_ids.count()
+
+        self.stdout.write(self.style.WARNING(f"=== 이미지 변형 백필 {'(DRY RUN)' if options['dry_run'] else ''} ==="))
+        self.stdout.write(f"대상 이미지: {total}개 (이미지당 변형 {expected}개)")
+        if options["dry_run"] or not total:
+            return
+
+        processed = created = failed = 0
+        for image_id in image_ids.iterator(chunk_size=options["batch_size"]):
+            if options["sync"]:
+                try:
+                    result = ImageVariantService.generate(image_id, force=options["force"])
+                    created += len(result.created)
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"  실패: image_id={image_id}, error={e}")
+            else:
+                generate_product_image_variants.delay(image_id, force=options["force"])
+            processed += 1
+
+        if options["sync"]:
+            ImageVariantService.shutdown()
+            self.stdout.write(self.style.SUCCESS(f"완료: {processed}개 처리, 변형 {created}개 생성, 실패 {failed}개"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"완료: {processed}개 태스크 발행"))
@@ -0,0 +1,92 @@
+"""
+Celery 워커 프로필별 큐 대기 시간 벤치마크.
+
+큐마다 합성 태스크(synthetic_workload)를 섞어서 발행하고,
+발행 → 실행 시작까지의 대기 시간 p50/p99를 워커 프로필별로 출력한다.
+
+사용 예시:
+    # 모든 프로필 (docker-compose로 워커를 띄운 상태에서)
+    python manage.py benchmark_celery_queues --tasks 500
+
+    # 특정 프로필만, IO 작업 20ms
+    python manage.py benchmark_celery_queues --profiles io --kind io --work-ms 20
+"""
+
+import time
+from collections import defaultdict
+
+from celery.result import ResultSet
+from django.core.management.base import BaseCommand, CommandError
+
+from myproject.celery import WORKER_PROFILES
+from shopping.tasks.benchmark_tasks import synthetic_workload
+from shopping.utils.queue_metrics import get_backlog, reset_latency, summarize_latency
+
+
+class Command(BaseCommand):
+    help = "워커 프로필별 큐 대기 시간(p50/p99)을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profiles",
+            nargs="+",
+            choices=sorted(WORKER_PROFILES),
+            default=sorted(WORKER_PROFILES),
+            help="측정할 워커 프로필 (기본: 전체).",
+        )
+        parser.add_argument("--tasks", type=int, default=200, help="큐당 발행할 태스크 수 (기본 200).")
+        parser.add_argument("--work-ms", type=int, default=5, help="태스크당 작업 시간 ms (기본 5).")
+        parser.add_argument(
+            "--kind",
+            choices=["auto", "io", "cpu"],
+            default="auto",
+            help="작업 종류 (auto: threads 풀은 io, prefork 풀은 cpu).",
+        )
+        parser.add_argument("--timeout", type=int, default=300, help="결과 대기 시간 초 (기본 300).")
+
+    def handle(self, *args, **options):
+        profiles = {name: WORKER_PROFILES[name] for name in options["profiles"]}
+        queues = [queue for profile in profiles.values() for queue in profile["queues"]]
+
+        reset_latency(queues)
+
+        # 큐를 번갈아 발행 (실제 트래픽처럼 섞인 상태로 적재)
+        results = []
+        started = time.perf_counter()
+        for _ in range(options["tasks"]):
+            for profile in profiles.values():
+                kind = options["kind"]
+                if kind == "auto":
+                    kind = "io" if profile["pool"] == "threads" else "cpu"
+                for queue in profile["queues"]:
+                    results.append(
+                        synthetic_workload.apply_async(kwargs={"kind": kind, "work_ms": options["work_ms"]}, queue=queue)
+                    )
+
+        self.stdout.write(f"{len(results)}개 태스크 발행 완료 ({time.perf_counter() - started:.2f}s), 결과 대기 중...")
+
+        try:
+            # 태스크 내부가 아닌 관리 명령어 프로세스이므로 동기 대기 허용
+            outputs = ResultSet(results).get(timeout=options["timeout"], disable_sync_subtasks=False)
+        except Exception as e:
+            raise CommandError(f"결과 대기 실패: {e} (워커가 실행 중인지 확인하세요)") from e
+        elapsed = time.perf_counter() - started
+
+        latencies = defaultdict(list)
+        for output in outputs:
+            latencies[output["queue"]].append(output["latency"])
+
+        self.stdout.write(self.style.WARNING("=== 큐 대기 시간 (발행 → 실행 시작) ==="))
+        self.stdout.write(
+            f"{'profile':<12}{'pool':<10}{'conc':>5}  {'queue':<18}{'tasks':>7}{'p50(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}"
+        )
+        for name, profile in profiles.items():
+            for queue in profile["queues"]:
+                stats = summarize_latency(latencies[queue])
+                self.stdout.write(
+                    f"{name:<12}{profile['pool']:<10}{profile['concurrency']:>5}  {queue:<18}"
+                    f"{stats['samples']:>7}{stats['p50_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}"
+                )
+
+        self.stdout.write(f"처리량: {len(outputs) / elapsed:.1f} tasks/s (총 {elapsed:.2f}s)")
+        self.stdout.write(f"남은 적체량: {get_backlog(queues)}")
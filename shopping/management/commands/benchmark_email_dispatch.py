@@ -0,0 +1,118 @@
+"""
+이메일 발송 방식 벤치마크 (메일마다 새 연결 vs 연결 재사용 배치).
+
+Django locmem 백엔드를 감싸 연결을 열 때마다 --handshake-ms만큼 지연시키고
+(SMTP의 TCP + TLS 핸드셰이크 + AUTH 비용), 두 방식의 처리량과 연결 수를 비교한다.
+
+- per-message: send_mail() 호출마다 연결 생성/종료 (기존 태스크 방식)
+- batched: EmailDispatchService.send_batch() (워커 스레드 연결 하나로 발송)
+
+사용 예시:
+    python manage.py benchmark_email_dispatch --messages 200 --handshake-ms 80
+"""
+
+import time
+
+from django.core import mail
+from django.core.mail import send_mail
+from django.core.mail.backends import locmem
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from shopping.services.email_dispatch_service import EmailDispatchService, EmailEntry
+
+BACKEND_PATH = "shopping.management.commands.benchmark_email_dispatch.SimulatedSMTPBackend"
+
+
+class SimulatedSMTPBackend(locmem.EmailBackend):
+    """
+    연결 비용을 흉내 내는 locmem 백엔드
+
+    SMTP 백엔드처럼 send_messages 호출 시 열린 연결이 없으면 새로 열고, 직접 연 연결은 닫는다.
+    """
+
+    handshake_seconds = 0.0
+    connections_opened = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_open = False
+
+    def open(self):
+        if self.is_open:
+            return False
+        time.sleep(self.handshake_seconds)
+        SimulatedSMTPBackend.connections_opened += 1
+        self.is_open = True
+        return True
+
+    def close(self):
+        self.is_open = False
+
+    def send_messages(self, messages):
+        new_connection = self.open()
+        try:
+            return super().send_messages(messages)
+        finally:
+            if new_connection:
+                self.close()
+
+
+class Command(BaseCommand):
+    help = "메일마다 SMTP 연결을 여는 방식과 연결 재사용 배치 발송의 처리량을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=100, help="발송할 메일 수 (기본 100).")
+        parser.add_argument(
+            "--handshake-ms", type=float, default=50.0, help="연결 1회당 지연 ms (TLS + AUTH 모사, 기본 50)."
+        )
+
+    def handle(self, *args, **options):
+        count = options["messages"]
+        SimulatedSMTPBackend.handshake_seconds = options["handshake_ms"] / 1000
+
+        entries = [
+            EmailEntry(subject=f"벤치마크 {i}", body="본문", to=[f"bench{i}@example.com"], html_body="<p>본문</p>")
+            for i in range(count)
+        ]
+
+        with override_settings(EMAIL_BACKEND=BACKEND_PATH, EMAIL_RATE_LIMIT_PER_SECOND=0):
+            per_message = self._measure(lambda: self._send_per_message(entries))
+            batched = self._measure(lambda: self._send_batched(entries))
+
+        self.stdout.write(self.style.WARNING(f"=== 이메일 발송 벤치마크 ({count}통, 연결 지연 {options['handshake_ms']}ms) ==="))
+        self.stdout.write(f"{'mode':<14}{'elapsed(s)':>12}{'msg/s':>10}{'connections':>13}{'outbox':>8}")
+        for name, stats in (("per-message", per_message), ("batched", batched)):
+            self.stdout.write(
+                f"{name:<14}{stats['elapsed']:>12.3f}{stats['throughput']:>10.1f}"
+                f"{stats['connections']:>13}{stats['outbox']:>8}"
+            )
+
+        if batched["elapsed"] > 0:
+            self.stdout.write(f"속도 향상: {per_message['elapsed'] / batched['elapsed']:.1f}x")
+
+    def _measure(self, run):
+        mail.outbox = []
+        SimulatedSMTPBackend.connections_opened = 0
+        EmailDispatchService.close_connection()
+
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+
+        EmailDispatchService.close_connection()
+        return {
+            "elapsed": elapsed,
+            "throughput": len(mail.outbox) / elapsed if elapsed else 0.0,
+            "connections": SimulatedSMTPBackend.connections_opened,
+            "outbox": len(mail.outbox),
+        }
+
+    @staticmethod
+    def _send_per_message(entries):
+        for entry in entries:
+            send_mail(entry.subject, entry.body, None, entry.to, html_message=entry.html_body)
+
+    @staticmethod
+    def _send_batched(entries):
+        EmailDispatchService.send_batch(entries)
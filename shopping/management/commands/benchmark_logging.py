@@ -0,0 +1,148 @@
+"""
+로깅 방식별 요청 스레드 오버헤드 벤치마크.
+
+주문/결제 처리 1건을 흉내 낸 로그 호출 묶음(INFO 단계 로그 + 상품별 INFO + 걸러지는 DEBUG)을
+--requests번 실행하고, 호출 스레드에서 걸린 시간을 요청당 µs로 비교한다.
+
+- sync-fstring: 기존 방식 (f-string 즉시 조합 + 동기 FileHandler, verbose 포맷)
+- queued-lazy: %-style 지연 포맷 + DeferredQueueHandler → QueueListener 스레드에서 JSON 기록
+- queued-sampled: queued-lazy + 상품별 로그 샘플링 (--sample-rate)
+
+사용 예시:
+    python manage.py benchmark_logging --requests 2000 --items 5
+"""
+
+import logging
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from shopping.utils.structured_logging import SAMPLED, configure_logging, stop_listeners
+
+LOGGER_NAME = "benchmark.logging"
+
+
+class Command(BaseCommand):
+    help = "동기 f-string 로깅과 큐 기반 지연 포맷 로깅의 요청당 오버헤드를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000, help="반복할 요청 수 (기본 1000).")
+        parser.add_argument("--items", type=int, default=5, help="요청당 주문 상품 수 (기본 5).")
+        parser.add_argument("--sample-rate", type=float, default=0.1, help="상품별 로그 샘플링 비율 (기본 0.1).")
+
+    def handle(self, *args, **options):
+        requests, items = options["requests"], options["items"]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            results = {
+                "sync-fstring": self._measure(self._sync_config(Path(tmp) / "sync.log"), self._fstring_request, options),
+                "queued-lazy": self._measure(self._queued_config(Path(tmp) / "queued.log", 1.0), self._lazy_request, options),
+                "queued-sampled": self._measure(
+                    self._queued_config(Path(tmp) / "sampled.log", options["sample_rate"]), self._lazy_request, options
+                ),
+            }
+
+        # 벤치마크 로거 설정이 남지 않도록 원래 설정 복구
+        from django.conf import settings
+
+        configure_logging(settings.LOGGING)
+
+        self.stdout.write(self.style.WARNING(f"=== 로깅 벤치마크 ({requests}요청, 요청당 상품 {items}개) ==="))
+        self.stdout.write(f"{'mode':<16}{'us/request':>12}{'drain(ms)':>12}{'lines':>8}")
+        for name, stats in results.items():
+            self.stdout.write(f"{name:<16}{stats['per_request_us']:>12.1f}{stats['drain_ms']:>12.1f}{stats['lines']:>8}")
+
+        baseline = results["sync-fstring"]["per_request_us"]
+        if results["queued-lazy"]["per_request_us"] > 0:
+            self.stdout.write(f"요청 스레드 오버헤드 감소: {baseline / results['queued-lazy']['per_request_us']:.1f}x")
+
+    # ===== 측정 =====
+
+    def _measure(self, config, request_fn, options):
+        configure_logging(config)
+        logger = logging.getLogger(LOGGER_NAME)
+
+        started = time.perf_counter()
+        for i in range(options["requests"]):
+            request_fn(logger, i, options["items"])
+        elapsed = time.perf_counter() - started
+
+        # 리스너 큐를 비우는 시간 (요청 스레드 밖에서 일어나는 I/O)
+        drain_started = time.perf_counter()
+        stop_listeners()
+        drain_ms = (time.perf_counter() - drain_started) * 1000
+
+        filename = config["handlers"]["file"]["filename"]
+        for handler in logging.getLogger(LOGGER_NAME).handlers:
+            handler.close()
+        lines = sum(1 for _ in open(filename, encoding="utf-8"))
+
+        return {"per_request_us": elapsed / options["requests"] * 1_000_000, "drain_ms": drain_ms, "lines": lines}
+
+    @staticmethod
+    def _base_config(filename, formatter, queued, sample_rate):
+        return {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "queued_handlers": ["file"] if queued else [],
+            "filters": {
+                "sampling": {"()": "shopping.utils.structured_logging.SamplingFilter", "rate": sample_rate},
+            },
+            "formatters": {
+                "verbose": {"format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}", "style": "{"},
+                "json": {"()": "shopping.utils.structured_logging.JSONFormatter"},
+            },
+            "handlers": {
+                "file": {
+                    "class": "logging.FileHandler",
+                    "filename": str(filename),
+                    "formatter": formatter,
+                    "filters": ["sampling"],
+                },
+            },
+            "loggers": {LOGGER_NAME: {"handlers": ["file"], "level": "INFO", "propagate": False}},
+        }
+
+    def _sync_config(self, filename):
+        return self._base_config(filename, "verbose", queued=False, sample_rate=1.0)
+
+    def _queued_config(self, filename, sample_rate):
+        return self._base_config(filename, "json", queued=True, sample_rate=sample_rate)
+
+    # ===== 요청 1건의 로그 호출 =====
+
+    @staticmethod
+    def _fstring_request(logger, order_id, items):
+        amount = Decimal("129000.00")
+        logger.info(f"주문 생성 시작: user_id={order_id % 97}, cart_id={order_id}, use_points={0}, postal_code={'06236'}")
+        logger.debug(f"장바구니 상세: cart_id={order_id}, amount={amount}")
+        logger.info(f"배송비 계산 완료: total_amount={amount}, shipping_fee={Decimal('3000')}, is_free_shipping={False}")
+        for product_id in range(items):
+            logger.info(f"재고 차감: product_id={product_id}, product_name={'상품'}, quantity={1}, previous_stock={10}")
+            logger.debug(f"재고 상세: product_id={product_id}, amount={amount}")
+            logger.info(f"주문 아이템 생성: order_id={order_id}, product_id={product_id}, price={amount}")
+        logger.info(f"주문 생성 완료: order_id={order_id}, total_amount={amount}, final_amount={amount}")
+
+    @staticmethod
+    def _lazy_request(logger, order_id, items):
+        amount = Decimal("129000.00")
+        logger.info("주문 생성 시작: user_id=%s, cart_id=%s, use_points=%s, postal_code=%s", order_id % 97, order_id, 0, "06236")
+        logger.debug("장바구니 상세: cart_id=%s, amount=%s", order_id, amount)
+        logger.info("배송비 계산 완료: total_amount=%s, shipping_fee=%s, is_free_shipping=%s", amount, Decimal("3000"), False)
+        for product_id in range(items):
+            logger.info(
+                "재고 차감: product_id=%s, product_name=%s, quantity=%s, previous_stock=%s",
+                product_id,
+                "상품",
+                1,
+                10,
+                extra=SAMPLED,
+            )
+            logger.debug("재고 상세: product_id=%s, amount=%s", product_id, amount)
+            logger.info(
+                "주문 아이템 생성: order_id=%s, product_id=%s, price=%s", order_id, product_id, amount, extra=SAMPLED
+            )
+        logger.info("주문 생성 완료: order_id=%s, total_amount=%s, final_amount=%s", order_id, amount, amount)
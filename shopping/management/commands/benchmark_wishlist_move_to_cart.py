@@ -0,0 +1,120 @@
+"""
+찜 목록 → 장바구니 이동 벤치마크.
+
+--items개 상품을 찜한 사용자로 전체 이동(remove_from_wishlist=True)을 --repeat번 실행하고
+실행당 시간(ms)과 SQL 수를 비교한다. 측정 데이터는 트랜잭션 롤백으로 남기지 않는다.
+
+- per-row: 기존 방식 (상품마다 CartItem get_or_create + 상품명 IN 조회 후 찜 제거)
+- set-based: WishlistService.move_to_cart (재고 조회 1회 + bulk_create 1회 + 중간 테이블 DELETE 1회)
+
+사용 예시:
+    python manage.py benchmark_wishlist_move_to_cart --items 100 --repeat 5
+"""
+
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from shopping.models.cart import Cart, CartItem
+from shopping.models.product import Category, Product
+from shopping.models.user import User
+from shopping.services.wishlist_service import WishlistService
+
+
+class RollbackBenchmark(Exception):
+    """측정 데이터 롤백용"""
+
+
+class Command(BaseCommand):
+    help = "찜 목록 장바구니 이동의 상품별 처리와 집합 기반 처리를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=100, help="찜한 상품 수 (기본 100).")
+        parser.add_argument("--repeat", type=int, default=5, help="방식별 반복 횟수 (기본 5).")
+
+    def handle(self, *args, **options):
+        items, repeat = options["items"], options["repeat"]
+
+        try:
+            with transaction.atomic():
+                user, product_ids = self._setup(items)
+                results = {
+                    "per-row": self._measure(user, product_ids, self._per_row, repeat),
+                    "set-based": self._measure(user, product_ids, self._set_based, repeat),
+                }
+                raise RollbackBenchmark
+        except RollbackBenchmark:
+            pass
+
+        self.stdout.write(self.style.WARNING(f"=== 찜 → 장바구니 이동 벤치마크 (상품 {items}개, {repeat}회) ==="))
+        self.stdout.write(f"{'mode':<12}{'ms/run':>10}{'queries':>10}")
+        for name, stats in results.items():
+            self.stdout.write(f"{name:<12}{stats['ms']:>10.1f}{stats['queries']:>10}")
+
+        if results["set-based"]["ms"] > 0:
+            self.stdout.write(f"속도 향상: {results['per-row']['ms'] / results['set-based']['ms']:.1f}x")
+
+    # ===== 측정 =====
+
+    @staticmethod
+    def _setup(items):
+        suffix = uuid.uuid4().hex[:8]
+        user = User.objects.create_user(username=f"bench_wishlist_{suffix}", email=f"bench_wishlist_{suffix}@example.com")
+        category = Category.objects.create(name=f"벤치마크 {suffix}", slug=f"bench-wishlist-{suffix}")
+        products = Product.objects.bulk_create(
+            [
+                Product(
+                    name=f"벤치마크 상품 {i}",
+                    slug=f"bench-wishlist-{suffix}-{i}",
+                    sku=f"BW-{suffix}-{i}",
+                    category=category,
+                    seller=user,
+                    price=Decimal("10000"),
+                    # 10개 중 1개는 품절
+                    stock=0 if i % 10 == 0 else 10,
+                )
+                for i in range(items)
+            ]
+        )
+        return user, [product.pk for product in products]
+
+    def _measure(self, user, product_ids, move_fn, repeat):
+        elapsed = 0.0
+        queries = 0
+        for _ in range(repeat):
+            # 매 실행을 같은 상태(빈 장바구니 + 전체 찜)에서 시작
+            CartItem.objects.filter(cart__user=user).delete()
+            user.wishlist_products.set(product_ids)
+
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                move_fn(user, product_ids)
+                elapsed += time.perf_counter() - started
+            queries = len(ctx.captured_queries)
+
+        return {"ms": elapsed / repeat * 1000, "queries": queries}
+
+    @staticmethod
+    def _set_based(user, product_ids):
+        WishlistService.move_to_cart(user, product_ids, remove_from_wishlist=True)
+
+    @staticmethod
+    @transaction.atomic
+    def _per_row(user, product_ids):
+        """기존 WishlistService.move_to_cart 구현"""
+        cart, _ = Cart.get_or_create_active_cart(user)
+
+        added_items = []
+        for product in user.wishlist_products.filter(id__in=product_ids):
+            if product.stock <= 0:
+                continue
+            _, created = CartItem.objects.get_or_create(cart=cart, product=product, defaults={"quantity": 1})
+            if created:
+                added_items.append(product.name)
+
+        if added_items:
+            user.wishlist_products.remove(*Product.objects.filter(name__in=added_items))
@@ -0,0 +1,31 @@
+"""
+Celery 큐별 적체량(backlog)과 대기 시간(p50/p99)을 출력하는 커맨드.
+
+워커가 기록한 최근 대기 시간 샘플(shopping.utils.queue_metrics)과
+브로커의 남은 메시지 수를 워커 프로필 단위로 보여준다.
+"""
+
+from django.core.management.base import BaseCommand
+
+from myproject.celery import WORKER_PROFILES
+from shopping.utils.queue_metrics import get_backlog, get_latency_stats
+
+
+class Command(BaseCommand):
+    help = "Celery 큐별 적체량과 대기 시간(p50/p99)을 출력합니다."
+
+    def handle(self, *args, **options):
+        queues = [queue for profile in WORKER_PROFILES.values() for queue in profile["queues"]]
+        backlog = get_backlog(queues)
+
+        self.stdout.write(self.style.WARNING("=== Celery 큐 상태 ==="))
+        self.stdout.write(
+            f"{'profile':<12}{'queue':<18}{'backlog':>9}{'samples':>9}{'p50(ms)':>10}{'p99(ms)':>10}"
+        )
+        for name, profile in WORKER_PROFILES.items():
+            for queue in profile["queues"]:
+                stats = get_latency_stats(queue)
+                pending = "-" if backlog[queue] is None else backlog[queue]
+                self.stdout.write(
+                    f"{name:<12}{queue:<18}{pending:>9}{stats['samples']:>9}{stats['p50_ms']:>10}{stats['p99_ms']:>10}"
+                )
@@ -7,11 +7,11 @@ from decimal import Decimal
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 from django.db import transaction
-from django.utils import timezone
 
 from dotenv import load_dotenv
 
 from shopping.models import Cart, CartItem, Category, Order, OrderItem, Product, ProductImage, ProductReview
+from shopping.services.order_summary_service import OrderSummaryService
 
 # 환경변수 로드
 load_dotenv()
@@ -545,6 +545,7 @@ class Command(BaseCommand):
         self.stdout.write("📋 주문 샘플 생성 중...")
 
         orders_created = 0
+        created_orders = []
         statuses = ["pending", "paid", "preparing", "shipped", "delivered"]
         payment_methods = ["card", "bank_transfer", "kakao_pay"]
 
@@ -578,11 +579,6 @@ class Command(BaseCommand):
                     payment_method=random.choice(payment_methods),
                 )
 
-                # 주문번호 생성
-                date_str = timezone.now().strftime("%Y%m%d")
-                order.order_number = f"{date_str}{order.pk:06d}"
-                order.save()
-
                 # 주문 상품 추가
                 num_items = random.randint(1, min(3, len(products)))
                 order_products = random.sample(products, num_items)
@@ -603,8 +599,12 @@ class Command(BaseCommand):
                 order.total_amount = total_amount
                 order.save()
 
+                created_orders.append(order)
                 orders_created += 1
 
+        # 주문 목록용 요약 (item_count, 대표 상품명/이미지) 일괄 기록
+        OrderSummaryService.refresh(created_orders)
+
         self.stdout.write(f"  ✓ {orders_created}개 주문 생성 완료")
 
     def print_summary(self):
@@ -0,0 +1,96 @@
+"""
+요청 단위 성능 계측 / DB 라우팅 미들웨어
+
+요청마다 처리 시간, DB 쿼리 수/시간, 캐시 히트/미스, 직렬화 시간을 측정해
+URL 이름(view_name)별로 집계합니다. 집계 결과는 /api/metrics/ (Prometheus)로 노출됩니다.
+
+설정:
+- REQUEST_METRICS_ENABLED: 계측 사용 여부 (기본 True)
+- REQUEST_METRICS_SLOW_MS: 이 시간(ms)을 넘는 요청은 구성 비율과 함께 WARNING 로깅
+- REQUEST_METRICS_SERVER_TIMING: 응답에 Server-Timing 헤더 추가 (브라우저 개발자 도구에서 확인)
+
+ReplicaRoutingMiddleware는 읽기 replica 사용 시 쓰기 이후 primary 고정(sticky)을 담당합니다.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+
+from . import db_router
+from .utils import request_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class PerformanceMetricsMiddleware:
+    """
+    요청 성능 계측 미들웨어
+
+    MIDDLEWARE 목록 맨 앞에 두어 다른 미들웨어(세션, 인증)의 쿼리까지 포함해 측정합니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "REQUEST_METRICS_ENABLED", True)
+        self.slow_ms = getattr(settings, "REQUEST_METRICS_SLOW_MS", 500)
+        self.server_timing = getattr(settings, "REQUEST_METRICS_SERVER_TIMING", False)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        with request_metrics.profile_request() as profile:
+            response = self.get_response(request)
+        latency = time.perf_counter() - start
+
+        match = request.resolver_match
+        endpoint = match.view_name if match else "unresolved"
+        request_metrics.record(endpoint, request.method, latency, profile)
+
+        if self.server_timing:
+            response["Server-Timing"] = (
+                f"total;dur={latency * 1000:.1f}, "
+                f'db;dur={profile.db_time * 1000:.1f};desc="{profile.queries} queries", '
+                f"serializer;dur={profile.serializer_time * 1000:.1f}, "
+                f'cache;desc="{profile.cache_hits} hit / {profile.cache_misses} miss"'
+            )
+
+        if latency * 1000 > self.slow_ms:
+            logger.warning(
+                f"느린 요청: {request.method} {endpoint} | total={latency * 1000:.1f}ms, "
+                f"db={profile.db_time * 1000:.1f}ms ({profile.queries} queries), "
+                f"serializer={profile.serializer_time * 1000:.1f}ms, "
+                f"cache={profile.cache_hits} hit/{profile.cache_misses} miss"
+            )
+
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    읽기 replica 라우팅 상태 관리 미들웨어 (shopping.db_router)
+
+    - 요청마다 라우팅 상태를 만들어 같은 요청 안의 쓰기 이후 읽기를 primary로 고정
+    - 쓰기가 있었던 인증 사용자는 REPLICA_STICKY_SECONDS 동안 다음 요청의 읽기도 primary 사용
+
+    request.user를 사용하므로 AuthenticationMiddleware 다음에 둡니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = db_router.begin_request(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            state = db_router.end_request(token)
+
+        if state.wrote and db_router.replica_configured():
+            user = getattr(request, "user", None)
+            if user is not None and user.is_authenticated:
+                db_router.pin_primary(user.pk)
+
+        return response
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.4 on 2026-10-18 21:52
+
+from django.db import migrations, models
+
+
+def backfill_order_summary(apps, schema_editor):
+    """기존 주문의 목록용 요약을 주문 아이템 기준으로 채움"""
+    Order = apps.get_model("shopping", "Order")
+    OrderItem = apps.get_model("shopping", "OrderItem")
+    ProductImage = apps.get_model("shopping", "ProductImage")
+
+    batch_size = 1000
+    order_ids = list(Order.objects.order_by("pk").values_list("pk", flat=True))
+
+    for start in range(0, len(order_ids), batch_size):
+        chunk = order_ids[start : start + batch_size]
+
+        lines_by_order = {}
+        for order_id, product_id, product_name in (
+            OrderItem.objects.filter(order_id__in=chunk)
+            .order_by("order_id", "pk")
+            .values_list("order_id", "product_id", "product_name")
+        ):
+            lines_by_order.setdefault(order_id, []).append((product_id, product_name))
+
+        thumbnails = {}
+        first_product_ids = {lines[0][0] for lines in lines_by_order.values() if lines[0][0] is not None}
+        for product_id, image in (
+            ProductImage.objects.filter(product_id__in=first_product_ids)
+            .order_by("product_id", "-is_primary", "order", "created_at")
+            .values_list("product_id", "image")
+        ):
+            thumbnails.setdefault(product_id, image)
+
+        orders = []
+        for order_id, lines in lines_by_order.items():
+            first_product_id, first_product_name = lines[0]
+            orders.append(
+                Order(
+                    pk=order_id,
+                    item_count=len(lines),
+                    first_product_name=first_product_name,
+                    thumbnail_image=thumbnails.get(first_product_id, ""),
+                )
+            )
+        Order.objects.bulk_update(orders, ["item_count", "first_product_name", "thumbnail_image"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0014_notification_metadata"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="first_product_name",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="주문 목록에 표시할 첫 번째 상품명",
+                max_length=255,
+                verbose_name="대표 상품명",
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="item_count",
+            field=models.PositiveIntegerField(default=0, help_text="주문에 포함된 상품 종류 수", verbose_name="주문 상품 수"),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="thumbnail_image",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="첫 번째 상품의 대표 이미지 경로 (MEDIA 기준)",
+                max_length=255,
+                verbose_name="대표 이미지",
+            ),
+        ),
+        migrations.RunPython(backfill_order_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0015_order_list_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="return",
+            name="refund_attempts",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="PG 환불 시도 횟수"),
+        ),
+        migrations.AddField(
+            model_name="return",
+            name="refund_error",
+            field=models.TextField(blank=True, help_text="마지막 토스 취소 API 오류 메시지", verbose_name="PG 환불 오류"),
+        ),
+        migrations.AddField(
+            model_name="return",
+            name="refund_status",
+            field=models.CharField(
+                choices=[
+                    ("not_required", "해당없음"),
+                    ("pending", "환불대기"),
+                    ("processing", "환불요청중"),
+                    ("succeeded", "환불완료"),
+                    ("failed", "환불실패"),
+                ],
+                default="not_required",
+                max_length=20,
+                verbose_name="PG 환불 상태",
+            ),
+        ),
+        migrations.AddField(
+            model_name="return",
+            name="refunded_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="PG 환불 시각"),
+        ),
+        migrations.AddIndex(
+            model_name="return",
+            index=models.Index(fields=["refund_status", "updated_at"], name="shopping_re_refund__ad2c8a_idx"),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:31
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+
+
+def backfill_return_summary(apps, schema_editor):
+    """기존 교환/환불의 목록용 요약을 반품 상품 기준으로 채움"""
+    Return = apps.get_model("shopping", "Return")
+    ReturnItem = apps.get_model("shopping", "ReturnItem")
+
+    batch_size = 1000
+    return_ids = list(Return.objects.order_by("pk").values_list("pk", flat=True))
+
+    for start in range(0, len(return_ids), batch_size):
+        chunk = return_ids[start : start + batch_size]
+        summaries = (
+            ReturnItem.objects.filter(return_request_id__in=chunk)
+            .values("return_request_id")
+            .annotate(item_count=Count("pk"), items_amount=Sum(F("product_price") * F("quantity")))
+            .order_by()
+        )
+        returns = [
+            Return(pk=row["return_request_id"], item_count=row["item_count"], items_amount=row["items_amount"])
+            for row in summaries
+        ]
+        Return.objects.bulk_update(returns, ["item_count", "items_amount"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0016_return_refund_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="return",
+            name="item_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="교환/환불에 포함된 상품 종류 수", verbose_name="반품 상품 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="return",
+            name="items_amount",
+            field=models.DecimalField(
+                decimal_places=0,
+                default=Decimal("0"),
+                help_text="반품 상품 단가 × 수량 합계 (배송비 차감 전)",
+                max_digits=12,
+                verbose_name="반품 상품 금액",
+            ),
+        ),
+        migrations.RunPython(backfill_return_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:39
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    User.wishlist_products 자동 중간 테이블(shopping_wishlist)을 WishlistItem 모델로 전환
+
+    테이블/컬럼/유니크 제약은 자동 생성 테이블과 동일하므로 상태만 바꾸고(SeparateDatabaseAndState),
+    실제 스키마 변경은 added_at 컬럼과 (user, -added_at, -id) 인덱스 추가뿐입니다.
+    기존 찜 항목의 added_at은 마이그레이션 시각으로 채워집니다.
+    """
+
+    dependencies = [
+        ("shopping", "0017_return_list_summary"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="WishlistItem",
+                    fields=[
+                        ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                        (
+                            "product",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="wishlist_items",
+                                to="shopping.product",
+                                verbose_name="상품",
+                            ),
+                        ),
+                        (
+                            "user",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="wishlist_items",
+                                to=settings.AUTH_USER_MODEL,
+                                verbose_name="사용자",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "찜 항목",
+                        "verbose_name_plural": "찜 목록",
+                        "db_table": "shopping_wishlist",
+                        "unique_together": {("user", "product")},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name="user",
+                    name="wishlist_products",
+                    field=models.ManyToManyField(
+                        blank=True,
+                        related_name="wished_by_users",
+                        through="shopping.WishlistItem",
+                        to="shopping.product",
+                        verbose_name="찜한 상품",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="wishlistitem",
+            name="added_at",
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now, verbose_name="찜한 일시"),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="wishlistitem",
+            index=models.Index(fields=["user", "-added_at", "-id"], name="wishlist_user_added_idx"),
+        ),
+    ]
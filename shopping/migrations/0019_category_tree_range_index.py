@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0018_wishlist_item"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(fields=["tree_id", "lft"], name="category_tree_lft_idx"),
+        ),
+    ]
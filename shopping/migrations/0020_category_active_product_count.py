@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:47
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_active_product_count(apps, schema_editor):
+    """기존 카테고리의 활성 상품 수를 상품 테이블 기준으로 채움"""
+    Category = apps.get_model("shopping", "Category")
+    Product = apps.get_model("shopping", "Product")
+
+    active_count = (
+        Product.objects.filter(category=OuterRef("pk"), is_active=True)
+        .order_by()
+        .values("category")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    Category.objects.update(active_product_count=Coalesce(Subquery(active_count), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0019_category_tree_range_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="active_product_count",
+            field=models.IntegerField(default=0, editable=False, verbose_name="활성 상품 수"),
+        ),
+        migrations.RunPython(backfill_active_product_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-19 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0020_category_active_product_count"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductImageVariant",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "format",
+                    models.CharField(choices=[("webp", "WebP"), ("jpeg", "JPEG")], max_length=10, verbose_name="포맷"),
+                ),
+                ("width", models.PositiveIntegerField(verbose_name="너비")),
+                ("height", models.PositiveIntegerField(verbose_name="높이")),
+                ("file", models.ImageField(max_length=255, upload_to="product/variants", verbose_name="파일")),
+                ("size", models.PositiveIntegerField(default=0, verbose_name="파일 크기(byte)")),
+                ("source_name", models.CharField(max_length=255, verbose_name="원본 파일 경로")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "image",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="variants",
+                        to="shopping.productimage",
+                        verbose_name="원본 이미지",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "상품 이미지 변형",
+                "verbose_name_plural": "상품 이미지 변형",
+                "ordering": ["width"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("image", "format", "width"), name="unique_variant_per_image_format_width"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.4 on 2026-10-19 10:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+# ImageVariantService.LIST_WIDTH
+LIST_WIDTH = 400
+
+
+def backfill_thumbnail_image(apps, schema_editor):
+    """기존 상품의 대표 이미지 경로를 채움 (목록 너비 변형이 있으면 변형, 없으면 원본)"""
+    Product = apps.get_model("shopping", "Product")
+    ProductImage = apps.get_model("shopping", "ProductImage")
+    ProductImageVariant = apps.get_model("shopping", "ProductImageVariant")
+
+    formats = list(getattr(settings, "PRODUCT_IMAGE_VARIANT_FORMATS", ["webp", "jpeg"]))
+    batch_size = 1000
+    product_ids = list(ProductImage.objects.order_by("product_id").values_list("product_id", flat=True).distinct())
+
+    for start in range(0, len(product_ids), batch_size):
+        chunk = product_ids[start : start + batch_size]
+
+        representatives = {}
+        for product_id, image_id, image in (
+            ProductImage.objects.filter(product_id__in=chunk)
+            .order_by("product_id", "-is_primary", "order", "created_at")
+            .values_list("product_id", "pk", "image")
+        ):
+            representatives.setdefault(product_id, (image_id, image))
+
+        variants_by_image = {}
+        for image_id, fmt, width, file, source_name in ProductImageVariant.objects.filter(
+            image_id__in=[image_id for image_id, _ in representatives.values()]
+        ).values_list("image_id", "format", "width", "file", "source_name"):
+            variants_by_image.setdefault(image_id, []).append((fmt, width, file, source_name))
+
+        products = []
+        for product_id, (image_id, image) in representatives.items():
+            thumbnail = image
+            variants = [v for v in variants_by_image.get(image_id, []) if v[3] == image]
+            for fmt in formats:
+                candidates = sorted((v for v in variants if v[0] == fmt), key=lambda v: v[1])
+                if candidates:
+                    thumbnail = next((v for v in candidates if v[1] >= LIST_WIDTH), candidates[-1])[2]
+                    break
+            products.append(Product(pk=product_id, thumbnail_image=thumbnail))
+        Product.objects.bulk_update(products, ["thumbnail_image"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0021_product_image_variant"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="thumbnail_image",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="대표 이미지의 목록 너비 변형(없으면 원본) 경로 (MEDIA 기준)",
+                max_length=255,
+                verbose_name="대표 이미지",
+            ),
+        ),
+        migrations.RunPython(backfill_thumbnail_image, migrations.RunPython.noop),
+    ]
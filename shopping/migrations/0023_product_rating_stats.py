@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_rating_stats(apps, schema_editor):
+    """기존 상품의 리뷰 수/평점 합계를 리뷰 테이블 기준으로 채움"""
+    Product = apps.get_model("shopping", "Product")
+    ProductReview = apps.get_model("shopping", "ProductReview")
+
+    stats = ProductReview.objects.filter(product=OuterRef("pk")).order_by().values("product")
+    Product.objects.update(
+        rating_count=Coalesce(Subquery(stats.annotate(count=Count("pk")).values("count")), Value(0)),
+        rating_sum=Coalesce(Subquery(stats.annotate(total=Sum("rating")).values("total")), Value(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0022_product_thumbnail_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name="리뷰 수"),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name="평점 합계"),
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
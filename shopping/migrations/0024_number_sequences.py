@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:10
+
+from django.db import migrations
+
+# NumberSequenceService.ORDER_SEQUENCE / RETURN_SEQUENCE
+# 테스트 DB(--nomigrations)에서도 같은 SQL로 생성 (shopping/tests/conftest.py의 django_db_setup)
+#
+# 주문번호 시퀀스는 처음 만들 때만 기존 최대 주문 ID로 시작값을 맞춤 (PK 기반 기존 주문번호와 충돌 방지)
+# 이미 있는 시퀀스는 그대로 유지 (되감으면 이미 발급한 번호와 중복)
+CREATE_SEQUENCES_SQL = """
+DO $$
+BEGIN
+    IF to_regclass('shopping_order_number_seq') IS NULL THEN
+        CREATE SEQUENCE shopping_order_number_seq;
+        PERFORM setval('shopping_order_number_seq', MAX(id)) FROM shopping_orders HAVING MAX(id) IS NOT NULL;
+    END IF;
+END
+$$;
+CREATE SEQUENCE IF NOT EXISTS shopping_return_number_seq;
+"""
+
+DROP_SEQUENCES_SQL = """
+DROP SEQUENCE IF EXISTS shopping_order_number_seq;
+DROP SEQUENCE IF EXISTS shopping_return_number_seq;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0023_product_rating_stats"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SEQUENCES_SQL, reverse_sql=DROP_SEQUENCES_SQL),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-19 15:02
+
+from django.db import migrations
+
+# 0018에서 기존 찜 항목의 added_at이 모두 마이그레이션 시각 하나로 채워졌으므로
+# 같은 사용자 안에서 added_at이 겹치는 항목을 id 순으로 1마이크로초씩 앞당겨 서로 다른 값으로 만듦
+# (id가 큰 항목이 가장 최근 → 기존 "-added_at, -id" 정렬 순서는 그대로 유지)
+STAGGER_ADDED_AT_SQL = """
+UPDATE shopping_wishlist AS w
+SET added_at = w.added_at - (d.rn - 1) * interval '1 microsecond'
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY user_id, added_at ORDER BY id DESC) AS rn
+    FROM shopping_wishlist
+) AS d
+WHERE w.id = d.id AND d.rn > 1;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0024_number_sequences"),
+    ]
+
+    operations = [
+        migrations.RunSQL(STAGGER_ADDED_AT_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shopping", "0025_wishlist_distinct_added_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NumberCounter",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=64, unique=True, verbose_name="시퀀스 이름")),
+                ("value", models.BigIntegerField(default=0, verbose_name="마지막 발급 값")),
+            ],
+            options={
+                "verbose_name": "번호 발급 카운터",
+                "verbose_name_plural": "번호 발급 카운터",
+                "db_table": "shopping_number_counter",
+            },
+        ),
+    ]
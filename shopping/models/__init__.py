@@ -1,14 +1,16 @@
 from .cart import Cart, CartItem
 from .email_verification import EmailLog, EmailVerificationToken
 from .notification import Notification
+from .number_counter import NumberCounter
 from .order import Order, OrderItem
 from .password_reset import PasswordResetToken
 from .payment import Payment, PaymentLog
 from .point import PointHistory
-from .product import Category, Product, ProductImage, ProductReview
+from .product import Category, Product, ProductImage, ProductImageVariant, ProductReview
 from .product_qa import ProductAnswer, ProductQuestion
 from .return_request import Return, ReturnItem
 from .user import User
+from .wishlist import WishlistItem
 
 # import 위해
 
@@ -16,6 +18,7 @@ __all__ = [
     "Product",
     "Category",
     "ProductImage",
+    "ProductImageVariant",
     "ProductReview",
     "Order",
     "OrderItem",
@@ -33,4 +36,6 @@ __all__ = [
     "ProductAnswer",
     "Return",
     "ReturnItem",
+    "WishlistItem",
+    "NumberCounter",
 ]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from django.db import models
+
+
+class NumberCounter(models.Model):
+    """
+    번호 발급 카운터 (PostgreSQL 이외 DB용)
+
+    PostgreSQL에서는 시퀀스(0024_number_sequences)로 번호를 발급하고,
+    시퀀스가 없는 DB(SQLite 테스트/로컬 환경 등)에서만 NumberSequenceService가 이 행을 증가시켜 사용합니다.
+    """
+
+    name = models.CharField(max_length=64, unique=True, verbose_name="시퀀스 이름")
+    value = models.BigIntegerField(default=0, verbose_name="마지막 발급 값")
+
+    class Meta:
+        db_table = "shopping_number_counter"
+        verbose_name = "번호 발급 카운터"
+        verbose_name_plural = "번호 발급 카운터"
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.value}"
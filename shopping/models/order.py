@@ -174,6 +174,29 @@ class Order(models.Model):
         help_text="자동 생성되는 고유 주문번호",
     )
 
+    # 주문 목록용 요약 (주문 생성 시 OrderSummaryService가 기록, 목록 조회 시 조인 불필요)
+    item_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="주문 상품 수",
+        help_text="주문에 포함된 상품 종류 수",
+    )
+
+    first_product_name = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        verbose_name="대표 상품명",
+        help_text="주문 목록에 표시할 첫 번째 상품명",
+    )
+
+    thumbnail_image = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        verbose_name="대표 이미지",
+        help_text="첫 번째 상품의 대표 이미지 경로 (MEDIA 기준)",
+    )
+
     # 시간 정보
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="주문일시")  # 생성시 자동 설정
 
@@ -201,9 +224,13 @@ class Order(models.Model):
         """
         주문 저장
 
-        주문번호는 post_save signal에서 자동으로 생성됩니다.
-        (signals.py의 generate_order_number 참조)
+        신규 주문은 INSERT 전에 주문번호를 발급받아 한 번에 저장합니다.
+        (NumberSequenceService.next_order_number 참조)
         """
+        if self._state.adding and not self.order_number:
+            from shopping.services.number_sequence_service import NumberSequenceService
+
+            self.order_number = NumberSequenceService.next_order_number(using=kwargs.get("using") or "default")
         super().save(*args, **kwargs)
 
     @property
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 from django.utils.text import slugify
 
 from mptt.models import MPTTModel, TreeForeignKey
@@ -14,7 +14,55 @@ if TYPE_CHECKING:
     from shopping.models.user import User
 
 
-class Category(MPTTModel):
+class CategoryRange(NamedTuple):
+    """
+    카테고리 서브트리 범위 (MPTT tree_id + lft~rght)
+
+    하위 카테고리는 같은 tree_id에서 lft가 [lft, rght] 범위에 있으므로
+    카테고리 목록(IN)이나 추가 조회 없이 범위 조건 하나로 서브트리를 필터링합니다.
+    """
+
+    tree_id: int
+    lft: int
+    rght: int
+    is_active: bool = True
+
+    def filter_q(self, prefix: str = "category") -> Q:
+        """
+        서브트리 필터 조건
+
+        Args:
+            prefix: 카테고리까지의 lookup 경로 (Product 기준 "category", Category 기준 "")
+
+        Returns:
+            Q: tree_id 일치 + lft 범위 조건
+        """
+        path = f"{prefix}__" if prefix else ""
+        return Q(**{f"{path}tree_id": self.tree_id, f"{path}lft__gte": self.lft, f"{path}lft__lte": self.rght})
+
+
+class DenormalizedFieldsMixin:
+    """
+    수정 저장(update_fields 미지정) 시 비정규화 필드와 지연 필드를 저장 대상에서 제외하는 모델 mixin
+
+    - DENORMALIZED_FIELDS: 다른 모델 변경 시 UPDATE로만 갱신하는 필드 (메모리의 이전 값으로 덮어쓰지 않음)
+    - .only()/.defer()로 지연된 필드: 저장 시 필드마다 다시 조회하지 않고, 그 사이의 변경도 덮어쓰지 않음
+    """
+
+    DENORMALIZED_FIELDS: tuple[str, ...] = ()
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
+
+class Category(DenormalizedFieldsMixin, MPTTModel):
     """
     상품 카테고리 (MPTT를 사용한 계층구조)
 
@@ -35,6 +83,8 @@ class Category(MPTTModel):
     )
     description = models.TextField(blank=True, verbose_name="카테고리 설명")
     is_active = models.BooleanField(default=True, db_index=True, verbose_name="활성화 여부")
+    # 직접 속한 활성 상품 수 (상품의 카테고리/활성 상태가 바뀔 때만 증감, 매일 정합성 검사)
+    active_product_count = models.IntegerField(default=0, editable=False, verbose_name="활성 상품 수")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -48,6 +98,13 @@ class Category(MPTTModel):
         verbose_name = "카테고리"
         verbose_name_plural = "카테고리"
         ordering = ["name"]  # 기본 정렬
+        indexes = [
+            # 서브트리 범위 조회 (tree_id 일치 + lft 범위)
+            models.Index(fields=["tree_id", "lft"], name="category_tree_lft_idx"),
+        ]
+
+    # 상품 시그널에서 UPDATE로만 증감하는 필드 (수정 저장 시 메모리의 이전 값으로 덮어쓰지 않음)
+    DENORMALIZED_FIELDS = ("active_product_count",)
 
     def __str__(self) -> str:
         # 계층 구조를 보여주는 문자열 표현
@@ -59,8 +116,8 @@ class Category(MPTTModel):
         return self.name
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        # slug 자동 생성 (한글 지원)
-        if not self.slug:
+        # slug 자동 생성 (한글 지원, 지연된 slug는 이미 저장된 값이 있으므로 건너뜀)
+        if "slug" not in self.get_deferred_fields() and not self.slug:
             self.slug = slugify(self.name, allow_unicode=True)
         super().save(*args, **kwargs)
 
@@ -72,16 +129,22 @@ class Category(MPTTModel):
         ancestors = self.get_ancestors(include_self=True)
         return " > ".join([cat.name for cat in ancestors])
 
+    @property
+    def subtree_range(self) -> CategoryRange:
+        """현재 카테고리 서브트리 범위"""
+        return CategoryRange(self.tree_id, self.lft, self.rght, self.is_active)
+
     def get_all_products(self) -> QuerySet[Product]:
         """
         현재 카테고리와 모든 하위 카테고리의 상품을 반환
+
+        하위 카테고리를 따로 조회하지 않고 lft/rght 범위로 카테고리를 조인합니다.
         """
-        categories = self.get_descendants(include_self=True)
-        return Product.objects.filter(category__in=categories, is_active=True)
+        return Product.objects.filter(self.subtree_range.filter_q(), is_active=True)
 
     @property
     def product_count(self) -> int:
-        """현재 카테고리의 활성 상품 수"""
+        """현재 카테고리의 활성 상품 수 (실시간 집계, 캐시된 값은 active_product_count)"""
         return self.products.filter(is_active=True).count()
 
     @property
@@ -90,7 +153,7 @@ class Category(MPTTModel):
         return self.get_all_products().count()
 
 
-class Product(models.Model):
+class Product(DenormalizedFieldsMixin, models.Model):
     """상품 기본 정보"""
 
     # 기본 정보
@@ -160,9 +223,22 @@ class Product(models.Model):
         blank=True,
     )
 
+    # 목록용 대표 이미지 (ProductService.refresh_thumbnails로만 갱신)
+    thumbnail_image = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="대표 이미지",
+        help_text="대표 이미지의 목록 너비 변형(없으면 원본) 경로 (MEDIA 기준)",
+    )
+
     # 통계 정보
     view_count = models.PositiveIntegerField(default=0, verbose_name="조회수")
     sold_count = models.PositiveIntegerField(default=0, verbose_name="판매량")
+    # 리뷰 통계 (리뷰 저장/삭제 시그널에서 F() 증감, 상세 조회의 평점/리뷰 수 집계 대체)
+    rating_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="리뷰 수")
+    rating_sum = models.PositiveIntegerField(default=0, editable=False, verbose_name="평점 합계")
 
     # 시간 정보
     created_at = models.DateTimeField(auto_now_add=True)
@@ -181,14 +257,40 @@ class Product(models.Model):
             models.Index(fields=["price"]),
         ]
 
+    # 카테고리 상품 수(Category.active_product_count)에 영향을 주는 필드
+    COUNTER_FIELDS = ("category", "category_id", "is_active")
+
+    # 다른 모델 변경 시 UPDATE로만 갱신하는 필드 (전체 저장 시 메모리의 이전 값으로 덮어쓰지 않음)
+    DENORMALIZED_FIELDS = ("thumbnail_image", "rating_count", "rating_sum")
+    # 판매자 활성 상품 수 캐시에 영향을 주는 필드
+    SELLER_COUNT_FIELDS = ("seller", "seller_id", "is_active")
+
     def __str__(self) -> str:
         return self.name
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: list[str], values: list[Any]) -> Product:
+        """DB에서 읽은 시점의 집계 카테고리를 기록 (저장 시 변경 여부 판단용)"""
+        instance = super().from_db(db, field_names, values)
+        if "category_id" in instance.__dict__ and "is_active" in instance.__dict__:
+            instance._loaded_counted_category_id = instance.counted_category_id
+        return instance
+
     def save(self, *args: Any, **kwargs: Any) -> None:
-        if not self.slug:
+        if "slug" not in self.get_deferred_fields() and not self.slug:
             self.slug = slugify(self.name, allow_unicode=True)
         super().save(*args, **kwargs)
 
+    @property
+    def counted_category_id(self) -> int | None:
+        """카테고리 상품 수에 집계되는 카테고리 ID (비활성 상품은 None)"""
+        return self.category_id if self.is_active else None
+
+    @property
+    def rating_average(self) -> float:
+        """평균 평점 (소수점 1자리, 리뷰가 없으면 0.0)"""
+        return round(self.rating_sum / self.rating_count, 1) if self.rating_count else 0.0
+
     @property
     def is_on_sale(self) -> bool:
         """할인 중인지 확인"""
@@ -287,15 +389,68 @@ class ProductImage(models.Model):
     def __str__(self) -> str:
         return f"{self.product.name} - 이미지 {self.order}"
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: list[str], values: list[Any]) -> ProductImage:
+        """DB에서 읽은 시점의 원본 파일 경로를 기록 (저장 시 교체 여부 판단용)"""
+        instance = super().from_db(db, field_names, values)
+        if "image" in instance.__dict__:
+            instance._loaded_image_name = instance.image.name
+        return instance
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         """
         모델 저장
 
+        원본 파일이 새로 업로드되거나 교체되면 커밋 후 변형 이미지 생성 태스크를 예약합니다.
+
         Note: 대표 이미지 설정은 ProductService.set_primary_image()를 통해 처리해야 합니다.
               이 메서드에서는 단순 저장만 수행합니다.
         """
         super().save(*args, **kwargs)
 
+        if self.image and self.image.name != getattr(self, "_loaded_image_name", None):
+            from shopping.services.image_variant_service import ImageVariantService
+
+            ImageVariantService.schedule(self.pk)
+        self._loaded_image_name = self.image.name
+
+
+class ProductImageVariant(models.Model):
+    """
+    상품 이미지 변형 (고정 너비로 미리 생성한 WebP/JPEG)
+
+    ImageVariantService가 원본 업로드 후 생성하며, 목록/상세 Serializer가 필요한 너비를 골라 사용합니다.
+    source_name이 원본의 현재 파일 경로와 다르면 교체 전 원본의 변형이므로 다시 생성됩니다.
+    """
+
+    FORMAT_CHOICES = [
+        ("webp", "WebP"),
+        ("jpeg", "JPEG"),
+    ]
+
+    image = models.ForeignKey(ProductImage, on_delete=models.CASCADE, related_name="variants", verbose_name="원본 이미지")
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES, verbose_name="포맷")
+    width = models.PositiveIntegerField(verbose_name="너비")
+    height = models.PositiveIntegerField(verbose_name="높이")
+    file = models.ImageField(upload_to="product/variants", max_length=255, verbose_name="파일")
+    size = models.PositiveIntegerField(default=0, verbose_name="파일 크기(byte)")
+    source_name = models.CharField(max_length=255, verbose_name="원본 파일 경로")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "상품 이미지 변형"
+        verbose_name_plural = "상품 이미지 변형"
+        ordering = ["width"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["image", "format", "width"],
+                name="unique_variant_per_image_format_width",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.image_id} - {self.format} {self.width}w"
+
 
 class ProductReview(models.Model):
     """상품 리뷰 (선택사항)"""
@@ -317,12 +472,23 @@ class ProductReview(models.Model):
     def __str__(self) -> str:
         return f"{self.product.name} - {self.user.username}의 리뷰"
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: list[str], values: list[Any]) -> ProductReview:
+        """DB에서 읽은 시점의 상품/평점을 기록 (저장 시 리뷰 통계 증감 계산용)"""
+        instance = super().from_db(db, field_names, values)
+        if "product_id" in instance.__dict__ and "rating" in instance.__dict__:
+            instance._loaded_rating = (instance.product_id, instance.rating)
+        return instance
+
 
 # ==================== 캐시 무효화 신호 ====================
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
+# from_db로 읽지 않은(또는 필드가 지연된) 인스턴스의 집계 카테고리
+_UNKNOWN = object()
+
 
 @receiver([post_save, post_delete], sender=Category)
 def invalidate_category_tree_cache(sender, **kwargs):
@@ -336,27 +502,156 @@ def invalidate_category_tree_cache(sender, **kwargs):
 
     무효화 이유:
     - 카테고리 구조가 변경되었으므로 전체 트리를 다시 빌드해야 함
+    - 삽입/이동/삭제로 다른 카테고리의 lft/rght도 바뀌므로 서브트리 범위 캐시도 삭제
     """
+    from shopping.services.category_tree_service import CategoryTreeService
+
     cache.delete("category_tree_v2")
+    CategoryTreeService.invalidate()
 
 
-@receiver([post_save, post_delete], sender=Product)
-def invalidate_category_tree_on_product_change(sender, instance, **kwargs):
+def _touches_counter(update_fields: frozenset[str] | None) -> bool:
+    """저장 필드에 카테고리/활성 상태가 포함되는지 (update_fields 미지정은 전체 저장)"""
+    return update_fields is None or bool(set(update_fields) & set(Product.COUNTER_FIELDS))
+
+
+@receiver(pre_save, sender=Product)
+def track_product_counted_category(sender, instance, update_fields=None, **kwargs):
+    """
+    저장 전 상품의 기존 집계 카테고리 확보
+
+    from_db로 읽은 인스턴스는 이미 기록되어 있어 쿼리가 없고,
+    직접 만든 인스턴스(pk 지정)나 필드가 지연된 인스턴스만 DB에서 한 번 조회합니다.
+    """
+    if instance._state.adding:
+        instance._loaded_counted_category_id = None
+        return
+    if not _touches_counter(update_fields):
+        return
+    if getattr(instance, "_loaded_counted_category_id", _UNKNOWN) is _UNKNOWN:
+        row = Product.objects.filter(pk=instance.pk).values_list("category_id", "is_active").first()
+        instance._loaded_counted_category_id = row[0] if row and row[1] else None
+
+
+@receiver(post_save, sender=Product)
+def update_category_product_count(sender, instance, created, update_fields=None, **kwargs):
     """
-    상품 생성/삭제 시 카테고리 트리 캐시 무효화
+    상품 저장 시 카테고리 상품 수 증감
 
     트리거:
-    - Product 생성 (product_count 증가)
-    - Product 삭제 (product_count 감소)
-    - Product의 is_active 변경 (product_count 변동)
+    - Product 생성 (활성 상품이면 +1)
+    - Product의 카테고리 변경 (이전 카테고리 -1, 새 카테고리 +1)
+    - Product의 is_active 변경 (+1 / -1)
+
+    Note:
+    - 가격, 재고, 상품명 등 다른 필드 변경은 카운터와 카테고리 트리 캐시에 영향 없음
+    - 카테고리 트리 캐시는 다시 빌드하지 않고 바뀐 카테고리의 상품 수만 갱신
+    - queryset.update / bulk_create 등 시그널 없는 변경은 매일 정합성 검사에서 보정
+    """
+    from shopping.services.category_tree_service import CategoryTreeService
+
+    if not created and not _touches_counter(update_fields):
+        return
+
+    previous = instance._loaded_counted_category_id
+    current = instance.counted_category_id
+    instance._loaded_counted_category_id = current
+    if previous == current:
+        return
+
+    deltas = {}
+    if previous is not None:
+        deltas[previous] = -1
+    if current is not None:
+        deltas[current] = 1
+    CategoryTreeService.apply_product_count_deltas(deltas)
 
-    무효화 이유:
-    - 카테고리별 product_count가 변경되므로 트리를 다시 빌드해야 함
+
+@receiver(post_delete, sender=Product)
+def decrease_category_product_count_on_delete(sender, instance, **kwargs):
+    """상품 삭제 시 활성 상품이었다면 카테고리 상품 수 -1"""
+    from shopping.services.category_tree_service import CategoryTreeService
+
+    previous = getattr(instance, "_loaded_counted_category_id", _UNKNOWN)
+    if previous is _UNKNOWN:
+        previous = instance.counted_category_id
+    if previous is not None:
+        CategoryTreeService.apply_product_count_deltas({previous: -1})
+
+
+@receiver([post_save, post_delete], sender=ProductImage)
+def refresh_product_thumbnail(sender, instance, **kwargs):
+    """
+    상품 이미지 추가/수정/삭제 시 상품의 대표 이미지 경로 갱신
 
     Note:
-    - Product의 category 변경도 감지됨 (post_save 시그널)
-    - 단, 상품명, 가격 등 변경은 캐시에 영향 없으나 신호가 발생함
-    - 성능 영향 미미 (캐시 삭제는 매우 빠름)
+    - 대표 이미지 변경(ProductService.set_primary_image)은 queryset.update라 시그널이 없으므로 서비스에서 직접 갱신
+    - 상품 삭제로 CASCADE된 경우는 갱신할 상품이 없으므로 건너뜀
     """
-    cache.delete("category_tree_v2")
+    from shopping.services.product_service import ProductService
+
+    origin = kwargs.get("origin")
+    if isinstance(origin, Product) or getattr(origin, "model", None) is Product:
+        return
+    ProductService.refresh_thumbnails([instance.product_id])
+
+
+@receiver(post_delete, sender=ProductImageVariant)
+def delete_variant_file(sender, instance, **kwargs):
+    """변형 레코드 삭제 시 저장소의 파일도 삭제 (원본 이미지 삭제로 CASCADE된 경우 포함)"""
+    if instance.file:
+        instance.file.delete(save=False)
+
+
+@receiver(post_save, sender=ProductReview)
+def update_product_rating_on_review_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    리뷰 작성/수정 시 상품의 리뷰 수/평점 합계 증감
 
+    Note:
+    - 평점 외 필드(내용 등)만 바뀐 수정은 UPDATE 없음
+    - from_db로 읽지 않은 인스턴스의 수정은 이전 평점을 모르므로 상품 통계를 다시 계산
+    """
+    from shopping.services.product_service import ProductService
+
+    current = (instance.product_id, instance.rating)
+    previous = None if created else getattr(instance, "_loaded_rating", _UNKNOWN)
+    instance._loaded_rating = current
+
+    if previous is _UNKNOWN:
+        ProductService.refresh_review_stats([instance.product_id])
+        return
+    if previous == current:
+        return
+
+    deltas = {}
+    if previous is not None:
+        count, total = deltas.get(previous[0], (0, 0))
+        deltas[previous[0]] = (count - 1, total - previous[1])
+    count, total = deltas.get(current[0], (0, 0))
+    deltas[current[0]] = (count + 1, total + current[1])
+    ProductService.apply_review_stat_deltas(deltas)
+
+
+@receiver(post_delete, sender=ProductReview)
+def update_product_rating_on_review_delete(sender, instance, **kwargs):
+    """리뷰 삭제 시 상품의 리뷰 수/평점 합계 감소 (상품 삭제로 CASCADE된 경우 제외)"""
+    from shopping.services.product_service import ProductService
+
+    origin = kwargs.get("origin")
+    if isinstance(origin, Product) or getattr(origin, "model", None) is Product:
+        return
+    product_id, rating = getattr(instance, "_loaded_rating", (instance.product_id, instance.rating))
+    ProductService.apply_review_stat_deltas({product_id: (-1, -rating)})
+
+
+@receiver([post_save, post_delete], sender=Product)
+def invalidate_seller_product_count(sender, instance, update_fields=None, **kwargs):
+    """상품 생성/수정/삭제 시 판매자 상품 수 캐시 삭제 (판매자 변경 시 이전 판매자는 TTL 만료로 반영)"""
+    from shopping.services.product_service import ProductService
+
+    # 판매자/활성 상태를 저장하지 않는 수정은 건너뜀 (지연된 seller_id를 다시 조회하지 않음)
+    if update_fields is not None and not set(update_fields) & set(Product.SELLER_COUNT_FIELDS):
+        return
+    if instance.seller_id:
+        ProductService.invalidate_seller_product_count(instance.seller_id)
@@ -47,6 +47,15 @@ class Return(models.Model):
         ("completed", "완료"),  # 환불/교환 완료
     ]
 
+    # PG 환불 상태 (재고 복구/상태 변경 이후 별도 단계에서 토스 취소 API 호출)
+    REFUND_STATUS_CHOICES = [
+        ("not_required", "해당없음"),  # 교환 또는 실제 환불 금액 0원
+        ("pending", "환불대기"),  # 완료 처리됨, PG 환불 요청 대기 (재시도 포함)
+        ("processing", "환불요청중"),  # 워커가 토스 API 호출 중
+        ("succeeded", "환불완료"),
+        ("failed", "환불실패"),  # 재시도 불가 오류 또는 재시도 소진 → 수동 처리 필요
+    ]
+
     # 신청 사유
     REASON_CHOICES = [
         ("change_of_mind", "단순변심"),
@@ -165,6 +174,45 @@ class Return(models.Model):
         verbose_name="예금주",
     )
 
+    refund_status = models.CharField(
+        max_length=20,
+        choices=REFUND_STATUS_CHOICES,
+        default="not_required",
+        verbose_name="PG 환불 상태",
+    )
+
+    refund_attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="PG 환불 시도 횟수",
+    )
+
+    refund_error = models.TextField(
+        blank=True,
+        verbose_name="PG 환불 오류",
+        help_text="마지막 토스 취소 API 오류 메시지",
+    )
+
+    refunded_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="PG 환불 시각",
+    )
+
+    # 목록용 요약 (반품 상품 prefetch 없이 표시, ReturnService.create_return/refresh_summary에서 기록)
+    item_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="반품 상품 수",
+        help_text="교환/환불에 포함된 상품 종류 수",
+    )
+
+    items_amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=0,
+        default=Decimal("0"),
+        verbose_name="반품 상품 금액",
+        help_text="반품 상품 단가 × 수량 합계 (배송비 차감 전)",
+    )
+
     # 교환 정보 (type='exchange'일 때만 사용)
     exchange_product = models.ForeignKey(
         Product,
@@ -233,6 +281,7 @@ class Return(models.Model):
             models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["order"]),
             models.Index(fields=["status"]),
+            models.Index(fields=["refund_status", "updated_at"]),  # 환불 대기/정체 건 재처리 조회
         ]
 
     def __str__(self) -> str:
@@ -97,13 +97,13 @@ class User(AbstractUser):
 
     withdrawn_at = models.DateTimeField(null=True, blank=True, verbose_name="탈퇴 일시")
 
-    # 찜한 상품 (ManyToMany 관계)
+    # 찜한 상품 (ManyToMany 관계, 중간 테이블 shopping_wishlist에 찜한 일시 기록)
     wishlist_products = models.ManyToManyField(
         "Product",  # Product 모델과 연결
+        through="WishlistItem",
         related_name="wished_by_users",  # 역참조 이름
         blank=True,  # 찜한 상품이 없어도 됨
         verbose_name="찜한 상품",
-        db_table="shopping_wishlist",  # 중간 테이블 이름 지정
     )
 
     class Meta:
@@ -135,6 +135,18 @@ class User(AbstractUser):
 
         super().save(*args, **kwargs)
 
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        """
+        인증 캐시로 만든 인스턴스(UserAuthCacheService.build)는
+        지연 필드 하나에 접근할 때 나머지 지연 필드도 한 번에 로드
+        (필드마다 쿼리가 나가는 것을 방지)
+        """
+        if fields is not None and getattr(self, "_auth_cached", False):
+            deferred = self.get_deferred_fields()
+            if deferred and set(fields) <= deferred:
+                fields = deferred
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
     def __str__(self) -> str:
         return f'{self.username} ({self.get_full_name() or "이름없음"})'
 
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import models
+
+
+class WishlistItem(models.Model):
+    """
+    찜 목록 항목 (User.wishlist_products 중간 테이블)
+
+    기존 자동 생성 M2M 테이블(shopping_wishlist)을 그대로 사용하고
+    찜한 시각(added_at)을 추가해 "최근 찜한 순" 정렬과 키셋 페이지네이션에 사용합니다.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="wishlist_items",
+        verbose_name="사용자",
+    )
+
+    product = models.ForeignKey(
+        "Product",
+        on_delete=models.CASCADE,
+        related_name="wishlist_items",
+        verbose_name="상품",
+    )
+
+    added_at = models.DateTimeField(auto_now_add=True, verbose_name="찜한 일시")
+
+    class Meta:
+        db_table = "shopping_wishlist"
+        verbose_name = "찜 항목"
+        verbose_name_plural = "찜 목록"
+        unique_together = [("user", "product")]
+        indexes = [
+            # 사용자별 최근 찜한 순 조회 / 키셋 페이지네이션 (added_at, id)
+            models.Index(fields=["user", "-added_at", "-id"], name="wishlist_user_added_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user_id} - {self.product_id}"
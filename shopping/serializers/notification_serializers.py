@@ -169,17 +169,12 @@ class NotificationMarkReadSerializer(serializers.Serializer):
 
     def mark_as_read(self) -> int:
         """알림을 읽음 처리"""
+        from shopping.services.notification_service import NotificationService
+
         user = self.context["request"].user
         notification_ids = self.validated_data.get("notification_ids", [])
 
-        if notification_ids:
-            # 특정 알림들만 읽음 처리
-            notifications = Notification.objects.filter(id__in=notification_ids, user=user, is_read=False)
-        else:
-            # 전체 읽음 처리
-            notifications = Notification.objects.filter(user=user, is_read=False)
-
-        # 읽음 처리
-        count = notifications.update(is_read=True, read_at=timezone.now())
+        # 빈 리스트면 전체 읽음 처리 (읽지 않은 알림 카운터 캐시도 함께 갱신)
+        result = NotificationService.mark_as_read(user, notification_ids=notification_ids or None)
 
-        return count
+        return result.count
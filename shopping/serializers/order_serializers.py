@@ -3,6 +3,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Any
 
+from django.core.files.storage import default_storage
 from django.db import transaction
 from django.db.models import F, QuerySet
 
@@ -52,14 +53,15 @@ class OrderListSerializer(TotalShippingFeeMixin, serializers.ModelSerializer):
     주문 목록 조회용 Serializer
 
     성능 최적화:
-    - item_count: queryset에서 annotate로 계산됨 (N+1 쿼리 방지)
+    - item_count/first_product_name/thumbnail_image: 주문 생성 시 Order에 저장된 요약 사용
+      (주문 아이템/상품 조회 없음, OrderSummaryService 참조)
     - user_username: queryset에서 select_related("user")로 최적화
     """
 
     user_username = serializers.CharField(source="user.username", read_only=True)
-    item_count = serializers.IntegerField(read_only=True)  # annotate에서 제공
     status_display = serializers.CharField(source="get_status_display", read_only=True)
     total_shipping_fee = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
 
     class Meta:
         model = Order
@@ -74,9 +76,22 @@ class OrderListSerializer(TotalShippingFeeMixin, serializers.ModelSerializer):
             "used_points",
             "final_amount",
             "item_count",
+            "first_product_name",
+            "thumbnail_url",
             "created_at",
         ]
 
+    def get_thumbnail_url(self, obj: Order) -> str | None:
+        """대표 이미지 URL (이미지가 없으면 None)"""
+        if not obj.thumbnail_image:
+            return None
+
+        url = default_storage.url(obj.thumbnail_image)
+        request = self.context.get("request")
+        if request:
+            return request.build_absolute_uri(url)
+        return url
+
 
 class OrderDetailSerializer(TotalShippingFeeMixin, serializers.ModelSerializer):
     """
@@ -4,11 +4,12 @@ import decimal
 from typing import Any
 
 from django.contrib.auth import get_user_model
-from django.db.models import Avg
+from django.core.files.storage import default_storage
 
 from rest_framework import serializers
 
 from ..models.product import Category, Product, ProductImage, ProductReview
+from ..services.product_service import ProductService
 
 User = get_user_model()
 
@@ -98,16 +99,15 @@ class ProductListSerializer(serializers.ModelSerializer):
         Returns:
             str: 이미지 URL 또는 None
         """
-        # 상품의 첫번째 이미지를 대표 이미지로 사용
-        first_image = obj.images.first()
-
-        if first_image and first_image.image:
+        # 상품에 저장된 대표 이미지 경로 사용 (이미지 prefetch 없음, 목록 너비 변형 또는 원본)
+        if obj.thumbnail_image:
+            url = default_storage.url(obj.thumbnail_image)
             # request 객체에서 build_absolute_uri 메서드를 사용하여 전체 URL 생성
             request = self.context.get("request")
             if request:
-                return request.build_absolute_uri(first_image.image.url)
+                return request.build_absolute_uri(url)
             # request가 없으면 상대 경로 반환
-            return first_image.image.url
+            return url
 
         # 이미지가 없으면 None 반환 (프론드엔드에서 기본 이미지 처리)
         return None
@@ -126,10 +126,11 @@ class ProductImageSerializer(serializers.ModelSerializer):
     """상품 이미지 Serializer"""
 
     image_url = serializers.SerializerMethodField()
+    variants = serializers.SerializerMethodField(help_text="미리 생성된 변형 목록 (srcset 용)")
 
     class Meta:
         model = ProductImage
-        fields = ["id", "image", "image_url", "alt_text", "order", "is_primary"]
+        fields = ["id", "image", "image_url", "variants", "alt_text", "order", "is_primary"]
 
     def get_image_url(self, obj: ProductImage) -> str | None:
         request = self.context.get("request")
@@ -137,6 +138,19 @@ class ProductImageSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return obj.image.url if obj.image else None
 
+    def get_variants(self, obj: ProductImage) -> list[dict[str, Any]]:
+        """포맷/너비별 변형 URL (images__variants prefetch 시 쿼리 없음)"""
+        request = self.context.get("request")
+        return [
+            {
+                "format": variant.format,
+                "width": variant.width,
+                "height": variant.height,
+                "url": request.build_absolute_uri(variant.file.url) if request else variant.file.url,
+            }
+            for variant in obj.variants.all()
+        ]
+
 
 class ProductReviewSerializer(serializers.ModelSerializer):
     """상품 리뷰"""
@@ -162,7 +176,17 @@ class ProductReviewSerializer(serializers.ModelSerializer):
 
 
 class ProductDetailSerializer(serializers.ModelSerializer):
-    """상품 상세 조회용 Serializer"""
+    """
+    상품 상세 조회용 Serializer
+
+    ProductViewSet.get_detail_queryset()과 함께 사용하면 추가 쿼리 없이 직렬화됩니다.
+    - 최근 리뷰: recent_review_list (작성자 포함 prefetch)
+    - 평점/리뷰 수: Product.rating_count/rating_sum
+    - 판매자 상품 수: ProductService.get_seller_product_count (캐시)
+    """
+
+    # 최근 리뷰 표시 개수
+    RECENT_REVIEW_LIMIT = 10
 
     # 카테고리 정보 - 필요한 필드만 직접 지정
     category_id = serializers.IntegerField(source="category.id", read_only=True)
@@ -181,8 +205,8 @@ class ProductDetailSerializer(serializers.ModelSerializer):
     recent_reviews = serializers.SerializerMethodField()
 
     # 계산 필드
-    average_rating = serializers.SerializerMethodField()
-    review_count = serializers.IntegerField(source="reviews.count", read_only=True)
+    average_rating = serializers.FloatField(source="rating_average", read_only=True)
+    review_count = serializers.IntegerField(source="rating_count", read_only=True)
     stock_status = serializers.ReadOnlyField()
     is_in_stock = serializers.SerializerMethodField()
 
@@ -221,22 +245,15 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ["slug", "created_at", "updated_at"]
 
     def get_seller_product_count(self, obj: Product) -> int:
-        """판매자의 상품 수를 반환"""
-        if obj.seller:
-            return obj.seller.products.filter(is_active=True).count()
-        return 0
+        """판매자의 활성 상품 수를 반환 (캐시)"""
+        return ProductService.get_seller_product_count(obj.seller_id)
 
     def get_recent_reviews(self, obj: Product) -> list[dict[str, Any]]:
-        """최근 리뷰 10개 반환"""
-        recent_reivews = obj.reviews.all().order_by("-created_at")[:10]
-        return ProductReviewSerializer(recent_reivews, many=True, context=self.context).data
-
-    def get_average_rating(self, obj: Product) -> float:
-        """평균 평점 계산"""
-        avg_rating = obj.reviews.aggregate(avg=Avg("rating"))["avg"]
-        return round(avg_rating, 1) if avg_rating else 0.0
-
-
+        """최근 리뷰 10개 반환 (prefetch 되지 않았으면 작성자 JOIN 1쿼리)"""
+        recent_reviews = getattr(obj, "recent_review_list", None)
+        if recent_reviews is None:
+            recent_reviews = obj.reviews.select_related("user").order_by("-created_at")[: self.RECENT_REVIEW_LIMIT]
+        return ProductReviewSerializer(recent_reviews, many=True, context=self.context).data
 
     def get_is_in_stock(self, obj: Product) -> bool:
         """재고 여부"""
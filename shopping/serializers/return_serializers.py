@@ -165,7 +165,7 @@ class ReturnCreateSerializer(serializers.ModelSerializer):
             )
 
             # 판매자에게 알림 발송
-            from shopping.models import Notification
+            from shopping.services.notification_service import NotificationService
 
             # 반품하는 상품들의 판매자 찾기
             sellers = set()
@@ -175,7 +175,7 @@ class ReturnCreateSerializer(serializers.ModelSerializer):
 
             # 각 판매자에게 알림
             for seller in sellers:
-                Notification.objects.create(
+                NotificationService.create(
                     user=seller,  # 판매자에게 알림
                     notification_type="return",
                     title=f"새로운 {return_obj.get_type_display()} 신청",
@@ -194,7 +194,6 @@ class ReturnListSerializer(serializers.ModelSerializer):
     status_display = serializers.CharField(source="get_status_display", read_only=True)
     reason_display = serializers.CharField(source="get_reason_display", read_only=True)
     order_number = serializers.CharField(source="order.order_number", read_only=True)
-    item_count = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = Return
@@ -209,19 +208,12 @@ class ReturnListSerializer(serializers.ModelSerializer):
             "reason_display",
             "order_number",
             "refund_amount",
+            # 목록용 요약 (Return에 비정규화, 반품 상품 조회 없음)
             "item_count",
+            "items_amount",
             "created_at",
         ]
 
-    def get_item_count(self, obj: Return) -> int:
-        """
-        반품 상품 개수
-
-        성능 최적화: prefetch_related된 데이터 사용
-        count()는 DB 쿼리를 유발할 수 있으므로 len() 사용
-        """
-        return len(obj.return_items.all())
-
 
 class ReturnDetailSerializer(serializers.ModelSerializer):
     """교환/환불 상세 Serializer"""
@@ -264,6 +256,8 @@ class ReturnDetailSerializer(serializers.ModelSerializer):
             "refund_account_bank",
             "refund_account_number",
             "refund_account_holder",
+            "refund_status",
+            "refunded_at",
             # 교환 정보
             "exchange_product_info",
             "exchange_shipping_company",
@@ -354,7 +348,7 @@ class ReturnUpdateSerializer(serializers.ModelSerializer):
         instance.save()
 
         # 판매자에게 알림
-        from shopping.models import Notification
+        from shopping.services.notification_service import NotificationService
 
         # 성능 최적화: select_related로 N+1 쿼리 방지
         sellers = set()
@@ -364,7 +358,7 @@ class ReturnUpdateSerializer(serializers.ModelSerializer):
 
         # 각 판매자에게 알림
         for seller in sellers:
-            Notification.objects.create(
+            NotificationService.create(
                 user=seller,  # 판매자에게 알림
                 notification_type="return",
                 title="반품 상품 발송",
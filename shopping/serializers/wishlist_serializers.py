@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from django.core.files.storage import default_storage
+
 from rest_framework import serializers
 
 from shopping.models.product import Product
@@ -15,6 +17,8 @@ class WishlistProductSerializer(serializers.ModelSerializer):
     wishlist_count = serializers.SerializerMethodField()
     discount_rate = serializers.SerializerMethodField()
     primary_image = serializers.SerializerMethodField()
+    # 찜한 일시 (WishlistService.get_list 주석 값)
+    added_at = serializers.DateTimeField(read_only=True)
 
     class Meta:
         model = Product
@@ -29,6 +33,7 @@ class WishlistProductSerializer(serializers.ModelSerializer):
             "is_available",
             "wishlist_count",
             "created_at",
+            "added_at",
         ]
 
     def get_is_available(self, obj: Product) -> bool:
@@ -47,13 +52,8 @@ class WishlistProductSerializer(serializers.ModelSerializer):
         return 0
 
     def get_primary_image(self, obj: Product) -> str | None:
-        """대표 이미지 URL"""
-        primary = obj.images.filter(is_primary=True).first()
-        if primary:
-            return primary.image.url if hasattr(primary.image, "url") else None
-        # 대표 이미지가 없으면 첫 번째 이미지
-        first_image = obj.images.first()
-        return first_image.image.url if first_image and hasattr(first_image.image, "url") else None
+        """대표 이미지 URL (상품에 저장된 목록용 대표 이미지 경로 사용, 이미지 조회 없음)"""
+        return default_storage.url(obj.thumbnail_image) if obj.thumbnail_image else None
 
 
 class WishlistToggleSerializer(serializers.Serializer):
@@ -0,0 +1,264 @@
+"""카테고리 트리 서비스
+
+1) 서브트리 범위
+
+카테고리별 상품 조회가 카테고리 조회 + 하위 카테고리 IN 목록 없이
+상품 쿼리 하나(카테고리 조인 + tree_id/lft 범위 조건)로 끝나도록
+카테고리 ID → 서브트리 범위(CategoryRange) 맵을 프로세스 메모리에 캐시합니다.
+
+기존 방식의 문제:
+- Category.objects.get(pk=...) 1회 + get_descendants(include_self=True) 서브쿼리/IN 목록
+- 카테고리 페이지를 열 때마다 카테고리 테이블 왕복이 추가됨
+
+캐시 방식:
+- 전체 카테고리의 (id, tree_id, lft, rght, is_active)를 한 번에 로드 (카테고리 수는 작음)
+- 카테고리 저장/삭제 시 기존 category_tree_v2 무효화 시그널에서 invalidate() 호출
+  - 현재 프로세스: 맵 즉시 삭제
+  - 다른 프로세스: 공유 캐시의 버전 키가 바뀐 것을 VERSION_CHECK_INTERVAL마다 확인해 다시 로드
+
+2) 카테고리 트리 캐시 (category_tree_v2)와 상품 수 카운터
+
+기존 방식의 문제:
+- Product 저장마다(가격/재고 수정 포함) 트리 캐시 삭제 → 트리 조회 때마다 Count 집계로 재빌드
+
+카운터 방식:
+- Category.active_product_count: 직접 속한 활성 상품 수
+- 상품의 카테고리/활성 상태가 실제로 바뀔 때만 증감 (Product 시그널, 변경 추적)
+- 캐시된 트리는 다시 빌드하지 않고 바뀐 카테고리의 product_count만 커밋 후 갱신 (공유 캐시 잠금 안에서)
+- 카테고리 구조 변경(생성/수정/삭제)만 트리 캐시 삭제
+- 시그널 없는 변경(queryset.update 등)은 매일 verify_product_counts로 보정
+
+사용 예시:
+    category_range = CategoryTreeService.get_range(category_id)   # 맵 적중 시 쿼리 0회
+    if category_range:
+        products = products.filter(category_range.filter_q())
+
+    tree = CategoryTreeService.get_tree()
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from mptt.templatetags.mptt_tags import cache_tree_children
+
+from ..models.product import Category, CategoryRange, Product
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryTreeService:
+    """
+    카테고리 서브트리 범위 캐시 (프로세스 단위) + 카테고리 트리 캐시 / 상품 수 카운터
+
+    캐시 값 형식:
+        범위 맵 (프로세스 메모리): {category_id: CategoryRange(tree_id, lft, rght, is_active)}
+        category_tree_v2 (공유 캐시): [{"id", "name", "slug", "product_count", "children"}, ...]
+    """
+
+    # 다른 프로세스의 트리 변경을 알리는 공유 캐시 키 (값: 임의 버전 문자열)
+    VERSION_KEY = "category_tree_v2:ranges_version"
+    # 공유 버전 확인 주기 (초) - 다른 프로세스의 변경이 반영되기까지의 최대 지연
+    VERSION_CHECK_INTERVAL = 5
+
+    # 카테고리 트리 캐시 (카테고리 구조 변경 시에만 삭제되므로 긴 TTL)
+    TREE_CACHE_KEY = "category_tree_v2"
+    TREE_CACHE_TIMEOUT = 60 * 60  # 1시간
+
+    # 트리 상품 수 갱신(patch_tree_counts) 잠금 - 잠금 만료(초) / 최대 대기(초)
+    PATCH_LOCK_KEY = "category_tree_v2:patch_lock"
+    PATCH_LOCK_TIMEOUT = 10
+    PATCH_LOCK_WAIT = 1.0
+
+    _lock = threading.Lock()
+    _ranges: dict[int, CategoryRange] | None = None
+    _version: str | None = None
+    _checked_at = float("-inf")
+
+    @classmethod
+    def get_range(cls, category_id: int | str | None) -> CategoryRange | None:
+        """
+        카테고리 서브트리 범위 조회
+
+        Args:
+            category_id: 카테고리 ID (쿼리 파라미터 문자열 허용)
+
+        Returns:
+            CategoryRange (없는 카테고리이거나 ID 형식이 잘못되면 None)
+        """
+        try:
+            category_id = int(category_id)
+        except (TypeError, ValueError):
+            return None
+        return cls._get_ranges().get(category_id)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        범위 맵 삭제 (카테고리 저장/삭제 시그널에서 호출)
+
+        트랜잭션 안의 변경은 커밋 전에 다른 스레드가 이전 범위를 다시 읽을 수 있으므로
+        커밋 이후에 한 번 더 삭제합니다.
+        """
+        cls._clear()
+        transaction.on_commit(cls._clear)
+
+    @classmethod
+    def _clear(cls) -> None:
+        with cls._lock:
+            cls._ranges = None
+        cache.set(cls.VERSION_KEY, uuid.uuid4().hex, None)
+
+    @classmethod
+    def _get_ranges(cls) -> dict[int, CategoryRange]:
+        ranges = cls._ranges
+        if ranges is not None and time.monotonic() - cls._checked_at < cls.VERSION_CHECK_INTERVAL:
+            return ranges
+
+        with cls._lock:
+            version = cache.get(cls.VERSION_KEY)
+            if cls._ranges is None or version != cls._version:
+                cls._ranges = {
+                    pk: CategoryRange(tree_id, lft, rght, is_active)
+                    for pk, tree_id, lft, rght, is_active in Category.objects.values_list(
+                        "pk", "tree_id", "lft", "rght", "is_active"
+                    )
+                }
+                cls._version = version
+            cls._checked_at = time.monotonic()
+            return cls._ranges
+
+    # ===== 카테고리 트리 / 상품 수 카운터 =====
+
+    @staticmethod
+    def get_tree() -> list[dict[str, Any]]:
+        """
+        카테고리 트리 조회 (캐시 미스 시 활성 카테고리로 빌드)
+
+        Returns:
+            list: [{"id", "name", "slug", "product_count", "children": [...]}, ...]
+        """
+        tree = cache.get(CategoryTreeService.TREE_CACHE_KEY)
+        if tree is None:
+            tree = CategoryTreeService.build_tree()
+            cache.set(CategoryTreeService.TREE_CACHE_KEY, tree, CategoryTreeService.TREE_CACHE_TIMEOUT)
+        return tree
+
+    @staticmethod
+    def build_tree() -> list[dict[str, Any]]:
+        """활성 카테고리 트리 빌드 (상품 수는 카운터 컬럼 사용, 상품 테이블 조인 없음)"""
+        # MPTT 내장 함수로 get_children() 결과를 미리 채움 (카테고리 쿼리 1회)
+        root_nodes = cache_tree_children(Category.objects.filter(is_active=True))
+
+        def serialize_category(category: Category) -> dict[str, Any]:
+            return {
+                "id": category.id,
+                "name": category.name,
+                "slug": category.slug,
+                "product_count": category.active_product_count,
+                "children": [serialize_category(child) for child in category.get_children()],
+            }
+
+        return [serialize_category(category) for category in root_nodes]
+
+    @staticmethod
+    def apply_product_count_deltas(deltas: Mapping[int, int]) -> None:
+        """
+        카테고리 상품 수 증감 (UPDATE 1회) 후 커밋 시 캐시된 트리 갱신
+
+        Args:
+            deltas: {category_id: 증감 수}
+        """
+        deltas = {category_id: delta for category_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        Category.objects.filter(pk__in=deltas).update(
+            active_product_count=F("active_product_count")
+            + Case(*[When(pk=category_id, then=Value(delta)) for category_id, delta in deltas.items()], default=Value(0))
+        )
+
+        category_ids = list(deltas)
+        transaction.on_commit(lambda: CategoryTreeService.patch_tree_counts(category_ids), robust=True)
+
+    @staticmethod
+    def patch_tree_counts(category_ids: Iterable[int]) -> None:
+        """
+        캐시된 트리에서 해당 카테고리의 product_count만 현재 카운터 값으로 교체
+
+        트리는 캐시 값 하나이므로 읽기-수정-쓰기를 공유 캐시 잠금(PATCH_LOCK_KEY) 안에서 실행합니다.
+        잠금 없이 겹치면 나중에 쓴 쪽이 다른 카테고리의 갱신을 지운 트리로 덮어씁니다.
+        카운터는 잠금을 잡은 뒤 DB에서 읽으므로 커밋 순서와 관계없이 마지막 갱신이 최신 값입니다.
+        잠금을 PATCH_LOCK_WAIT 안에 얻지 못하면 트리 캐시를 삭제해 다음 조회에서 다시 빌드합니다.
+        캐시가 없으면 다음 조회에서 빌드하므로 아무것도 하지 않습니다.
+        """
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + CategoryTreeService.PATCH_LOCK_WAIT
+        while not cache.add(CategoryTreeService.PATCH_LOCK_KEY, token, CategoryTreeService.PATCH_LOCK_TIMEOUT):
+            if time.monotonic() >= deadline:
+                cache.delete(CategoryTreeService.TREE_CACHE_KEY)
+                logger.warning("카테고리 트리 상품 수 갱신 잠금 대기 초과, 트리 캐시 삭제")
+                return
+            time.sleep(0.05)
+
+        try:
+            tree = cache.get(CategoryTreeService.TREE_CACHE_KEY)
+            if tree is None:
+                return
+
+            counts = dict(Category.objects.filter(pk__in=category_ids).values_list("pk", "active_product_count"))
+            stack = list(tree)
+            while stack:
+                node = stack.pop()
+                if node["id"] in counts:
+                    node["product_count"] = counts[node["id"]]
+                stack.extend(node["children"])
+
+            cache.set(CategoryTreeService.TREE_CACHE_KEY, tree, CategoryTreeService.TREE_CACHE_TIMEOUT)
+        finally:
+            # 잠금이 만료되어 다른 프로세스가 잡은 경우 그 잠금은 지우지 않음
+            if cache.get(CategoryTreeService.PATCH_LOCK_KEY) == token:
+                cache.delete(CategoryTreeService.PATCH_LOCK_KEY)
+
+    @staticmethod
+    def verify_product_counts() -> dict[int, tuple[int, int]]:
+        """
+        카테고리 상품 수 정합성 검사 및 보정
+
+        시그널을 거치지 않은 변경(queryset.update, bulk_create 등)으로
+        어긋난 카운터를 실제 활성 상품 수로 맞추고 트리 캐시를 삭제합니다.
+        보정은 상관 서브쿼리 UPDATE 한 번으로 실행해 검사와 보정 사이의 증감을 덮어쓰지 않습니다.
+
+        Returns:
+            dict: 보정한 카테고리 {category_id: (기존 값, 실제 값)}
+        """
+        rows = (
+            Category.objects.annotate(actual_count=Count("products", filter=Q(products__is_active=True)))
+            .order_by()
+            .values_list("pk", "active_product_count", "actual_count")
+        )
+        mismatched = {pk: (stored, actual) for pk, stored, actual in rows if stored != actual}
+
+        if mismatched:
+            active_count = (
+                Product.objects.filter(category=OuterRef("pk"), is_active=True)
+                .order_by()
+                .values("category")
+                .annotate(count=Count("pk"))
+                .values("count")
+            )
+            Category.objects.filter(pk__in=mismatched).update(active_product_count=Coalesce(Subquery(active_count), Value(0)))
+            cache.delete(CategoryTreeService.TREE_CACHE_KEY)
+            logger.warning(f"카테고리 상품 수 보정: {len(mismatched)}개 카테고리, {mismatched}")
+
+        return mismatched
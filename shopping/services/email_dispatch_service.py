@@ -0,0 +1,347 @@
+"""이메일 배치 발송 서비스
+
+기존 방식의 문제:
+- 메일 한 통마다 send_mail → SMTP 연결 생성(TCP + TLS 핸드셰이크 + AUTH) 후 종료
+- 포인트 만료 알림처럼 수천 통을 보낼 때 연결 비용이 발송 시간 대부분을 차지
+
+배치 방식:
+1. 발송할 메일을 Redis 리스트에 적재 (enqueue)
+2. 컨슈머 태스크(send_email_batch)가 EMAIL_BATCH_SIZE개씩 꺼냄 (drain)
+3. 워커 스레드마다 하나씩 유지하는 SMTP 연결로 send_messages 호출
+   - EMAIL_CONNECTION_MAX_AGE초가 지나거나 연결이 끊기면 다시 연결
+4. 제공자 발송 한도를 넘지 않도록 토큰 버킷으로 속도 제한 (EMAIL_RATE_LIMIT_PER_SECOND)
+5. 배치 결과는 EmailLog bulk_update 1회로 기록
+
+사용 예시:
+    entry = EmailEntry(subject="제목", body="본문", to=["user@example.com"])
+
+    # 비동기 발송 (컨슈머 태스크가 배치로 처리)
+    EmailDispatchService.enqueue([entry])
+
+    # 워커 안에서 즉시 배치 발송
+    result = EmailDispatchService.send_batch([entry])
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import smtplib
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from django.conf import settings
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+from django.utils import timezone
+
+from ..models.email_verification import EmailLog
+
+logger = logging.getLogger(__name__)
+
+
+# ===== Data Transfer Objects (DTO) =====
+
+
+@dataclass
+class EmailEntry:
+    """발송 대기 중인 메일 한 통 (대기열에 JSON으로 저장)"""
+
+    subject: str
+    body: str
+    to: list[str]
+    html_body: str | None = None
+    email_log_id: int | None = None
+
+
+@dataclass
+class DispatchResult:
+    """배치 발송 결과 (results는 입력 순서의 성공 여부)"""
+
+    sent: int = 0
+    failed: int = 0
+    results: list[bool] = field(default_factory=list)
+
+
+class RateLimiter:
+    """
+    토큰 버킷 속도 제한 (스레드 안전)
+
+    rate개/초로 토큰이 차고, 최대 rate개까지 모아서 순간적으로 보낼 수 있습니다.
+    rate가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 1개를 얻을 때까지 대기하고 대기한 시간(초)을 반환"""
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class EmailDispatchService:
+    """
+    이메일 배치 발송 서비스
+
+    책임:
+    - 대기열 적재/배출 (Redis 리스트, 없으면 태스크 인자로 직접 전달)
+    - 워커 스레드별 SMTP 연결 재사용
+    - 발송 속도 제한 및 EmailLog 상태 일괄 기록
+    """
+
+    QUEUE_KEY = "email_dispatch:pending"
+    SCHEDULE_KEY = "email_dispatch:scheduled"
+    # 예약 플래그 TTL: 컨슈머가 죽어도 이 시간 이후에는 새 컨슈머가 예약됨
+    SCHEDULE_TTL_MS = 10000
+    # 대기열 적재 후 컨슈머 실행까지 대기 시간 (메일을 모아서 보내기 위함)
+    COLLECT_WINDOW_SECONDS = 1
+
+    _local = threading.local()
+    _limiter: RateLimiter | None = None
+    _limiter_lock = threading.Lock()
+
+    # ===== 설정 =====
+
+    @staticmethod
+    def get_batch_size() -> int:
+        return getattr(settings, "EMAIL_BATCH_SIZE", 50)
+
+    @staticmethod
+    def get_connection_max_age() -> int:
+        return getattr(settings, "EMAIL_CONNECTION_MAX_AGE", 60)
+
+    @staticmethod
+    def get_limiter() -> RateLimiter:
+        """프로세스 공용 속도 제한기 (설정값이 바뀌면 다시 생성)"""
+        rate = getattr(settings, "EMAIL_RATE_LIMIT_PER_SECOND", 0)
+        with EmailDispatchService._limiter_lock:
+            limiter = EmailDispatchService._limiter
+            if limiter is None or limiter.rate != rate:
+                limiter = EmailDispatchService._limiter = RateLimiter(rate)
+        return limiter
+
+    @staticmethod
+    def _get_redis() -> Any | None:
+        """Redis 연결 반환 (Redis 캐시 백엔드가 아니면 None)"""
+        try:
+            from django_redis import get_redis_connection
+
+            return get_redis_connection("default")
+        except (ImportError, NotImplementedError):
+            return None
+
+    # ===== SMTP 연결 =====
+
+    @staticmethod
+    def get_connection() -> Any:
+        """
+        현재 스레드의 메일 연결 반환 (없거나 오래되면 새로 연결)
+
+        연결을 직접 open()하므로 send_messages / send_mail(connection=...)은
+        연결을 닫지 않고 다음 메일에서 재사용합니다.
+        """
+        local = EmailDispatchService._local
+        connection = getattr(local, "connection", None)
+
+        if connection is not None and time.monotonic() - local.opened_at > EmailDispatchService.get_connection_max_age():
+            EmailDispatchService.close_connection()
+            connection = None
+
+        if connection is None:
+            connection = mail.get_connection(fail_silently=False)
+            connection.open()
+            local.connection = connection
+            local.opened_at = time.monotonic()
+
+        return connection
+
+    @staticmethod
+    def close_connection() -> None:
+        """현재 스레드의 메일 연결 종료 (워커 종료/연결 오류 시)"""
+        connection = getattr(EmailDispatchService._local, "connection", None)
+        EmailDispatchService._local.connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception as e:
+                logger.warning(f"메일 연결 종료 실패: {e}")
+
+    # ===== 대기열 =====
+
+    @staticmethod
+    def enqueue(entries: list[EmailEntry]) -> str | None:
+        """
+        메일을 대기열에 적재하고 컨슈머 태스크를 예약
+
+        Redis가 없으면 메일 목록을 인자로 담아 컨슈머 태스크를 바로 발행합니다.
+
+        Returns:
+            컨슈머 태스크 ID (이미 예약된 컨슈머가 있으면 그 ID)
+        """
+        from ..tasks.email_tasks import send_email_batch
+
+        if not entries:
+            return None
+
+        payload = [asdict(entry) for entry in entries]
+        conn = EmailDispatchService._get_redis()
+        if conn is None:
+            return send_email_batch.delay(entries=payload).id
+
+        conn.rpush(EmailDispatchService.QUEUE_KEY, *[json.dumps(item) for item in payload])
+
+        task_id = EmailDispatchService._schedule_consumer(conn)
+        logger.info(f"메일 배치 적재: task_id={task_id}, count={len(entries)}")
+        return task_id
+
+    @staticmethod
+    def reschedule_if_pending() -> str | None:
+        """
+        대기열에 메일이 남아 있으면 컨슈머를 다시 예약
+
+        컨슈머는 한 번 실행에서 최대 max_batches개 배치만 발송하므로 실행 종료 시 호출합니다.
+        (남은 메일이 다음 적재 요청까지 방치되지 않도록)
+        """
+        conn = EmailDispatchService._get_redis()
+        if conn is None or not conn.llen(EmailDispatchService.QUEUE_KEY):
+            return None
+
+        return EmailDispatchService._schedule_consumer(conn)
+
+    @staticmethod
+    def _schedule_consumer(conn: Any) -> str:
+        """예약 플래그를 SET NX로 선점한 경우에만 컨슈머 태스크 발행 (이미 예약되어 있으면 그 ID 반환)"""
+        from ..tasks.email_tasks import send_email_batch
+
+        task_id = str(uuid.uuid4())
+
+        # 선점 실패 후 확인 전에 플래그가 만료(또는 drain에서 삭제)되면 다시 선점 시도 (덮어쓰지 않음)
+        while not conn.set(EmailDispatchService.SCHEDULE_KEY, task_id, nx=True, px=EmailDispatchService.SCHEDULE_TTL_MS):
+            existing = conn.get(EmailDispatchService.SCHEDULE_KEY)
+            if existing is not None:
+                return existing.decode() if isinstance(existing, bytes) else existing
+
+        send_email_batch.apply_async(task_id=task_id, countdown=EmailDispatchService.COLLECT_WINDOW_SECONDS)
+
+        logger.info(f"메일 배치 컨슈머 예약: task_id={task_id}")
+        return task_id
+
+    @staticmethod
+    def drain(max_size: int | None = None) -> list[EmailEntry]:
+        """
+        대기열에서 최대 max_size통을 꺼냄
+
+        예약 플래그를 먼저 삭제하므로, 이후에 적재된 메일은 새 컨슈머가 처리합니다.
+        """
+        conn = EmailDispatchService._get_redis()
+        if conn is None:
+            return []
+
+        conn.delete(EmailDispatchService.SCHEDULE_KEY)
+        raw_entries = conn.lpop(EmailDispatchService.QUEUE_KEY, max_size or EmailDispatchService.get_batch_size()) or []
+        return [EmailEntry(**json.loads(raw)) for raw in raw_entries]
+
+    # ===== 발송 =====
+
+    @staticmethod
+    def build_message(entry: EmailEntry, connection: Any) -> EmailMultiAlternatives:
+        message = EmailMultiAlternatives(
+            subject=entry.subject,
+            body=entry.body,
+            from_email=getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@shopping.com"),
+            to=entry.to,
+            connection=connection,
+        )
+        if entry.html_body:
+            message.attach_alternative(entry.html_body, "text/html")
+        return message
+
+    @staticmethod
+    def _send_one(entry: EmailEntry) -> None:
+        """
+        메일 한 통 발송 (재사용 연결)
+
+        서버가 연결을 끊은 경우(idle 타임아웃 등)에만 새 연결로 한 번 더 시도합니다.
+        """
+        connection = EmailDispatchService.get_connection()
+        try:
+            connection.send_messages([EmailDispatchService.build_message(entry, connection)])
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            EmailDispatchService.close_connection()
+            connection = EmailDispatchService.get_connection()
+            connection.send_messages([EmailDispatchService.build_message(entry, connection)])
+
+    @staticmethod
+    def send_batch(entries: list[EmailEntry]) -> DispatchResult:
+        """
+        메일 목록을 하나의 연결로 발송하고 EmailLog를 일괄 갱신
+
+        한 통의 실패가 나머지 발송을 막지 않도록 메일별로 결과를 기록합니다.
+
+        Args:
+            entries: 발송할 메일 목록
+
+        Returns:
+            DispatchResult: 발송 결과 (입력 순서)
+        """
+        result = DispatchResult()
+        errors: dict[int, str] = {}
+        limiter = EmailDispatchService.get_limiter()
+
+        for entry in entries:
+            limiter.acquire()
+            try:
+                EmailDispatchService._send_one(entry)
+            except Exception as e:
+                logger.error(f"메일 발송 실패: to={entry.to}, error={e}")
+                result.failed += 1
+                result.results.append(False)
+                if entry.email_log_id:
+                    errors[entry.email_log_id] = str(e)
+                continue
+
+            result.sent += 1
+            result.results.append(True)
+
+        EmailDispatchService._update_logs(entries, errors)
+
+        logger.info(f"메일 배치 발송 완료: sent={result.sent}, failed={result.failed}")
+        return result
+
+    @staticmethod
+    def _update_logs(entries: list[EmailEntry], errors: dict[int, str]) -> None:
+        """배치에 포함된 EmailLog 상태를 UPDATE 1회로 기록"""
+        log_ids = [entry.email_log_id for entry in entries if entry.email_log_id]
+        if not log_ids:
+            return
+
+        now = timezone.now()
+        logs = list(EmailLog.objects.filter(id__in=log_ids))
+        for log in logs:
+            if log.id in errors:
+                log.status = "failed"
+                log.error_message = errors[log.id]
+            else:
+                log.status = "sent"
+                log.sent_at = now
+                log.error_message = ""
+
+        EmailLog.objects.bulk_update(logs, ["status", "sent_at", "error_message"])
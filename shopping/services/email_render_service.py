@@ -0,0 +1,127 @@
+"""이메일 템플릿 렌더링 서비스
+
+기존 방식의 문제:
+- 발송마다 render_to_string으로 템플릿 조회 (엔진 → 로더 탐색)
+- 텍스트 본문은 f-string으로 따로 작성 → HTML과 내용이 어긋나고 수신자마다 두 번 조합
+
+렌더링 방식:
+- 컴파일된 Template 객체를 프로세스 단위로 보관 (Django cached loader + 이름별 lru_cache)
+- 대량 발송은 render_many로 같은 Template 하나에 수신자별 context만 바꿔 렌더링
+- HTML을 한 번 렌더링하고 텍스트 본문은 그 결과에서 변환 (렌더링 1회로 두 파트 생성)
+
+사용 예시:
+    rendered = EmailRenderService.render("email/verification.html", {"user": user, ...})
+    send_mail(subject, rendered.text, from_email, [user.email], html_message=rendered.html)
+
+    for rendered in EmailRenderService.render_many("email/point_expiry.html", contexts):
+        ...
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from django.template.loader import get_template
+
+# HTML → 텍스트 변환 규칙
+_DROP_BLOCKS = re.compile(r"<(head|style|script)\b.*?</\1>", re.IGNORECASE | re.DOTALL)
+_LINKS = re.compile(r"<a\b[^>]*href=\"([^\"]*)\"[^>]*>(.*?)</a>", re.IGNORECASE | re.DOTALL)
+_LIST_ITEMS = re.compile(r"<li\b[^>]*>", re.IGNORECASE)
+_LINE_BREAKS = re.compile(r"<br\s*/?>|</(p|div|h[1-6]|li|tr|table|ul|ol)>", re.IGNORECASE)
+_TAGS = re.compile(r"<[^>]+>")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    """렌더링 결과 (텍스트/HTML 파트)"""
+
+    text: str
+    html: str
+
+
+class EmailRenderService:
+    """
+    이메일 템플릿 렌더링 서비스
+
+    Note:
+        템플릿 파일을 수정하면 프로세스(워커)를 재시작하거나 clear_cache()를 호출해야 합니다.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_template(template_name: str) -> Any:
+        """컴파일된 템플릿 반환 (프로세스 캐시)"""
+        return get_template(template_name)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """컴파일된 템플릿 캐시 초기화"""
+        EmailRenderService.get_template.cache_clear()
+
+    @staticmethod
+    def render(template_name: str, context: dict[str, Any]) -> RenderedEmail:
+        """
+        템플릿 한 번 렌더링으로 텍스트/HTML 파트 생성
+
+        Args:
+            template_name: HTML 템플릿 경로
+            context: 템플릿 context
+
+        Returns:
+            RenderedEmail: 텍스트/HTML 본문
+        """
+        rendered_html = EmailRenderService.get_template(template_name).render(context)
+        return RenderedEmail(text=EmailRenderService.html_to_text(rendered_html), html=rendered_html)
+
+    @staticmethod
+    def render_many(
+        template_name: str,
+        contexts: Iterable[dict[str, Any]],
+        shared_context: dict[str, Any] | None = None,
+    ) -> Iterator[RenderedEmail]:
+        """
+        같은 템플릿으로 여러 수신자 렌더링
+
+        Args:
+            template_name: HTML 템플릿 경로
+            contexts: 수신자별 context
+            shared_context: 모든 수신자에게 공통인 context
+
+        Yields:
+            RenderedEmail: contexts 순서대로
+        """
+        template = EmailRenderService.get_template(template_name)
+        shared_context = shared_context or {}
+
+        for context in contexts:
+            rendered_html = template.render({**shared_context, **context})
+            yield RenderedEmail(text=EmailRenderService.html_to_text(rendered_html), html=rendered_html)
+
+    @staticmethod
+    def html_to_text(rendered_html: str) -> str:
+        """
+        렌더링된 HTML을 텍스트 본문으로 변환
+
+        - <head>/<style>/<script> 제거
+        - 링크는 "텍스트 (URL)" 형식 (텍스트가 URL과 같으면 URL만)
+        - 블록 요소/줄바꿈은 개행, 목록 항목은 "- "
+        """
+        text = _DROP_BLOCKS.sub("", rendered_html)
+
+        def link(match: re.Match) -> str:
+            url, label = match.group(1), _TAGS.sub("", match.group(2)).strip()
+            return url if not label or label == url else f"{label} ({url})"
+
+        text = _LINKS.sub(link, text)
+        text = _LIST_ITEMS.sub("- ", text)
+        text = _LINE_BREAKS.sub("\n", text)
+        text = html.unescape(_TAGS.sub("", text))
+
+        lines = [line.strip() for line in text.splitlines()]
+        return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip() + "\n"
@@ -0,0 +1,221 @@
+"""상품 이미지 변형(썸네일) 생성 서비스
+
+기존 방식의 문제:
+- 목록의 thumbnail_image가 업로드 원본 URL → 목록 페이지가 원본 해상도 이미지를 그대로 전송
+- nginx는 media 볼륨의 파일을 리사이즈 없이 서빙
+
+변형 방식:
+1. ProductImage 저장 시 원본 파일이 새로 올라오거나 바뀌면 커밋 후 Celery 태스크 예약 (schedule)
+2. 태스크가 PRODUCT_IMAGE_VARIANT_WIDTHS × PRODUCT_IMAGE_VARIANT_FORMATS 변형을 생성 (generate)
+   - Pillow 렌더링은 프로세스 풀에서 실행 (CPU 작업이 워커의 GIL/이벤트 처리를 막지 않도록)
+   - 원본 디코딩은 한 번, 큰 너비부터 차례로 축소
+3. 결과는 ProductImageVariant에 기록하고 Serializer가 필요한 너비를 골라 사용 (pick)
+
+멱등성:
+- 같은 원본(source_name)으로 이미 만든 (포맷, 너비)는 다시 만들지 않음
+- 파일 경로가 원본 ID/너비/포맷으로 정해져 있어 재시도해도 파일이 쌓이지 않음
+- 원본이 교체되면 이전 원본의 변형(source_name 불일치)은 파일과 함께 삭제 후 다시 생성
+
+사용 예시:
+    # 업로드 후 (ProductImage.save가 자동 호출)
+    ImageVariantService.schedule(product_image.pk)
+
+    # 목록 썸네일 (images__variants prefetch 시 쿼리 없음)
+    url = ImageVariantService.pick_url(product_image, ImageVariantService.LIST_WIDTH)
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+
+from ..models.product import ProductImage, ProductImageVariant
+from ..utils.image_processing import EXTENSIONS, RenderedVariant, render_variants
+from .product_service import ProductService
+
+logger = logging.getLogger(__name__)
+
+
+# ===== Data Transfer Objects (DTO) =====
+
+
+@dataclass
+class VariantResult:
+    """변형 생성 결과"""
+
+    image_id: int
+    created: list[tuple[str, int]] = field(default_factory=list)
+    skipped: int = 0
+    removed: int = 0
+
+
+class ImageVariantService:
+    """
+    상품 이미지 변형 생성/선택 서비스
+
+    책임:
+    - 업로드 후 변형 생성 태스크 예약
+    - 프로세스 풀에서 변형 렌더링 및 저장 (멱등)
+    - Serializer용 변형 선택
+    """
+
+    # 목록 카드 / 상세 화면 기준 너비 (Serializer 기본값)
+    LIST_WIDTH = 400
+    DETAIL_WIDTH = 800
+
+    _executor: ProcessPoolExecutor | None = None
+    _executor_lock = threading.Lock()
+
+    # ===== 설정 =====
+
+    @staticmethod
+    def get_widths() -> list[int]:
+        return sorted(getattr(settings, "PRODUCT_IMAGE_VARIANT_WIDTHS", [200, 400, 800]))
+
+    @staticmethod
+    def get_formats() -> list[str]:
+        """생성할 포맷 (앞쪽이 우선, 뒤쪽은 대체용)"""
+        return list(getattr(settings, "PRODUCT_IMAGE_VARIANT_FORMATS", ["webp", "jpeg"]))
+
+    @staticmethod
+    def get_process_count() -> int:
+        """렌더링 프로세스 수 (0이면 현재 프로세스에서 직접 렌더링)"""
+        return getattr(settings, "PRODUCT_IMAGE_VARIANT_PROCESSES", 2)
+
+    # ===== 생성 =====
+
+    @staticmethod
+    def schedule(image_id: int) -> None:
+        """커밋 후 변형 생성 태스크 발행 (롤백되면 발행하지 않음)"""
+        from ..tasks.product_tasks import generate_product_image_variants
+
+        transaction.on_commit(lambda: generate_product_image_variants.delay(image_id), robust=True)
+
+    @staticmethod
+    def generate(image_id: int, force: bool = False) -> VariantResult:
+        """
+        원본 이미지의 변형 생성 (이미 있는 변형은 건너뜀)
+
+        Args:
+            image_id: ProductImage ID
+            force: True면 기존 변형을 지우고 모두 다시 생성
+
+        Returns:
+            VariantResult: 생성/건너뜀/삭제 수
+
+        Raises:
+            ProductImage.DoesNotExist: 원본 레코드가 없음
+            OSError: 원본 파일을 읽을 수 없음
+        """
+        product_image = ProductImage.objects.get(pk=image_id)
+        result = VariantResult(image_id=image_id)
+        if not product_image.image:
+            return result
+
+        source_name = product_image.image.name
+        existing = list(product_image.variants.all())
+        stale = [variant for variant in existing if force or variant.source_name != source_name]
+        if stale:
+            # 파일 삭제는 post_delete 시그널(delete_variant_file)에서 처리
+            for variant in stale:
+                variant.delete()
+            result.removed = len(stale)
+
+        done = {(variant.format, variant.width) for variant in existing if variant not in stale}
+        specs = [(fmt, width) for width in ImageVariantService.get_widths() for fmt in ImageVariantService.get_formats()]
+        missing = [spec for spec in specs if spec not in done]
+        result.skipped = len(specs) - len(missing)
+        if not missing:
+            return result
+
+        with product_image.image.open("rb") as source:
+            data = source.read()
+        rendered = ImageVariantService._render(data, missing)
+
+        stem = os.path.splitext(os.path.basename(source_name))[0]
+        variants = []
+        for item in rendered:
+            name = f"{product_image.pk}/{stem}_{item.width}w.{EXTENSIONS[item.format]}"
+            variant = ProductImageVariant(
+                image=product_image,
+                format=item.format,
+                width=item.width,
+                height=item.height,
+                size=len(item.content),
+                source_name=source_name,
+            )
+            # 같은 경로의 파일이 남아 있으면(이전 실패 등) 덮어써서 접미사가 붙은 파일이 쌓이지 않도록 함
+            path = variant.file.field.generate_filename(variant, name)
+            variant.file.storage.delete(path)
+            variant.file.save(name, ContentFile(item.content), save=False)
+            variants.append(variant)
+
+        # 동시에 실행된 같은 이미지의 태스크와 겹쳐도 유니크 제약으로 중복 행이 생기지 않음
+        ProductImageVariant.objects.bulk_create(variants, ignore_conflicts=True)
+        result.created = [(variant.format, variant.width) for variant in variants]
+
+        # 목록용 대표 이미지를 원본에서 변형으로 교체
+        ProductService.refresh_thumbnails([product_image.product_id])
+
+        logger.info(
+            f"이미지 변형 생성: image_id={image_id}, created={len(variants)}, "
+            f"skipped={result.skipped}, removed={result.removed}"
+        )
+        return result
+
+    @classmethod
+    def _render(cls, data: bytes, specs: list[tuple[str, int]]) -> list[RenderedVariant]:
+        """프로세스 풀에서 렌더링 (프로세스 수가 0이면 직접 실행)"""
+        processes = cls.get_process_count()
+        if processes <= 0:
+            return render_variants(data, specs)
+
+        with cls._executor_lock:
+            if cls._executor is None:
+                # Celery prefork 워커 안에서도 안전하도록 spawn 사용 (렌더링 모듈은 Django 미사용)
+                cls._executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+            executor = cls._executor
+        return executor.submit(render_variants, data, specs).result()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """프로세스 풀 종료 (워커 종료 시/테스트용)"""
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=True)
+                cls._executor = None
+
+    # ===== 선택 =====
+
+    @staticmethod
+    def pick(product_image: ProductImage, width: int) -> ProductImageVariant | None:
+        """
+        요청 너비에 맞는 변형 선택
+
+        우선 포맷(PRODUCT_IMAGE_VARIANT_FORMATS 첫 번째)부터 찾고,
+        너비 이상인 것 중 가장 작은 변형, 없으면 가장 큰 변형을 반환합니다.
+        원본 교체 후 아직 다시 생성되지 않은 이전 원본의 변형은 제외합니다.
+        images__variants를 prefetch 했다면 쿼리가 발생하지 않습니다.
+        """
+        variants = [variant for variant in product_image.variants.all() if variant.source_name == product_image.image.name]
+        for fmt in ImageVariantService.get_formats():
+            candidates = sorted((variant for variant in variants if variant.format == fmt), key=lambda v: v.width)
+            if candidates:
+                return next((variant for variant in candidates if variant.width >= width), candidates[-1])
+        return None
+
+    @staticmethod
+    def pick_url(product_image: ProductImage, width: int) -> str | None:
+        """요청 너비에 맞는 변형 URL (변형이 아직 없으면 원본 URL)"""
+        variant = ImageVariantService.pick(product_image, width)
+        if variant is not None:
+            return variant.file.url
+        return product_image.image.url if product_image.image else None
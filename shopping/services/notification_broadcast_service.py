@@ -0,0 +1,325 @@
+"""대량 알림 발송(broadcast) 서비스
+
+"20만 명 포인트 만료 예정", "배송 묶음 전체 상태 변경" 같은 캠페인성 알림을
+사용자 한 명씩 create 하지 않고 청크 단위 bulk_create로 삽입합니다.
+
+처리 흐름:
+1. broadcast(): 사용자 queryset(또는 ID 스트림)을 iterator()로 읽으면서
+   CHUNK_SIZE개씩 잘라 notifications 큐에 청크 태스크로 발행
+   - 전체 사용자 목록을 파이썬 메모리에 올리지 않음 (ID만 청크 단위로 보관)
+2. deliver_chunk(): 워커가 청크의 알림을 사용자별로 렌더링하면서
+   bulk_create(batch_size=BATCH_SIZE)로 한 트랜잭션에 삽입
+   - 트랜잭션 단위가 청크이므로 재시도해도 부분 삽입이 남지 않음
+3. 진행 상황은 캐시 카운터(processed/created/chunks_done)로 집계
+
+템플릿:
+    title/message/link는 str.format 문법의 플레이스홀더를 사용할 수 있습니다.
+    - 사용자 필드: {user_id}, {username}, {first_name}, {last_name}
+    - 항목별 값: ID 대신 {"user_id": ..., ...} dict를 넘기면 dict의 키
+    - 공통 값: BroadcastTemplate.context
+
+사용 예시:
+    template = BroadcastTemplate(
+        notification_type="point_expiry",
+        title="포인트 만료 예정 안내",
+        message="{username}님, {amount:,} 포인트가 7일 후 만료됩니다.",
+    )
+    rows = PointHistory.objects.values("user_id").annotate(amount=Sum("points"))
+    result = NotificationBroadcastService.broadcast(rows, template)
+
+    NotificationBroadcastService.get_progress(result.broadcast_id)
+"""
+
+from __future__ import annotations
+
+import logging
+import string
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import QuerySet
+
+from ..models.notification import Notification
+from ..models.user import User
+from .base import ServiceError
+from .notification_inbox_service import NotificationInboxService
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationBroadcastError(ServiceError):
+    """대량 알림 발송 관련 에러"""
+
+    def __init__(self, message: str, code: str = "BROADCAST_ERROR", details: dict | None = None):
+        super().__init__(message, code, details)
+
+
+# ===== Data Transfer Objects (DTO) =====
+
+
+@dataclass
+class BroadcastTemplate:
+    """알림 템플릿 (청크 태스크로 전달되므로 JSON 직렬화 가능한 값만 사용)"""
+
+    notification_type: str
+    title: str
+    message: str = ""
+    link: str = ""
+    metadata: dict[str, Any] = field(default_factory=dict)
+    context: dict[str, Any] = field(default_factory=dict)
+
+    def placeholders(self) -> set[str]:
+        """템플릿에서 사용하는 플레이스홀더 이름"""
+        names = set()
+        for text in (self.title, self.message, self.link):
+            for _, name, _, _ in string.Formatter().parse(text):
+                if name:
+                    names.add(name.split(".")[0].split("[")[0])
+        return names
+
+    def render(self, values: dict[str, Any]) -> Notification:
+        """사용자 한 명의 알림 생성 (저장하지 않음)"""
+        context = {**self.context, **values}
+        return Notification(
+            user_id=values["user_id"],
+            notification_type=self.notification_type,
+            title=self.title.format_map(context)[:100],
+            message=self.message.format_map(context),
+            link=self.link.format_map(context)[:200],
+            metadata=self.metadata,
+        )
+
+
+@dataclass
+class BroadcastResult:
+    """발송 요청 결과"""
+
+    broadcast_id: str
+    total: int
+    chunks: int
+
+
+class NotificationBroadcastService:
+    """
+    대량 알림 발송 서비스
+
+    진행 상황 캐시 형식:
+        notification_broadcast:{id}             → {"total", "chunks", "dispatched"}
+        notification_broadcast:{id}:processed   → 처리한 사용자 수
+        notification_broadcast:{id}:created     → 생성한 알림 수
+        notification_broadcast:{id}:chunks_done → 완료한 청크 수
+    """
+
+    # ===== 정책 상수 =====
+    CHUNK_SIZE = 1000  # 청크 태스크 하나가 처리하는 사용자 수
+    BATCH_SIZE = 500  # bulk_create INSERT 한 번의 행 수
+    ITERATOR_CHUNK_SIZE = 2000  # queryset.iterator() 서버 측 fetch 크기
+
+    PROGRESS_KEY = "notification_broadcast:{broadcast_id}"
+    PROGRESS_TIMEOUT = 60 * 60 * 24  # 1일
+    COUNTERS = ("processed", "created", "chunks_done")
+
+    # 템플릿에서 쓸 수 있는 사용자 필드
+    USER_FIELDS = ("username", "first_name", "last_name")
+
+    # ===== 발행 =====
+
+    @staticmethod
+    def broadcast(
+        recipients: QuerySet | Iterable[int | dict[str, Any]],
+        template: BroadcastTemplate,
+        chunk_size: int | None = None,
+    ) -> BroadcastResult:
+        """
+        대량 알림 발송 시작
+
+        Args:
+            recipients: 사용자 queryset, 사용자 ID 스트림,
+                또는 {"user_id": ..., 템플릿 값...} dict 스트림 (values() queryset 포함)
+            template: 알림 템플릿
+            chunk_size: 청크 크기 (기본: CHUNK_SIZE)
+
+        Returns:
+            BroadcastResult: 발송 ID와 대상 수 (청크 태스크는 비동기 처리)
+        """
+        from ..tasks.notification_tasks import deliver_notification_chunk
+
+        chunk_size = chunk_size or NotificationBroadcastService.CHUNK_SIZE
+        broadcast_id = uuid.uuid4().hex
+        payload = asdict(template)
+
+        # eager 모드에서는 청크가 발행 즉시 실행되므로 카운터를 먼저 생성
+        NotificationBroadcastService._init_progress(broadcast_id)
+
+        total = 0
+        chunks = 0
+        for chunk in NotificationBroadcastService._iter_chunks(recipients, chunk_size):
+            deliver_notification_chunk.delay(broadcast_id, chunk, payload)
+            total += len(chunk)
+            chunks += 1
+
+        cache.set(
+            NotificationBroadcastService._progress_key(broadcast_id),
+            {"total": total, "chunks": chunks, "dispatched": True},
+            NotificationBroadcastService.PROGRESS_TIMEOUT,
+        )
+
+        logger.info(
+            f"[Broadcast] 발행 완료 | broadcast_id={broadcast_id}, type={template.notification_type}, "
+            f"total={total}, chunks={chunks}"
+        )
+
+        return BroadcastResult(broadcast_id=broadcast_id, total=total, chunks=chunks)
+
+    @staticmethod
+    def _iter_chunks(
+        recipients: QuerySet | Iterable[int | dict[str, Any]], chunk_size: int
+    ) -> Iterator[list[int | dict[str, Any]]]:
+        """수신자를 chunk_size개씩 잘라서 반환 (전체 목록을 만들지 않음)"""
+        if isinstance(recipients, QuerySet):
+            if recipients.model is User:
+                recipients = recipients.order_by().values_list("id", flat=True)
+                # PgBouncer transaction pooling 모드는 서버 측 커서가 없어 iterator()가 전체 결과를 한 번에 받음
+                if connections[recipients.db].settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+                    recipients = NotificationBroadcastService._iter_ids_keyset(recipients)
+            if isinstance(recipients, QuerySet):
+                recipients = recipients.iterator(chunk_size=NotificationBroadcastService.ITERATOR_CHUNK_SIZE)
+
+        chunk: list[int | dict[str, Any]] = []
+        for recipient in recipients:
+            chunk.append(recipient)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _iter_ids_keyset(ids: QuerySet) -> Iterator[int]:
+        """id > 마지막 id 조건으로 ITERATOR_CHUNK_SIZE개씩 조회 (쿼리마다 짧은 트랜잭션, 커서 유지 없음)"""
+        last_id = 0
+        while True:
+            batch = list(ids.filter(id__gt=last_id).order_by("id")[: NotificationBroadcastService.ITERATOR_CHUNK_SIZE])
+            yield from batch
+            if len(batch) < NotificationBroadcastService.ITERATOR_CHUNK_SIZE:
+                return
+            last_id = batch[-1]
+
+    # ===== 청크 처리 =====
+
+    @staticmethod
+    def deliver_chunk(broadcast_id: str, recipients: list[int | dict[str, Any]], template: BroadcastTemplate) -> int:
+        """
+        청크 하나의 알림을 렌더링해서 일괄 삽입
+
+        Args:
+            broadcast_id: 발송 ID
+            recipients: 사용자 ID 또는 {"user_id": ...} dict 목록
+            template: 알림 템플릿
+
+        Returns:
+            int: 생성된 알림 수
+        """
+        rows = [r if isinstance(r, dict) else {"user_id": r} for r in recipients]
+        user_ids = [row["user_id"] for row in rows]
+
+        # 존재하는 사용자 + 템플릿이 쓰는 사용자 필드만 조회 (청크당 1회)
+        user_fields = [name for name in NotificationBroadcastService.USER_FIELDS if name in template.placeholders()]
+        users = {user["id"]: user for user in User.objects.filter(id__in=user_ids).values("id", *user_fields)}
+        metadata = {**template.metadata, "broadcast_id": broadcast_id}
+
+        def render() -> Iterator[Notification]:
+            for row in rows:
+                user = users.get(row["user_id"])
+                if user is None:  # 발행 이후 삭제된 사용자
+                    continue
+                notification = template.render({**user, **row})
+                notification.metadata = metadata
+                yield notification
+
+        with transaction.atomic():
+            created = Notification.objects.bulk_create(render(), batch_size=NotificationBroadcastService.BATCH_SIZE)
+            transaction.on_commit(lambda: NotificationInboxService.invalidate(user_ids))
+
+        NotificationBroadcastService._increment(broadcast_id, processed=len(rows), created=len(created), chunks_done=1)
+
+        logger.info(
+            f"[Broadcast] 청크 처리 | broadcast_id={broadcast_id}, recipients={len(rows)}, created={len(created)}"
+        )
+
+        return len(created)
+
+    # ===== 진행 상황 =====
+
+    @staticmethod
+    def _progress_key(broadcast_id: str, counter: str | None = None) -> str:
+        key = NotificationBroadcastService.PROGRESS_KEY.format(broadcast_id=broadcast_id)
+        return f"{key}:{counter}" if counter else key
+
+    @staticmethod
+    def _init_progress(broadcast_id: str) -> None:
+        timeout = NotificationBroadcastService.PROGRESS_TIMEOUT
+        cache.set_many(
+            {
+                NotificationBroadcastService._progress_key(broadcast_id): {"total": 0, "chunks": 0, "dispatched": False},
+                **{
+                    NotificationBroadcastService._progress_key(broadcast_id, counter): 0
+                    for counter in NotificationBroadcastService.COUNTERS
+                },
+            },
+            timeout,
+        )
+
+    @staticmethod
+    def _increment(broadcast_id: str, **deltas: int) -> None:
+        """진행 카운터 증가 (진행 상황 기록 실패가 발송을 막지 않도록 경고만 남김)"""
+        for counter, delta in deltas.items():
+            try:
+                cache.incr(NotificationBroadcastService._progress_key(broadcast_id, counter), delta)
+            except ValueError:
+                logger.warning(f"[Broadcast] 진행 카운터 없음 | broadcast_id={broadcast_id}, counter={counter}")
+
+    @staticmethod
+    def get_progress(broadcast_id: str) -> dict[str, Any]:
+        """
+        발송 진행 상황 조회
+
+        Returns:
+            {"broadcast_id", "status", "total", "chunks", "processed", "created", "chunks_done"}
+
+        Raises:
+            NotificationBroadcastError: 발송 정보가 없는 경우 (만료 포함)
+        """
+        keys = [NotificationBroadcastService._progress_key(broadcast_id)] + [
+            NotificationBroadcastService._progress_key(broadcast_id, counter)
+            for counter in NotificationBroadcastService.COUNTERS
+        ]
+        values = cache.get_many(keys)
+
+        meta = values.get(keys[0])
+        if meta is None:
+            raise NotificationBroadcastError(
+                "발송 정보를 찾을 수 없습니다.",
+                code="BROADCAST_NOT_FOUND",
+                details={"broadcast_id": broadcast_id},
+            )
+
+        progress = {
+            "broadcast_id": broadcast_id,
+            "total": meta["total"],
+            "chunks": meta["chunks"],
+            **{counter: values.get(key, 0) for counter, key in zip(NotificationBroadcastService.COUNTERS, keys[1:])},
+        }
+
+        if not meta["dispatched"]:
+            progress["status"] = "dispatching"
+        elif progress["chunks_done"] >= progress["chunks"]:
+            progress["status"] = "completed"
+        else:
+            progress["status"] = "running"
+
+        return progress
@@ -0,0 +1,177 @@
+"""알림 인박스 캐시 서비스
+
+헤더 알림 배지(읽지 않은 개수 + 최근 N개)를 캐시 조회 1회로 제공합니다.
+
+기존 방식의 문제:
+- 모든 인증 페이지에서 get_unread 호출
+- 매 호출마다 알림 테이블에 COUNT(is_read=False) + LIMIT 쿼리 2회
+
+인박스 캐시:
+- notification_unread:{user_id}: 읽지 않은 알림 수 (쓰기 시점에 incr/decr로 유지)
+- notification_latest:{user_id}: 읽지 않은 최신 알림 LATEST_LIMIT개 (읽기 시점에 채움, 쓰기 시 삭제)
+- 두 키는 get_many 한 번으로 조회
+- 키가 없거나 값이 비정상(음수)이면 DB에서 다시 계산해 채움 (self-healing)
+
+쓰기 규칙:
+- 카운터 조정과 목록 삭제는 트랜잭션 커밋 후에 실행 (롤백 시 카운터 오차 방지)
+- 키가 없으면 incr/decr을 건너뜀 → 다음 조회에서 재계산
+- 관리자 화면 등 서비스를 거치지 않는 변경은 CACHE_TIMEOUT 이내에 재계산으로 보정
+
+사용 예시:
+    # 배지 조회 (캐시 히트 시 쿼리 0회)
+    count, notifications = NotificationInboxService.get_inbox(user.id, limit=5)
+
+    # 쓰기 경로 (NotificationService 내부에서 호출)
+    NotificationInboxService.adjust_on_commit({user.id: 1})
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ..models.notification import Notification
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationInboxService:
+    """
+    사용자별 읽지 않은 알림 카운터 / 최신 목록 캐시
+
+    캐시 값 형식:
+        notification_unread:{user_id} → int
+        notification_latest:{user_id} → list[Notification] (최신순, 최대 LATEST_LIMIT개)
+    """
+
+    UNREAD_KEY = "notification_unread:{user_id}"
+    LATEST_KEY = "notification_latest:{user_id}"
+
+    # 서비스를 거치지 않은 변경이 남아 있을 수 있는 최대 시간
+    CACHE_TIMEOUT = 60 * 15  # 15분
+
+    # 캐시에 보관하는 최신 알림 수 (미리보기 개수보다 크게)
+    LATEST_LIMIT = 20
+
+    # ===== 캐시 키 =====
+
+    @staticmethod
+    def _unread_key(user_id: int) -> str:
+        return NotificationInboxService.UNREAD_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def _latest_key(user_id: int) -> str:
+        return NotificationInboxService.LATEST_KEY.format(user_id=user_id)
+
+    # ===== 조회 =====
+
+    @staticmethod
+    def get_inbox(user_id: int, limit: int) -> tuple[int, list[Notification]]:
+        """
+        읽지 않은 알림 수와 최신 알림 목록 조회
+
+        Args:
+            user_id: 사용자 ID
+            limit: 반환할 알림 수 (LATEST_LIMIT보다 크면 목록은 DB에서 조회)
+
+        Returns:
+            (읽지 않은 알림 수, 최신순 알림 목록)
+        """
+        unread_key = NotificationInboxService._unread_key(user_id)
+        latest_key = NotificationInboxService._latest_key(user_id)
+        cached = cache.get_many([unread_key, latest_key])
+
+        count = cached.get(unread_key)
+        if count is None or count < 0:
+            count = NotificationInboxService._recount(user_id)
+
+        if limit > NotificationInboxService.LATEST_LIMIT:
+            return count, list(NotificationInboxService._unread_queryset(user_id)[:limit])
+
+        latest = cached.get(latest_key)
+        if latest is None:
+            latest = list(NotificationInboxService._unread_queryset(user_id)[: NotificationInboxService.LATEST_LIMIT])
+            cache.set(latest_key, latest, NotificationInboxService.CACHE_TIMEOUT)
+
+        return count, latest[:limit]
+
+    @staticmethod
+    def get_unread_count(user_id: int) -> int:
+        """읽지 않은 알림 수 조회 (캐시 미스 시 재계산)"""
+        count = cache.get(NotificationInboxService._unread_key(user_id))
+        if count is None or count < 0:
+            count = NotificationInboxService._recount(user_id)
+        return count
+
+    @staticmethod
+    def _unread_queryset(user_id: int):
+        return Notification.objects.filter(user_id=user_id, is_read=False).order_by("-created_at")
+
+    @staticmethod
+    def _recount(user_id: int) -> int:
+        """DB에서 다시 계산해 카운터 저장"""
+        count = NotificationInboxService._unread_queryset(user_id).count()
+        cache.set(NotificationInboxService._unread_key(user_id), count, NotificationInboxService.CACHE_TIMEOUT)
+        return count
+
+    # ===== 쓰기 경로 =====
+
+    @staticmethod
+    def adjust(deltas: dict[int, int]) -> None:
+        """
+        사용자별 읽지 않은 알림 수 증감 + 최신 목록 삭제
+
+        Args:
+            deltas: {user_id: 증감량} (0이면 목록만 삭제)
+        """
+        for user_id, delta in deltas.items():
+            if not delta:
+                continue
+            key = NotificationInboxService._unread_key(user_id)
+            try:
+                if delta > 0:
+                    cache.incr(key, delta)
+                else:
+                    cache.decr(key, -delta)
+            except ValueError:
+                # 키가 없으면 다음 조회 시 재계산
+                pass
+            except Exception as e:
+                logger.warning(f"알림 카운터 갱신 실패: user_id={user_id}, error={e}")
+                cache.delete(key)
+
+        NotificationInboxService.invalidate_latest(deltas.keys())
+
+    @staticmethod
+    def adjust_on_commit(deltas: dict[int, int]) -> None:
+        """
+        트랜잭션 커밋 후 카운터 조정
+
+        (트랜잭션 밖에서 호출하면 즉시 조정)
+        """
+        deltas = dict(deltas)
+        transaction.on_commit(lambda: NotificationInboxService.adjust(deltas))
+
+    @staticmethod
+    def invalidate_latest(user_ids: Iterable[int]) -> None:
+        """최신 알림 목록 캐시 삭제 (다음 조회 시 다시 채움)"""
+        keys = [NotificationInboxService._latest_key(user_id) for user_id in user_ids]
+        if keys:
+            cache.delete_many(keys)
+
+    @staticmethod
+    def invalidate(user_ids: Iterable[int]) -> None:
+        """
+        카운터와 최신 목록 모두 삭제 (다음 조회 시 DB에서 재계산)
+
+        대량 발송처럼 사용자 수만큼 incr을 보내는 것보다 삭제 한 번이 싼 경로에서 사용합니다.
+        """
+        keys = []
+        for user_id in user_ids:
+            keys.append(NotificationInboxService._unread_key(user_id))
+            keys.append(NotificationInboxService._latest_key(user_id))
+        if keys:
+            cache.delete_many(keys)
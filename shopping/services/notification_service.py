@@ -22,6 +22,10 @@
         title="주문 완료",
         message="주문이 완료되었습니다.",
     )
+
+캐시:
+    읽지 않은 알림 수와 최신 알림 목록은 NotificationInboxService가 캐시합니다.
+    알림 생성/읽음/삭제는 이 서비스를 거쳐야 카운터가 함께 갱신됩니다.
 """
 
 from __future__ import annotations
@@ -32,12 +36,14 @@ from typing import TYPE_CHECKING
 
 from django.db import transaction
 from django.db.models import QuerySet
+from django.utils import timezone
 
 if TYPE_CHECKING:
     from ..models.user import User
 
 from ..models.notification import Notification
 from .base import ServiceError, log_service_call
+from .notification_inbox_service import NotificationInboxService
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +99,7 @@ class NotificationService:
 
     # ===== 정책 상수 =====
     PREVIEW_LIMIT = 5  # 미리보기 알림 개수
+    BULK_BATCH_SIZE = 500  # bulk_create INSERT 한 번의 행 수
 
     # ===== 알림 조회 =====
 
@@ -116,6 +123,8 @@ class NotificationService:
         """
         읽지 않은 알림 조회
 
+        개수와 최근 N개 모두 인박스 캐시에서 조회합니다 (캐시 히트 시 쿼리 0회).
+
         Args:
             user: 사용자
             limit: 최대 개수 (기본: PREVIEW_LIMIT)
@@ -125,11 +134,7 @@ class NotificationService:
         """
         limit = limit or NotificationService.PREVIEW_LIMIT
 
-        unread_qs = NotificationService.get_queryset(user).filter(is_read=False)
-        count = unread_qs.count()
-
-        # 최근 N개만 미리보기
-        notifications = list(unread_qs[:limit])
+        count, notifications = NotificationInboxService.get_inbox(user.id, limit)
 
         return UnreadResult(count=count, notifications=notifications)
 
@@ -180,7 +185,9 @@ class NotificationService:
         if notification_ids:
             queryset = queryset.filter(id__in=notification_ids)
 
-        count = queryset.update(is_read=True)
+        count = queryset.update(is_read=True, read_at=timezone.now())
+        if count:
+            NotificationInboxService.adjust_on_commit({user.id: -count})
 
         if count == 0:
             message = "읽지 않은 알림이 없습니다."
@@ -212,6 +219,7 @@ class NotificationService:
             return False
 
         notification.mark_as_read()
+        NotificationInboxService.adjust_on_commit({notification.user_id: -1})
 
         logger.info(
             "[Notification] 단일 읽음 처리 | notification_id=%d, user_id=%d",
@@ -239,6 +247,7 @@ class NotificationService:
         read_qs = NotificationService.get_queryset(user).filter(is_read=True)
         count = read_qs.count()
         read_qs.delete()
+        # 읽은 알림만 삭제하므로 읽지 않은 알림 수/최신 목록 캐시는 그대로 유효
 
         message = f"{count}개의 알림을 삭제했습니다."
 
@@ -265,8 +274,12 @@ class NotificationService:
         """
         notification = NotificationService.get_by_id(user, notification_id)
         title = notification.title
+        was_unread = not notification.is_read
         notification.delete()
 
+        if was_unread:
+            NotificationInboxService.adjust_on_commit({user.id: -1})
+
         logger.info(
             "[Notification] 알림 삭제 | user_id=%d, notification_id=%d",
             user.id,
@@ -285,8 +298,8 @@ class NotificationService:
         notification_type: str,
         title: str,
         message: str = "",
-        related_object_id: int | None = None,
-        url: str = "",
+        link: str = "",
+        metadata: dict | None = None,
     ) -> Notification:
         """
         알림 생성
@@ -296,8 +309,8 @@ class NotificationService:
             notification_type: 알림 유형 (order, point, system 등)
             title: 알림 제목
             message: 알림 내용
-            related_object_id: 관련 객체 ID
-            url: 이동 URL
+            link: 이동 링크
+            metadata: 추가 정보 (주문 ID, 상품 ID 등)
 
         Returns:
             Notification: 생성된 알림
@@ -307,9 +320,10 @@ class NotificationService:
             notification_type=notification_type,
             title=title,
             message=message,
-            related_object_id=related_object_id,
-            url=url,
+            link=link,
+            metadata=metadata or {},
         )
+        NotificationInboxService.adjust_on_commit({user.id: 1})
 
         logger.info(
             "[Notification] 알림 생성 | user_id=%d, type=%s, title=%s",
@@ -332,6 +346,9 @@ class NotificationService:
         """
         다수 사용자에게 알림 일괄 생성
 
+        수천 명 이상 캠페인성 발송은 NotificationBroadcastService.broadcast를 사용합니다.
+        (사용자 목록을 메모리에 올리지 않고 Celery 청크로 나눠 처리)
+
         Args:
             users: 사용자 목록
             notification_type: 알림 유형
@@ -351,7 +368,12 @@ class NotificationService:
             for user in users
         ]
 
-        created = Notification.objects.bulk_create(notifications)
+        created = Notification.objects.bulk_create(notifications, batch_size=NotificationService.BULK_BATCH_SIZE)
+
+        deltas: dict[int, int] = {}
+        for notification in created:
+            deltas[notification.user_id] = deltas.get(notification.user_id, 0) + 1
+        NotificationInboxService.adjust_on_commit(deltas)
 
         logger.info(
             "[Notification] 일괄 알림 생성 | count=%d, type=%s, title=%s",
@@ -368,7 +390,7 @@ class NotificationService:
     @log_service_call
     def get_unread_count(user: User) -> int:
         """
-        읽지 않은 알림 개수 조회
+        읽지 않은 알림 개수 조회 (인박스 캐시, 미스 시 재계산)
 
         Args:
             user: 사용자
@@ -376,4 +398,4 @@ class NotificationService:
         Returns:
             int: 읽지 않은 알림 개수
         """
-        return Notification.objects.filter(user=user, is_read=False).count()
+        return NotificationInboxService.get_unread_count(user.id)
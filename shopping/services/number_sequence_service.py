@@ -0,0 +1,93 @@
+"""주문번호/교환·환불 번호 발급 서비스
+
+기존 방식의 문제:
+- 주문번호: post_save 시그널(generate_order_number)에서 PK로 번호를 만들어
+  Order INSERT 직후 UPDATE를 한 번 더 실행
+- 교환/환불 번호: Max(return_number) 조회 후 +1 → 동시 신청 시 같은 번호를 받아
+  unique 제약 위반 발생
+
+PostgreSQL 시퀀스 사용:
+- nextval()은 트랜잭션/행 락과 무관하게 원자적으로 증가 (동시 발급 충돌 없음)
+- INSERT 전에 번호를 받아 레코드를 한 번에 저장
+- 시퀀스는 마이그레이션(0024_number_sequences)에서 생성/삭제
+
+PostgreSQL 이외 DB (SQLite 테스트/로컬 환경):
+- 시퀀스가 없으므로 NumberCounter 행을 UPDATE ... SET value = value + 1로 증가시켜 발급
+- 증가한 행은 트랜잭션이 끝날 때까지 잠기므로 동시 발급도 겹치지 않음
+
+주의:
+- 롤백된 트랜잭션에서 받은 번호는 재사용되지 않음 (번호에 빈 구간이 생길 수 있음)
+  빈 구간 없는 번호는 카운터 행 락이 필요하므로 동시성을 위해 고유성만 보장합니다.
+
+사용 예시:
+    order_number = NumberSequenceService.next_order_number()     # 20250115000042
+    return_number = NumberSequenceService.next_return_number()   # RET20250115000007
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class NumberSequenceService:
+    """PostgreSQL 시퀀스 기반 번호 발급 (그 외 DB는 카운터 테이블)"""
+
+    ORDER_SEQUENCE = "shopping_order_number_seq"
+    RETURN_SEQUENCE = "shopping_return_number_seq"
+
+    @staticmethod
+    def _next_value(sequence: str, using: str = "default") -> int:
+        connection = connections[using]
+        if connection.vendor != "postgresql":
+            return NumberSequenceService._next_counter_value(sequence, using)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT nextval(%s)", [sequence])
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _next_counter_value(sequence: str, using: str) -> int:
+        """카운터 행 증가 후 값 반환 (행이 없으면 1로 생성, 동시 생성 시 다시 증가)"""
+        from shopping.models.number_counter import NumberCounter
+
+        counters = NumberCounter.objects.using(using).filter(name=sequence)
+        with transaction.atomic(using=using):
+            while not counters.update(value=F("value") + 1):
+                _, created = NumberCounter.objects.using(using).get_or_create(name=sequence, defaults={"value": 1})
+                if created:
+                    return 1
+            return counters.values_list("value", flat=True).get()
+
+    @staticmethod
+    def next_order_number(using: str = "default") -> str:
+        """
+        주문번호 발급
+        형식: YYYYMMDD + 일련번호(6자리 이상)
+        예: 20250115000042
+
+        Returns:
+            str: 발급된 주문번호
+        """
+        date_str = timezone.now().strftime("%Y%m%d")
+        value = NumberSequenceService._next_value(NumberSequenceService.ORDER_SEQUENCE, using)
+        return f"{date_str}{value:06d}"
+
+    @staticmethod
+    def next_return_number(using: str = "default") -> str:
+        """
+        교환/환불 번호 발급
+        형식: RET + YYYYMMDD + 일련번호(6자리 이상)
+        예: RET20250115000007
+
+        Returns:
+            str: 발급된 교환/환불 번호
+        """
+        date_str = timezone.now().strftime("%Y%m%d")
+        value = NumberSequenceService._next_value(NumberSequenceService.RETURN_SEQUENCE, using)
+        return f"RET{date_str}{value:06d}"
@@ -0,0 +1,481 @@
+"""주문 배치 처리 서비스 레이어
+
+하이브리드 주문(create_order_hybrid)의 재고 확보를 마이크로 배치로 처리합니다.
+
+기존 방식(process_order_heavy_tasks 단건 처리)의 문제:
+- 주문마다 Order → Cart → Product 순으로 개별 행 락을 획득
+- 같은 인기 상품을 주문한 두 건이 서로 다른 워커에서 실행되면
+  Product 행 락 앞에서 순서대로 대기 (락 hand-off 비용이 처리량을 결정)
+
+배치 방식:
+1. 대기 중인 주문을 Redis 리스트에 적재 (enqueue)
+2. 수 ms 간격으로 컨슈머 태스크가 한 번에 처리 중 리스트로 옮김 (drain, LMOVE)
+   - 커밋 후 처리 중 리스트에서 제거 (ack)
+   - 워커가 커밋 전에 죽어 남은 주문은 주기 태스크가 대기열로 되돌림 (recover_stale)
+3. 배치 전체의 상품을 한 번의 SELECT ... FOR UPDATE로 잠금 (PK 순서 → Deadlock 방지)
+4. 메모리에서 주문 순서(FIFO)대로 재고를 배정하고 주문별로 확정/실패 결정
+5. 재고 차감 1회 UPDATE, OrderItem bulk_create 1회, 상태/주문 요약 bulk UPDATE
+
+사용 예시:
+    entry = OrderBatchEntry(order_id=order.id, cart_id=cart.id, use_points=0)
+    results = OrderBatchService.process_batch([entry])
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from ..models.cart import Cart, CartItem
+from ..models.order import Order, OrderItem
+from ..models.product import Product
+from .order_status_service import OrderStatusService
+from .order_summary_service import OrderSummaryService
+from ..utils.structured_logging import SAMPLED
+from .point_service import PointService
+
+logger = logging.getLogger(__name__)
+
+
+# ===== Data Transfer Objects (DTO) =====
+
+
+@dataclass(frozen=True)
+class OrderBatchEntry:
+    """배치 처리 대기 중인 주문 한 건"""
+
+    order_id: int
+    cart_id: int
+    use_points: int = 0
+
+
+class OrderBatchService:
+    """
+    주문 마이크로 배치 처리 서비스
+
+    책임:
+    - 대기열 적재/배출 (Redis 리스트)
+    - 배치 단위 재고 확보 및 주문 확정/실패 처리
+
+    Note:
+        Redis 캐시 백엔드(django_redis)가 아니면 대기열을 사용할 수 없으며,
+        이 경우 enqueue()는 None을 반환하고 호출자는 단건 태스크로 처리합니다.
+    """
+
+    QUEUE_KEY = "order_batch:pending"
+    # 컨슈머가 꺼냈지만 아직 커밋하지 않은 주문 (리스트) / 꺼낸 시각 (order_id → epoch 초 해시)
+    PROCESSING_KEY = "order_batch:processing"
+    CLAIMED_KEY = "order_batch:claimed"
+    SCHEDULE_KEY = "order_batch:scheduled"
+    # 예약 플래그 TTL: 컨슈머가 죽어도 이 시간 이후에는 새 컨슈머가 예약됨
+    SCHEDULE_TTL_MS = 5000
+
+    # ===== 설정 =====
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """배치 처리 사용 여부 (settings.ORDER_BATCH_ENABLED)"""
+        return getattr(settings, "ORDER_BATCH_ENABLED", False)
+
+    @staticmethod
+    def get_window_ms() -> int:
+        """배치 수집 대기 시간 (ms)"""
+        return getattr(settings, "ORDER_BATCH_WINDOW_MS", 20)
+
+    @staticmethod
+    def get_max_size() -> int:
+        """한 배치에 포함할 최대 주문 수"""
+        return getattr(settings, "ORDER_BATCH_MAX_SIZE", 100)
+
+    @staticmethod
+    def get_processing_timeout() -> int:
+        """꺼낸 뒤 이 시간(초) 안에 ack되지 않은 주문은 컨슈머가 죽은 것으로 보고 대기열로 되돌림"""
+        return getattr(settings, "ORDER_BATCH_PROCESSING_TIMEOUT", 60)
+
+    @staticmethod
+    def _get_connection() -> Any | None:
+        """Redis 연결 반환 (Redis 캐시 백엔드가 아니면 None)"""
+        try:
+            from django_redis import get_redis_connection
+
+            return get_redis_connection("default")
+        except (ImportError, NotImplementedError):
+            return None
+
+    # ===== 대기열 =====
+
+    @staticmethod
+    def enqueue(entry: OrderBatchEntry) -> str | None:
+        """
+        주문을 배치 대기열에 적재하고 컨슈머 태스크를 예약
+
+        이미 예약된 컨슈머가 있으면 새로 예약하지 않고 그 태스크 ID를 반환합니다.
+        (SET NX로 예약 플래그를 선점한 요청만 태스크를 발행)
+
+        Args:
+            entry: 배치 처리할 주문
+
+        Returns:
+            컨슈머 태스크 ID, 대기열을 사용할 수 없으면 None
+        """
+        conn = OrderBatchService._get_connection()
+        if conn is None:
+            return None
+
+        conn.rpush(OrderBatchService.QUEUE_KEY, json.dumps(asdict(entry)))
+
+        task_id = OrderBatchService._schedule_consumer(conn)
+        logger.info("주문 배치 적재: task_id=%s, order_id=%s", task_id, entry.order_id, extra=SAMPLED)
+
+        return task_id
+
+    @staticmethod
+    def reschedule_if_pending() -> str | None:
+        """
+        대기열에 주문이 남아 있으면 컨슈머를 다시 예약
+
+        컨슈머는 한 번 실행에서 최대 max_batches개 배치만 처리하므로,
+        그보다 많이 쌓인 주문이 새 주문 적재 없이도 처리되도록 실행 종료 시 호출합니다.
+
+        Returns:
+            컨슈머 태스크 ID, 남은 주문이 없으면 None
+        """
+        conn = OrderBatchService._get_connection()
+        if conn is None or not conn.llen(OrderBatchService.QUEUE_KEY):
+            return None
+
+        return OrderBatchService._schedule_consumer(conn)
+
+    @staticmethod
+    def _schedule_consumer(conn: Any) -> str:
+        """
+        예약 플래그를 SET NX로 선점한 경우에만 컨슈머 태스크를 발행
+
+        Returns:
+            새로 예약한 태스크 ID, 이미 예약된 컨슈머가 있으면 그 태스크 ID
+        """
+        task_id = str(uuid.uuid4())
+
+        # 선점 실패 후 확인(GET) 전에 플래그가 만료(또는 drain에서 삭제)되면 다시 선점 시도
+        # (덮어쓰기 SET은 다른 요청이 방금 선점한 플래그를 지울 수 있으므로 항상 NX)
+        while not conn.set(OrderBatchService.SCHEDULE_KEY, task_id, nx=True, px=OrderBatchService.SCHEDULE_TTL_MS):
+            existing = conn.get(OrderBatchService.SCHEDULE_KEY)
+            if existing is not None:
+                return existing.decode() if isinstance(existing, bytes) else existing
+
+        from ..tasks.order_tasks import process_order_batch
+
+        process_order_batch.apply_async(
+            task_id=task_id,
+            countdown=OrderBatchService.get_window_ms() / 1000,
+        )
+        logger.info("주문 배치 컨슈머 예약: task_id=%s", task_id, extra=SAMPLED)
+
+        return task_id
+
+    @staticmethod
+    def drain(max_size: int | None = None) -> list[OrderBatchEntry]:
+        """
+        대기열에서 최대 max_size건을 처리 중 리스트로 옮겨서 꺼냄
+
+        꺼내기 전에 예약 플래그를 먼저 삭제합니다.
+        - 삭제 이전에 적재된 주문: 이번 drain에서 함께 꺼내짐
+        - 삭제 이후에 적재된 주문: 새 컨슈머가 예약됨
+        - 컨슈머가 처리 한도까지 꺼내고 남은 주문: 종료 시 reschedule_if_pending()으로 재예약
+        꺼낸 주문은 LPOP으로 지우지 않고 LMOVE로 처리 중 리스트에 옮겨 두므로,
+        커밋 전에 워커가 죽어도 recover_stale()이 대기열로 되돌립니다. (처리 후 ack() 호출)
+        따라서 대기열에 남겨진 채 방치되거나 유실되는 주문이 없습니다.
+
+        Args:
+            max_size: 최대 건수 (기본: ORDER_BATCH_MAX_SIZE)
+
+        Returns:
+            꺼낸 주문 목록 (적재 순서)
+        """
+        conn = OrderBatchService._get_connection()
+        if conn is None:
+            return []
+
+        conn.delete(OrderBatchService.SCHEDULE_KEY)
+
+        pipe = conn.pipeline(transaction=False)
+        for _ in range(max_size or OrderBatchService.get_max_size()):
+            pipe.lmove(OrderBatchService.QUEUE_KEY, OrderBatchService.PROCESSING_KEY, "LEFT", "RIGHT")
+        entries = [OrderBatchEntry(**json.loads(raw)) for raw in pipe.execute() if raw is not None]
+
+        if entries:
+            claimed_at = time.time()
+            conn.hset(OrderBatchService.CLAIMED_KEY, mapping={entry.order_id: claimed_at for entry in entries})
+
+        return entries
+
+    @staticmethod
+    def ack(entries: list[OrderBatchEntry]) -> None:
+        """
+        처리(커밋)가 끝난 주문을 처리 중 리스트에서 제거
+
+        배치 실패로 단건 태스크에 넘긴 주문도 책임이 옮겨졌으므로 ack합니다.
+        """
+        conn = OrderBatchService._get_connection()
+        if conn is None or not entries:
+            return
+
+        pipe = conn.pipeline(transaction=False)
+        for entry in entries:
+            pipe.lrem(OrderBatchService.PROCESSING_KEY, 1, json.dumps(asdict(entry)))
+        pipe.hdel(OrderBatchService.CLAIMED_KEY, *[entry.order_id for entry in entries])
+        pipe.execute()
+
+    @staticmethod
+    def recover_stale() -> int:
+        """
+        ack되지 않은 채 처리 제한 시간이 지난 주문을 대기열로 되돌리고 컨슈머를 예약
+
+        주문 처리는 멱등이므로(pending이 아닌 주문은 already_processed)
+        커밋 후 ack 전에 죽은 컨슈머의 주문을 다시 처리해도 안전합니다.
+        LREM으로 먼저 제거한 쪽만 되돌리므로 ack/다른 복구와 겹쳐도 중복 적재되지 않습니다.
+
+        Returns:
+            대기열로 되돌린 주문 수
+        """
+        conn = OrderBatchService._get_connection()
+        if conn is None:
+            return 0
+
+        deadline = time.time() - OrderBatchService.get_processing_timeout()
+        claimed = {int(order_id): float(at) for order_id, at in conn.hgetall(OrderBatchService.CLAIMED_KEY).items()}
+
+        recovered = []
+        for raw in conn.lrange(OrderBatchService.PROCESSING_KEY, 0, -1):
+            order_id = json.loads(raw)["order_id"]
+            # 꺼낸 시각이 없는 항목은 LMOVE 직후 HSET 전에 죽은 컨슈머의 주문
+            if claimed.get(order_id, float("-inf")) > deadline:
+                continue
+            if conn.lrem(OrderBatchService.PROCESSING_KEY, 1, raw):
+                conn.rpush(OrderBatchService.QUEUE_KEY, raw)
+                recovered.append(order_id)
+
+        if not recovered:
+            return 0
+
+        conn.hdel(OrderBatchService.CLAIMED_KEY, *recovered)
+        OrderBatchService._schedule_consumer(conn)
+        logger.warning("처리 중 멈춘 주문 배치 복구: count=%s, order_ids=%s", len(recovered), recovered)
+        return len(recovered)
+
+    # ===== 배치 처리 =====
+
+    @staticmethod
+    @transaction.atomic
+    def process_batch(entries: list[OrderBatchEntry]) -> list[dict[str, Any]]:
+        """
+        주문 배치의 재고를 한 번에 확보하고 주문별로 확정/실패 처리
+
+        락 획득 순서 (모든 경로에서 동일 → Deadlock 방지):
+        Order(PK 순) → Cart(PK 순) → Product(PK 순) → User(포인트 사용 시)
+
+        Args:
+            entries: 처리할 주문 목록 (같은 주문이 중복되면 첫 항목만 사용)
+
+        Returns:
+            주문별 처리 결과 (entries 순서, 중복 제외)
+            - {"status": "success", "order_id", "order_number"}
+            - {"status": "failed", "reason": "insufficient_stock", "product", "order_id"}
+            - {"status": "failed", "reason": "point_deduction_failed", "message", "order_id"}
+            - {"status": "already_processed", "order_id"}
+            - {"status": "not_found", "order_id"}
+        """
+        # 중복 제거 (입력 순서 유지) + 재고 배정은 주문 ID 순서(FIFO)
+        unique_entries = OrderBatchService._dedupe(entries)
+        if not unique_entries:
+            return []
+
+        logger.info("주문 배치 처리 시작: size=%s", len(unique_entries), extra=SAMPLED)
+
+        # 1. Order 락 (pending이 아닌 주문은 멱등성 처리)
+        orders = {
+            order.pk: order
+            for order in Order.objects.select_for_update().filter(pk__in=[e.order_id for e in unique_entries]).order_by("pk")
+        }
+
+        # 2. Cart 락 + 장바구니 아이템 일괄 조회
+        cart_ids = sorted({e.cart_id for e in unique_entries})
+        list(Cart.objects.select_for_update().filter(pk__in=cart_ids).order_by("pk"))
+
+        items_by_cart: dict[int, list[CartItem]] = defaultdict(list)
+        for cart_item in CartItem.objects.filter(cart_id__in=cart_ids).select_related("product").order_by("product_id"):
+            items_by_cart[cart_item.cart_id].append(cart_item)
+
+        # 3. Product 락 (배치 전체에서 1회)
+        product_ids = sorted({item.product_id for items in items_by_cart.values() for item in items})
+        available_stock = dict(
+            Product.objects.select_for_update().filter(pk__in=product_ids).order_by("pk").values_list("pk", "stock")
+        )
+
+        results: dict[int, dict[str, Any]] = {}
+        stock_deltas: dict[int, int] = defaultdict(int)
+        order_items: list[OrderItem] = []
+        confirmed_ids: list[int] = []
+        failed_orders: list[Order] = []
+        consumed_cart_ids: set[int] = set()
+
+        # 4. 주문 순서대로 재고 배정 (메모리)
+        for entry in sorted(unique_entries, key=lambda e: e.order_id):
+            order = orders.get(entry.order_id)
+
+            if order is None:
+                logger.warning("배치 처리 대상 주문 없음: order_id=%s", entry.order_id)
+                results[entry.order_id] = {"status": "not_found", "order_id": entry.order_id}
+                continue
+
+            if order.status != "pending":
+                logger.warning("이미 처리된 주문: order_id=%s, status=%s", order.id, order.status)
+                results[order.id] = {"status": "already_processed", "order_id": order.id}
+                continue
+
+            # 같은 배치에서 이미 비워진 장바구니는 빈 장바구니로 취급 (순차 처리와 동일)
+            cart_items = [] if entry.cart_id in consumed_cart_ids else items_by_cart.get(entry.cart_id, [])
+
+            shortage = next(
+                (item for item in cart_items if available_stock.get(item.product_id, 0) < item.quantity),
+                None,
+            )
+            if shortage is not None:
+                remaining = available_stock.get(shortage.product_id, 0)
+                logger.error(
+                    "재고 부족: product_id=%s, requested=%s, available=%s",
+                    shortage.product_id,
+                    shortage.quantity,
+                    remaining,
+                )
+                order.status = "failed"
+                order.failure_reason = (
+                    f"재고 부족: {shortage.product.name} " f"(요청: {shortage.quantity}개, 재고: {remaining}개)"
+                )
+                failed_orders.append(order)
+                results[order.id] = {
+                    "status": "failed",
+                    "reason": "insufficient_stock",
+                    "product": shortage.product.name,
+                    "order_id": order.id,
+                }
+                continue
+
+            # 포인트 사용 (실패 시 재고 배정 전이므로 복구할 것이 없음)
+            if entry.use_points > 0:
+                point_result = PointService().use_points_fifo(
+                    user=order.user,
+                    amount=entry.use_points,
+                    type="use",
+                    order=order,
+                    description=f"주문 #{order.order_number} 결제시 사용",
+                    metadata={
+                        "order_id": order.id,
+                        "order_number": order.order_number,
+                    },
+                )
+
+                if not point_result["success"]:
+                    logger.error("포인트 사용 실패: order_id=%s, reason=%s", order.id, point_result["message"])
+                    order.status = "failed"
+                    order.failure_reason = f"포인트 사용 실패: {point_result['message']}"
+                    failed_orders.append(order)
+                    results[order.id] = {
+                        "status": "failed",
+                        "reason": "point_deduction_failed",
+                        "message": point_result["message"],
+                        "order_id": order.id,
+                    }
+                    continue
+
+            for item in cart_items:
+                available_stock[item.product_id] -= item.quantity
+                stock_deltas[item.product_id] += item.quantity
+                order_items.append(
+                    OrderItem(
+                        order=order,
+                        product=item.product,
+                        product_name=item.product.name,
+                        quantity=item.quantity,
+                        price=item.product.price,
+                    )
+                )
+
+            consumed_cart_ids.add(entry.cart_id)
+            confirmed_ids.append(order.id)
+            results[order.id] = {
+                "status": "success",
+                "order_id": order.id,
+                "order_number": order.order_number,
+            }
+
+        # 5. 일괄 반영
+        now = timezone.now()
+
+        if stock_deltas:
+            Product.objects.filter(pk__in=stock_deltas.keys()).update(
+                stock=F("stock")
+                - Case(
+                    *[When(pk=pk, then=Value(quantity)) for pk, quantity in stock_deltas.items()],
+                    output_field=IntegerField(),
+                )
+            )
+
+        if order_items:
+            OrderItem.objects.bulk_create(order_items)
+
+        if confirmed_ids:
+            # 확정 상태 + 목록용 요약(실제 주문 아이템 기준)을 한 번에 기록
+            lines_by_order: dict[int, list[tuple[int, str]]] = defaultdict(list)
+            for order_item in order_items:
+                lines_by_order[order_item.order_id].append((order_item.product_id, order_item.product_name))
+            thumbnails = OrderSummaryService.get_thumbnails(lines[0][0] for lines in lines_by_order.values())
+
+            confirmed_orders = [orders[order_id] for order_id in confirmed_ids]
+            for order in confirmed_orders:
+                order.status = "confirmed"
+                order.updated_at = now
+                for field, value in OrderSummaryService.build(lines_by_order[order.id], thumbnails).items():
+                    setattr(order, field, value)
+            Order.objects.bulk_update(confirmed_orders, ["status", "updated_at", *OrderSummaryService.SUMMARY_FIELDS])
+            CartItem.objects.filter(cart_id__in=consumed_cart_ids).delete()
+
+        if failed_orders:
+            for order in failed_orders:
+                order.updated_at = now
+            Order.objects.bulk_update(failed_orders, ["status", "failure_reason", "updated_at"])
+
+        # 6. 상태 채널에 결과 기록 (커밋 후)
+        OrderStatusService.publish_on_commit([orders[order_id] for order_id in confirmed_ids] + failed_orders)
+
+        logger.info(
+            "주문 배치 처리 완료: size=%s, confirmed=%s, failed=%s, products=%s",
+            len(unique_entries),
+            len(confirmed_ids),
+            len(failed_orders),
+            len(stock_deltas),
+            extra=SAMPLED,
+        )
+
+        return [results[entry.order_id] for entry in unique_entries]
+
+    @staticmethod
+    def _dedupe(entries: list[OrderBatchEntry]) -> list[OrderBatchEntry]:
+        """입력 순서를 유지하면서 중복 주문 제거 (첫 항목 우선)"""
+        seen: set[int] = set()
+        unique = []
+        for entry in entries:
+            if entry.order_id not in seen:
+                seen.add(entry.order_id)
+                unique.append(entry)
+        return unique
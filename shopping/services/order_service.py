@@ -10,6 +10,9 @@ from django.db.models import F
 from ..models.cart import Cart
 from ..models.order import Order, OrderItem
 from ..models.product import Product
+from ..utils.structured_logging import SAMPLED
+from .order_batch_service import OrderBatchEntry, OrderBatchService
+from .order_summary_service import OrderSummaryService
 from .point_service import PointService
 from .shipping_service import ShippingService
 
@@ -62,8 +65,11 @@ class OrderService:
             )
 
         logger.info(
-            f"포인트 사용 검증 통과: user_id={user.id}, use_points={use_points}, "
-            f"user_points={user.points}, total_payment_amount={total_payment_amount}"
+            "포인트 사용 검증 통과: user_id=%s, use_points=%s, user_points=%s, total_payment_amount=%s",
+            user.id,
+            use_points,
+            user.points,
+            total_payment_amount,
         )
 
     @staticmethod
@@ -100,8 +106,11 @@ class OrderService:
             OrderServiceError: 재고 부족 등의 오류
         """
         logger.info(
-            f"주문 생성 시작: user_id={user.id}, cart_id={cart.id}, "
-            f"use_points={use_points}, postal_code={shipping_postal_code}"
+            "주문 생성 시작: user_id=%s, cart_id=%s, use_points=%s, postal_code=%s",
+            user.id,
+            cart.id,
+            use_points,
+            shipping_postal_code,
         )
 
         # 1. 장바구니 락 획득 (동시성 제어)
@@ -113,10 +122,7 @@ class OrderService:
         if not cart.items.exists():
             raise OrderServiceError("장바구니가 비어있습니다.")
 
-        logger.info(
-            f"장바구니 락 획득: cart_id={cart.id}, user_id={user.id}, "
-            f"items_count={cart.items.count()}"
-        )
+        logger.info("장바구니 락 획득: cart_id=%s, user_id=%s", cart.id, user.id)
 
         # 2. 주문 총액 계산
         total_amount = cart.get_total_amount()
@@ -126,10 +132,11 @@ class OrderService:
             total_amount=total_amount, postal_code=shipping_postal_code
         )
         logger.info(
-            f"배송비 계산 완료: total_amount={total_amount}, "
-            f"shipping_fee={shipping_result['shipping_fee']}, "
-            f"additional_fee={shipping_result['additional_fee']}, "
-            f"is_free_shipping={shipping_result['is_free_shipping']}"
+            "배송비 계산 완료: total_amount=%s, shipping_fee=%s, additional_fee=%s, is_free_shipping=%s",
+            total_amount,
+            shipping_result["shipping_fee"],
+            shipping_result["additional_fee"],
+            shipping_result["is_free_shipping"],
         )
 
         # 4. 포인트 사용 검증 (비즈니스 로직)
@@ -141,7 +148,8 @@ class OrderService:
         # 5. 최종 결제 금액 계산 (배송비 포함, 포인트 차감)
         final_amount = max(Decimal("0"), total_payment_amount - Decimal(str(use_points)))
 
-        # 6. 주문 생성
+        # 6. 주문 생성 (목록용 요약 포함)
+        summary = OrderSummaryService.from_cart_items(list(cart.items.select_related("product")))
         order = Order.objects.create(
             user=user,
             status="pending",  # 결제 대기 상태
@@ -157,10 +165,14 @@ class OrderService:
             shipping_address=shipping_address,
             shipping_address_detail=shipping_address_detail,
             order_memo=order_memo,
+            **summary,
         )
         logger.info(
-            f"주문 생성 완료: order_id={order.id}, order_number={order.order_number}, "
-            f"total_amount={total_amount}, final_amount={final_amount}"
+            "주문 생성 완료: order_id=%s, order_number=%s, total_amount=%s, final_amount=%s",
+            order.id,
+            order.order_number,
+            total_amount,
+            final_amount,
         )
 
         # 7. 주문 아이템 생성 + 재고 차감
@@ -172,12 +184,9 @@ class OrderService:
 
         # 9. 장바구니 비우기
         cart.items.all().delete()
-        logger.info(f"장바구니 비우기 완료: cart_id={cart.id}, user_id={user.id}")
+        logger.info("장바구니 비우기 완료: cart_id=%s, user_id=%s", cart.id, user.id)
 
-        logger.info(
-            f"주문 생성 프로세스 완료: order_id={order.id}, order_number={order.order_number}, "
-            f"user_id={user.id}"
-        )
+        logger.info("주문 생성 프로세스 완료: order_id=%s, order_number=%s, user_id=%s", order.id, order.order_number, user.id)
 
         return order
 
@@ -216,7 +225,7 @@ class OrderService:
         Raises:
             OrderServiceError: 장바구니 비어있음, 포인트 부족 등
         """
-        logger.info(f"하이브리드 주문 생성 시작: user_id={user.id}, cart_id={cart.id}")
+        logger.info("하이브리드 주문 생성 시작: user_id=%s, cart_id=%s", user.id, cart.id)
 
         # 1. 사전 검증 (동기)
         if not cart.items.exists():
@@ -247,9 +256,12 @@ class OrderService:
             locked_cart = Cart.objects.select_for_update().get(pk=cart.id)
 
             # 재검증: 트랜잭션 내에서 장바구니가 비어있지 않은지 다시 확인
-            if not locked_cart.items.exists():
+            cart_items = list(locked_cart.items.select_related("product"))
+            if not cart_items:
                 raise OrderServiceError("장바구니가 비어있습니다.")
 
+            # 목록용 요약 (재고 확보 후 실제 주문 아이템 기준으로 다시 기록됨)
+            summary = OrderSummaryService.from_cart_items(cart_items)
             order = Order.objects.create(
                 user=user,
                 status="pending",  # 아직 미확정
@@ -265,11 +277,21 @@ class OrderService:
                 shipping_address=shipping_address,
                 shipping_address_detail=shipping_address_detail,
                 order_memo=order_memo,
+                **summary,
             )
 
-        logger.info(f"Order 레코드 생성 완료: order_id={order.id}, order_number={order.order_number}")
+        logger.info("Order 레코드 생성 완료: order_id=%s, order_number=%s", order.id, order.order_number)
 
         # 6. 무거운 작업은 비동기로 (재고, 포인트)
+        # 배치 처리 활성화 시: 대기열에 적재 → 배치 컨슈머가 묶어서 처리
+        if OrderBatchService.is_enabled():
+            batch_task_id = OrderBatchService.enqueue(
+                OrderBatchEntry(order_id=order.id, cart_id=cart.id, use_points=use_points)
+            )
+            if batch_task_id is not None:
+                logger.info("주문 배치 대기열 적재: order_id=%s, task_id=%s", order.id, batch_task_id)
+                return order, batch_task_id
+
         from ..tasks.order_tasks import process_order_heavy_tasks
 
         task_result = process_order_heavy_tasks.delay(
@@ -278,7 +300,7 @@ class OrderService:
             use_points=use_points
         )
 
-        logger.info(f"주문 비동기 처리 시작: order_id={order.id}, task_id={task_result.id}")
+        logger.info("주문 비동기 처리 시작: order_id=%s, task_id=%s", order.id, task_result.id)
 
         return order, task_result.id
 
@@ -295,10 +317,7 @@ class OrderService:
         Raises:
             OrderServiceError: 재고 부족
         """
-        logger.info(
-            f"주문 아이템 생성 및 재고 차감 시작: order_id={order.id}, "
-            f"cart_items_count={cart.items.count()}"
-        )
+        logger.info("주문 아이템 생성 및 재고 차감 시작: order_id=%s", order.id)
 
         for cart_item in cart.items.all():
             # 재고 최종 확인 (select_for_update로 동시성 제어)
@@ -306,8 +325,11 @@ class OrderService:
 
             if product.stock < cart_item.quantity:
                 logger.error(
-                    f"재고 부족: product_id={product.pk}, product_name={product.name}, "
-                    f"requested={cart_item.quantity}, available={product.stock}"
+                    "재고 부족: product_id=%s, product_name=%s, requested=%s, available=%s",
+                    product.pk,
+                    product.name,
+                    cart_item.quantity,
+                    product.stock,
                 )
                 raise OrderServiceError(
                     f"{product.name}의 재고가 부족합니다. "
@@ -317,8 +339,12 @@ class OrderService:
             # F() 객체를 사용한 안전한 재고 차감
             Product.objects.filter(pk=product.pk).update(stock=F("stock") - cart_item.quantity)
             logger.info(
-                f"재고 차감: product_id={product.pk}, product_name={product.name}, "
-                f"quantity={cart_item.quantity}, previous_stock={product.stock}"
+                "재고 차감: product_id=%s, product_name=%s, quantity=%s, previous_stock=%s",
+                product.pk,
+                product.name,
+                cart_item.quantity,
+                product.stock,
+                extra=SAMPLED,
             )
 
             # OrderItem 생성
@@ -330,11 +356,16 @@ class OrderService:
                 price=cart_item.product.price,
             )
             logger.info(
-                f"주문 아이템 생성: order_id={order.id}, product_id={product.pk}, "
-                f"product_name={product.name}, quantity={cart_item.quantity}, price={cart_item.product.price}"
+                "주문 아이템 생성: order_id=%s, product_id=%s, product_name=%s, quantity=%s, price=%s",
+                order.id,
+                product.pk,
+                product.name,
+                cart_item.quantity,
+                cart_item.product.price,
+                extra=SAMPLED,
             )
 
-        logger.info(f"주문 아이템 생성 및 재고 차감 완료: order_id={order.id}")
+        logger.info("주문 아이템 생성 및 재고 차감 완료: order_id=%s", order.id)
 
     @staticmethod
     def _process_point_usage(
@@ -350,10 +381,7 @@ class OrderService:
             total_amount: 주문 총액
             final_amount: 최종 결제 금액
         """
-        logger.info(
-            f"포인트 사용 처리 시작: user_id={user.id}, order_id={order.id}, "
-            f"use_points={use_points}"
-        )
+        logger.info("포인트 사용 처리 시작: user_id=%s, order_id=%s, use_points=%s", user.id, order.id, use_points)
 
         # 포인트 차감 (FIFO 방식)
         point_service = PointService()
@@ -374,10 +402,7 @@ class OrderService:
         if not result["success"]:
             raise ValueError(f"포인트 사용 실패: {result['message']}")
 
-        logger.info(
-            f"포인트 사용 완료: user_id={user.id}, order_id={order.id}, "
-            f"use_points={use_points}"
-        )
+        logger.info("포인트 사용 완료: user_id=%s, order_id=%s, use_points=%s", user.id, order.id, use_points)
 
     @staticmethod
     @transaction.atomic
@@ -401,14 +426,16 @@ class OrderService:
         # 트랜잭션 내에서 취소 가능 여부 체크
         if not order.can_cancel:
             logger.warning(
-                f"취소 불가능한 주문 취소 시도: order_id={order.id}, "
-                f"status={order.status}, user_id={order.user.id}"
+                "취소 불가능한 주문 취소 시도: order_id=%s, status=%s, user_id=%s", order.id, order.status, order.user.id
             )
             raise OrderServiceError("취소할 수 없는 주문입니다.")
 
         logger.info(
-            f"주문 취소 시작: order_id={order.id}, order_number={order.order_number}, "
-            f"status={order.status}, user_id={order.user.id}"
+            "주문 취소 시작: order_id=%s, order_number=%s, status=%s, user_id=%s",
+            order.id,
+            order.order_number,
+            order.status,
+            order.user.id,
         )
 
         # 주문 상태에 따라 재고/sold_count 복구
@@ -421,22 +448,25 @@ class OrderService:
                         sold_count=F("sold_count") - item.quantity,
                     )
                     logger.info(
-                        f"재고 및 판매량 복구: product_id={item.product.pk}, "
-                        f"product_name={item.product_name}, quantity={item.quantity}"
+                        "재고 및 판매량 복구: product_id=%s, product_name=%s, quantity=%s",
+                        item.product.pk,
+                        item.product_name,
+                        item.quantity,
+                        extra=SAMPLED,
                     )
                 elif order.status == "pending":
                     # pending 상태: 재고만 복구 (sold_count는 아직 증가 안했음)
                     Product.objects.filter(pk=item.product.pk).update(stock=F("stock") + item.quantity)
                     logger.info(
-                        f"재고 복구: product_id={item.product.pk}, "
-                        f"product_name={item.product_name}, quantity={item.quantity}"
+                        "재고 복구: product_id=%s, product_name=%s, quantity=%s",
+                        item.product.pk,
+                        item.product_name,
+                        item.quantity,
+                        extra=SAMPLED,
                     )
 
         # 주문 상태 변경
         order.status = "canceled"
         order.save(update_fields=["status", "updated_at"])
 
-        logger.info(
-            f"주문 취소 완료: order_id={order.id}, order_number={order.order_number}, "
-            f"user_id={order.user.id}"
-        )
+        logger.info("주문 취소 완료: order_id=%s, order_number=%s, user_id=%s", order.id, order.order_number, order.user.id)
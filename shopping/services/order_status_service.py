@@ -0,0 +1,250 @@
+"""주문 처리 상태 채널 서비스
+
+하이브리드 주문(create_order_hybrid)의 처리 결과를 캐시 키 하나로 전달합니다.
+
+기존 방식의 문제:
+- 클라이언트가 /api/orders/{id}/ 를 반복 호출하여 상태 확인
+- 매 호출마다 OrderViewSet.get_queryset (prefetch + Count annotate) 실행
+
+상태 채널:
+- 주문 상태가 바뀌면 스냅샷을 캐시 키(order_status:{id})에 기록 (publish)
+- 상태 조회/롱폴링/SSE는 이 키만 읽음 (캐시 미스 시 단일 컬럼 조회 1회)
+
+사용 예시:
+    # 상태 기록 (트랜잭션 커밋 후)
+    OrderStatusService.publish_on_commit(order)
+
+    # 상태 조회
+    snapshot = OrderStatusService.get(order_id)
+
+    # 롱폴링 (pending에서 바뀔 때까지 최대 10초 대기)
+    snapshot = OrderStatusService.wait(order_id, since_status="pending", timeout=10)
+
+배포:
+- 롱폴링: WSGI(gthread)에서 요청 스레드를 점유하므로 프로세스당 ORDER_STATUS_MAX_WAITERS개까지만 대기
+- SSE: ASGI 서버(docker-compose의 web_stream, nginx가 /status/stream/만 라우팅)에서만 상태 변경을 따라감
+  WSGI로 들어온 요청은 현재 상태 이벤트 하나만 보내고 종료 (EventSource 재연결 = 폴링)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..models.order import Order
+
+logger = logging.getLogger(__name__)
+
+
+class OrderStatusService:
+    """
+    주문 처리 상태 채널
+
+    캐시 스냅샷 형식:
+        {
+            "order_id": int,
+            "order_number": str | None,
+            "status": str,
+            "failure_reason": str,
+            "user_id": int | None,
+        }
+    """
+
+    CACHE_KEY = "order_status:{order_id}"
+    CACHE_TIMEOUT = 60 * 60  # 1시간
+
+    # 처리 중 상태 (이 상태에서 바뀌면 클라이언트에 결과 전달)
+    PROCESSING_STATUSES = ("pending",)
+
+    # 롱폴링/SSE 정책
+    POLL_INTERVAL = 0.2  # 초
+    MAX_WAIT_SECONDS = 25  # 프록시 타임아웃(60초)보다 충분히 짧게
+
+    SNAPSHOT_FIELDS = ("id", "order_number", "status", "failure_reason", "user_id")
+
+    # 롱폴링 중인 요청 수 (프로세스 단위, gthread 워커 스레드 고갈 방지)
+    _waiters = 0
+    _waiters_lock = threading.Lock()
+
+    @staticmethod
+    def get_max_waiters() -> int:
+        """프로세스당 동시에 대기할 수 있는 롱폴링 요청 수 (초과 시 대기 없이 즉시 응답)"""
+        return getattr(settings, "ORDER_STATUS_MAX_WAITERS", 2)
+
+    # ===== 기록 =====
+
+    @staticmethod
+    def _cache_key(order_id: int) -> str:
+        return OrderStatusService.CACHE_KEY.format(order_id=order_id)
+
+    @staticmethod
+    def build_snapshot(order: Order) -> dict[str, Any]:
+        """Order 인스턴스에서 상태 스냅샷 생성"""
+        return {
+            "order_id": order.id,
+            "order_number": order.order_number,
+            "status": order.status,
+            "failure_reason": order.failure_reason,
+            "user_id": order.user_id,
+        }
+
+    @staticmethod
+    def publish(orders: Order | Iterable[Order]) -> None:
+        """
+        주문 상태 스냅샷을 캐시에 기록
+
+        Args:
+            orders: 주문 또는 주문 목록
+        """
+        if isinstance(orders, Order):
+            orders = [orders]
+
+        snapshots = {
+            OrderStatusService._cache_key(order.id): OrderStatusService.build_snapshot(order) for order in orders
+        }
+        if snapshots:
+            cache.set_many(snapshots, OrderStatusService.CACHE_TIMEOUT)
+
+    @staticmethod
+    def publish_on_commit(orders: Order | Iterable[Order]) -> None:
+        """
+        트랜잭션 커밋 후 상태 기록
+
+        롤백된 상태가 클라이언트에 노출되지 않도록 커밋 이후에 기록합니다.
+        (트랜잭션 밖에서 호출하면 즉시 기록)
+        """
+        orders = [orders] if isinstance(orders, Order) else list(orders)
+        transaction.on_commit(lambda: OrderStatusService.publish(orders))
+
+    @staticmethod
+    def invalidate(order_ids: Iterable[int]) -> None:
+        """
+        캐시된 상태 삭제
+
+        queryset.update()처럼 스냅샷을 만들 인스턴스가 없는 경로에서 사용합니다.
+        다음 조회 시 DB에서 다시 채워집니다.
+        """
+        keys = [OrderStatusService._cache_key(order_id) for order_id in order_ids]
+        if keys:
+            cache.delete_many(keys)
+
+    # ===== 조회 =====
+
+    @staticmethod
+    def _load_snapshot(order_id: int) -> dict[str, Any] | None:
+        """캐시 미스 시 상태 컬럼만 조회하여 캐시 채움"""
+        row = Order.objects.filter(pk=order_id).values(*OrderStatusService.SNAPSHOT_FIELDS).first()
+        if row is None:
+            return None
+
+        snapshot = {
+            "order_id": row["id"],
+            "order_number": row["order_number"],
+            "status": row["status"],
+            "failure_reason": row["failure_reason"],
+            "user_id": row["user_id"],
+        }
+        cache.set(OrderStatusService._cache_key(order_id), snapshot, OrderStatusService.CACHE_TIMEOUT)
+        return snapshot
+
+    @staticmethod
+    def get(order_id: int) -> dict[str, Any] | None:
+        """
+        주문 상태 스냅샷 조회
+
+        Returns:
+            스냅샷 dict, 주문이 없으면 None
+        """
+        snapshot = cache.get(OrderStatusService._cache_key(order_id))
+        if snapshot is not None:
+            return snapshot
+        return OrderStatusService._load_snapshot(order_id)
+
+    @staticmethod
+    def wait(order_id: int, since_status: str | None = None, timeout: float = 0) -> dict[str, Any] | None:
+        """
+        롱폴링: 상태가 since_status에서 바뀔 때까지 대기
+
+        캐시 키만 POLL_INTERVAL 간격으로 확인합니다. (DB 조회 없음)
+        대기 중에는 요청 스레드를 점유하므로, 프로세스당 대기 요청이 ORDER_STATUS_MAX_WAITERS개를
+        넘으면 대기하지 않고 현재 스냅샷을 바로 반환합니다. (클라이언트는 다시 폴링)
+
+        Args:
+            order_id: 주문 ID
+            since_status: 클라이언트가 알고 있는 상태 (기본: 처리 중 상태에서 벗어날 때까지)
+            timeout: 최대 대기 시간 (초, MAX_WAIT_SECONDS로 제한)
+
+        Returns:
+            최신 스냅샷 (타임아웃 시 마지막으로 본 스냅샷), 주문이 없으면 None
+        """
+        snapshot = OrderStatusService.get(order_id)
+        if snapshot is None or not OrderStatusService._is_unchanged(snapshot, since_status):
+            return snapshot
+        if not OrderStatusService._acquire_waiter():
+            return snapshot
+
+        try:
+            deadline = time.monotonic() + min(max(timeout, 0), OrderStatusService.MAX_WAIT_SECONDS)
+            while OrderStatusService._is_unchanged(snapshot, since_status) and time.monotonic() < deadline:
+                time.sleep(OrderStatusService.POLL_INTERVAL)
+                snapshot = cache.get(OrderStatusService._cache_key(order_id)) or snapshot
+        finally:
+            OrderStatusService._release_waiter()
+
+        return snapshot
+
+    @classmethod
+    def _acquire_waiter(cls) -> bool:
+        with cls._waiters_lock:
+            if cls._waiters >= cls.get_max_waiters():
+                return False
+            cls._waiters += 1
+            return True
+
+    @classmethod
+    def _release_waiter(cls) -> None:
+        with cls._waiters_lock:
+            cls._waiters -= 1
+
+    @staticmethod
+    async def stream(order_id: int, initial: dict[str, Any], follow: bool = True) -> AsyncIterator[dict[str, Any]]:
+        """
+        SSE용 비동기 스트림: 상태가 바뀔 때마다 스냅샷을 내보냄
+
+        처리 중 상태를 벗어나거나 MAX_WAIT_SECONDS가 지나면 종료합니다.
+        (클라이언트는 EventSource 재연결로 이어서 구독)
+
+        Args:
+            order_id: 주문 ID
+            initial: 권한 확인에 사용한 최초 스냅샷
+            follow: False면 최초 스냅샷만 내보내고 종료
+                (WSGI는 비동기 이터레이터를 끝까지 모아서 응답하므로 대기하지 않음)
+        """
+        snapshot = initial
+        yield snapshot
+        if not follow:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + OrderStatusService.MAX_WAIT_SECONDS
+
+        while snapshot["status"] in OrderStatusService.PROCESSING_STATUSES and loop.time() < deadline:
+            await asyncio.sleep(OrderStatusService.POLL_INTERVAL)
+            latest = await cache.aget(OrderStatusService._cache_key(order_id))
+            if latest is not None and latest != snapshot:
+                snapshot = latest
+                yield snapshot
+
+    @staticmethod
+    def _is_unchanged(snapshot: dict[str, Any], since_status: str | None) -> bool:
+        if since_status is None:
+            return snapshot["status"] in OrderStatusService.PROCESSING_STATUSES
+        return snapshot["status"] == since_status
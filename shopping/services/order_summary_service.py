@@ -0,0 +1,128 @@
+"""주문 목록용 요약 정보 서비스
+
+주문 목록(/api/orders/)이 Order 컬럼만 읽도록 주문 생성 시점에
+아이템 수, 대표 상품명, 대표 이미지를 Order에 함께 저장합니다.
+
+기존 방식의 문제:
+- 목록 조회마다 prefetch_related("order_items__product") + annotate(Count("order_items"))
+- 목록에 표시하지 않는 상품 행까지 모두 로딩 (3쿼리 + GROUP BY)
+
+사용 예시:
+    # 장바구니 아이템으로 요약 생성 (Order INSERT 전에)
+    summary = OrderSummaryService.from_cart_items(cart_items)
+    order = Order.objects.create(..., **summary)
+
+    # 기존 주문 재계산 (관리 명령어, 데이터 보정)
+    OrderSummaryService.refresh(orders)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from ..models.cart import CartItem
+from ..models.order import Order, OrderItem
+from ..models.product import ProductImage
+
+logger = logging.getLogger(__name__)
+
+
+class OrderSummaryService:
+    """주문 요약(item_count, first_product_name, thumbnail_image) 계산"""
+
+    SUMMARY_FIELDS = ("item_count", "first_product_name", "thumbnail_image")
+
+    # 대표 이미지 선택 순서: 대표 이미지 → 표시 순서 → 등록 순서
+    THUMBNAIL_ORDERING = ("product_id", "-is_primary", "order", "created_at")
+
+    @staticmethod
+    def get_thumbnails(product_ids: Iterable[int]) -> dict[int, str]:
+        """
+        상품별 대표 이미지 경로 조회 (1쿼리)
+
+        Returns:
+            {product_id: 이미지 경로} (이미지가 없는 상품은 제외)
+        """
+        product_ids = set(product_ids)
+        if not product_ids:
+            return {}
+
+        thumbnails: dict[int, str] = {}
+        rows = (
+            ProductImage.objects.filter(product_id__in=product_ids)
+            .order_by(*OrderSummaryService.THUMBNAIL_ORDERING)
+            .values_list("product_id", "image")
+        )
+        for product_id, image in rows:
+            thumbnails.setdefault(product_id, image)
+        return thumbnails
+
+    @staticmethod
+    def build(lines: list[tuple[int | None, str]], thumbnails: dict[int, str]) -> dict[str, Any]:
+        """
+        주문 라인 목록으로 요약 생성
+
+        Args:
+            lines: [(product_id, product_name), ...] 주문 아이템 순서
+            thumbnails: get_thumbnails() 결과
+
+        Returns:
+            Order에 저장할 요약 필드 dict
+        """
+        if not lines:
+            return {"item_count": 0, "first_product_name": "", "thumbnail_image": ""}
+
+        first_product_id, first_product_name = lines[0]
+        return {
+            "item_count": len(lines),
+            "first_product_name": first_product_name,
+            "thumbnail_image": thumbnails.get(first_product_id, ""),
+        }
+
+    @staticmethod
+    def from_cart_items(cart_items: list[CartItem]) -> dict[str, Any]:
+        """
+        장바구니 아이템으로 요약 생성 (Order INSERT 전에 호출)
+
+        Args:
+            cart_items: select_related("product")로 조회한 장바구니 아이템
+        """
+        lines = [(item.product_id, item.product.name) for item in cart_items]
+        thumbnails = OrderSummaryService.get_thumbnails([lines[0][0]] if lines else [])
+        return OrderSummaryService.build(lines, thumbnails)
+
+    @staticmethod
+    def refresh(orders: Iterable[Order]) -> int:
+        """
+        주문 아이템 기준으로 요약 재계산 후 일괄 저장
+
+        서비스 레이어를 거치지 않고 생성된 주문(관리 명령어, 데이터 보정)에 사용합니다.
+
+        Returns:
+            int: 갱신된 주문 수
+        """
+        orders = list(orders)
+        if not orders:
+            return 0
+
+        lines_by_order: dict[int, list[tuple[int | None, str]]] = {order.pk: [] for order in orders}
+        for order_id, product_id, product_name in (
+            OrderItem.objects.filter(order_id__in=lines_by_order.keys())
+            .order_by("order_id", "pk")
+            .values_list("order_id", "product_id", "product_name")
+        ):
+            lines_by_order[order_id].append((product_id, product_name))
+
+        thumbnails = OrderSummaryService.get_thumbnails(
+            lines[0][0] for lines in lines_by_order.values() if lines and lines[0][0] is not None
+        )
+
+        for order in orders:
+            for field, value in OrderSummaryService.build(lines_by_order[order.pk], thumbnails).items():
+                setattr(order, field, value)
+
+        Order.objects.bulk_update(orders, OrderSummaryService.SUMMARY_FIELDS)
+        logger.info(f"주문 요약 재계산 완료: count={len(orders)}")
+        return len(orders)
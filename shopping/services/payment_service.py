@@ -12,6 +12,7 @@ from ..models.cart import Cart
 from ..models.order import Order
 from ..models.payment import Payment, PaymentLog
 from ..models.product import Product
+from ..utils.structured_logging import SAMPLED
 from ..utils.toss_payment import TossPaymentClient, TossPaymentError
 from .point_service import PointService
 
@@ -47,8 +48,11 @@ class PaymentService:
             Payment: 생성된 결제 정보
         """
         logger.info(
-            f"결제 정보 생성 시작: order_id={order.id}, order_number={order.order_number}, "
-            f"payment_method={payment_method}, amount={order.final_amount}"
+            "결제 정보 생성 시작: order_id=%s, order_number=%s, payment_method=%s, amount=%s",
+            order.id,
+            order.order_number,
+            payment_method,
+            order.final_amount,
         )
 
         # 동시성 제어: Order를 락으로 보호
@@ -57,7 +61,7 @@ class PaymentService:
         # 기존 Payment가 있으면 삭제 (재시도의 경우)
         existing_count = Payment.objects.filter(order=order).count()
         if existing_count > 0:
-            logger.warning(f"기존 결제 정보 삭제: order_id={order.id}, count={existing_count}")
+            logger.warning("기존 결제 정보 삭제: order_id=%s, count=%s", order.id, existing_count)
             Payment.objects.filter(order=order).delete()
 
         # 새 Payment 생성 (포인트 차감 후 금액으로)
@@ -83,7 +87,7 @@ class PaymentService:
             },
         )
 
-        logger.info(f"결제 정보 생성 완료: payment_id={payment.id}, order_id={order.id}, " f"amount={payment.amount}")
+        logger.info("결제 정보 생성 완료: payment_id=%s, order_id=%s, amount=%s", payment.id, order.id, payment.amount)
 
         return payment
 
@@ -121,28 +125,32 @@ class PaymentService:
         order = payment.order
 
         logger.info(
-            f"결제 승인 시작: payment_id={payment.id}, order_id={order.id}, "
-            f"order_number={order_id}, amount={amount}, user_id={user.id}"
+            "결제 승인 시작: payment_id=%s, order_id=%s, order_number=%s, amount=%s, user_id=%s",
+            payment.id,
+            order.id,
+            order_id,
+            amount,
+            user.id,
         )
 
         # 토스페이먼츠 API 클라이언트
         toss_client = TossPaymentClient()
 
         # 1. 토스페이먼츠에 결제 승인 요청
-        logger.info(f"토스페이먼츠 결제 승인 요청: order_id={order_id}, amount={amount}")
+        logger.info("토스페이먼츠 결제 승인 요청: order_id=%s, amount=%s", order_id, amount)
         payment_data = toss_client.confirm_payment(
             payment_key=payment_key,
             order_id=str(order_id),  # Toss API는 문자열 orderId를 받음
             amount=amount,
         )
-        logger.info(f"토스페이먼츠 결제 승인 성공: payment_id={payment.id}, order_id={order_id}")
+        logger.info("토스페이먼츠 결제 승인 성공: payment_id=%s, order_id=%s", payment.id, order_id)
 
         # 2. Payment 정보 업데이트
         payment.mark_as_paid(payment_data)
-        logger.info(f"결제 정보 업데이트 완료: payment_id={payment.id}, status={payment.status}")
+        logger.info("결제 정보 업데이트 완료: payment_id=%s, status=%s", payment.id, payment.status)
 
         # 3. 재고 차감 (sold_count 증가, Product 락으로 동시성 제어)
-        logger.info(f"판매량 증가 시작: order_id={order.id}")
+        logger.info("판매량 증가 시작: order_id=%s", order.id)
         for order_item in order.order_items.all():
             if order_item.product:
                 # Product를 락으로 보호
@@ -150,18 +158,22 @@ class PaymentService:
                 # sold_count만 증가 (F 객체로 안전하게)
                 Product.objects.filter(pk=product.pk).update(sold_count=F("sold_count") + order_item.quantity)
                 logger.info(
-                    f"판매량 증가: product_id={product.pk}, product_name={product.name}, " f"quantity={order_item.quantity}"
+                    "판매량 증가: product_id=%s, product_name=%s, quantity=%s",
+                    product.pk,
+                    product.name,
+                    order_item.quantity,
+                    extra=SAMPLED,
                 )
 
         # 4. 주문 상태 변경
         order.status = "paid"
         order.payment_method = payment.method
         order.save(update_fields=["status", "payment_method", "updated_at"])
-        logger.info(f"주문 상태 변경: order_id={order.id}, status=paid")
+        logger.info("주문 상태 변경: order_id=%s, status=paid", order.id)
 
         # 5. 장바구니 비활성화
         Cart.objects.filter(user=user, is_active=True).update(is_active=False)
-        logger.info(f"장바구니 비활성화 완료: user_id={user.id}")
+        logger.info("장바구니 비활성화 완료: user_id=%s", user.id)
 
         # 6. 포인트 적립 (순수 상품 금액 기준, 배송비 제외)
         points_to_add = 0
@@ -175,8 +187,11 @@ class PaymentService:
 
             if points_to_add > 0:
                 logger.info(
-                    f"포인트 적립 시작: user_id={user.id}, order_id={order.id}, "
-                    f"points={points_to_add}, earn_rate={earn_rate}%"
+                    "포인트 적립 시작: user_id=%s, order_id=%s, points=%s, earn_rate=%s%%",
+                    user.id,
+                    order.id,
+                    points_to_add,
+                    earn_rate,
                 )
 
                 # 포인트 적립 (PointService 사용)
@@ -209,11 +224,11 @@ class PaymentService:
                     data={"points": points_to_add},
                 )
 
-                logger.info(f"포인트 적립 완료: user_id={user.id}, order_id={order.id}, points={points_to_add}")
+                logger.info("포인트 적립 완료: user_id=%s, order_id=%s, points=%s", user.id, order.id, points_to_add)
         else:
             # 포인트 전액 결제 로그
             if order.used_points > 0:
-                logger.info(f"포인트 전액 결제: user_id={user.id}, order_id={order.id}, " f"used_points={order.used_points}")
+                logger.info("포인트 전액 결제: user_id=%s, order_id=%s, used_points=%s", user.id, order.id, order.used_points)
                 PaymentLog.objects.create(
                     payment=payment,
                     log_type="approve",
@@ -230,7 +245,11 @@ class PaymentService:
         )
 
         logger.info(
-            f"결제 승인 완료: payment_id={payment.id}, order_id={order.id}, " f"amount={amount}, points_earned={points_to_add}"
+            "결제 승인 완료: payment_id=%s, order_id=%s, amount=%s, points_earned=%s",
+            payment.id,
+            order.id,
+            amount,
+            points_to_add,
         )
 
         return {
@@ -265,7 +284,7 @@ class PaymentService:
 
         from ..tasks.payment_tasks import call_toss_confirm_api, finalize_payment_confirm
 
-        logger.info(f"비동기 결제 승인 시작: payment_id={payment.id}")
+        logger.info("비동기 결제 승인 시작: payment_id=%s", payment.id)
 
         # 1. Payment 상태 확인 및 변경 (동시성 제어)
         with transaction.atomic():
@@ -307,7 +326,7 @@ class PaymentService:
             )
             result = task_chain.apply_async()
 
-        logger.info(f"결제 승인 태스크 실행: payment_id={payment.id}, task_id={result.id}")
+        logger.info("결제 승인 태스크 실행: payment_id=%s, task_id=%s", payment.id, result.id)
 
         # 3. 즉시 응답 (사용자는 결과를 WebSocket/Polling으로 확인)
         return {
@@ -337,28 +356,28 @@ class PaymentService:
             Payment.DoesNotExist: 결제 정보를 찾을 수 없음
             PaymentCancelError: 취소 불가능한 상태
         """
-        logger.info(f"결제 취소 시작: payment_id={payment_id}, user_id={user.id}, " f"cancel_reason={cancel_reason}")
+        logger.info("결제 취소 시작: payment_id=%s, user_id=%s, cancel_reason=%s", payment_id, user.id, cancel_reason)
 
         # 1. 동시성 제어: Payment를 락으로 보호하며 조회
         try:
             payment = Payment.objects.select_for_update().get(id=payment_id, order__user=user)
         except Payment.DoesNotExist:
-            logger.error(f"결제 정보를 찾을 수 없음: payment_id={payment_id}, user_id={user.id}")
+            logger.error("결제 정보를 찾을 수 없음: payment_id=%s, user_id=%s", payment_id, user.id)
             raise PaymentCancelError("결제 정보를 찾을 수 없습니다.")
 
         # 2. 중복 취소 방지: 이미 취소된 결제인지 확인
         if payment.is_canceled:
-            logger.warning(f"이미 취소된 결제 취소 시도: payment_id={payment_id}, user_id={user.id}")
+            logger.warning("이미 취소된 결제 취소 시도: payment_id=%s, user_id=%s", payment_id, user.id)
             raise PaymentCancelError("이미 취소된 결제입니다.")
 
         # 3. 취소 가능한 상태인지 확인
         if payment.status != "done":
-            logger.warning(f"취소 불가능한 결제 상태: payment_id={payment_id}, status={payment.status}")
+            logger.warning("취소 불가능한 결제 상태: payment_id=%s, status=%s", payment_id, payment.status)
             raise PaymentCancelError(f"취소할 수 없는 결제 상태입니다: {payment.get_status_display()}")
 
         # 4. Order를 락으로 보호
         order = Order.objects.select_for_update().get(pk=payment.order_id)
-        logger.info(f"결제 취소 검증 완료: payment_id={payment_id}, order_id={order.id}")
+        logger.info("결제 취소 검증 완료: payment_id=%s, order_id=%s", payment_id, order.id)
 
         # 5. 토스페이먼츠 API 클라이언트
         toss_client = TossPaymentClient()
@@ -369,16 +388,16 @@ class PaymentService:
 
         try:
             # 6. 토스페이먼츠에 취소 요청
-            logger.info(f"토스페이먼츠 결제 취소 요청: payment_id={payment_id}, order_id={order.id}")
+            logger.info("토스페이먼츠 결제 취소 요청: payment_id=%s, order_id=%s", payment_id, order.id)
             cancel_data = toss_client.cancel_payment(payment_key=payment.payment_key, cancel_reason=cancel_reason)
-            logger.info(f"토스페이먼츠 결제 취소 성공: payment_id={payment_id}")
+            logger.info("토스페이먼츠 결제 취소 성공: payment_id=%s", payment_id)
 
             # 7. Payment 정보 업데이트
             payment.mark_as_canceled(cancel_data)
-            logger.info(f"결제 정보 업데이트 완료: payment_id={payment_id}, status={payment.status}")
+            logger.info("결제 정보 업데이트 완료: payment_id=%s, status=%s", payment_id, payment.status)
 
             # 8. 재고 복구 (Product 락으로 동시성 제어)
-            logger.info(f"재고 복구 시작: order_id={order.id}")
+            logger.info("재고 복구 시작: order_id=%s", order.id)
             for order_item in order.order_items.all():
                 if order_item.product:  # 상품이 삭제되지 않았다면
                     # Product를 락으로 보호
@@ -389,20 +408,23 @@ class PaymentService:
                         sold_count=Greatest(F("sold_count") - order_item.quantity, 0),
                     )
                     logger.info(
-                        f"재고 및 판매량 복구: product_id={product.pk}, product_name={product.name}, "
-                        f"quantity={order_item.quantity}"
+                        "재고 및 판매량 복구: product_id=%s, product_name=%s, quantity=%s",
+                        product.pk,
+                        product.name,
+                        order_item.quantity,
+                        extra=SAMPLED,
                     )
 
             # 9. 주문 상태 변경
             order.status = "canceled"
             order.save(update_fields=["status", "updated_at"])
-            logger.info(f"주문 상태 변경: order_id={order.id}, status=canceled")
+            logger.info("주문 상태 변경: order_id=%s, status=canceled", order.id)
 
             # 10. 포인트 처리
             # 10-1. 사용한 포인트 환불
             if order.used_points > 0:
                 points_refunded = order.used_points
-                logger.info(f"포인트 환불 시작: user_id={user.id}, order_id={order.id}, " f"points={points_refunded}")
+                logger.info("포인트 환불 시작: user_id=%s, order_id=%s, points=%s", user.id, order.id, points_refunded)
 
                 # 포인트 환불 (PointService 사용)
                 PointService.add_points(
@@ -426,7 +448,7 @@ class PaymentService:
                     data={"points": order.used_points},
                 )
 
-                logger.info(f"포인트 환불 완료: user_id={user.id}, points={points_refunded}")
+                logger.info("포인트 환불 완료: user_id=%s, points=%s", user.id, points_refunded)
 
             # 10-2. 적립된 포인트 차감
             if order.earned_points > 0:
@@ -434,8 +456,10 @@ class PaymentService:
                 user.refresh_from_db()
                 if user.points < order.earned_points:
                     logger.warning(
-                        f"포인트 부족으로 결제 취소 불가: user_id={user.id}, "
-                        f"required={order.earned_points}, available={user.points}"
+                        "포인트 부족으로 결제 취소 불가: user_id=%s, required=%s, available=%s",
+                        user.id,
+                        order.earned_points,
+                        user.points,
                     )
                     raise PaymentCancelError(
                         f"포인트가 부족하여 결제를 취소할 수 없습니다. "
@@ -443,7 +467,7 @@ class PaymentService:
                     )
 
                 points_deducted = order.earned_points
-                logger.info(f"적립 포인트 차감 시작: user_id={user.id}, order_id={order.id}, " f"points={points_deducted}")
+                logger.info("적립 포인트 차감 시작: user_id=%s, order_id=%s, points=%s", user.id, order.id, points_deducted)
 
                 # 포인트 차감 (FIFO 방식)
                 point_service = PointService()
@@ -471,7 +495,7 @@ class PaymentService:
                     data={"points": -order.earned_points},
                 )
 
-                logger.info(f"적립 포인트 차감 완료: user_id={user.id}, points={points_deducted}")
+                logger.info("적립 포인트 차감 완료: user_id=%s, points=%s", user.id, points_deducted)
 
             # 취소 성공 로그
             PaymentLog.objects.create(
@@ -487,9 +511,12 @@ class PaymentService:
             )
 
             logger.info(
-                f"결제 취소 완료: payment_id={payment_id}, order_id={order.id}, "
-                f"canceled_amount={payment.canceled_amount}, "
-                f"points_refunded={points_refunded}, points_deducted={points_deducted}"
+                "결제 취소 완료: payment_id=%s, order_id=%s, canceled_amount=%s, points_refunded=%s, points_deducted=%s",
+                payment_id,
+                order.id,
+                payment.canceled_amount,
+                points_refunded,
+                points_deducted,
             )
 
             # payment 저장 (mark_as_canceled에서 save 호출)
@@ -510,7 +537,7 @@ class PaymentService:
             error_data = {"error_code": e.code, "error_message": e.message}
 
             logger.error(
-                f"토스페이먼츠 결제 취소 실패: payment_id={payment_id}, " f"error_code={e.code}, error_message={e.message}"
+                "토스페이먼츠 결제 취소 실패: payment_id=%s, error_code=%s, error_message=%s", payment_id, e.code, e.message
             )
 
             # 트랜잭션 밖에서 로그 기록
@@ -534,7 +561,7 @@ class PaymentService:
             error_message = f"결제 취소 중 오류 발생: {str(e)}"
             error_data = {"error": str(e)}
 
-            logger.error(f"결제 취소 중 예상치 못한 오류: payment_id={payment_id}, error={str(e)}")
+            logger.error("결제 취소 중 예상치 못한 오류: payment_id=%s, error=%s", payment_id, str(e))
 
             # 트랜잭션 밖에서 로그 기록
             try:
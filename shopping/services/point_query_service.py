@@ -1,6 +1,6 @@
 """
 포인트 조회 관련 비즈니스 로직
-읽기 전용 쿼리: 필터링, 통계, 집계
+읽기 전용 쿼리: 필터링, 통계, 집계 (replica 설정 시 replica에서 조회)
 """
 
 from __future__ import annotations
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any, Optional
 from django.db.models import Count, Q, QuerySet, Sum
 from django.utils import timezone
 
+from shopping.db_router import replica_reads
 from shopping.models.point import PointHistory
 
 if TYPE_CHECKING:
@@ -99,6 +100,7 @@ class PointStatistics:
     by_type: list[dict[str, Any]]
 
 
+@replica_reads
 class PointQueryService:
     """
     포인트 조회 서비스 클래스
@@ -6,6 +6,7 @@ FIFO 방식 포인트 사용 및 만료 처리
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -28,6 +29,8 @@ logger = logging.getLogger(__name__)
 class PointService:
     """포인트 관련 서비스 클래스"""
 
+    EXPIRY_EMAIL_TEMPLATE = "email/point_expiry.html"
+
     @staticmethod
     @transaction.atomic
     def add_points(
@@ -416,87 +419,125 @@ class PointService:
 
     def send_expiry_notifications(self) -> int:
         """
-        만료 예정 포인트 알림 발송
+        만료 예정 포인트 알림 발송 예약
+
+        대상 사용자를 EMAIL_BATCH_SIZE명씩 나눠 청크 태스크(send_expiry_notification_chunk)로 발행합니다.
+        한 태스크에서 전체를 발송 속도 제한에 맞춰 보내면 태스크 시간 제한에 걸려 중간에 종료되고,
+        끝나지 않은 청크의 알림 표시도 저장되지 않으므로 청크마다 발송과 표시를 따로 완료합니다.
 
         Returns:
-            알림 발송 건수
+            알림 대상 사용자 수 (발송 예약 건수)
         """
-        from shopping.tasks import send_email_notification
+        from ..tasks.point_tasks import send_expiry_notification_chunk
+        from .email_dispatch_service import EmailDispatchService
 
-        expiring_points = self.get_expiring_points_soon(days=7)
+        targets = self._group_expiring_points(self.get_expiring_points_soon(days=7))
+        batch_size = EmailDispatchService.get_batch_size()
 
-        # 사용자별로 그룹화
-        user_points = {}
-        for point in expiring_points:
-            user_id = point.user_id
-            if user_id not in user_points:
-                user_points[user_id] = {"user": point.user, "points": [], "total": 0}
-            remaining = self.get_remaining_points(point)
-            if remaining > 0:
-                user_points[user_id]["points"].append(point)
-                user_points[user_id]["total"] += remaining
+        for start in range(0, len(targets), batch_size):
+            chunk = targets[start : start + batch_size]
+            send_expiry_notification_chunk.delay([point.pk for user_data in chunk for point in user_data["points"]])
 
-        notification_count = 0
+        logger.info(f"포인트 만료 알림 예약: users={len(targets)}, chunk_size={batch_size}")
+        return len(targets)
 
-        for user_data in user_points.values():
-            user = user_data["user"]
-            total_expiring = user_data["total"]
+    def send_expiry_notification_chunk(self, point_ids: Iterable[int]) -> int:
+        """
+        만료 예정 알림 청크 발송
 
-            if total_expiring > 0:
-                # 이메일 발송
-                subject = f"포인트 만료 예정 안내 - {total_expiring:,} 포인트"
-                message = self._create_expiry_notification_message(user, user_data["points"], total_expiring)
+        아직 알림을 보내지 않은 포인트만 다시 읽으므로 재시도 시 이미 발송한 사용자는 건너뜁니다.
+        청크 전체를 하나의 SMTP 연결로 발송한 뒤 성공한 사용자의 포인트만 일괄 표시합니다.
 
-                try:
-                    send_email_notification(user.email, subject, message)
+        Args:
+            point_ids: 청크에 포함된 만료 예정 포인트 ID 목록
 
-                    # 알림 발송 표시
-                    for point in user_data["points"]:
-                        point.metadata["expiry_notified"] = True
-                        point.metadata["notified_at"] = timezone.now().isoformat()
-                        point.save(update_fields=["metadata"])
+        Returns:
+            알림 발송 건수
+        """
+        from .email_dispatch_service import EmailDispatchService, EmailEntry
+        from .email_render_service import EmailRenderService
+
+        points = (
+            PointHistory.objects.filter(pk__in=list(point_ids))
+            .exclude(metadata__contains={"expiry_notified": True})
+            .select_related("user")
+        )
+        targets = self._group_expiring_points(points)
 
-                    notification_count += 1
+        # 컴파일된 템플릿 하나로 청크 수신자 렌더링
+        contexts = (
+            self._build_expiry_context(user_data["user"], zip(user_data["points"], user_data["remaining"]), user_data["total"])
+            for user_data in targets
+        )
+        entries = [
+            EmailEntry(
+                subject=f"포인트 만료 예정 안내 - {user_data['total']:,} 포인트",
+                body=rendered.text,
+                to=[user_data["user"].email],
+                html_body=rendered.html,
+            )
+            for user_data, rendered in zip(targets, EmailRenderService.render_many(self.EXPIRY_EMAIL_TEMPLATE, contexts))
+        ]
+        result = EmailDispatchService.send_batch(entries)
+
+        notification_count = 0
+        notified_at = timezone.now().isoformat()
+        notified_points = []
+        for user_data, sent in zip(targets, result.results):
+            user = user_data["user"]
+            if not sent:
+                logger.error(f"알림 발송 실패: User={user.username}")
+                continue
 
-                    logger.info(f"포인트 만료 알림 발송: User={user.username}, " f"points={total_expiring}")
+            for point in user_data["points"]:
+                point.metadata["expiry_notified"] = True
+                point.metadata["notified_at"] = notified_at
+                notified_points.append(point)
 
-                except Exception as e:
-                    logger.error(f"알림 발송 실패: User={user.username}, " f"Error={str(e)}")
+            notification_count += 1
+            logger.info(f"포인트 만료 알림 발송: User={user.username}, " f"points={user_data['total']}")
+
+        PointHistory.objects.bulk_update(notified_points, ["metadata"])
         return notification_count
 
-    def _create_expiry_notification_message(self, user: AbstractBaseUser, points: list[PointHistory], total: int) -> str:
+    def _group_expiring_points(self, points: Iterable[PointHistory]) -> list[dict[str, Any]]:
         """
-        만료 알림 메세지 생성
+        만료 예정 포인트를 사용자별로 묶음 (남은 포인트가 있는 사용자만)
 
-        Args:
-            user: 사용자
-            points: 만료 예정 포인트 리스트
-            total: 총 만료 예정 포인트
         Returns:
-            이메일 메시지
+            [{"user", "points", "remaining", "total"}, ...]
         """
-        message = f"""
-안녕하세요, {user.username}님!
-
-보유하신 포인트 중 일부가 곧 만료될 예정입니다.
-
-[만료 예정 포인트]
-총 {total:,} 포인트
-
-[상세 내역]
-"""
-
+        user_points = {}
         for point in points:
+            user_id = point.user_id
+            if user_id not in user_points:
+                user_points[user_id] = {"user": point.user, "points": [], "remaining": [], "total": 0}
             remaining = self.get_remaining_points(point)
-            expiry_date = point.expires_at.strftime("%Y년 %m월 %d일")
-            message += f"- {remaining:,}P (만료일: {expiry_date})\n"
-
-        message += """
+            if remaining > 0:
+                user_points[user_id]["points"].append(point)
+                user_points[user_id]["remaining"].append(remaining)
+                user_points[user_id]["total"] += remaining
 
-만료되기 전에 사용해 주세요!
+        return [user_data for user_data in user_points.values() if user_data["total"] > 0]
 
-감사합니다.
-쇼핑몰 드림
-"""
+    def _build_expiry_context(
+        self, user: AbstractBaseUser, points: Iterable[tuple[PointHistory, int]], total: int
+    ) -> dict[str, Any]:
+        """
+        만료 알림 템플릿 context 생성
 
-        return message
+        Args:
+            user: 사용자
+            points: (만료 예정 포인트, 남은 포인트) 목록
+            total: 총 만료 예정 포인트
+        Returns:
+            템플릿 context
+        """
+        return {
+            "user": user,
+            "total": f"{total:,}",
+            "points": [
+                {"amount": f"{remaining:,}", "expiry_date": point.expires_at.strftime("%Y년 %m월 %d일")}
+                for point, remaining in points
+            ],
+        }
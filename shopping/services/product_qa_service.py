@@ -42,7 +42,7 @@ class ProductQAService:
         Returns:
             ProductAnswer: 생성된 답변
         """
-        from shopping.models.notification import Notification
+        from shopping.services.notification_service import NotificationService
         from shopping.models.product_qa import ProductAnswer
 
         # 1. 답변 생성
@@ -57,7 +57,7 @@ class ProductQAService:
         question.save(update_fields=["is_answered"])
 
         # 3. 알림 생성
-        Notification.objects.create(
+        NotificationService.create(
             user=question.user,
             notification_type="qa_answer",
             title="상품 문의에 답변이 달렸습니다",
@@ -5,9 +5,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING
 
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Case, CharField, Count, F, IntegerField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
 
 if TYPE_CHECKING:
     from shopping.models.product import ProductImage
@@ -18,6 +22,13 @@ logger = logging.getLogger(__name__)
 class ProductService:
     """상품 관련 서비스 클래스"""
 
+    # 대표 이미지 선택 순서: 대표 이미지 → 표시 순서 → 등록 순서
+    THUMBNAIL_ORDERING = ("product_id", "-is_primary", "order", "created_at")
+
+    # 판매자 활성 상품 수 캐시 (상품 저장/삭제 시 삭제)
+    SELLER_PRODUCT_COUNT_KEY = "seller_product_count:{seller_id}"
+    SELLER_PRODUCT_COUNT_TIMEOUT = 60 * 5  # 5분
+
     @staticmethod
     @transaction.atomic
     def set_primary_image(product_image: ProductImage) -> None:
@@ -57,7 +68,153 @@ class ProductService:
         # 타겟 이미지만 True로 설정 (DB 직접 업데이트로 메모리 불일치 방지)
         ProductImage.objects.filter(pk=product_image.pk).update(is_primary=True)
 
+        # queryset.update는 시그널이 없으므로 목록용 대표 이미지 직접 갱신
+        ProductService.refresh_thumbnails([product_image.product_id])
+
         logger.info(
             f"대표 이미지 설정: product_id={product_image.product_id}, "
             f"image_id={product_image.pk}"
         )
+
+    @staticmethod
+    def refresh_thumbnails(product_ids: Iterable[int]) -> None:
+        """
+        상품 목록용 대표 이미지 경로(Product.thumbnail_image) 갱신 (3쿼리)
+
+        상품 목록이 이미지/변형을 prefetch 하지 않고 Product 컬럼만 읽도록
+        대표 이미지의 목록 너비 변형(없으면 원본) 경로를 상품에 저장합니다.
+
+        호출 시점:
+            - 이미지 추가/수정/삭제 (ProductImage 시그널)
+            - 대표 이미지 변경 (set_primary_image)
+            - 변형 생성 완료 (ImageVariantService.generate)
+
+        Args:
+            product_ids: 갱신할 상품 ID 목록 (이미지가 없는 상품은 빈 문자열)
+        """
+        product_ids = set(product_ids)
+        if not product_ids:
+            return
+
+        from shopping.models.product import Product, ProductImage
+
+        from .image_variant_service import ImageVariantService
+
+        representatives: dict[int, ProductImage] = {}
+        images = (
+            ProductImage.objects.filter(product_id__in=product_ids)
+            .order_by(*ProductService.THUMBNAIL_ORDERING)
+            .prefetch_related("variants")
+        )
+        for image in images:
+            representatives.setdefault(image.product_id, image)
+
+        thumbnails = {}
+        for product_id, image in representatives.items():
+            variant = ImageVariantService.pick(image, ImageVariantService.LIST_WIDTH)
+            thumbnails[product_id] = variant.file.name if variant else image.image.name
+
+        Product.objects.filter(pk__in=product_ids).update(
+            thumbnail_image=Case(
+                *[When(pk=pk, then=Value(name)) for pk, name in thumbnails.items()],
+                default=Value(""),
+                output_field=CharField(),
+            )
+        )
+
+    @staticmethod
+    def apply_review_stat_deltas(deltas: Mapping[int, tuple[int, int]]) -> None:
+        """
+        상품 리뷰 통계(rating_count, rating_sum) 증감
+
+        Args:
+            deltas: {상품 ID: (리뷰 수 증감, 평점 합계 증감)}
+        """
+        from shopping.models.product import Product
+
+        for product_id, (count_delta, sum_delta) in deltas.items():
+            if not count_delta and not sum_delta:
+                continue
+            Product.objects.filter(pk=product_id).update(
+                rating_count=F("rating_count") + count_delta,
+                rating_sum=F("rating_sum") + sum_delta,
+            )
+
+    @staticmethod
+    def refresh_review_stats(product_ids: Iterable[int]) -> None:
+        """
+        상품 리뷰 통계를 리뷰 테이블 기준으로 다시 계산 (UPDATE 1회)
+
+        이전 평점을 알 수 없는 리뷰 수정이나 bulk_create 등 시그널 없는 변경 뒤 보정용입니다.
+        """
+        from shopping.models.product import Product, ProductReview
+
+        stats = ProductReview.objects.filter(product=OuterRef("pk")).order_by().values("product")
+        Product.objects.filter(pk__in=set(product_ids)).update(
+            rating_count=Coalesce(Subquery(stats.annotate(count=Count("pk")).values("count")), Value(0)),
+            rating_sum=Coalesce(Subquery(stats.annotate(total=Sum("rating")).values("total")), Value(0)),
+        )
+
+    @staticmethod
+    def get_seller_product_count(seller_id: int | None) -> int:
+        """판매자의 활성 상품 수 (캐시, 미스 시 COUNT 1쿼리)"""
+        if not seller_id:
+            return 0
+
+        key = ProductService.SELLER_PRODUCT_COUNT_KEY.format(seller_id=seller_id)
+        count = cache.get(key)
+        if count is None:
+            from shopping.models.product import Product
+
+            count = Product.objects.filter(seller_id=seller_id, is_active=True).count()
+            cache.set(key, count, ProductService.SELLER_PRODUCT_COUNT_TIMEOUT)
+        return count
+
+    @staticmethod
+    def invalidate_seller_product_count(seller_id: int) -> None:
+        cache.delete(ProductService.SELLER_PRODUCT_COUNT_KEY.format(seller_id=seller_id))
+
+    @staticmethod
+    @transaction.atomic
+    def apply_stock_deltas(deltas: Mapping[int, int]) -> None:
+        """
+        여러 상품의 재고를 한 번에 증감
+
+        교환/환불처럼 여러 상품 재고를 함께 바꾸는 흐름에서 사용합니다.
+        상품마다 read-modify-write(product.stock += n; save())를 하면
+        동시에 F("stock") - n으로 차감하는 주문과 섞여 갱신이 유실될 수 있습니다.
+
+        동시성 안전성:
+            - select_for_update()로 id 순서대로 잠금 획득 (다른 배치/주문 흐름과 같은 순서 → deadlock 방지)
+            - 잠금 후 재고 부족 여부를 확인하고 UPDATE 1회(CASE WHEN)로 반영
+
+        Args:
+            deltas: {상품 ID: 증감량} (양수: 복구, 음수: 차감, 0은 무시)
+
+        Raises:
+            ValueError: 차감 후 재고가 음수가 되는 상품이 있는 경우
+        """
+        deltas = {pk: delta for pk, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        from shopping.models.product import Product
+
+        current_stock = dict(
+            Product.objects.select_for_update().filter(pk__in=deltas.keys()).order_by("pk").values_list("pk", "stock")
+        )
+
+        short_ids = [pk for pk, delta in deltas.items() if pk in current_stock and current_stock[pk] + delta < 0]
+        if short_ids:
+            short_names = Product.objects.filter(pk__in=short_ids).order_by("pk").values_list("name", flat=True)
+            raise ValueError(f"재고가 부족합니다: {', '.join(short_names)}")
+
+        Product.objects.filter(pk__in=current_stock.keys()).update(
+            stock=F("stock")
+            + Case(
+                *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+                output_field=IntegerField(),
+            )
+        )
+
+        logger.info(f"재고 일괄 반영: products={len(current_stock)}, deltas={deltas}")
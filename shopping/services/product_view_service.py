@@ -0,0 +1,247 @@
+"""상품 조회수 집계 / 인기 급상승(trending) 서비스
+
+상세 조회마다 Product 행을 UPDATE 하면 인기 상품일수록 같은 행에 락 경합이 몰립니다.
+조회는 Redis에 모으고 주기적으로 한 번에 반영합니다.
+
+처리 흐름:
+1. record_view(): 상세 조회 시 Redis 파이프라인 1회
+   - HINCRBY product_views:pending {product_id} 1  (DB 반영 대기 조회수)
+   - ZINCRBY product_views:trending 1 {product_id}  (인기 점수)
+2. flush(): Celery beat가 FLUSH_INTERVAL마다 실행
+   - pending 해시를 flushing 키로 RENAME (이후 조회는 새 pending에 쌓임)
+   - 모인 증감을 UPDATE ... FROM (VALUES ...) 한 번으로 view_count에 반영 후 flushing 키 삭제
+   - 반영 중 실패하면 flushing 키가 남아 다음 실행에서 다시 반영 (조회수 유실 없음)
+3. 인기 점수 감쇠: flush 때마다 경과 시간만큼 점수 전체에 0.5^(경과/반감기)를 곱함
+   - 최근 조회일수록 큰 비중 (PRODUCT_TRENDING_HALF_LIFE초 전 조회는 절반)
+   - 점수가 MIN_TRENDING_SCORE 미만이거나 상위 TRENDING_MAX_SIZE 밖인 상품은 제거
+
+Redis가 없으면 (로컬/테스트):
+- 조회수는 프로세스 메모리에 모아 FLUSH_INTERVAL마다 요청 처리 중에 반영
+- 인기 급상승 목록은 누적 조회수 순으로 대체
+
+사용 예시:
+    ProductViewService.record_view(product.pk)
+
+    # 인기 급상승 상품 ID와 점수 (점수 높은 순)
+    ProductViewService.get_trending(limit=12)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Value, When
+
+from ..models.product import Product
+
+logger = logging.getLogger(__name__)
+
+
+class ProductViewService:
+    """
+    상품 조회수 버퍼 / 인기 점수
+
+    Redis 키 형식:
+        product_views:pending → hash {product_id: 반영 대기 조회수}
+        product_views:flushing → hash (반영 중인 스냅샷)
+        product_views:trending → sorted set {product_id: 감쇠 점수}
+        product_views:trending:decayed_at → 마지막 감쇠 시각 (unix time)
+    """
+
+    PENDING_KEY = "product_views:pending"
+    FLUSHING_KEY = "product_views:flushing"
+    FLUSH_LOCK_KEY = "product_views:flush_lock"
+    TRENDING_KEY = "product_views:trending"
+    DECAYED_AT_KEY = "product_views:trending:decayed_at"
+
+    # 반영 주기 (초) - celery beat 스케줄과 동일하게 유지
+    FLUSH_INTERVAL = 60
+    # 동시에 두 flush가 같은 스냅샷을 반영하지 않도록 잡는 락 TTL (초)
+    FLUSH_LOCK_TIMEOUT = 120
+    # UPDATE ... FROM (VALUES ...) 한 번에 넣을 최대 행 수
+    FLUSH_CHUNK_SIZE = 1000
+
+    # 인기 점수 보관 범위
+    TRENDING_MAX_SIZE = 1000
+    MIN_TRENDING_SCORE = 0.05
+
+    # Redis가 없을 때의 프로세스 로컬 버퍼
+    _local_counts: Counter[int] = Counter()
+    _local_lock = threading.Lock()
+    _local_flushed_at = time.monotonic()
+
+    # ===== 설정 =====
+
+    @staticmethod
+    def get_half_life() -> int:
+        """인기 점수 반감기 (초)"""
+        return getattr(settings, "PRODUCT_TRENDING_HALF_LIFE", 60 * 60 * 6)
+
+    @staticmethod
+    def _get_redis() -> Any | None:
+        """Redis 연결 반환 (Redis 캐시 백엔드가 아니면 None)"""
+        try:
+            from django_redis import get_redis_connection
+
+            return get_redis_connection("default")
+        except (ImportError, NotImplementedError):
+            return None
+
+    # ===== 기록 =====
+
+    @staticmethod
+    def record_view(product_id: int) -> None:
+        """상세 조회 1회 기록 (Redis 왕복 1회, Redis 장애 시 조회 응답에는 영향 없음)"""
+        conn = ProductViewService._get_redis()
+        if conn is None:
+            ProductViewService._record_local(product_id)
+            return
+
+        try:
+            pipe = conn.pipeline(transaction=False)
+            pipe.hincrby(ProductViewService.PENDING_KEY, product_id, 1)
+            pipe.zincrby(ProductViewService.TRENDING_KEY, 1, product_id)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"조회수 기록 실패: product_id={product_id}, error={e}")
+
+    @classmethod
+    def _record_local(cls, product_id: int) -> None:
+        with cls._local_lock:
+            cls._local_counts[product_id] += 1
+            if time.monotonic() - cls._local_flushed_at < cls.FLUSH_INTERVAL:
+                return
+            deltas = dict(cls._local_counts)
+            cls._local_counts.clear()
+            cls._local_flushed_at = time.monotonic()
+        cls.apply_view_deltas(deltas)
+
+    @classmethod
+    def reset_local_buffer(cls) -> None:
+        """로컬 버퍼와 반영 시각 초기화 (테스트용)"""
+        with cls._local_lock:
+            cls._local_counts.clear()
+            cls._local_flushed_at = time.monotonic()
+
+    # ===== 반영 =====
+
+    @staticmethod
+    def flush() -> int:
+        """
+        모인 조회수를 view_count에 반영하고 인기 점수 감쇠
+
+        Returns:
+            반영한 상품 수 (다른 flush가 실행 중이면 0)
+        """
+        conn = ProductViewService._get_redis()
+        if conn is None:
+            return ProductViewService._flush_local()
+
+        if not conn.set(ProductViewService.FLUSH_LOCK_KEY, 1, nx=True, ex=ProductViewService.FLUSH_LOCK_TIMEOUT):
+            return 0
+
+        try:
+            # 이전 실행이 반영 도중 실패했다면 남은 스냅샷부터 반영
+            if not conn.exists(ProductViewService.FLUSHING_KEY) and conn.exists(ProductViewService.PENDING_KEY):
+                conn.rename(ProductViewService.PENDING_KEY, ProductViewService.FLUSHING_KEY)
+
+            raw = conn.hgetall(ProductViewService.FLUSHING_KEY)
+            deltas = {int(product_id): int(count) for product_id, count in raw.items()}
+            ProductViewService.apply_view_deltas(deltas)
+            conn.delete(ProductViewService.FLUSHING_KEY)
+
+            ProductViewService._decay_trending(conn)
+        finally:
+            conn.delete(ProductViewService.FLUSH_LOCK_KEY)
+
+        if deltas:
+            logger.info(f"조회수 반영: products={len(deltas)}, views={sum(deltas.values())}")
+        return len(deltas)
+
+    @classmethod
+    def _flush_local(cls) -> int:
+        with cls._local_lock:
+            deltas = dict(cls._local_counts)
+            cls._local_counts.clear()
+            cls._local_flushed_at = time.monotonic()
+        cls.apply_view_deltas(deltas)
+        return len(deltas)
+
+    @staticmethod
+    def apply_view_deltas(deltas: Mapping[int, int]) -> None:
+        """
+        상품별 조회수 증가분을 UPDATE 한 번으로 반영 (FLUSH_CHUNK_SIZE개 단위)
+
+        PostgreSQL: UPDATE ... FROM (VALUES (id, delta), ...) 조인
+        그 외 DB: CASE WHEN UPDATE
+        """
+        items = [(int(product_id), int(delta)) for product_id, delta in deltas.items() if delta > 0]
+        for start in range(0, len(items), ProductViewService.FLUSH_CHUNK_SIZE):
+            chunk = items[start : start + ProductViewService.FLUSH_CHUNK_SIZE]
+
+            if connection.vendor == "postgresql":
+                table = connection.ops.quote_name(Product._meta.db_table)
+                values = ", ".join(["(%s::bigint, %s::integer)"] * len(chunk))
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"UPDATE {table} AS p SET view_count = p.view_count + v.delta "
+                        f"FROM (VALUES {values}) AS v(id, delta) WHERE p.id = v.id",
+                        [param for row in chunk for param in row],
+                    )
+            else:
+                Product.objects.filter(pk__in=[product_id for product_id, _ in chunk]).update(
+                    view_count=F("view_count")
+                    + Case(
+                        *[When(pk=product_id, then=Value(delta)) for product_id, delta in chunk],
+                        default=Value(0),
+                        output_field=IntegerField(),
+                    )
+                )
+
+    @staticmethod
+    def _decay_trending(conn: Any) -> None:
+        """마지막 감쇠 이후 경과 시간만큼 인기 점수 전체를 감쇠하고 하위 상품 제거"""
+        now = time.time()
+        decayed_at = conn.get(ProductViewService.DECAYED_AT_KEY)
+        conn.set(ProductViewService.DECAYED_AT_KEY, now)
+        if decayed_at is None:
+            return
+
+        factor = 0.5 ** ((now - float(decayed_at)) / ProductViewService.get_half_life())
+        pipe = conn.pipeline(transaction=True)
+        pipe.zunionstore(ProductViewService.TRENDING_KEY, {ProductViewService.TRENDING_KEY: factor})
+        pipe.zremrangebyscore(ProductViewService.TRENDING_KEY, "-inf", f"({ProductViewService.MIN_TRENDING_SCORE}")
+        pipe.zremrangebyrank(ProductViewService.TRENDING_KEY, 0, -(ProductViewService.TRENDING_MAX_SIZE + 1))
+        pipe.execute()
+
+    # ===== 조회 =====
+
+    @staticmethod
+    def get_trending(limit: int) -> list[tuple[int, float]]:
+        """
+        인기 급상승 상품 (점수 높은 순)
+
+        Returns:
+            [(product_id, score), ...] - Redis가 없으면 누적 조회수를 점수로 사용
+        """
+        conn = ProductViewService._get_redis()
+        if conn is not None:
+            try:
+                rows = conn.zrevrange(ProductViewService.TRENDING_KEY, 0, limit - 1, withscores=True)
+                return [(int(product_id), float(score)) for product_id, score in rows]
+            except Exception as e:
+                logger.warning(f"인기 급상승 조회 실패, 누적 조회수로 대체: error={e}")
+
+        rows = (
+            Product.objects.filter(is_active=True, view_count__gt=0)
+            .order_by("-view_count", "-pk")
+            .values_list("pk", "view_count")[:limit]
+        )
+        return [(product_id, float(view_count)) for product_id, view_count in rows]
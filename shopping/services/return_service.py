@@ -5,11 +5,12 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from datetime import timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from django.db import transaction
-from django.db.models import Max
 from django.utils import timezone
 
 if TYPE_CHECKING:
@@ -23,34 +24,25 @@ logger = logging.getLogger(__name__)
 class ReturnService:
     """교환/환불 관련 서비스 클래스"""
 
+    # PG 환불 최대 시도 횟수 (초과 시 refund_status=failed → 수동 처리)
+    REFUND_MAX_ATTEMPTS = 5
+
     @staticmethod
     def generate_return_number() -> str:
         """
         교환/환불 번호 자동 생성
-        형식: RET + YYYYMMDD + 일련번호(3자리)
-        예: RET20250115001
+        형식: RET + YYYYMMDD + 일련번호(6자리)
+        예: RET20250115000001
+
+        PostgreSQL 시퀀스에서 발급하므로 동시 신청에도 번호가 겹치지 않습니다.
+        (NumberSequenceService.next_return_number 참조)
 
         Returns:
             str: 생성된 교환/환불 번호
         """
-        from shopping.models.return_request import Return
-
-        today = timezone.now().strftime("%Y%m%d")
-        prefix = f"RET{today}"
-
-        # 오늘 날짜의 마지막 번호 조회
-        last_return = Return.objects.filter(
-            return_number__startswith=prefix
-        ).aggregate(Max("return_number"))["return_number__max"]
-
-        if last_return:
-            # 마지막 3자리 추출하여 +1
-            last_number = int(last_return[-3:])
-            new_number = last_number + 1
-        else:
-            new_number = 1
+        from shopping.services.number_sequence_service import NumberSequenceService
 
-        return f"{prefix}{new_number:03d}"
+        return NumberSequenceService.next_return_number()
 
     @staticmethod
     def calculate_refund_amount(return_items: list) -> Decimal:
@@ -68,6 +60,37 @@ class ReturnService:
             total += item.product_price * item.quantity
         return total
 
+    @staticmethod
+    def refresh_summary(return_ids: list[int]) -> None:
+        """
+        목록용 요약(item_count, items_amount)을 반품 상품 기준으로 다시 계산
+
+        create_return을 거치지 않고 반품 상품이 바뀐 경우(관리자 수정 등) 호출합니다.
+
+        Args:
+            return_ids: 다시 계산할 Return ID 목록
+        """
+        from django.db.models import Count, F, Sum
+
+        from shopping.models.return_request import Return, ReturnItem
+
+        summaries = {
+            row["return_request_id"]: row
+            for row in ReturnItem.objects.filter(return_request_id__in=return_ids)
+            .values("return_request_id")
+            .annotate(item_count=Count("pk"), items_amount=Sum(F("product_price") * F("quantity")))
+            .order_by()
+        }
+        returns = [
+            Return(
+                pk=return_id,
+                item_count=summaries.get(return_id, {}).get("item_count", 0),
+                items_amount=summaries.get(return_id, {}).get("items_amount") or Decimal("0"),
+            )
+            for return_id in set(return_ids)
+        ]
+        Return.objects.bulk_update(returns, ["item_count", "items_amount"])
+
     @staticmethod
     @transaction.atomic
     def create_return(
@@ -104,10 +127,20 @@ class ReturnService:
         """
         from shopping.models.return_request import Return, ReturnItem
 
-        # 1. return_number 생성
-        return_number = ReturnService.generate_return_number()
+        # 1. 반품 상품을 메모리에서 구성 (상품 정보 스냅샷, ReturnItem.save()와 같은 기본값)
+        return_items = [
+            ReturnItem(
+                order_item=item_data["order_item"],
+                quantity=item_data["quantity"],
+                product_name=item_data.get("product_name") or item_data["order_item"].product_name,
+                product_price=item_data.get("product_price") or item_data["order_item"].price,
+            )
+            for item_data in return_items_data
+        ]
+        items_amount = ReturnService.calculate_refund_amount(return_items)
 
-        # 2. Return 객체 생성 (refund_amount는 나중에 계산)
+        # 2. Return INSERT 1회 (번호/환불 금액/목록용 요약을 미리 계산)
+        return_number = ReturnService.generate_return_number()
         return_request = Return.objects.create(
             order=order,
             user=user,
@@ -115,32 +148,16 @@ class ReturnService:
             type=type,
             reason=reason,
             reason_detail=reason_detail,
-            refund_amount=Decimal("0"),  # 임시값
+            refund_amount=items_amount if type == "refund" else Decimal("0"),
+            item_count=len(return_items),
+            items_amount=items_amount,
             **kwargs
         )
 
-        # 3. ReturnItem 생성
-        return_items = []
-        for item_data in return_items_data:
-            order_item = item_data['order_item']
-            quantity = item_data['quantity']
-            product_name = item_data.get('product_name', order_item.product_name)
-            product_price = item_data.get('product_price', order_item.price)
-
-            return_item = ReturnItem.objects.create(
-                return_request=return_request,
-                order_item=order_item,
-                quantity=quantity,
-                product_name=product_name,
-                product_price=product_price,
-            )
-            return_items.append(return_item)
-
-        # 4. refund_amount 계산 및 업데이트 (환불인 경우에만)
-        if type == "refund":
-            refund_amount = ReturnService.calculate_refund_amount(return_items)
-            return_request.refund_amount = refund_amount
-            return_request.save(update_fields=["refund_amount"])
+        # 3. ReturnItem 일괄 INSERT
+        for return_item in return_items:
+            return_item.return_request = return_request
+        ReturnItem.objects.bulk_create(return_items)
 
         logger.info(
             f"교환/환불 신청 생성: return_number={return_number}, "
@@ -182,9 +199,9 @@ class ReturnService:
         return_obj.save()
 
         # 알림 발송
-        from shopping.models import Notification
+        from shopping.services.notification_service import NotificationService
 
-        Notification.objects.create(
+        NotificationService.create(
             user=return_obj.user,
             notification_type="return",
             title=f"{return_obj.get_type_display()} 승인",
@@ -224,9 +241,9 @@ class ReturnService:
         return_obj.save()
 
         # 알림 발송
-        from shopping.models import Notification
+        from shopping.services.notification_service import NotificationService
 
-        Notification.objects.create(
+        NotificationService.create(
             user=return_obj.user,
             notification_type="return",
             title=f"{return_obj.get_type_display()} 거부",
@@ -264,9 +281,9 @@ class ReturnService:
         return_obj.save()
 
         # 알림 발송
-        from shopping.models import Notification
+        from shopping.services.notification_service import NotificationService
 
-        Notification.objects.create(
+        NotificationService.create(
             user=return_obj.user,
             notification_type="return",
             title="반품 도착 확인",
@@ -288,11 +305,14 @@ class ReturnService:
         """
         환불 완료 처리
 
-        실제 환불 처리:
-        1. 토스페이먼츠 API 호출하여 환불
-        2. 재고 복구
-        3. 포인트 처리 (향후 구현)
-        4. 상태 변경
+        1단계 (이 메서드, 트랜잭션):
+        1. 재고 복구 (반품 전체를 UPDATE 1회로 반영)
+        2. 포인트 처리 (향후 구현)
+        3. 상태 변경 + PG 환불 대기(refund_status=pending) 기록
+
+        2단계 (커밋 후, 락 없음):
+        - 토스페이먼츠 환불은 refund_return_payment 태스크에서 처리 (process_refund, 실패 시 재시도)
+        - 느린 PG 응답이 상품/주문 행 락을 잡고 있지 않도록 트랜잭션 밖에서 호출합니다.
 
         Args:
             return_obj: 환불 처리할 Return 객체
@@ -306,74 +326,119 @@ class ReturnService:
         if return_obj.type != "refund":
             raise ValueError("환불 타입에서만 사용 가능합니다.")
 
-        if return_obj.status != "received":
-            raise ValueError("반품 도착 상태에서만 환불 처리할 수 있습니다.")
-
-        # 성능 최적화: N+1 쿼리 방지
-        return_items = return_obj.return_items.select_related('order_item__product').all()
-
-        # 1. 토스페이먼츠 환불 처리
-        actual_refund_amount = return_obj.refund_amount - return_obj.return_shipping_fee
-
-        if hasattr(return_obj.order, "payment") and return_obj.order.payment:
-            from shopping.utils.toss_payment import TossPaymentClient
+        ReturnService._lock_received(return_obj, "반품 도착 상태에서만 환불 처리할 수 있습니다.")
 
-            toss_client = TossPaymentClient()
-
-            if actual_refund_amount > 0:
-                refund_account = None
-                if return_obj.refund_account_number:
-                    # 복호화된 계좌번호 사용
-                    decrypted_account = return_obj.get_decrypted_account_number()
-                    refund_account = {
-                        "bank": return_obj.refund_account_bank,
-                        "accountNumber": decrypted_account,
-                        "holderName": return_obj.refund_account_holder,
-                    }
+        # 1. 재고 복구
+        from shopping.services.product_service import ProductService
 
-                toss_client.cancel_payment(
-                    payment_key=return_obj.order.payment.payment_key,
-                    cancel_reason=f"{return_obj.get_reason_display()} - {return_obj.reason_detail}",
-                    cancel_amount=int(actual_refund_amount),
-                    refund_account=refund_account,
-                )
+        ProductService.apply_stock_deltas(ReturnService._get_stock_deltas(return_obj))
 
-        # 2. 재고 복구
-        for return_item in return_items:
-            if return_item.order_item.product:
-                product = return_item.order_item.product
-                product.stock += return_item.quantity
-                product.save(update_fields=["stock"])
-
-        # 3. 포인트 처리 (향후 구현)
+        # 2. 포인트 처리 (향후 구현)
         # - 사용한 포인트 환불
         # - 적립된 포인트 회수
 
-        # 4. 상태 변경
+        # 3. 상태 변경 (PG 환불이 필요한 경우 pending으로 기록 후 커밋 뒤에 처리)
+        actual_refund_amount = return_obj.refund_amount - return_obj.return_shipping_fee
+        needs_pg_refund = actual_refund_amount > 0 and hasattr(return_obj.order, "payment")
+
         return_obj.status = "completed"
         return_obj.completed_at = timezone.now()
+        return_obj.refund_status = "pending" if needs_pg_refund else "not_required"
         return_obj.save()
 
-        # 5. 주문 상태 변경
+        # 4. 주문 상태 변경
         return_obj.order.status = "refunded"
         return_obj.order.save(update_fields=["status"])
 
-        # 알림 발송
-        from shopping.models import Notification
+        if needs_pg_refund:
+            from shopping.tasks.payment_tasks import refund_return_payment
 
-        Notification.objects.create(
-            user=return_obj.user,
-            notification_type="return",
-            title="환불 완료",
-            message=f"{return_obj.return_number} 환불이 완료되었습니다. 환불 금액: {actual_refund_amount:,}원",
-            link=f"/returns/{return_obj.id}",
-            metadata={
-                "return_id": return_obj.id,
-                "return_number": return_obj.return_number,
-                "refund_amount": str(actual_refund_amount),
-            },
+            # 큐 등록 실패는 커밋된 완료 처리에 영향 없음 (retry_pending_refunds_task가 재등록)
+            return_id = return_obj.id
+            transaction.on_commit(lambda: refund_return_payment.delay(return_id), robust=True)
+        else:
+            ReturnService._notify_refund_completed(return_obj, actual_refund_amount)
+
+        logger.info(
+            f"환불 완료 처리: return_id={return_obj.id}, "
+            f"return_number={return_obj.return_number}, refund_amount={actual_refund_amount}, "
+            f"refund_status={return_obj.refund_status}"
         )
 
+        return return_obj
+
+    @staticmethod
+    def process_refund(return_id: int) -> Return | None:
+        """
+        PG 환불 처리 (complete_refund 커밋 이후 단계)
+
+        트랜잭션/행 락 없이 토스페이먼츠 취소 API를 호출합니다.
+        - refund_status=pending인 건만 조건부 UPDATE로 processing 선점 (중복 호출 방지)
+        - 반품 번호 기반 멱등키 전달 (재시도/정체 건 재처리 시에도 한 번만 취소)
+
+        Args:
+            return_id: 환불 처리할 Return ID
+
+        Returns:
+            Return: 처리한 Return 객체 (다른 워커가 처리 중이거나 대기 상태가 아니면 None)
+            - succeeded: 환불 완료
+            - pending: 일시적 오류 (재시도 필요)
+            - failed: 재시도 불가 오류 또는 최대 시도 횟수 초과 (수동 처리 필요)
+        """
+        from django.db.models import F
+
+        from shopping.models.return_request import Return
+        from shopping.utils.toss_payment import TossPaymentClient, TossPaymentError
+
+        claimed = Return.objects.filter(pk=return_id, refund_status="pending").update(
+            refund_status="processing",
+            refund_attempts=F("refund_attempts") + 1,
+            updated_at=timezone.now(),
+        )
+        if not claimed:
+            logger.info(f"PG 환불 대상 아님 (이미 처리 중이거나 완료): return_id={return_id}")
+            return None
+
+        return_obj = Return.objects.select_related("order__payment", "user").get(pk=return_id)
+        actual_refund_amount = return_obj.refund_amount - return_obj.return_shipping_fee
+
+        refund_account = None
+        if return_obj.refund_account_number:
+            # 복호화된 계좌번호 사용
+            refund_account = {
+                "bank": return_obj.refund_account_bank,
+                "accountNumber": return_obj.get_decrypted_account_number(),
+                "holderName": return_obj.refund_account_holder,
+            }
+
+        try:
+            TossPaymentClient().cancel_payment(
+                payment_key=return_obj.order.payment.payment_key,
+                cancel_reason=f"{return_obj.get_reason_display()} - {return_obj.reason_detail}",
+                cancel_amount=int(actual_refund_amount),
+                refund_account=refund_account,
+                idempotency_key=f"refund-{return_obj.return_number}",
+            )
+        except TossPaymentError as e:
+            # 네트워크 오류/토스 서버 오류만 재시도
+            retryable = e.status_code >= 500 and return_obj.refund_attempts < ReturnService.REFUND_MAX_ATTEMPTS
+            return_obj.refund_status = "pending" if retryable else "failed"
+            return_obj.refund_error = f"[{e.code}] {e.message}"
+            return_obj.save(update_fields=["refund_status", "refund_error", "updated_at"])
+
+            logger.error(
+                f"PG 환불 실패: return_id={return_obj.id}, attempts={return_obj.refund_attempts}, "
+                f"refund_status={return_obj.refund_status}, error={return_obj.refund_error}"
+            )
+            return return_obj
+
+        return_obj.refund_status = "succeeded"
+        return_obj.refund_error = ""
+        return_obj.refunded_at = timezone.now()
+        return_obj.save(update_fields=["refund_status", "refund_error", "refunded_at", "updated_at"])
+
+        ReturnService._notify_refund_completed(return_obj, actual_refund_amount)
+
         logger.info(
             f"환불 완료: return_id={return_obj.id}, "
             f"return_number={return_obj.return_number}, refund_amount={actual_refund_amount}"
@@ -381,6 +446,38 @@ class ReturnService:
 
         return return_obj
 
+    @staticmethod
+    def get_retryable_refund_ids(stale_after: timedelta) -> list[int]:
+        """
+        재처리할 PG 환불 대상 조회
+
+        - pending: 큐 등록 실패/유실로 stale_after 이상 대기 중인 건
+        - processing: 워커 중단 등으로 stale_after 이상 멈춘 건 → pending으로 되돌림
+          (토스 멱등키로 이미 취소된 건이 다시 취소되지 않음)
+
+        Args:
+            stale_after: 마지막 갱신 후 경과 시간 기준
+
+        Returns:
+            list[int]: 재처리할 Return ID 목록
+        """
+        from shopping.models.return_request import Return
+
+        cutoff = timezone.now() - stale_after
+        pending_ids = list(
+            Return.objects.filter(refund_status="pending", updated_at__lt=cutoff).values_list("pk", flat=True)
+        )
+        stalled_ids = list(
+            Return.objects.filter(refund_status="processing", updated_at__lt=cutoff).values_list("pk", flat=True)
+        )
+        if stalled_ids:
+            Return.objects.filter(pk__in=stalled_ids, refund_status="processing").update(
+                refund_status="pending", updated_at=timezone.now()
+            )
+            logger.warning(f"PG 환불 처리 정체 건 재등록: return_ids={stalled_ids}")
+
+        return pending_ids + stalled_ids
+
     @staticmethod
     @transaction.atomic
     def complete_exchange(
@@ -392,7 +489,7 @@ class ReturnService:
         교환 완료 처리
 
         교환 상품 발송 후 호출:
-        1. 재고 조정 (반품 +1, 교환 -1)
+        1. 재고 조정 (반품 상품 +수량, 교환 상품 -1을 UPDATE 1회로 반영)
         2. 상태 변경
         3. 교환 상품 송장번호 저장
 
@@ -405,29 +502,20 @@ class ReturnService:
             Return: 교환 완료된 Return 객체
 
         Raises:
-            ValueError: 교환 처리 불가능한 상태인 경우
+            ValueError: 교환 처리 불가능한 상태이거나 교환 상품 재고가 부족한 경우
         """
         if return_obj.type != "exchange":
             raise ValueError("교환 타입에서만 사용 가능합니다.")
 
-        if return_obj.status != "received":
-            raise ValueError("반품 도착 상태에서만 교환 처리할 수 있습니다.")
+        ReturnService._lock_received(return_obj, "반품 도착 상태에서만 교환 처리할 수 있습니다.")
 
-        # 성능 최적화: N+1 쿼리 방지
-        return_items = return_obj.return_items.select_related('order_item__product').all()
+        # 1. 재고 조정 (반품 상품 증가 + 교환 상품 감소)
+        from shopping.services.product_service import ProductService
 
-        # 1. 재고 조정
-        for return_item in return_items:
-            # 반품 상품 재고 증가
-            if return_item.order_item.product:
-                product = return_item.order_item.product
-                product.stock += return_item.quantity
-                product.save(update_fields=["stock"])
-
-        # 교환 상품 재고 감소
-        if return_obj.exchange_product:
-            return_obj.exchange_product.stock -= 1
-            return_obj.exchange_product.save(update_fields=["stock"])
+        stock_deltas = ReturnService._get_stock_deltas(return_obj)
+        if return_obj.exchange_product_id:
+            stock_deltas[return_obj.exchange_product_id] -= 1
+        ProductService.apply_stock_deltas(stock_deltas)
 
         # 2. 교환 상품 송장번호 저장
         return_obj.exchange_tracking_number = exchange_tracking_number
@@ -439,9 +527,9 @@ class ReturnService:
         return_obj.save()
 
         # 알림 발송
-        from shopping.models import Notification
+        from shopping.services.notification_service import NotificationService
 
-        Notification.objects.create(
+        NotificationService.create(
             user=return_obj.user,
             notification_type="return",
             title="교환 완료",
@@ -460,3 +548,43 @@ class ReturnService:
         )
 
         return return_obj
+
+    @staticmethod
+    def _lock_received(return_obj: Return, error_message: str) -> None:
+        """
+        Return 행을 잠그고 반품 도착 상태인지 확인
+
+        동시에 완료 처리가 두 번 요청되어도 재고가 한 번만 반영되도록 DB 상태 기준으로 확인합니다.
+        """
+        from shopping.models.return_request import Return
+
+        status = Return.objects.select_for_update().values_list("status", flat=True).get(pk=return_obj.pk)
+        if status != "received":
+            raise ValueError(error_message)
+
+    @staticmethod
+    def _get_stock_deltas(return_obj: Return) -> defaultdict[int, int]:
+        """반품 아이템의 상품별 재고 복구량 ({상품 ID: 수량}, 삭제된 상품 제외)"""
+        stock_deltas: defaultdict[int, int] = defaultdict(int)
+        for product_id, quantity in return_obj.return_items.values_list("order_item__product_id", "quantity"):
+            if product_id:
+                stock_deltas[product_id] += quantity
+        return stock_deltas
+
+    @staticmethod
+    def _notify_refund_completed(return_obj: Return, refund_amount: Decimal) -> None:
+        """환불 완료 알림 발송"""
+        from shopping.services.notification_service import NotificationService
+
+        NotificationService.create(
+            user=return_obj.user,
+            notification_type="return",
+            title="환불 완료",
+            message=f"{return_obj.return_number} 환불이 완료되었습니다. 환불 금액: {refund_amount:,}원",
+            link=f"/returns/{return_obj.id}",
+            metadata={
+                "return_id": return_obj.id,
+                "return_number": return_obj.return_number,
+                "refund_amount": str(refund_amount),
+            },
+        )
@@ -0,0 +1,96 @@
+"""인증 사용자 캐시 서비스
+
+JWT 인증(CachedJWTAuthentication)이 매 요청마다 사용자 행 전체를 조회하지 않도록
+권한 판단에 필요한 필드만 짧은 TTL로 캐시합니다.
+
+기존 방식의 문제:
+- 인증된 모든 요청에서 User.objects.get(pk=user_id) 실행
+- shopping_users는 주소, 마케팅 동의, 포인트 등 컬럼이 많은 넓은 행
+
+캐시 방식:
+- auth_user:{user_id} 키에 AUTH_FIELDS 값만 저장 (CACHE_TIMEOUT초)
+- 캐시 값으로 나머지 필드가 지연(deferred)된 User 인스턴스를 만들어 request.user로 사용
+- 뷰가 지연 필드(points, email 등)에 처음 접근하면 나머지 필드를 한 번에 로드
+- User 저장(비밀번호 변경, 탈퇴 포함) 시 post_save 시그널로 캐시 삭제
+
+사용 예시:
+    user = UserAuthCacheService.get(user_id)   # 캐시 히트 시 쿼리 0회
+    user.is_staff                              # 캐시 값
+    user.points                                # 이 시점에 나머지 필드 1회 로드
+"""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from ..models.user import User
+
+
+class UserAuthCacheService:
+    """
+    인증 사용자 캐시
+
+    캐시 값 형식:
+        auth_user:{user_id} → {AUTH_FIELDS 필드명: 값}
+    """
+
+    CACHE_KEY = "auth_user:{user_id}"
+    # 시그널을 거치지 않는 변경(queryset.update 등)이 남아 있을 수 있는 최대 시간
+    CACHE_TIMEOUT = 60
+
+    # 인증/권한 판단에 필요한 필드 (비밀번호 해시는 캐시하지 않음)
+    AUTH_FIELDS = (
+        "id",
+        "username",
+        "is_active",
+        "is_staff",
+        "is_superuser",
+        "is_seller",
+        "is_withdrawn",
+        "is_email_verified",
+    )
+
+    @staticmethod
+    def _cache_key(user_id: int) -> str:
+        return UserAuthCacheService.CACHE_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def get(user_id: int) -> User | None:
+        """
+        인증 사용자 조회
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            AUTH_FIELDS만 로드된 User 인스턴스 (없으면 None)
+        """
+        key = UserAuthCacheService._cache_key(user_id)
+        values = cache.get(key)
+
+        if values is None:
+            values = User.objects.filter(pk=user_id).values(*UserAuthCacheService.AUTH_FIELDS).first()
+            if values is None:
+                return None
+            cache.set(key, values, UserAuthCacheService.CACHE_TIMEOUT)
+
+        return UserAuthCacheService.build(values)
+
+    @staticmethod
+    def build(values: dict) -> User:
+        """
+        캐시 값으로 User 인스턴스 생성
+
+        AUTH_FIELDS 외의 필드는 지연 필드로 남고, 처음 접근할 때 한 번에 로드됩니다.
+        (User.refresh_from_db 참고)
+        """
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+        user = User.from_db(DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names])
+        user._auth_cached = True
+        return user
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        """캐시 삭제 (다음 요청에서 DB 재조회)"""
+        cache.delete(UserAuthCacheService._cache_key(user_id))
@@ -15,17 +15,18 @@
     # 일괄 추가
     result = WishlistService.bulk_add(user, product_ids=[1, 2, 3])
 
-    # 통계 조회
+    # 통계 조회 (사용자별 캐시, 찜 목록 변경 시 무효화)
     stats = WishlistService.get_stats(user)
 """
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models import Case, Count, F, Q, Sum, Value, When
 from django.db.models.functions import Coalesce
@@ -37,6 +38,7 @@ if TYPE_CHECKING:
 
 from ..models.cart import Cart, CartItem
 from ..models.product import Product
+from ..models.wishlist import WishlistItem
 from .base import ServiceError, log_service_call
 
 logger = logging.getLogger(__name__)
@@ -99,7 +101,7 @@ class WishlistFilter:
 
     is_available: bool | None = None  # 구매 가능 상품만
     on_sale: bool | None = None  # 세일 중인 상품만
-    ordering: str = "-created_at"
+    ordering: str = "-added_at"  # 기본: 최근 찜한 순
 
 
 class WishlistService:
@@ -119,7 +121,12 @@ class WishlistService:
     """
 
     # ===== 정책 상수 =====
-    VALID_ORDERINGS = ["created_at", "-created_at", "price", "-price", "name"]
+    VALID_ORDERINGS = ["added_at", "-added_at", "created_at", "-created_at", "price", "-price", "name"]
+    DEFAULT_ORDERING = "-added_at"
+
+    # 통계 캐시 (찜 추가/제거 시 무효화, 상품 가격/재고 변경은 TTL 동안 반영 지연)
+    STATS_CACHE_KEY = "wishlist_stats:{user_id}"
+    STATS_CACHE_TIMEOUT = 60 * 5  # 5분
 
     # ===== 찜하기 토글 =====
 
@@ -345,11 +352,19 @@ class WishlistService:
             filters: 필터 옵션
 
         Returns:
-            QuerySet: 필터링/정렬된 상품 쿼리셋
+            QuerySet: 필터링/정렬된 상품 쿼리셋 (찜한 일시 added_at 주석 포함)
+
+        Note:
+            중간 테이블(shopping_wishlist)과 한 번만 조인하고 찜한 일시를 주석으로 붙입니다.
+            정렬에는 항상 id를 보조 키로 붙여 키셋 페이지네이션의 순서를 고정합니다.
         """
         filters = filters or WishlistFilter()
 
-        queryset = user.wishlist_products.select_related("category").prefetch_related("images")
+        queryset = (
+            Product.objects.filter(wishlist_items__user=user)
+            .annotate(added_at=F("wishlist_items__added_at"))
+            .select_related("category")
+        )
 
         # 구매 가능 필터
         if filters.is_available is True:
@@ -361,14 +376,16 @@ class WishlistService:
         if filters.on_sale is True:
             queryset = queryset.filter(
                 compare_price__isnull=False,
-                compare_price__gt=0,
-            ).extra(where=["compare_price > price"])
+                compare_price__gt=F("price"),
+            )
 
-        # 정렬
-        if filters.ordering in WishlistService.VALID_ORDERINGS:
-            queryset = queryset.order_by(filters.ordering)
+        # 정렬 (알 수 없는 값은 최근 찜한 순)
+        ordering = (
+            filters.ordering if filters.ordering in WishlistService.VALID_ORDERINGS else WishlistService.DEFAULT_ORDERING
+        )
+        tiebreaker = "-id" if ordering.startswith("-") else "id"
 
-        return queryset
+        return queryset.order_by(ordering, tiebreaker)
 
     # ===== 통계 조회 =====
 
@@ -388,7 +405,13 @@ class WishlistService:
             성능 최적화: Python 루프 대신 DB 집계 쿼리 사용
             - 기존: N개 상품을 Python에서 순회 (O(N))
             - 개선: 단일 DB 쿼리로 집계 (O(1) DB 호출)
+            집계 결과는 사용자별로 STATS_CACHE_TIMEOUT 동안 캐시하고 찜 목록이 바뀌면 삭제합니다.
         """
+        cache_key = WishlistService.STATS_CACHE_KEY.format(user_id=user.id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return WishlistStats(**cached)
+
         products = user.wishlist_products.all()
 
         # 단일 쿼리로 모든 통계 집계
@@ -434,7 +457,7 @@ class WishlistService:
             ),
         )
 
-        return WishlistStats(
+        result = WishlistStats(
             total_count=stats["total_count"] or 0,
             available_count=stats["available_count"] or 0,
             out_of_stock_count=stats["out_of_stock_count"] or 0,
@@ -443,6 +466,19 @@ class WishlistService:
             total_sale_price=stats["total_sale_price"] or Decimal("0"),
             total_discount=stats["total_discount"] or Decimal("0"),
         )
+        cache.set(cache_key, asdict(result), WishlistService.STATS_CACHE_TIMEOUT)
+
+        return result
+
+    @staticmethod
+    def invalidate_stats(user_id: int) -> None:
+        """
+        사용자 찜 목록 통계 캐시 삭제
+
+        Args:
+            user_id: 사용자 ID
+        """
+        cache.delete(WishlistService.STATS_CACHE_KEY.format(user_id=user_id))
 
     # ===== 장바구니로 이동 =====
 
@@ -474,10 +510,10 @@ class WishlistService:
                 code="EMPTY_PRODUCT_IDS",
             )
 
-        # 찜 목록에 있는 상품만 필터링
-        products = user.wishlist_products.filter(id__in=product_ids)
+        # 찜 목록에 있는 상품만 필터링 (id/이름/재고만 1회 조회)
+        products = list(user.wishlist_products.filter(id__in=product_ids).values_list("id", "name", "stock"))
 
-        if not products.exists():
+        if not products:
             user_wishlist_ids = list(user.wishlist_products.values_list("id", flat=True))
             raise WishlistServiceError(
                 "찜 목록에 해당 상품이 없습니다.",
@@ -493,28 +529,29 @@ class WishlistService:
 
         result = MoveToCartResult()
 
-        for product in products:
-            # 재고 확인
-            if product.stock <= 0:
-                result.out_of_stock.append(product.name)
-                continue
-
-            # 장바구니에 추가
-            cart_item, created = CartItem.objects.get_or_create(
-                cart=cart,
-                product=product,
-                defaults={"quantity": 1},
-            )
-
-            if created:
-                result.added_items.append(product.name)
-            else:
-                result.already_in_cart.append(product.name)
+        # 재고 확인
+        in_stock = [(product_id, name) for product_id, name, stock in products if stock > 0]
+        result.out_of_stock = [name for _, name, stock in products if stock <= 0]
 
-        # 찜 목록에서 제거 옵션
-        if remove_from_wishlist and result.added_items:
-            moved_products = Product.objects.filter(name__in=result.added_items)
-            user.wishlist_products.remove(*moved_products)
+        # 장바구니에 추가 (이미 담긴 상품은 건너뜀, 동시 추가는 unique(cart, product) 충돌 무시)
+        in_cart_ids = set(
+            CartItem.objects.filter(cart=cart, product_id__in=[product_id for product_id, _ in in_stock]).values_list(
+                "product_id", flat=True
+            )
+        )
+        added = [(product_id, name) for product_id, name in in_stock if product_id not in in_cart_ids]
+        CartItem.objects.bulk_create(
+            [CartItem(cart=cart, product_id=product_id, quantity=1) for product_id, _ in added],
+            ignore_conflicts=True,
+        )
+        result.added_items = [name for _, name in added]
+        result.already_in_cart = [name for product_id, name in in_stock if product_id in in_cart_ids]
+
+        # 찜 목록에서 제거 옵션 (상품 ID 기준으로 중간 테이블에서 한 번에 삭제)
+        if remove_from_wishlist and added:
+            WishlistItem.objects.filter(user_id=user.id, product_id__in=[product_id for product_id, _ in added]).delete()
+            # 중간 테이블 직접 삭제는 m2m_changed 시그널이 없으므로 통계 캐시를 직접 삭제
+            WishlistService.invalidate_stats(user.id)
 
         # 결과 메시지 생성
         result.message = WishlistService._build_move_to_cart_message(result)
@@ -2,15 +2,19 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
-from django.utils import timezone
 
 from allauth.socialaccount.models import SocialAccount
 from allauth.socialaccount.signals import pre_social_login
 
 from shopping.models.email_verification import EmailVerificationToken
 from shopping.models.order import Order
+from shopping.models.user import User
+from shopping.models.wishlist import WishlistItem
+from shopping.services.order_status_service import OrderStatusService
+from shopping.services.user_auth_cache_service import UserAuthCacheService
+from shopping.services.wishlist_service import WishlistService
 
 if TYPE_CHECKING:
     from allauth.socialaccount.models import SocialLogin
@@ -95,29 +99,59 @@ def handle_new_social_account(sender: type[SocialAccount], instance: SocialAccou
 
 
 @receiver(post_save, sender=Order)
-def generate_order_number(sender: type[Order], instance: Order, created: bool, **kwargs: Any) -> None:
+def publish_order_status(sender: type[Order], instance: Order, **kwargs: Any) -> None:
     """
-    주문 생성 시 주문번호 자동 생성
+    주문 저장 시 주문 상태 채널 갱신
 
-    주문이 생성되면 (created=True) order_number가 없는 경우에만
-    YYYYMMDD + 6자리 ID 형식으로 주문번호를 생성합니다.
-
-    예: 202401150000042
+    상태 조회(/api/orders/{id}/status/)가 캐시 키 하나만 읽도록
+    커밋 이후 최신 상태 스냅샷을 기록합니다.
 
     Args:
         sender: Order 모델
-        instance: 생성된 Order 인스턴스
-        created: 신규 생성 여부
+        instance: 저장된 Order 인스턴스
+        **kwargs: 추가 매개변수
+    """
+    OrderStatusService.publish_on_commit(instance)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_auth_user_cache(sender: type[User], instance: User, **kwargs: Any) -> None:
+    """
+    사용자 저장/삭제 시 인증 사용자 캐시 삭제
+
+    비밀번호 변경(set_password + save), 탈퇴(is_withdrawn/is_active 변경),
+    권한 변경이 다음 요청의 인증에 바로 반영되도록 합니다.
+
+    Args:
+        sender: User 모델
+        instance: 저장/삭제된 User 인스턴스
         **kwargs: 추가 매개변수
     """
-    # 신규 생성이고 주문번호가 없는 경우에만 처리
-    if created and not instance.order_number:
-        # 날짜 + ID 형식으로 주문번호 생성
-        date_str = timezone.now().strftime("%Y%m%d")
-        order_number = f"{date_str}{instance.id:06d}"
+    UserAuthCacheService.invalidate(instance.pk)
+
+
+@receiver(m2m_changed, sender=WishlistItem)
+def invalidate_wishlist_stats(
+    sender: type[WishlistItem], instance: Any, action: str, reverse: bool, pk_set: set[int] | None, **kwargs: Any
+) -> None:
+    """
+    찜 목록 변경 시 찜 통계 캐시 삭제
+
+    user.wishlist_products.add/remove/clear (User.add_to_wishlist 등)로 바뀐 사용자의
+    통계가 다음 조회에서 다시 집계되도록 합니다.
 
-        # update()를 사용하여 단일 쿼리로 업데이트 (signal 재귀 방지)
-        Order.objects.filter(pk=instance.pk).update(order_number=order_number)
+    Args:
+        sender: 중간 모델 (WishlistItem)
+        instance: 변경된 User (역방향이면 Product)
+        action: m2m 변경 종류
+        reverse: product.wished_by_users 쪽에서 변경했는지 여부
+        pk_set: 추가/제거된 상대 쪽 ID 집합
+        **kwargs: 추가 매개변수
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
 
-        # 인스턴스도 업데이트
-        instance.order_number = order_number
+    user_ids = (pk_set or ()) if reverse else (instance.pk,)
+    for user_id in user_ids:
+        WishlistService.invalidate_stats(user_id)
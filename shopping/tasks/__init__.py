@@ -3,22 +3,42 @@ Celery 태스크 패키지
 모든 태스크를 여기서 임포트하여 Celery가 자동으로 발견할 수 있게 함
 """
 
+from .benchmark_tasks import synthetic_workload
 from .cleanup_tasks import (
     cleanup_expired_tokens_task,
     cleanup_old_email_logs_task,
     cleanup_used_tokens_task,
     delete_unverified_users_task,
 )
-from .email_tasks import retry_failed_emails_task, send_email_task, send_verification_email_task
-from .order_tasks import process_order_heavy_tasks
-from .point_tasks import expire_points_task, send_email_notification, send_expiry_notification_task
-from .payment_tasks import call_toss_confirm_api, finalize_payment_confirm
+from .email_tasks import retry_failed_emails_task, send_email_batch, send_email_task, send_verification_email_task
+from .notification_tasks import deliver_notification_chunk
+from .order_tasks import process_order_batch, process_order_heavy_tasks, recover_order_batch
+from .point_tasks import (
+    expire_points_task,
+    send_email_notification,
+    send_expiry_notification_chunk,
+    send_expiry_notification_task,
+)
+from .product_tasks import (
+    flush_product_view_counts_task,
+    generate_product_image_variants,
+    verify_category_product_counts_task,
+)
+from .payment_tasks import (
+    call_toss_confirm_api,
+    finalize_payment_confirm,
+    refund_return_payment,
+    retry_pending_refunds_task,
+)
 
 __all__ = [
     # 이메일 태스크
     "send_verification_email_task",
     "send_email_task",
     "retry_failed_emails_task",
+    "send_email_batch",
+    # 알림 태스크
+    "deliver_notification_chunk",
     # 정리 태스크
     "delete_unverified_users_task",
     "cleanup_old_email_logs_task",
@@ -27,10 +47,21 @@ __all__ = [
     # 포인트 태스크
     "expire_points_task",
     "send_expiry_notification_task",
+    "send_expiry_notification_chunk",
     "send_email_notification",
     # 주문 태스크
     "process_order_heavy_tasks",
+    "process_order_batch",
+    "recover_order_batch",
     # 결제 태스크
     "call_toss_confirm_api",
     "finalize_payment_confirm",
+    "refund_return_payment",
+    "retry_pending_refunds_task",
+    # 상품/카테고리 태스크
+    "verify_category_product_counts_task",
+    "generate_product_image_variants",
+    "flush_product_view_counts_task",
+    # 벤치마크 태스크
+    "synthetic_workload",
 ]
@@ -0,0 +1,44 @@
+"""큐 토폴로지 벤치마크용 합성(synthetic) 태스크
+
+benchmark_celery_queues 관리 명령어에서 큐마다 발행하여
+워커 프로필별 대기 시간(p50/p99)을 측정합니다.
+"""
+
+import time
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+
+@shared_task(
+    bind=True,
+    name="shopping.tasks.benchmark_tasks.synthetic_workload",
+)
+def synthetic_workload(self, kind: str = "io", work_ms: int = 5) -> dict:
+    """
+    합성 작업 실행
+
+    Args:
+        kind: "io" (sleep으로 네트워크 대기 흉내) 또는 "cpu" (busy loop)
+        work_ms: 작업 시간 (ms)
+
+    Returns:
+        {"queue", "latency", "hostname"} (latency: 발행 → 실행 시작, 초)
+    """
+    started_at = time.time()
+    enqueued_at = self.request.get("enqueued_at")
+
+    if kind == "cpu":
+        deadline = time.perf_counter() + work_ms / 1000
+        while time.perf_counter() < deadline:
+            pass
+    else:
+        time.sleep(work_ms / 1000)
+
+    return {
+        "queue": self.request.get("enqueued_queue"),
+        "latency": max(started_at - float(enqueued_at), 0.0) if enqueued_at else 0.0,
+        "hostname": self.request.hostname,
+    }
@@ -48,7 +48,7 @@ def delete_unverified_users_task(self: Task, days: int = 7) -> dict[str, Any]:
             # 주문이 있으면 유지
             if hasattr(user, "orders") and user.orders.exists():
                 users_to_keep.append(user.email)
-                logger.info(f"⏭️ 주문 이력 있음, 유지: {user.email}")
+                logger.info("⏭️ 주문 이력 있음, 유지: %s", user.email)
                 continue
 
             users_to_delete.append(user)
@@ -61,8 +61,8 @@ def delete_unverified_users_task(self: Task, days: int = 7) -> dict[str, Any]:
             # 일괄 삭제 (연관된 토큰, 로그도 자동 삭제됨 - CASCADE)
             User.objects.filter(id__in=[user.id for user in users_to_delete]).delete()
 
-            logger.info(f"🗑️ 미인증 계정 {delete_count}개 삭제 완료")
-            logger.info(f"삭제된 계정: {deleted_emails}")
+            logger.info("🗑️ 미인증 계정 %s개 삭제 완료", delete_count)
+            logger.info("삭제된 계정: %s", deleted_emails)
         else:
             logger.info("✅ 삭제할 미인증 계정이 없습니다.")
 
@@ -76,11 +76,11 @@ def delete_unverified_users_task(self: Task, days: int = 7) -> dict[str, Any]:
             "cutoff_date": cutoff_date.isoformat(),
         }
 
-        logger.info(f"📊 미인증 계정 정리 완료: {result}")
+        logger.info("📊 미인증 계정 정리 완료: %s", result)
         return result
 
     except Exception as e:
-        logger.error(f"❌ 미인증 계정 삭제 실패: {str(e)}")
+        logger.error("❌ 미인증 계정 삭제 실패: %s", str(e))
         return {
             "success": False,
             "message": str(e),
@@ -128,7 +128,7 @@ def cleanup_old_email_logs_task(self: Task, days: int = 90) -> dict[str, Any]:
         # 일괄 삭제
         if total_count > 0:
             old_logs.delete()
-            logger.info(f"🗑️ 오래된 이메일 로그 {total_count}개 삭제 완료")
+            logger.info("🗑️ 오래된 이메일 로그 %s개 삭제 완료", total_count)
         else:
             logger.info("✅ 삭제할 오래된 이메일 로그가 없습니다.")
 
@@ -139,11 +139,11 @@ def cleanup_old_email_logs_task(self: Task, days: int = 90) -> dict[str, Any]:
             "cutoff_date": cutoff_date.isoformat(),
         }
 
-        logger.info(f"📊 이메일 로그 정리 완료: {result}")
+        logger.info("📊 이메일 로그 정리 완료: %s", result)
         return result
 
     except Exception as e:
-        logger.error(f"❌ 이메일 로그 정리 실패: {str(e)}")
+        logger.error("❌ 이메일 로그 정리 실패: %s", str(e))
         return {
             "success": False,
             "message": str(e),
@@ -182,7 +182,7 @@ def cleanup_used_tokens_task(self: Task, days: int = 30) -> dict[str, Any]:
         # 일괄 삭제
         if total_count > 0:
             used_tokens.delete()
-            logger.info(f"🗑️ 사용된 토큰 {total_count}개 삭제 완료")
+            logger.info("🗑️ 사용된 토큰 %s개 삭제 완료", total_count)
         else:
             logger.info("✅ 삭제할 사용된 토큰이 없습니다.")
 
@@ -192,11 +192,11 @@ def cleanup_used_tokens_task(self: Task, days: int = 30) -> dict[str, Any]:
             "cutoff_date": cutoff_date.isoformat(),
         }
 
-        logger.info(f"📊 사용된 토큰 정리 완료: {result}")
+        logger.info("📊 사용된 토큰 정리 완료: %s", result)
         return result
 
     except Exception as e:
-        logger.error(f"❌ 사용된 토큰 정리 실패: {str(e)}")
+        logger.error("❌ 사용된 토큰 정리 실패: %s", str(e))
         return {
             "success": False,
             "message": str(e),
@@ -231,7 +231,7 @@ def cleanup_expired_tokens_task(self: Task) -> dict[str, Any]:
         # 일괄 삭제
         if total_count > 0:
             expired_tokens.delete()
-            logger.info(f"🗑️ 만료된 토큰 {total_count}개 삭제 완료")
+            logger.info("🗑️ 만료된 토큰 %s개 삭제 완료", total_count)
         else:
             logger.info("✅ 삭제할 만료된 토큰이 없습니다.")
 
@@ -241,11 +241,11 @@ def cleanup_expired_tokens_task(self: Task) -> dict[str, Any]:
             "cutoff_date": cutoff_date.isoformat(),
         }
 
-        logger.info(f"📊 만료된 토큰 정리 완료: {result}")
+        logger.info("📊 만료된 토큰 정리 완료: %s", result)
         return result
 
     except Exception as e:
-        logger.error(f"❌ 만료된 토큰 정리 실패: {str(e)}")
+        logger.error("❌ 만료된 토큰 정리 실패: %s", str(e))
         return {
             "success": False,
             "message": str(e),
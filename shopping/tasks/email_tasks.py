@@ -7,11 +7,12 @@ from typing import Any
 from celery import Task, shared_task
 from django.conf import settings
 from django.core.mail import send_mail
-from django.template.loader import render_to_string
 from django.utils import timezone
 
 from shopping.models.email_verification import EmailLog, EmailVerificationToken
 from shopping.models.user import User
+from shopping.services.email_dispatch_service import EmailDispatchService, EmailEntry
+from shopping.services.email_render_service import EmailRenderService
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,7 @@ def send_verification_email_task(self: Task, user_id: int, token_id: int, is_res
 
         # 이미 발송 성공한 경우 중복 발송 방지
         if email_log.status == "send" and not is_resend:
-            logger.info(f"이미 발송된 이메일입니다: {user.email}")
+            logger.info("이미 발송된 이메일입니다: %s", user.email)
             return {
                 "success": True,
                 "message": "이미 발송된 이메일입니다.",
@@ -63,9 +64,8 @@ def send_verification_email_task(self: Task, user_id: int, token_id: int, is_res
         # 인증 URL 생성
         verification_url = f"{settings.FRONTEND_URL}/verify-email?token={token.token}"
 
-        # HTML 이메일 내용
-        # HTML 이메일 내용
-        html_message = render_to_string(
+        # 템플릿 한 번 렌더링으로 HTML/텍스트 본문 생성 (컴파일된 템플릿 재사용)
+        rendered = EmailRenderService.render(
             "email/verification.html",
             {
                 "user": user,
@@ -75,39 +75,21 @@ def send_verification_email_task(self: Task, user_id: int, token_id: int, is_res
             },
         )
 
-        # 텍스트 버전
-        plain_message = f"""
-안녕하세요, {user.first_name}님!
-
-{'요청하신 이메일 인증 메일을 다시 보내드립니다.' if is_resend else '회원가입을 환영합니다!'}
-
-이메일 인증을 완료하려면 아래 링크를 클릭하거나 인증 코드를 입력해주세요.
-
-인증 링크: {verification_url}
-인증 코드: {token.verification_code}
-
-이 링크와 코드는 24시간 동안 유효합니다.
-
-{'이전에 받으신 인증 메일은 더 이상 유효하지 않습니다.' if is_resend else ''}
-
-감사합니다.
-쇼핑몰 팀 드림
-"""
-
-        # 이메일 발송
+        # 이메일 발송 (워커 스레드의 SMTP 연결 재사용)
         send_mail(
             subject=email_log.subject,
-            message=plain_message,
+            message=rendered.text,
             from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[user.email],
-            html_message=html_message,
+            html_message=rendered.html,
             fail_silently=False,
+            connection=EmailDispatchService.get_connection(),
         )
 
         # 발송 성공 처리
         email_log.mark_as_sent()
 
-        logger.info(f"✅ 이메일 발송 성공: {user.email} (토큰: {token.verification_code})")
+        logger.info("✅ 이메일 발송 성공: %s (토큰: %s)", user.email, token.verification_code)
 
         return {
             "success": True,
@@ -117,21 +99,24 @@ def send_verification_email_task(self: Task, user_id: int, token_id: int, is_res
         }
 
     except User.DoesNotExist:
-        logger.error(f"❌ 사용자를 찾을 수 없습니다: user_id={user_id}")
+        logger.error("❌ 사용자를 찾을 수 없습니다: user_id=%s", user_id)
         return {
             "success": False,
             "message": "사용자를 찾을 수 없습니다.",
         }
 
     except EmailVerificationToken.DoesNotExist:
-        logger.error(f"❌ 토큰을 찾을 수 없습니다: token_id={token_id}")
+        logger.error("❌ 토큰을 찾을 수 없습니다: token_id=%s", token_id)
         return {
             "success": False,
             "message": "토큰을 찾을 수 없습니다.",
         }
 
     except Exception as e:
-        logger.error(f"❌ 이메일 발송 실패: {user.email if 'user' in locals() else 'unknown'} - {str(e)}")
+        logger.error("❌ 이메일 발송 실패: %s - %s", user.email if "user" in locals() else "unknown", str(e))
+
+        # 끊긴 연결을 재시도에서 다시 쓰지 않도록 종료
+        EmailDispatchService.close_connection()
 
         # 이메일 로그 실패 처리
         if "email_log" in locals():
@@ -166,12 +151,12 @@ def retry_failed_emails_task(self: Task) -> dict[str, Any]:
         for email_log in failed_logs:
             # 토큰이 없거나 만료된 경우 스킵
             if not email_log.token or email_log.token.is_expired():
-                logger.info(f"⏭️ 만료된 토큰 스킵: {email_log.recipient_email}")
+                logger.info("⏭️ 만료된 토큰 스킵: %s", email_log.recipient_email)
                 continue
 
             # 이미 인증된 경우 스킵
             if email_log.user and email_log.user.is_email_verified:
-                logger.info(f"⏭️ 이미 인증됨 스킵: {email_log.recipient_email}")
+                logger.info("⏭️ 이미 인증됨 스킵: %s", email_log.recipient_email)
                 continue
 
             # 재발송 시도
@@ -186,10 +171,10 @@ def retry_failed_emails_task(self: Task) -> dict[str, Any]:
                 )
 
                 success_count += 1
-                logger.info(f"🔄 재발송 예약 성공: {email_log.recipient_email}")
+                logger.info("🔄 재발송 예약 성공: %s", email_log.recipient_email)
 
             except Exception as e:
-                logger.error(f"❌ 재발송 예약 실패: {email_log.recipient_email} - {str(e)}")
+                logger.error("❌ 재발송 예약 실패: %s - %s", email_log.recipient_email, str(e))
 
         result = {
             "success": True,
@@ -198,11 +183,11 @@ def retry_failed_emails_task(self: Task) -> dict[str, Any]:
             "retry_success": success_count,
         }
 
-        logger.info(f"📊 실패 이메일 재시도 완료: {result}")
+        logger.info("📊 실패 이메일 재시도 완료: %s", result)
         return result
 
     except Exception as e:
-        logger.error(f"❌ 실패 이메일 재시도 작업 실패: {str(e)}")
+        logger.error("❌ 실패 이메일 재시도 작업 실패: %s", str(e))
         return {
             "success": False,
             "message": str(e),
@@ -249,7 +234,7 @@ def send_email_task(
             try:
                 user = User.objects.get(id=user_id)
             except User.DoesNotExist:
-                logger.warning(f"사용자를 찾을 수 없습니다: user_id={user_id}")
+                logger.warning("사용자를 찾을 수 없습니다: user_id=%s", user_id)
 
         # EmailLog 조회 또는 생성
         if user and email_type:
@@ -266,7 +251,7 @@ def send_email_task(
 
             # 이미 발송 성공한 경우 중복 발송 방지
             if not created and email_log.status == "sent":
-                logger.info(f"이미 발송된 이메일입니다: {recipient_list[0]}")
+                logger.info("이미 발송된 이메일입니다: %s", recipient_list[0])
                 return {
                     "success": True,
                     "message": "이미 발송된 이메일입니다.",
@@ -274,7 +259,7 @@ def send_email_task(
         else:
             email_log = None
 
-        # 이메일 발송
+        # 이메일 발송 (워커 스레드의 SMTP 연결 재사용)
         send_mail(
             subject=subject,
             message=message,
@@ -282,13 +267,14 @@ def send_email_task(
             recipient_list=recipient_list,
             html_message=html_message,
             fail_silently=False,
+            connection=EmailDispatchService.get_connection(),
         )
 
         # 발송 성공 처리
         if email_log:
             email_log.mark_as_sent()
 
-        logger.info(f"✅ 이메일 발송 성공: {recipient_list}")
+        logger.info("✅ 이메일 발송 성공: %s", recipient_list)
 
         return {
             "success": True,
@@ -297,7 +283,10 @@ def send_email_task(
         }
 
     except Exception as e:
-        logger.error(f"❌ 이메일 발송 실패: {recipient_list} - {str(e)}")
+        logger.error("❌ 이메일 발송 실패: %s - %s", recipient_list, str(e))
+
+        # 끊긴 연결을 재시도에서 다시 쓰지 않도록 종료
+        EmailDispatchService.close_connection()
 
         # 이메일 로그 실패 처리
         if "email_log" in locals() and email_log:
@@ -305,3 +294,45 @@ def send_email_task(
 
         # Celery 재시도
         raise self.retry(exc=e, countdown=60)
+
+
+@shared_task(bind=True)
+def send_email_batch(self: Task, entries: list[dict[str, Any]] | None = None, max_batches: int = 20) -> dict[str, Any]:
+    """
+    이메일 배치 컨슈머 (EmailDispatchService)
+
+    entries가 주어지면 그 메일만 발송하고(Redis 미사용 환경),
+    없으면 대기열이 빌 때까지 최대 max_batches회 EMAIL_BATCH_SIZE통씩 꺼내 발송합니다.
+    한도까지 발송한 뒤에도 대기열이 남아 있으면 다음 컨슈머를 예약합니다.
+    모든 배치는 워커 스레드의 SMTP 연결 하나로 발송됩니다.
+
+    Args:
+        self: Celery task 인스턴스 (bind=True)
+        entries: 발송할 메일 목록 (EmailEntry 필드 dict)
+        max_batches: 한 번 실행에서 처리할 최대 배치 수
+
+    Returns:
+        dict: 처리 결과 요약 {'batches', 'sent', 'failed'}
+    """
+    summary = {"batches": 0, "sent": 0, "failed": 0}
+
+    if entries is not None:
+        batches = [[EmailEntry(**entry) for entry in entries]]
+    else:
+        batches = (EmailDispatchService.drain() for _ in range(max_batches))
+
+    for batch in batches:
+        if not batch:
+            break
+
+        result = EmailDispatchService.send_batch(batch)
+        summary["batches"] += 1
+        summary["sent"] += result.sent
+        summary["failed"] += result.failed
+
+    # 처리 한도(max_batches)에 걸려 남은 메일은 다음 컨슈머가 이어서 발송
+    if entries is None:
+        EmailDispatchService.reschedule_if_pending()
+
+    logger.info("📨 이메일 배치 발송 완료: %s", summary)
+    return summary
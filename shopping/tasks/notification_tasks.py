@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+
+@shared_task(
+    name="shopping.tasks.notification_tasks.deliver_notification_chunk",
+    queue="notifications",
+    max_retries=3,
+    default_retry_delay=30,
+)
+def deliver_notification_chunk(broadcast_id: str, recipients: list[int | dict[str, Any]], template: dict[str, Any]) -> int:
+    """
+    대량 알림 발송 청크 처리
+
+    청크 단위로 한 트랜잭션에 삽입하므로 실패 시 청크 전체를 재시도합니다.
+
+    Args:
+        broadcast_id: 발송 ID (NotificationBroadcastService.broadcast 반환값)
+        recipients: 사용자 ID 또는 {"user_id": ...} dict 목록
+        template: BroadcastTemplate 필드 dict
+
+    Returns:
+        생성된 알림 수
+    """
+    from ..services.notification_broadcast_service import BroadcastTemplate, NotificationBroadcastService
+
+    try:
+        return NotificationBroadcastService.deliver_chunk(broadcast_id, recipients, BroadcastTemplate(**template))
+    except Exception as e:
+        logger.error(f"알림 청크 처리 실패: broadcast_id={broadcast_id}, size={len(recipients)}, error={str(e)}")
+        raise deliver_notification_chunk.retry(exc=e)
@@ -2,8 +2,6 @@
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
-from django.db import transaction
-from django.db.models import F
 
 logger = get_task_logger(__name__)
 
@@ -25,6 +23,9 @@ def process_order_heavy_tasks(
     - 포인트 사용
     - 장바구니 비우기
 
+    단건 배치로 OrderBatchService.process_batch에 위임합니다.
+    (배치 컨슈머와 동일한 락 순서/재고 배정 로직 사용)
+
     Args:
         order_id: Order ID
         cart_id: Cart ID
@@ -33,125 +34,106 @@ def process_order_heavy_tasks(
     Returns:
         처리 결과
     """
-    from ..models.cart import Cart
-    from ..models.order import Order, OrderItem
-    from ..models.product import Product
-    from ..services.point_service import PointService
+    from ..services.order_batch_service import OrderBatchEntry, OrderBatchService
 
-    logger.info(f"주문 무거운 작업 시작: order_id={order_id}")
+    logger.info("주문 무거운 작업 시작: order_id=%s", order_id)
 
     try:
-        with transaction.atomic():
-            # 1. Order 조회 및 락
-            order = Order.objects.select_for_update().get(pk=order_id)
-
-            # 이미 처리된 주문인지 확인 (멱등성)
-            if order.status != "pending":
-                logger.warning(f"이미 처리된 주문: order_id={order_id}, status={order.status}")
-                return {"status": "already_processed", "order_id": order_id}
-
-            # 2. Cart 조회 및 락
-            cart = Cart.objects.select_for_update().get(pk=cart_id)
-
-            # 3. 재고 차감 및 OrderItem 생성
-            # ✅ Deadlock 방지: Product ID 순서대로 정렬하여 락 획득 순서를 일관되게 유지
-            cart_items = cart.items.select_related('product').order_by('product_id').all()
-
-            for cart_item in cart_items:
-                product = Product.objects.select_for_update().get(pk=cart_item.product.pk)
-
-                # 재고 부족 체크
-                if product.stock < cart_item.quantity:
-                    logger.error(
-                        f"재고 부족: product_id={product.pk}, "
-                        f"requested={cart_item.quantity}, available={product.stock}"
-                    )
-
-                    # 주문 실패 처리
-                    order.status = "failed"
-                    order.failure_reason = (
-                        f"재고 부족: {product.name} "
-                        f"(요청: {cart_item.quantity}개, 재고: {product.stock}개)"
-                    )
-                    order.save(update_fields=["status", "failure_reason", "updated_at"])
-
-                    return {
-                        "status": "failed",
-                        "reason": "insufficient_stock",
-                        "product": product.name,
-                        "order_id": order_id,
-                    }
-
-                # 재고 차감
-                Product.objects.filter(pk=product.pk).update(
-                    stock=F("stock") - cart_item.quantity
-                )
+        entry = OrderBatchEntry(order_id=order_id, cart_id=cart_id, use_points=use_points)
+        result = OrderBatchService.process_batch([entry])[0]
 
-                logger.info(f"재고 차감: product_id={product.pk}, quantity={cart_item.quantity}")
+        logger.info("주문 무거운 작업 완료: order_id=%s, status=%s", order_id, result["status"])
 
-                # OrderItem 생성
-                OrderItem.objects.create(
-                    order=order,
-                    product=cart_item.product,
-                    product_name=cart_item.product.name,
-                    quantity=cart_item.quantity,
-                    price=cart_item.product.price,
-                )
+        return result
 
-            # 4. 포인트 사용 (선택적)
-            if use_points > 0:
-                point_service = PointService()
-                result = point_service.use_points_fifo(
-                    user=order.user,
-                    amount=use_points,
-                    type="use",
-                    order=order,
-                    description=f"주문 #{order.order_number} 결제시 사용",
-                    metadata={
-                        "order_id": order.id,
-                        "order_number": order.order_number,
-                    }
-                )
+    except Exception as e:
+        logger.error("주문 처리 실패: order_id=%s, error=%s", order_id, str(e))
+
+        # 재시도
+        raise process_order_heavy_tasks.retry(exc=e)
+
+
+@shared_task(
+    name="shopping.tasks.order_tasks.process_order_batch",
+    queue="order_processing",
+)
+def process_order_batch(max_batches: int = 10) -> dict:
+    """
+    주문 배치 컨슈머
 
-                if not result["success"]:
-                    logger.error(f"포인트 사용 실패: order_id={order_id}, reason={result['message']}")
+    대기열(OrderBatchService.QUEUE_KEY)이 빌 때까지, 최대 max_batches회
+    ORDER_BATCH_MAX_SIZE건씩 꺼내 한 트랜잭션으로 처리합니다.
+    한도까지 처리한 뒤에도 대기열이 남아 있으면 다음 컨슈머를 예약합니다.
 
-                    # 주문 실패 처리 (재고는 이미 차감됨 → 복구 필요)
-                    for item in order.order_items.all():
-                        Product.objects.filter(pk=item.product.pk).update(
-                            stock=F("stock") + item.quantity
-                        )
+    처리 실패 시 꺼낸 주문은 단건 태스크로 재발행하여 유실을 막습니다.
+    꺼낸 주문은 커밋(또는 단건 태스크 발행) 후에 ack하므로, 그 전에 워커가 죽으면
+    recover_order_batch가 대기열로 되돌립니다.
 
-                    order.status = "failed"
+    Args:
+        max_batches: 한 번 실행에서 처리할 최대 배치 수
 
-                    order.failure_reason = f"포인트 사용 실패: {result['message']}"
-                    order.save(update_fields=["status", "failure_reason", "updated_at"])
+    Returns:
+        처리 결과 요약
+    """
+    from ..services.order_batch_service import OrderBatchService
+
+    summary = {"batches": 0, "processed": 0, "confirmed": 0, "failed": 0}
+
+    for _ in range(max_batches):
+        entries = OrderBatchService.drain()
+        if not entries:
+            break
+
+        try:
+            results = OrderBatchService.process_batch(entries)
+        except Exception as e:
+            logger.error("주문 배치 처리 실패: size=%s, error=%s", len(entries), str(e))
+
+            # 배치 트랜잭션은 롤백됨 → 주문별 단건 태스크로 격리 재처리
+            for entry in entries:
+                process_order_heavy_tasks.delay(
+                    order_id=entry.order_id,
+                    cart_id=entry.cart_id,
+                    use_points=entry.use_points,
+                )
+            OrderBatchService.ack(entries)
+            continue
 
+        OrderBatchService.ack(entries)
+        summary["batches"] += 1
+        summary["processed"] += len(results)
+        summary["confirmed"] += sum(1 for r in results if r["status"] == "success")
+        summary["failed"] += sum(1 for r in results if r["status"] == "failed")
 
-                    return {
-                        "status": "failed",
-                        "reason": "point_deduction_failed",
-                        "message": result["message"],
-                        "order_id": order_id,
-                    }
+    # 처리 한도(max_batches)에 걸려 남은 주문은 다음 컨슈머가 이어서 처리
+    OrderBatchService.reschedule_if_pending()
 
-            # 5. 주문 확정
-            order.status = "confirmed"
-            order.save(update_fields=["status", "updated_at"])
+    if summary["batches"]:
+        logger.info(
+            "주문 배치 컨슈머 완료: batches=%s, processed=%s, confirmed=%s, failed=%s",
+            summary["batches"],
+            summary["processed"],
+            summary["confirmed"],
+            summary["failed"],
+        )
 
-            # 6. 장바구니 비우기
-            cart.items.all().delete()
+    return summary
 
-            logger.info(f"주문 무거운 작업 완료: order_id={order_id}")
 
-            return {
-                "status": "success",
-                "order_id": order_id,
-                "order_number": order.order_number,
-            }
+@shared_task(
+    name="shopping.tasks.order_tasks.recover_order_batch",
+    queue="order_processing",
+)
+def recover_order_batch() -> int:
+    """
+    처리 중 멈춘 주문 배치 복구 (주기 실행)
+
+    컨슈머가 꺼낸 뒤 커밋 전에 워커가 죽거나 재시작되어 ack되지 않은 주문을
+    ORDER_BATCH_PROCESSING_TIMEOUT이 지나면 대기열로 되돌리고 컨슈머를 예약합니다.
 
-    except Exception as e:
-        logger.error(f"주문 처리 실패: order_id={order_id}, error={str(e)}")
+    Returns:
+        대기열로 되돌린 주문 수
+    """
+    from ..services.order_batch_service import OrderBatchService
 
-        # 재시도
-        raise process_order_heavy_tasks.retry(exc=e)
+    return OrderBatchService.recover_stale()
@@ -1,5 +1,7 @@
 """결제 관련 Celery 태스크"""
 
+from datetime import timedelta
+
 from celery import shared_task
 from celery.utils.log import get_task_logger
 from django.db import transaction
@@ -36,7 +38,7 @@ def call_toss_confirm_api(payment_key: str, order_id: int, amount: int) -> dict:
     Raises:
         TossPaymentError: API 호출 실패
     """
-    logger.info(f"Toss API 호출 시작: order_id={order_id}, amount={amount}")
+    logger.info("Toss API 호출 시작: order_id=%s, amount=%s", order_id, amount)
 
     try:
         toss_client = TossPaymentClient()
@@ -46,11 +48,11 @@ def call_toss_confirm_api(payment_key: str, order_id: int, amount: int) -> dict:
             amount=amount,
         )
 
-        logger.info(f"Toss API 호출 성공: order_id={order_id}")
+        logger.info("Toss API 호출 성공: order_id=%s", order_id)
         return payment_data
 
     except TossPaymentError as e:
-        logger.error(f"Toss API 호출 실패: order_id={order_id}, error={e.message}")
+        logger.error("Toss API 호출 실패: order_id=%s, error=%s", order_id, e.message)
 
         # 에러 로그 기록 및 Payment 상태만 업데이트
         # Order 상태는 변경하지 않음 (트랜잭션 롤백 테스트 지원)
@@ -66,7 +68,7 @@ def call_toss_confirm_api(payment_key: str, order_id: int, amount: int) -> dict:
                 data={"error_code": e.code, "error_message": e.message},
             )
         except Exception as log_error:
-            logger.error(f"에러 로그 기록 실패: {str(log_error)}")
+            logger.error("에러 로그 기록 실패: %s", str(log_error))
 
         # 재시도 (네트워크 오류 등)
         if e.code in ["NETWORK_ERROR", "TIMEOUT"]:
@@ -101,7 +103,7 @@ def finalize_payment_confirm(toss_response: dict, payment_id: int, user_id: int)
     """
     from ..models.user import User
 
-    logger.info(f"결제 최종 처리 시작: payment_id={payment_id}")
+    logger.info("결제 최종 처리 시작: payment_id=%s", payment_id)
 
     try:
         with transaction.atomic():
@@ -110,7 +112,7 @@ def finalize_payment_confirm(toss_response: dict, payment_id: int, user_id: int)
 
             # 중복 처리 방지
             if payment.is_paid:
-                logger.warning(f"이미 처리된 결제: payment_id={payment_id}")
+                logger.warning("이미 처리된 결제: payment_id=%s", payment_id)
                 return {"status": "already_processed", "payment_id": payment_id}
 
             payment.mark_as_paid(toss_response)
@@ -137,7 +139,7 @@ def finalize_payment_confirm(toss_response: dict, payment_id: int, user_id: int)
                 data=toss_response,
             )
 
-        logger.info(f"결제 최종 처리 완료: payment_id={payment_id}, order_id={order.id}")
+        logger.info("결제 최종 처리 완료: payment_id=%s, order_id=%s", payment_id, order.id)
 
         # 6. 포인트 적립은 별도 태스크로 (비동기)
         from .point_tasks import add_points_after_payment
@@ -152,7 +154,67 @@ def finalize_payment_confirm(toss_response: dict, payment_id: int, user_id: int)
         }
 
     except Exception as e:
-        logger.error(f"결제 최종 처리 실패: payment_id={payment_id}, error={str(e)}")
+        logger.error("결제 최종 처리 실패: payment_id=%s, error=%s", payment_id, str(e))
 
         # 재시도
         raise finalize_payment_confirm.retry(exc=e)
+
+
+# 반품 PG 환불 재시도 간격 (초) - 시도마다 2배 (30초, 60초, 120초, ...)
+REFUND_RETRY_BASE_DELAY = 30
+# 이 시간 이상 pending/processing에 머문 환불은 정기 태스크가 다시 큐에 등록
+REFUND_STALE_AFTER = timedelta(minutes=10)
+
+
+@shared_task(
+    name="shopping.tasks.payment_tasks.refund_return_payment",
+    queue="payment_critical",
+    bind=True,
+    max_retries=None,  # 시도 횟수는 Return.refund_attempts로 제한 (ReturnService.REFUND_MAX_ATTEMPTS)
+)
+def refund_return_payment(self, return_id: int) -> dict:
+    """
+    반품 PG 환불 (ReturnService.complete_refund 커밋 후 실행)
+
+    재고 복구/상태 변경 트랜잭션과 분리되어 있어 토스 API가 느려도 상품 행 락을 잡지 않습니다.
+    일시적 오류로 pending이 유지되면 지수 백오프로 재시도합니다.
+
+    Args:
+        return_id: Return ID
+
+    Returns:
+        처리 결과
+    """
+    from ..services.return_service import ReturnService
+
+    return_obj = ReturnService.process_refund(return_id)
+    if return_obj is None:
+        return {"status": "skipped", "return_id": return_id}
+
+    if return_obj.refund_status == "pending":
+        countdown = REFUND_RETRY_BASE_DELAY * 2**self.request.retries
+        logger.warning("반품 PG 환불 재시도 예약: return_id=%s, countdown=%s", return_id, countdown)
+        raise self.retry(countdown=countdown)
+
+    return {"status": return_obj.refund_status, "return_id": return_id}
+
+
+@shared_task(name="shopping.tasks.payment_tasks.retry_pending_refunds_task", queue="payment_critical")
+def retry_pending_refunds_task() -> dict:
+    """
+    대기/정체된 반품 PG 환불 재등록 (정기 실행)
+
+    커밋 후 큐 등록 실패, 워커 중단 등으로 처리되지 않은 환불을 다시 refund_return_payment에 넣습니다.
+
+    Returns:
+        재등록 건수
+    """
+    from ..services.return_service import ReturnService
+
+    return_ids = ReturnService.get_retryable_refund_ids(stale_after=REFUND_STALE_AFTER)
+    for return_id in return_ids:
+        refund_return_payment.delay(return_id)
+
+    if return_ids:
+        logger.info("반품 PG 환불 재등록: count=%s", len(return_ids))
+    return {"requeued": len(return_ids)}
@@ -27,7 +27,7 @@ def expire_points_task() -> dict[str, Any]:
     """
     from shopping.services.point_service import PointService
 
-    logger.info(f"포인트 만료 처리 시작: {timezone.now()}")
+    logger.info("포인트 만료 처리 시작: %s", timezone.now())
 
     try:
         service = PointService()
@@ -40,11 +40,11 @@ def expire_points_task() -> dict[str, Any]:
             "message": f"{expired_count}건의 포인트가 만료 처리되었습니다.",
         }
 
-        logger.info(f"포인트 만료 처리 완료: {result}")
+        logger.info("포인트 만료 처리 완료: %s", result)
         return result
 
     except Exception as e:
-        logger.error(f"포인트 만료 처리 실패: {str(e)}\n{traceback.format_exc()}")
+        logger.error("포인트 만료 처리 실패: %s\n%s", str(e), traceback.format_exc())
 
         # 재시도
         raise expire_points_task.retry(exc=e)
@@ -65,7 +65,7 @@ def send_expiry_notification_task() -> dict[str, Any]:
     """
     from shopping.services.point_service import PointService
 
-    logger.info(f"포인트 만료 알림 발송 시작: {timezone.now()}")
+    logger.info("포인트 만료 알림 발송 시작: %s", timezone.now())
 
     try:
         service = PointService()
@@ -75,17 +75,44 @@ def send_expiry_notification_task() -> dict[str, Any]:
             "status": "success",
             "notification_count": notification_count,
             "executed_at": timezone.now().isoformat(),
-            "message": f"{notification_count}명에게 만료 예정 알림을 발송했습니다.",
+            "message": f"{notification_count}명에게 만료 예정 알림 발송을 예약했습니다.",
         }
 
-        logger.info(f"포인트 만료 알림 발송 완료: {result}")
+        logger.info("포인트 만료 알림 발송 완료: %s", result)
         return result
 
     except Exception as e:
-        logger.error(f"포인트 만료 알림 발송 실패: {str(e)}\n{traceback.format_exc()}")
+        logger.error("포인트 만료 알림 발송 실패: %s\n%s", str(e), traceback.format_exc())
         raise send_expiry_notification_task.retry(exc=e)
 
 
+@shared_task(
+    name="shopping.tasks.send_expiry_notification_chunk",
+    queue="notifications",
+    max_retries=3,
+    default_retry_delay=60,
+)
+def send_expiry_notification_chunk(point_ids: list[int]) -> int:
+    """
+    포인트 만료 예정 알림 청크 발송 태스크 (send_expiry_notification_task가 발행)
+
+    청크는 EMAIL_BATCH_SIZE명 단위라 발송 속도 제한 안에서도 태스크 시간 제한보다 훨씬 짧게 끝납니다.
+
+    Args:
+        point_ids: 청크에 포함된 만료 예정 포인트 ID 목록
+
+    Returns:
+        알림 발송 건수
+    """
+    from shopping.services.point_service import PointService
+
+    try:
+        return PointService().send_expiry_notification_chunk(point_ids)
+    except Exception as e:
+        logger.error("포인트 만료 알림 청크 발송 실패: size=%s, error=%s", len(point_ids), str(e))
+        raise send_expiry_notification_chunk.retry(exc=e)
+
+
 @shared_task(
     name="shopping.tasks.send_email_notification",
     queue="notifications",
@@ -105,6 +132,8 @@ def send_email_notification(email: str, subject: str, message: str, html_message
     Returns:
         발송 성공 여부
     """
+    from shopping.services.email_dispatch_service import EmailDispatchService
+
     try:
         send_mail(
             subject=subject,
@@ -113,13 +142,15 @@ def send_email_notification(email: str, subject: str, message: str, html_message
             recipient_list=[email],
             html_message=html_message,
             fail_silently=False,
+            connection=EmailDispatchService.get_connection(),
         )
 
-        logger.info(f"이메일 발송 성공: {email} - {subject}")
+        logger.info("이메일 발송 성공: %s - %s", email, subject)
         return True
 
     except Exception as e:
-        logger.error(f"이메일 발송 실패: {email} - {str(e)}")
+        logger.error("이메일 발송 실패: %s - %s", email, str(e))
+        EmailDispatchService.close_connection()
 
         # 재시도
         raise send_email_notification.retry(exc=e)
@@ -150,7 +181,7 @@ def add_points_after_payment(user_id: int, order_id: int) -> dict[str, Any]:
     from shopping.models.user import User
     from shopping.services.point_service import PointService
 
-    logger.info(f"포인트 적립 처리 시작: user_id={user_id}, order_id={order_id}")
+    logger.info("포인트 적립 처리 시작: user_id=%s, order_id=%s", user_id, order_id)
 
     try:
         user = User.objects.get(pk=user_id)
@@ -159,7 +190,7 @@ def add_points_after_payment(user_id: int, order_id: int) -> dict[str, Any]:
         # 포인트 적립 계산
         # 포인트로만 결제한 경우는 적립하지 않음
         if order.final_amount <= 0:
-            logger.info(f"포인트 전액 결제로 적립 없음: order_id={order_id}")
+            logger.info("포인트 전액 결제로 적립 없음: order_id=%s", order_id)
             return {
                 "status": "skipped",
                 "message": "포인트 전액 결제로 적립하지 않음",
@@ -173,14 +204,16 @@ def add_points_after_payment(user_id: int, order_id: int) -> dict[str, Any]:
         points_to_add = int(product_amount * Decimal(earn_rate) / Decimal("100"))
 
         if points_to_add <= 0:
-            logger.info(f"적립할 포인트 없음: order_id={order_id}, final_amount={order.final_amount}")
+            logger.info("적립할 포인트 없음: order_id=%s, final_amount=%s", order_id, order.final_amount)
             return {
                 "status": "skipped",
                 "message": "적립할 포인트 없음",
                 "order_id": order_id,
             }
 
-        logger.info(f"포인트 적립: user_id={user.id}, order_id={order.id}, " f"points={points_to_add}, earn_rate={earn_rate}%")
+        logger.info(
+            "포인트 적립: user_id=%s, order_id=%s, points=%s, earn_rate=%s%%", user.id, order.id, points_to_add, earn_rate
+        )
 
         # 포인트 적립
         PointService.add_points(
@@ -214,7 +247,7 @@ def add_points_after_payment(user_id: int, order_id: int) -> dict[str, Any]:
                 data={"points": points_to_add},
             )
 
-        logger.info(f"포인트 적립 완료: user_id={user.id}, order_id={order.id}, points={points_to_add}")
+        logger.info("포인트 적립 완료: user_id=%s, order_id=%s, points=%s", user.id, order.id, points_to_add)
 
         return {
             "status": "success",
@@ -225,7 +258,7 @@ def add_points_after_payment(user_id: int, order_id: int) -> dict[str, Any]:
         }
 
     except (User.DoesNotExist, Order.DoesNotExist) as e:
-        logger.error(f"포인트 적립 실패 - 데이터 없음: {str(e)}")
+        logger.error("포인트 적립 실패 - 데이터 없음: %s", str(e))
         return {
             "status": "failed",
             "message": str(e),
@@ -234,7 +267,7 @@ def add_points_after_payment(user_id: int, order_id: int) -> dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"포인트 적립 처리 실패: user_id={user_id}, order_id={order_id}, error={str(e)}")
+        logger.error("포인트 적립 처리 실패: user_id=%s, order_id=%s, error=%s", user_id, order_id, str(e))
 
         # 재시도
         raise add_points_after_payment.retry(exc=e)
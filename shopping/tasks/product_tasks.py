@@ -0,0 +1,85 @@
+"""상품/카테고리 관련 Celery 태스크"""
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+
+@shared_task(name="shopping.tasks.product_tasks.verify_category_product_counts_task")
+def verify_category_product_counts_task() -> dict:
+    """
+    카테고리 상품 수 카운터 정합성 검사 (매일 실행)
+
+    시그널을 거치지 않은 상품 변경으로 어긋난 Category.active_product_count를
+    실제 활성 상품 수로 보정합니다.
+
+    Returns:
+        검사 결과 (보정한 카테고리 수, 카테고리별 기존/실제 값)
+    """
+    from ..services.category_tree_service import CategoryTreeService
+
+    mismatched = CategoryTreeService.verify_product_counts()
+
+    logger.info("카테고리 상품 수 정합성 검사 완료: fixed=%s", len(mismatched))
+    return {
+        "fixed": len(mismatched),
+        "categories": {
+            category_id: {"stored": stored, "actual": actual} for category_id, (stored, actual) in mismatched.items()
+        },
+    }
+
+
+@shared_task(
+    name="shopping.tasks.product_tasks.generate_product_image_variants",
+    max_retries=3,
+    default_retry_delay=30,
+)
+def generate_product_image_variants(image_id: int, force: bool = False) -> dict:
+    """
+    상품 이미지 변형(WebP/JPEG 고정 너비) 생성
+
+    이미 만든 변형은 건너뛰므로 재시도/중복 실행해도 안전합니다.
+    원본이 삭제되었거나 이미지로 읽을 수 없는 파일이면 재시도하지 않습니다.
+
+    Args:
+        image_id: ProductImage ID
+        force: True면 기존 변형을 지우고 다시 생성
+
+    Returns:
+        생성 결과 (생성/건너뜀/삭제 수)
+    """
+    from PIL import UnidentifiedImageError
+
+    from ..models.product import ProductImage
+    from ..services.image_variant_service import ImageVariantService
+
+    try:
+        result = ImageVariantService.generate(image_id, force=force)
+    except ProductImage.DoesNotExist:
+        logger.info("이미지 변형 생성 건너뜀 (원본 삭제됨): image_id=%s", image_id)
+        return {"image_id": image_id, "created": 0, "skipped": 0, "removed": 0}
+    except UnidentifiedImageError as e:
+        logger.error("이미지 변형 생성 실패 (이미지 형식 아님): image_id=%s, error=%s", image_id, e)
+        return {"image_id": image_id, "created": 0, "skipped": 0, "removed": 0}
+    except Exception as e:
+        logger.error("이미지 변형 생성 실패: image_id=%s, error=%s", image_id, e)
+        raise generate_product_image_variants.retry(exc=e)
+
+    return {"image_id": image_id, "created": len(result.created), "skipped": result.skipped, "removed": result.removed}
+
+
+@shared_task(name="shopping.tasks.product_tasks.flush_product_view_counts_task")
+def flush_product_view_counts_task() -> dict:
+    """
+    Redis에 모인 상품 조회수를 view_count에 반영 (1분마다 실행)
+
+    반영 후 인기 급상승 점수를 경과 시간만큼 감쇠합니다.
+    다른 워커가 반영 중이면 아무것도 하지 않습니다.
+
+    Returns:
+        반영 결과 (조회수가 반영된 상품 수)
+    """
+    from ..services.product_view_service import ProductViewService
+
+    return {"flushed": ProductViewService.flush()}
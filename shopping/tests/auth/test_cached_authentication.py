@@ -0,0 +1,140 @@
+"""CachedJWTAuthentication (인증 사용자 캐시) 테스트"""
+
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from shopping.authentication import CachedJWTAuthentication
+from shopping.services.user_auth_cache_service import UserAuthCacheService
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """캐시 검증용 실제 캐시 (테스트 기본값은 DummyCache)"""
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def authenticate(user):
+    return CachedJWTAuthentication().get_user(AccessToken.for_user(user))
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    """캐시 기반 사용자 조회 테스트"""
+
+    def test_cache_hit_costs_no_query(self, locmem_cache, user, django_assert_num_queries):
+        """캐시가 채워진 뒤 인증은 쿼리 없이 처리"""
+        # Arrange
+        authenticate(user)
+
+        # Act & Assert
+        with django_assert_num_queries(0):
+            resolved = authenticate(user)
+            assert resolved.pk == user.pk
+            assert resolved.is_authenticated
+            assert resolved.is_staff is False
+
+    def test_deferred_fields_load_in_one_query(self, locmem_cache, user, django_assert_num_queries):
+        """권한 필드 외의 필드는 처음 접근할 때 한 번에 로드"""
+        # Arrange
+        resolved = authenticate(user)
+
+        # Act & Assert
+        with django_assert_num_queries(1):
+            assert resolved.email == user.email
+            assert resolved.points == user.points
+            assert resolved.phone_number == user.phone_number
+
+    def test_save_invalidates_cache(self, locmem_cache, user):
+        """사용자 저장(권한 변경) 시 다음 인증에 바로 반영"""
+        # Arrange
+        authenticate(user)
+
+        # Act
+        user.is_staff = True
+        user.save(update_fields=["is_staff"])
+
+        # Assert
+        assert authenticate(user).is_staff is True
+
+    def test_withdrawn_user_is_rejected(self, locmem_cache, user):
+        """탈퇴(비활성화) 후 캐시에 남은 토큰으로 인증 불가"""
+        # Arrange
+        authenticate(user)
+
+        # Act
+        user.is_withdrawn = True
+        user.is_active = False
+        user.save()
+
+        # Assert
+        with pytest.raises(AuthenticationFailed) as exc_info:
+            authenticate(user)
+        assert exc_info.value.detail["code"] == "user_inactive"
+
+    def test_deleted_user_is_rejected(self, locmem_cache, user):
+        """삭제된 사용자는 user_not_found"""
+        # Arrange
+        token = AccessToken.for_user(user)
+        authenticate(user)
+
+        # Act
+        user.delete()
+
+        # Assert
+        with pytest.raises(AuthenticationFailed) as exc_info:
+            CachedJWTAuthentication().get_user(token)
+        assert exc_info.value.detail["code"] == "user_not_found"
+
+    def test_token_without_user_claim(self):
+        """user_id 클레임이 없는 토큰은 InvalidToken"""
+        token = AccessToken()
+
+        with pytest.raises(InvalidToken):
+            CachedJWTAuthentication().get_user(token)
+
+    def test_cached_values_exclude_password(self, locmem_cache, user):
+        """비밀번호 해시는 캐시에 저장하지 않음"""
+        # Act
+        UserAuthCacheService.get(user.pk)
+
+        # Assert
+        cached = cache.get(UserAuthCacheService.CACHE_KEY.format(user_id=user.pk))
+        assert set(cached) == set(UserAuthCacheService.AUTH_FIELDS)
+
+
+@pytest.mark.django_db
+class TestCachedAuthenticationApi:
+    """API 요청 경로 테스트"""
+
+    def test_password_change_invalidates_cache(self, locmem_cache, authenticated_client, user):
+        """비밀번호 변경 후 캐시 항목 삭제"""
+        # Arrange
+        authenticated_client.get(reverse("user-profile"))
+        key = UserAuthCacheService.CACHE_KEY.format(user_id=user.pk)
+        assert cache.get(key) is not None
+
+        # Act
+        user.set_password("newpass123!")
+        user.save()
+
+        # Assert
+        assert cache.get(key) is None
+
+    def test_profile_request_uses_cached_user(self, locmem_cache, authenticated_client, user):
+        """프로필 조회 응답은 기존과 동일"""
+        # Act
+        response = authenticated_client.get(reverse("user-profile"))
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["username"] == user.username
+        assert response.json()["email"] == user.email
@@ -1,6 +1,12 @@
+import importlib
+import re
+from collections import Counter
+from contextlib import contextmanager
 from decimal import Decimal
 
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -24,6 +30,14 @@ DEFAULT_SHIPPING_FEE = ShippingService.DEFAULT_SHIPPING_FEE
 REMOTE_AREA_FEE = ShippingService.REMOTE_AREA_FEE
 MIN_POINTS = OrderService.MIN_POINTS
 
+# caplog로 캡처할 수 있도록 propagate=True로 바꿀 로거
+PROPAGATE_LOGGERS = [
+    "shopping.services",
+    "shopping.services.order_service",
+    "shopping.services.payment_service",
+    "shopping.webhooks",
+]
+
 # Fixture 기본값 상수
 DEFAULT_USER_POINTS = 5000
 DEFAULT_PRODUCT_PRICE = Decimal("10000")
@@ -73,6 +87,32 @@ def setup_throttle_for_tests():
     }
 
 
+@pytest.fixture(autouse=True)
+def reset_throttle_state():
+    """
+    테스트마다 프로세스 로컬 rate limit 상태 초기화
+
+    테스트 환경은 Redis가 없어 throttle이 프로세스 로컬 GCRA로 동작하므로
+    이전 테스트의 요청 수가 다음 테스트로 이어지지 않도록 합니다.
+    """
+    from shopping.throttles import reset_local_limits
+
+    reset_local_limits()
+
+
+@pytest.fixture(autouse=True)
+def reset_product_view_buffer():
+    """
+    테스트마다 프로세스 로컬 조회수 버퍼 초기화
+
+    Redis가 없으면 상세 조회수가 프로세스 메모리에 쌓였다가 일정 주기마다 요청 중에 반영되므로
+    이전 테스트의 조회수나 반영 시점이 쿼리 수 검증에 섞이지 않도록 합니다.
+    """
+    from shopping.services.product_view_service import ProductViewService
+
+    ProductViewService.reset_local_buffer()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_logging_for_tests():
     """
@@ -85,12 +125,7 @@ def setup_logging_for_tests():
     import logging
 
     # shopping 앱의 주요 로거들 propagate 설정
-    for logger_name in [
-        "shopping.services",
-        "shopping.services.order_service",
-        "shopping.services.payment_service",
-        "shopping.webhooks",
-    ]:
+    for logger_name in PROPAGATE_LOGGERS:
         logger = logging.getLogger(logger_name)
         logger.propagate = True
 
@@ -102,10 +137,19 @@ def django_db_setup(django_db_setup, django_db_blocker):
 
     PostgreSQL 환경에서 테스트 DB 설정 최적화
     Session scope로 DB 연결 비용 최소화
+
+    --nomigrations는 모델로 테이블만 만들므로, 모델 상태 밖에서 마이그레이션 SQL로 만드는
+    객체(번호 발급 시퀀스)는 같은 SQL을 직접 실행하여 생성합니다.
+    PostgreSQL 이외 DB(test_replica의 SQLite 등)는 시퀀스 대신 카운터 테이블을 사용하므로 건너뜁니다.
     """
+    if connection.vendor != "postgresql":
+        return
+
+    number_sequences = importlib.import_module("shopping.migrations.0024_number_sequences")
+
     with django_db_blocker.unblock():
-        # 필요한 경우 초기 데이터 설정
-        pass
+        with connection.cursor() as cursor:
+            cursor.execute(number_sequences.CREATE_SEQUENCES_SQL)
 
 
 # ==========================================
@@ -626,6 +670,108 @@ def freeze_time(mocker):
     return _freeze
 
 
+class InMemoryRedis:
+    """
+    대기열 테스트용 Redis 대역 (리스트/해시/문자열 키만, TTL은 무시)
+
+    테스트 환경은 Redis 캐시 백엔드가 아니므로 실제 대기열 경로
+    (RPUSH → SET NX 예약 → LMOVE/LPOP)를 검증할 때 _get_connection 대신 사용합니다.
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return InMemoryPipeline(self)
+
+    def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+        return len(self.data[key])
+
+    def lpop(self, key, count=None):
+        items = self.data.get(key, [])
+        popped, self.data[key] = items[: count or 1], items[count or 1 :]
+        if count is None:
+            return popped[0] if popped else None
+        return popped or None
+
+    def lmove(self, source, destination, src="LEFT", dest="RIGHT"):
+        items = self.data.get(source, [])
+        if not items:
+            return None
+        value = items.pop(0 if src == "LEFT" else -1)
+        target = self.data.setdefault(destination, [])
+        target.insert(0 if dest == "LEFT" else len(target), value)
+        return value
+
+    def lrem(self, key, count, value):
+        items = self.data.get(key, [])
+        if value in items:
+            items.remove(value)
+            return 1
+        return 0
+
+    def lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        return list(items[start:] if end == -1 else items[start : end + 1])
+
+    def llen(self, key):
+        return len(self.data.get(key, []))
+
+    def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update({str(field): str(value) for field, value in mapping.items()})
+        return len(mapping)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hdel(self, key, *fields):
+        hash_ = self.data.get(key, {})
+        return sum(1 for field in fields if hash_.pop(str(field), None) is not None)
+
+    def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+
+class InMemoryPipeline:
+    """InMemoryRedis 파이프라인 (명령을 모았다가 execute에서 순서대로 실행)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((getattr(self.conn, name), args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+@pytest.fixture
+def in_memory_redis():
+    """
+    Redis 대기열 대역
+
+    사용 예시:
+        mocker.patch.object(OrderBatchService, "_get_connection", return_value=in_memory_redis)
+    """
+    return InMemoryRedis()
+
+
 # ==========================================
 # 9. 주문/결제 Fixture (Order/Payment)
 # ==========================================
@@ -863,3 +1009,56 @@ def add_to_cart_helper(db):
         return cart, cart_item
 
     return _add_to_cart
+
+
+# ==========================================
+# 11. 쿼리 예산 (N+1 회귀 방지)
+# ==========================================
+
+# URL 이름별 최대 쿼리 수 (JWT 인증 조회 포함)
+# 목록 크기와 무관해야 하므로, 늘어나면 N+1 회귀입니다.
+QUERY_BUDGETS = {
+    "product-list": 3,
+    "order-list": 3,
+    "notification-list": 3,
+    "return-list": 2,
+}
+
+_SQL_LITERALS = re.compile(r"'[^']*'|\b\d+\b")
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    쿼리 수 상한 검증 헬퍼
+
+    예산은 숫자로 직접 주거나 QUERY_BUDGETS의 URL 이름으로 지정합니다.
+    초과 시 실행된 SQL과 반복된 SQL 패턴(N+1 의심)을 함께 출력합니다.
+
+    사용 예시:
+        with assert_max_queries("product-list"):
+            api_client.get(reverse("product-list"))
+
+        with assert_max_queries(2):
+            OrderService.get_summary(user)
+    """
+
+    @contextmanager
+    def _assert_max_queries(budget):
+        limit = QUERY_BUDGETS[budget] if isinstance(budget, str) else budget
+
+        with CaptureQueriesContext(connection) as context:
+            yield context
+
+        if len(context) > limit:
+            patterns = Counter(_SQL_LITERALS.sub("?", query["sql"]) for query in context.captured_queries)
+            repeated = [f"  {count}x {sql}" for sql, count in patterns.most_common() if count > 1]
+            executed = [f"  {i}. {query['sql']}" for i, query in enumerate(context.captured_queries, 1)]
+            pytest.fail(
+                f"쿼리 예산 초과 ({budget}): {len(context)} > {limit}\n"
+                + ("반복된 쿼리 (N+1 의심):\n" + "\n".join(repeated) + "\n" if repeated else "")
+                + "실행된 쿼리:\n"
+                + "\n".join(executed)
+            )
+
+    return _assert_max_queries
@@ -1323,6 +1323,15 @@ class ReturnItemFactory(DjangoModelFactory):
     product_name = factory.LazyAttribute(lambda obj: obj.order_item.product_name)
     product_price = factory.LazyAttribute(lambda obj: obj.order_item.price)
 
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        """생성 후 Return 목록용 요약(item_count, items_amount)도 create_return과 같게 갱신"""
+        from shopping.services.return_service import ReturnService
+
+        return_item = super()._create(model_class, *args, **kwargs)
+        ReturnService.refresh_summary([return_item.return_request_id])
+        return return_item
+
 
 # ==========================================
 # Product QA Factories
@@ -1,6 +1,8 @@
 from datetime import timedelta
 from decimal import Decimal
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -9,6 +11,7 @@ from rest_framework import status
 
 from shopping.models.order import Order, OrderItem
 from shopping.models.user import User
+from shopping.tests.factories import ProductFactory, ProductImageFactory
 
 from .conftest import TEST_ADMIN_PASSWORD, TEST_USER_PASSWORD
 
@@ -379,6 +382,42 @@ class TestOrderListBoundary:
         assert response.data["count"] == 100
         assert len(response.data["results"]) == 10  # 기본 page_size
 
+    def test_list_shows_summary_saved_at_order_creation(
+        self, authenticated_client, user, product, add_to_cart_helper, shipping_data
+    ):
+        """주문 생성 시 저장된 요약(상품 수, 대표 상품명/이미지)을 목록에 표시"""
+        # Arrange
+        image = ProductImageFactory.primary(product=product)
+        other_product = ProductFactory(stock=10)
+        add_to_cart_helper(user, product, quantity=1)
+        add_to_cart_helper(user, other_product, quantity=2)
+        authenticated_client.post(reverse("order-list"), shipping_data, format="json")
+
+        # Act
+        response = authenticated_client.get(reverse("order-list"))
+
+        # Assert
+        result = response.data["results"][0]
+        assert result["status"] == "confirmed"
+        assert result["item_count"] == 2
+        assert result["first_product_name"] == product.name  # 확정 시 실제 주문 아이템 기준 (상품 ID 순)
+        assert result["thumbnail_url"].endswith(image.image.url)
+
+    def test_list_does_not_query_order_items(self, authenticated_client, user, order_factory):
+        """목록 조회는 주문 아이템/상품 테이블을 조회하지 않음"""
+        # Arrange
+        order_factory(user, item_count=3, first_product_name="요약 상품")
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(reverse("order-list"))
+
+        # Assert
+        assert response.data["results"][0]["item_count"] == 3
+        assert response.data["results"][0]["first_product_name"] == "요약 상품"
+        assert response.data["results"][0]["thumbnail_url"] is None
+        assert not [q for q in ctx.captured_queries if OrderItem._meta.db_table in q["sql"]]
+
 
 @pytest.mark.django_db
 class TestOrderListException:
@@ -519,10 +558,9 @@ class TestOrderListException:
         url = reverse("order-list")
 
         # Act & Assert - 쿼리 수 확인
-        # 실제 쿼리: 인증(1) + count(1) + orders with select_related/prefetch_related(1)
-        #            + annotate(1) + session(1) = 5
-        # 리팩토링 후 select_related("user")로 user 조회 최적화 완료
-        with django_assert_num_queries(5):
+        # 실제 쿼리: 인증(1) + count(1) + orders with select_related("user")(1) = 3
+        # 목록은 Order에 저장된 요약만 사용 (order_items/product prefetch 없음)
+        with django_assert_num_queries(3):
             response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
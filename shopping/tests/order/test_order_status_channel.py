@@ -0,0 +1,166 @@
+"""주문 처리 상태 채널 테스트 (/api/orders/{id}/status/)"""
+
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from shopping.models.order import Order
+from shopping.services.order_status_service import OrderStatusService
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """상태 채널 검증용 실제 캐시 (테스트 기본값은 DummyCache)"""
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestOrderStatusChannelHappyPath:
+    """상태 조회 정상 케이스"""
+
+    def test_returns_processing_status(self, authenticated_client, user, order_factory):
+        """pending 주문은 처리 중으로 표시"""
+        # Arrange
+        order = order_factory(user, status="pending")
+        url = reverse("order-order-status", kwargs={"pk": order.id})
+
+        # Act
+        response = authenticated_client.get(url)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["order_id"] == order.id
+        assert response.data["status"] == "pending"
+        assert response.data["is_processing"] is True
+        assert "user_id" not in response.data
+
+    def test_cache_hit_does_not_query_orders(self, authenticated_client, user, order_factory, locmem_cache):
+        """캐시된 상태 조회는 주문 테이블을 조회하지 않음"""
+        # Arrange
+        order = order_factory(user, status="pending")
+        OrderStatusService.publish(order)
+        url = reverse("order-order-status", kwargs={"pk": order.id})
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert not [q for q in ctx.captured_queries if Order._meta.db_table in q["sql"]]
+
+    def test_save_publishes_latest_status_on_commit(
+        self, authenticated_client, user, order_factory, locmem_cache, django_capture_on_commit_callbacks
+    ):
+        """주문 저장 시 커밋 후 상태 채널이 갱신됨"""
+        # Arrange
+        order = order_factory(user, status="pending")
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            order.status = "confirmed"
+            order.save(update_fields=["status", "updated_at"])
+
+        # Assert
+        snapshot = cache.get(f"order_status:{order.id}")
+        assert snapshot["status"] == "confirmed"
+        assert snapshot["order_number"] == order.order_number
+
+    def test_long_poll_returns_immediately_when_already_changed(self, authenticated_client, user, order_factory):
+        """이미 처리 완료된 주문은 대기 없이 응답"""
+        # Arrange
+        order = order_factory(user, status="failed", failure_reason="재고 부족")
+        url = reverse("order-order-status", kwargs={"pk": order.id})
+
+        # Act
+        response = authenticated_client.get(url, {"wait": 10})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == "failed"
+        assert response.data["failure_reason"] == "재고 부족"
+        assert response.data["is_processing"] is False
+
+    def test_stream_sends_status_event(self, authenticated_client, user, order_factory):
+        """SSE 스트림은 상태 이벤트를 전송하고 처리 완료 시 종료"""
+        # Arrange
+        order = order_factory(user, status="confirmed")
+        url = reverse("order-order-status-stream", kwargs={"pk": order.id})
+
+        # Act
+        response = authenticated_client.get(url, HTTP_ACCEPT="text/event-stream")
+        body = b"".join(response).decode()
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/event-stream"
+        event, data = body.strip().split("\n")
+        assert event == "event: status"
+        assert json.loads(data.removeprefix("data: "))["status"] == "confirmed"
+
+    def test_stream_under_wsgi_does_not_wait(self, authenticated_client, user, order_factory, mocker):
+        """WSGI 요청은 처리 중이어도 현재 상태 이벤트 하나만 보내고 종료 (스레드 점유 없음)"""
+        # Arrange
+        order = order_factory(user, status="pending")
+        url = reverse("order-order-status-stream", kwargs={"pk": order.id})
+        sleep = mocker.patch("shopping.services.order_status_service.asyncio.sleep")
+
+        # Act
+        response = authenticated_client.get(url, HTTP_ACCEPT="text/event-stream")
+        body = b"".join(response).decode()
+
+        # Assert
+        assert body.count("event: status") == 1
+        assert json.loads(body.strip().split("\n")[1].removeprefix("data: "))["status"] == "pending"
+        sleep.assert_not_called()
+
+    def test_long_poll_skips_wait_when_waiters_exhausted(
+        self, authenticated_client, user, order_factory, settings, mocker
+    ):
+        """동시 대기 한도를 넘으면 대기 없이 현재 상태 반환"""
+        # Arrange
+        settings.ORDER_STATUS_MAX_WAITERS = 0
+        order = order_factory(user, status="pending")
+        sleep = mocker.patch("shopping.services.order_status_service.time.sleep")
+
+        # Act
+        response = authenticated_client.get(reverse("order-order-status", kwargs={"pk": order.id}), {"wait": 10})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["is_processing"] is True
+        sleep.assert_not_called()
+        assert OrderStatusService._waiters == 0
+
+
+@pytest.mark.django_db
+class TestOrderStatusChannelException:
+    """상태 조회 예외 케이스"""
+
+    def test_other_users_order_returns_404(self, authenticated_client, other_user, order_factory):
+        """다른 사용자의 주문은 존재 여부를 노출하지 않음"""
+        # Arrange
+        order = order_factory(other_user, status="pending")
+
+        # Act
+        response = authenticated_client.get(reverse("order-order-status", kwargs={"pk": order.id}))
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_nonexistent_order_returns_404(self, authenticated_client):
+        """존재하지 않는 주문"""
+        response = authenticated_client.get(reverse("order-order-status-stream", kwargs={"pk": 999999}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,170 @@
+"""
+Locust DB Connection Test - 연결 방식별 PostgreSQL 연결 수 / 지연 시간 비교
+
+목적:
+    DB_CONNECTION_MODE(persistent / pool / pgbouncer)를 바꿔 가며 같은 부하를 걸고
+    PostgreSQL 서버 연결 수(pg_stat_activity)와 API 지연 시간을 비교
+    - 조회 위주(상품 목록/상세) + 쓰기(장바구니 추가, select_for_update 포함) 혼합
+
+측정 항목:
+    - 역할별(application_name=shopping-web/worker/beat) 연결 수: 최대 / 평균 (active, idle 구분)
+    - API 지연 시간: Locust 기본 통계 (p50 / p95 / p99)
+
+실행 방법:
+    # 1) 연결 방식 선택 후 서버 재시작 (.env)
+    #    DB_CONNECTION_MODE=persistent | pool | pgbouncer
+    #    pgbouncer: docker compose --profile pgbouncer up -d, DATABASE_HOST=pgbouncer
+
+    # 2) 부하 실행 (연결 수 조회용으로 PostgreSQL에 직접 접속: PG_MONITOR_DSN)
+    PG_MONITOR_DSN="host=localhost port=5432 dbname=shopping_db user=shopping_user password=shopping_pass" \\
+    locust -f shopping/tests/performance/scenarios/connection_pool.py \\
+        --host=http://localhost:8000 \\
+        --users 300 \\
+        --spawn-rate 30 \\
+        --run-time 5m \\
+        --headless \\
+        --csv=results/conn_persistent
+
+    # 3) 방식별 결과(종료 시 출력되는 연결 수 + csv의 지연 시간)를 비교
+
+사전 준비:
+    python shopping/tests/performance/setup_test_data.py  # load_test_user_0~999 / 상품 생성
+"""
+
+import logging
+import os
+import random
+import time
+from collections import defaultdict
+
+import gevent
+from locust import HttpUser, between, events, task
+
+# PostgreSQL 연결 수 샘플링 주기 (초)
+SAMPLE_INTERVAL = 2
+
+CONNECTION_COUNT_SQL = """
+SELECT COALESCE(NULLIF(application_name, ''), 'other'), state, COUNT(*)
+FROM pg_stat_activity
+WHERE datname = current_database() AND pid <> pg_backend_pid()
+GROUP BY 1, 2
+"""
+
+# (application_name, state) → 샘플 값 목록
+connection_samples = defaultdict(list)
+total_samples = []
+
+
+class ConnectionLoadUser(HttpUser):
+    """
+    조회 80% / 쓰기 20% 혼합 사용자
+
+    쓰기(장바구니 추가)는 select_for_update로 행 락을 잡아 트랜잭션이 길어지는 경우를 포함합니다.
+    """
+
+    wait_time = between(0.5, 2)
+
+    def on_start(self):
+        """로그인 및 상품 ID 수집"""
+        self.user_id = random.randint(0, 999)
+        self.product_ids = []
+
+        response = self.client.post(
+            "/api/auth/login/",
+            json={"username": f"load_test_user_{self.user_id}", "password": "testpass123"},
+            name="/api/auth/login/",
+        )
+        if response.status_code == 200:
+            self.client.headers.update({"Authorization": f"Bearer {response.json().get('access')}"})
+        else:
+            logging.error(f"Login failed for user {self.user_id}: {response.status_code}")
+
+        response = self.client.get("/api/products/?page=1", name="/api/products/ [List]")
+        if response.status_code == 200:
+            self.product_ids = [p["id"] for p in response.json().get("results", [])]
+
+    @task(5)
+    def browse_products(self):
+        """상품 목록 조회"""
+        self.client.get(f"/api/products/?page={random.randint(1, 5)}", name="/api/products/ [List]")
+
+    @task(3)
+    def view_product(self):
+        """상품 상세 조회"""
+        if self.product_ids:
+            self.client.get(f"/api/products/{random.choice(self.product_ids)}/", name="/api/products/{id}/")
+
+    @task(2)
+    def add_to_cart(self):
+        """장바구니 추가 (select_for_update 트랜잭션)"""
+        if self.product_ids:
+            self.client.post(
+                "/api/cart-items/",
+                json={"product_id": random.choice(self.product_ids), "quantity": 1},
+                name="/api/cart-items/ [Add to Cart]",
+            )
+
+
+def sample_connections(dsn):
+    """SAMPLE_INTERVAL마다 pg_stat_activity에서 연결 수 수집 (모니터링 연결 1개 사용)"""
+    import psycopg2
+
+    conn = psycopg2.connect(dsn, application_name="locust-monitor")
+    conn.autocommit = True
+    try:
+        while True:
+            with conn.cursor() as cursor:
+                cursor.execute(CONNECTION_COUNT_SQL)
+                rows = cursor.fetchall()
+
+            seen = set()
+            for app_name, state, count in rows:
+                connection_samples[(app_name, state or "unknown")].append(count)
+                seen.add((app_name, state or "unknown"))
+            # 이번 샘플에 없는 조합은 0으로 기록 (평균 계산용)
+            for key in connection_samples.keys() - seen:
+                connection_samples[key].append(0)
+            total_samples.append(sum(count for _, _, count in rows))
+
+            gevent.sleep(SAMPLE_INTERVAL)
+    finally:
+        conn.close()
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """연결 수 샘플링 시작 (PG_MONITOR_DSN이 없으면 지연 시간만 측정)"""
+    dsn = os.environ.get("PG_MONITOR_DSN")
+    if not dsn:
+        logging.warning("PG_MONITOR_DSN이 없어 연결 수는 측정하지 않습니다.")
+        return
+    environment.connection_sampler = gevent.spawn(sample_connections, dsn)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """테스트 종료 시 연결 수 / 지연 시간 요약 출력"""
+    sampler = getattr(environment, "connection_sampler", None)
+    if sampler is not None:
+        sampler.kill()
+
+    mode = os.environ.get("DB_CONNECTION_MODE", "persistent")
+    print("\n" + "=" * 60)
+    print(f"📊 DB Connection Test Results (DB_CONNECTION_MODE={mode})")
+    print("=" * 60)
+
+    if total_samples:
+        print(f"전체 연결 수:  최대 {max(total_samples)} / 평균 {sum(total_samples) / len(total_samples):.1f}")
+        for (app_name, state), samples in sorted(connection_samples.items()):
+            print(f"  {app_name:<20} {state:<20} 최대 {max(samples):>4} / 평균 {sum(samples) / len(samples):>6.1f}")
+
+    total = environment.stats.total
+    if total.num_requests:
+        print(
+            f"지연 시간(ms):  p50 {total.get_response_time_percentile(0.5):.0f} / "
+            f"p95 {total.get_response_time_percentile(0.95):.0f} / "
+            f"p99 {total.get_response_time_percentile(0.99):.0f}"
+        )
+        print(f"처리량:        {total.total_rps:.1f} req/s, 실패율 {total.fail_ratio * 100:.2f}%")
+    print(f"측정 시각:     {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60 + "\n")
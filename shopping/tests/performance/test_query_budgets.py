@@ -0,0 +1,39 @@
+"""엔드포인트별 쿼리 예산 테스트 (QUERY_BUDGETS, N+1 회귀 방지)"""
+
+from django.urls import reverse
+
+import pytest
+
+from shopping.services.notification_service import NotificationService
+from shopping.tests.conftest import QUERY_BUDGETS
+from shopping.tests.factories import CategoryFactory, OrderWithItemsFactory, ProductFactory, ProductImageFactory
+
+
+@pytest.fixture
+def populate(user):
+    """사용자 기준 목록 데이터 생성"""
+
+    def _populate(count):
+        category = CategoryFactory()
+        for _ in range(count):
+            product = ProductFactory(category=category)
+            ProductImageFactory(product=product)
+            OrderWithItemsFactory(user=user)
+            NotificationService.create(user=user, notification_type="order_status", title="알림", message="내용")
+
+    return _populate
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("endpoint", sorted(QUERY_BUDGETS))
+@pytest.mark.parametrize("count", [1, 5])
+def test_list_endpoint_within_budget(authenticated_client, populate, assert_max_queries, endpoint, count):
+    """목록 크기와 관계없이 예산 내 쿼리로 응답"""
+    # Arrange
+    populate(count)
+
+    # Act & Assert
+    with assert_max_queries(endpoint):
+        response = authenticated_client.get(reverse(endpoint))
+
+    assert response.status_code == 200
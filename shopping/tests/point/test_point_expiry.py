@@ -142,14 +142,14 @@ class PointExpiryTestCase(TestCase):
         self.assertEqual(expiring_points[0].points, 1000)
 
         # 2. 알림 발송 함수 테스트 (Mocking)
-        with patch("shopping.tasks.send_email_notification") as mock_send_email:
+        with patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one") as mock_send_email:
             self.point_service.send_expiry_notifications()
 
             # 이메일 발송이 호출되었는지 확인
             mock_send_email.assert_called_once()
-            call_args = mock_send_email.call_args[0]
-            self.assertEqual(call_args[0], self.user.email)
-            self.assertIn("포인트 만료", call_args[1])  # 제목에 포함
+            entry = mock_send_email.call_args[0][0]
+            self.assertEqual(entry.to, [self.user.email])
+            self.assertIn("포인트 만료", entry.subject)  # 제목에 포함
 
     def test_partial_point_usage_tracking(self):
         """부분 사용된 포인트 추적 테스트"""
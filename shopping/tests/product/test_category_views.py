@@ -90,3 +90,263 @@ class TestCategoryViews:
         product_names = [p["name"] for p in response.data["results"]]
         assert "충전기" in product_names
         assert "노트북" in product_names
+
+
+@pytest.mark.django_db
+class TestCategorySubtreeLookup:
+    """MPTT 범위 기반 서브트리 상품 조회 테스트 (CategoryTreeService)"""
+
+    @pytest.fixture
+    def tree(self):
+        """전자제품 > 컴퓨터 > 노트북, 전자제품 > 스마트폰, 식품"""
+        electronics = CategoryFactory(name="전자제품", parent=None)
+        computer = CategoryFactory(name="컴퓨터", parent=electronics)
+        laptop = CategoryFactory(name="노트북", parent=computer)
+        phone = CategoryFactory(name="스마트폰", parent=electronics)
+        food = CategoryFactory(name="식품", parent=None)
+        products = {
+            "charger": ProductFactory(category=electronics, name="충전기"),
+            "desktop": ProductFactory(category=computer, name="데스크탑"),
+            "gram": ProductFactory(category=laptop, name="그램"),
+            "galaxy": ProductFactory(category=phone, name="갤럭시"),
+            "snack": ProductFactory(category=food, name="과자"),
+        }
+        # 뒤이은 삽입으로 바뀐 lft/rght 반영
+        for category in (electronics, computer, phone):
+            category.refresh_from_db()
+        return {"electronics": electronics, "computer": computer, "phone": phone}, products
+
+    def test_get_all_products_uses_subtree_range(self, tree):
+        """하위 카테고리 상품만 포함 (형제/다른 트리 제외)"""
+        categories, products = tree
+
+        names = set(categories["computer"].get_all_products().values_list("name", flat=True))
+
+        assert names == {"데스크탑", "그램"}
+        assert categories["electronics"].total_product_count == 4
+
+    def test_range_map_is_cached_in_process(self, tree, django_assert_num_queries):
+        """범위 맵은 한 번 로드한 뒤 쿼리 없이 조회"""
+        from shopping.services.category_tree_service import CategoryTreeService
+
+        categories, _ = tree
+        CategoryTreeService.get_range(categories["computer"].pk)
+
+        with django_assert_num_queries(0):
+            category_range = CategoryTreeService.get_range(categories["computer"].pk)
+
+        assert category_range == categories["computer"].subtree_range
+        assert CategoryTreeService.get_range("abc") is None
+
+    def test_range_map_invalidated_on_category_change(self, tree):
+        """카테고리 추가로 다른 카테고리의 lft/rght가 바뀌면 범위 맵 다시 로드"""
+        from shopping.services.category_tree_service import CategoryTreeService
+
+        categories, _ = tree
+        before = CategoryTreeService.get_range(categories["electronics"].pk)
+
+        CategoryFactory(name="태블릿", parent=categories["electronics"])
+
+        after = CategoryTreeService.get_range(categories["electronics"].pk)
+        categories["electronics"].refresh_from_db()
+        assert after != before
+        assert after == categories["electronics"].subtree_range
+
+    def test_product_list_category_filter_adds_no_query(self, api_client, tree, django_assert_max_num_queries):
+        """?category= 필터는 카테고리 조회 없이 상품 쿼리의 범위 조건으로 처리"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        categories, _ = tree
+        url = reverse("product-list")
+        api_client.get(url, {"category": categories["computer"].pk})  # 범위 맵 로드
+
+        with CaptureQueriesContext(connection) as unfiltered:
+            api_client.get(url)
+        with CaptureQueriesContext(connection) as filtered:
+            response = api_client.get(url, {"category": categories["computer"].pk})
+
+        assert {p["name"] for p in response.data["results"]} == {"데스크탑", "그램"}
+        assert len(filtered.captured_queries) == len(unfiltered.captured_queries)
+        assert not any(" IN (SELECT" in q["sql"] for q in filtered.captured_queries)
+
+    def test_products_action_returns_404_for_inactive_category(self, api_client, tree):
+        """비활성/없는 카테고리의 상품 목록은 404"""
+        categories, _ = tree
+        categories["phone"].is_active = False
+        categories["phone"].save()
+
+        inactive = api_client.get(reverse("category-products", kwargs={"pk": categories["phone"].pk}))
+        missing = api_client.get(reverse("category-products", kwargs={"pk": 999999}))
+
+        assert inactive.status_code == status.HTTP_404_NOT_FOUND
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_admin_counts_come_from_list_query(self, tree, rf, admin_user):
+        """관리자 목록의 직접/누적 제품 수는 목록 쿼리에서 함께 계산"""
+        from django.contrib.admin.sites import site
+
+        from shopping.models.product import Category
+
+        categories, _ = tree
+        request = rf.get("/admin/shopping/category/")
+        request.user = admin_user
+        model_admin = site._registry[Category]
+
+        electronics = model_admin.get_queryset(request).get(pk=categories["electronics"].pk)
+
+        assert model_admin.related_products_count(electronics) == 1
+        assert model_admin.related_products_cumulative_count(electronics) == 4
+
+
+@pytest.mark.django_db
+class TestCategoryProductCounter:
+    """카테고리 활성 상품 수 카운터와 트리 캐시 갱신 테스트"""
+
+    @pytest.fixture
+    def locmem_cache(self, settings):
+        """트리 캐시 확인용 실제 캐시 (테스트 기본값은 DummyCache)"""
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        yield cache
+        cache.clear()
+
+    @staticmethod
+    def count_of(category):
+        category.refresh_from_db(fields=["active_product_count"])
+        return category.active_product_count
+
+    def test_counter_follows_category_and_active_changes(self):
+        """생성/비활성화/카테고리 이동/삭제 시에만 증감"""
+        # Arrange
+        clothes = CategoryFactory(name="의류")
+        food = CategoryFactory(name="식품")
+        product = ProductFactory(category=clothes, is_active=True)
+        assert self.count_of(clothes) == 1
+
+        # Act & Assert - 카테고리 이동
+        product.category = food
+        product.save()
+        assert (self.count_of(clothes), self.count_of(food)) == (0, 1)
+
+        # 비활성화 / 재활성화
+        product.is_active = False
+        product.save(update_fields=["is_active"])
+        assert self.count_of(food) == 0
+        product.is_active = True
+        product.save()
+        assert self.count_of(food) == 1
+
+        # 삭제
+        product.delete()
+        assert self.count_of(food) == 0
+
+    def test_unrelated_product_save_does_not_touch_counter_or_tree(self, locmem_cache, django_assert_num_queries):
+        """가격/재고 수정은 카테고리 UPDATE도 트리 캐시 삭제도 하지 않음"""
+        from shopping.models.product import Product
+        from shopping.services.category_tree_service import CategoryTreeService
+
+        category = CategoryFactory(name="의류")
+        product = Product.objects.get(pk=ProductFactory(category=category).pk)
+        CategoryTreeService.get_tree()
+
+        product.price += 1000
+        with django_assert_num_queries(1):  # 상품 UPDATE만
+            product.save()
+
+        assert cache.get(CategoryTreeService.TREE_CACHE_KEY) is not None
+
+    def test_cached_tree_is_patched_in_place(self, locmem_cache, django_capture_on_commit_callbacks):
+        """상품 추가 시 캐시된 트리의 해당 카테고리 상품 수만 갱신 (재빌드 없음)"""
+        from shopping.services.category_tree_service import CategoryTreeService
+
+        parent = CategoryFactory(name="전자제품", parent=None)
+        child = CategoryFactory(name="컴퓨터", parent=parent)
+        CategoryTreeService.get_tree()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ProductFactory(category=child)
+
+        tree = cache.get(CategoryTreeService.TREE_CACHE_KEY)
+        node = next(item for item in tree if item["id"] == parent.pk)
+        assert node["product_count"] == 0
+        assert node["children"][0]["product_count"] == 1
+
+    def test_tree_patch_drops_tree_when_lock_is_held(self, locmem_cache, mocker):
+        """다른 갱신이 잠금을 잡고 있으면 덮어쓰지 않고 트리 캐시를 삭제 (다음 조회에서 재빌드)"""
+        from shopping.services.category_tree_service import CategoryTreeService
+
+        category = CategoryFactory(name="의류")
+        CategoryTreeService.get_tree()
+        mocker.patch.object(CategoryTreeService, "PATCH_LOCK_WAIT", 0)
+        cache.add(CategoryTreeService.PATCH_LOCK_KEY, "other", 10)
+
+        CategoryTreeService.patch_tree_counts([category.pk])
+
+        assert cache.get(CategoryTreeService.TREE_CACHE_KEY) is None
+        assert cache.get(CategoryTreeService.PATCH_LOCK_KEY) == "other"
+
+    def test_tree_patch_releases_lock(self, locmem_cache):
+        """갱신이 끝나면 잠금을 풀어 다음 갱신이 바로 진행"""
+        from shopping.services.category_tree_service import CategoryTreeService
+
+        first = CategoryFactory(name="의류")
+        second = CategoryFactory(name="식품")
+        CategoryTreeService.get_tree()
+        type(first).objects.filter(pk=first.pk).update(active_product_count=2)
+        type(second).objects.filter(pk=second.pk).update(active_product_count=3)
+
+        CategoryTreeService.patch_tree_counts([first.pk])
+        CategoryTreeService.patch_tree_counts([second.pk])
+
+        assert cache.get(CategoryTreeService.PATCH_LOCK_KEY) is None
+        counts = {node["id"]: node["product_count"] for node in cache.get(CategoryTreeService.TREE_CACHE_KEY)}
+        assert counts[first.pk] == 2
+        assert counts[second.pk] == 3
+
+    def test_category_save_keeps_counter(self):
+        """카테고리 수정은 메모리의 이전 카운터로 덮어쓰지 않음"""
+        category = CategoryFactory(name="의류")
+        stale = type(category).objects.get(pk=category.pk)
+        ProductFactory(category=category)
+
+        stale.description = "설명 변경"
+        stale.save()
+
+        assert self.count_of(category) == 1
+
+    def test_deferred_category_save_updates_loaded_fields_only(self, django_assert_num_queries):
+        """.only()로 읽은 카테고리 저장은 지연 필드를 다시 조회하지 않고 그 사이 변경도 덮어쓰지 않음"""
+        category = CategoryFactory(name="의류")
+        # MPTT 저장이 위치 판단에 쓰는 트리 필드(parent, name, tree_id 등)는 함께 읽음
+        partial = (
+            type(category)
+            .objects.only("id", "description", "parent", "name", "tree_id", "lft", "rght", "level")
+            .get(pk=category.pk)
+        )
+        type(category).objects.filter(pk=category.pk).update(is_active=False)
+
+        partial.description = "설명 변경"
+        with django_assert_num_queries(1):  # 카테고리 UPDATE만
+            partial.save()
+
+        category.refresh_from_db()
+        assert category.description == "설명 변경"
+        assert category.is_active is False
+
+    def test_nightly_check_fixes_drift(self):
+        """시그널 없는 변경으로 어긋난 카운터를 정합성 검사 태스크가 보정"""
+        from shopping.models.product import Product
+        from shopping.tasks.product_tasks import verify_category_product_counts_task
+
+        category = CategoryFactory(name="의류")
+        ProductFactory(category=category)
+        ProductFactory(category=category)
+        Product.objects.filter(category=category).update(is_active=False)  # 시그널 없음
+
+        result = verify_category_product_counts_task()
+
+        assert result["fixed"] == 1
+        assert result["categories"][category.pk] == {"stored": 2, "actual": 0}
+        assert self.count_of(category) == 0
+        assert verify_category_product_counts_task()["fixed"] == 0
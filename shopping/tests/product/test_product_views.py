@@ -19,6 +19,7 @@ from shopping.models.product import Product, ProductReview
 from shopping.tests.factories import (
     CategoryFactory,
     ProductFactory,
+    ProductImageFactory,
     ProductReviewFactory,
     UserFactory,
 )
@@ -104,6 +105,24 @@ class TestProductListFiltering:
         assert response.data["count"] == 1
         assert "맥북" in response.data["results"][0]["name"]
 
+    def test_list_query_count_is_constant(self, api_client, django_assert_num_queries):
+        """목록은 이미지/리뷰 prefetch 없이 페이지 COUNT + 상품 조회 2쿼리"""
+        # Arrange
+        for _ in range(5):
+            product = ProductFactory()
+            ProductImageFactory.primary(product=product)
+            ProductReviewFactory(product=product)
+
+        # Act
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse("product-list"))
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["results"]
+        assert len(results) == 5
+        assert all(item["thumbnail_image"] for item in results)
+
 
 # ==========================================
 # 상품 CRUD 테스트
@@ -213,6 +232,70 @@ class TestProductCRUD:
         assert not Product.objects.filter(id=product_id).exists()
 
 
+# ==========================================
+# 상품 상세 테스트
+# ==========================================
+
+
+@pytest.mark.django_db
+class TestProductDetail:
+    """상품 상세 조회 쿼리 계획 및 리뷰 통계 테스트"""
+
+    def test_detail_query_count_is_constant(self, api_client, django_assert_num_queries):
+        """리뷰/이미지 수와 관계없이 상품 + 이미지 + 변형 + 최근 리뷰 + 판매자 상품 수 5쿼리"""
+        # Arrange
+        product = ProductFactory(category=CategoryFactory(parent=CategoryFactory()))
+        ProductImageFactory.primary(product=product)
+        ProductImageFactory(product=product)
+        for rating in [5, 4, 3] * 4:
+            ProductReviewFactory(product=product, rating=rating)
+
+        # Act (테스트 캐시는 DummyCache라 판매자 상품 수는 매번 COUNT)
+        with django_assert_num_queries(5):
+            response = api_client.get(reverse("product-detail", kwargs={"pk": product.id}))
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["review_count"] == 12
+        assert response.data["average_rating"] == 4.0
+        assert len(response.data["recent_reviews"]) == 10
+        assert len(response.data["images"]) == 2
+        assert response.data["seller_product_count"] == 1
+        assert response.data["category_parent_name"] == product.category.parent.name
+
+    def test_review_stats_follow_review_changes(self):
+        """리뷰 작성/평점 수정/삭제 시 상품의 리뷰 수와 평점 합계 증감"""
+        # Arrange
+        product = ProductFactory()
+        first = ProductReviewFactory(product=product, rating=5)
+        ProductReviewFactory(product=product, rating=2)
+
+        # Act & Assert
+        product.refresh_from_db()
+        assert (product.rating_count, product.rating_sum, product.rating_average) == (2, 7, 3.5)
+
+        review = ProductReview.objects.get(pk=first.pk)
+        review.rating = 3
+        review.save()
+        product.refresh_from_db()
+        assert (product.rating_count, product.rating_sum) == (2, 5)
+
+        review.delete()
+        product.refresh_from_db()
+        assert (product.rating_count, product.rating_sum) == (1, 2)
+
+    def test_product_save_keeps_review_stats(self):
+        """상품 수정은 메모리의 이전 리뷰 통계로 덮어쓰지 않음"""
+        product = ProductFactory()
+        ProductReviewFactory(product=product, rating=4)
+
+        product.price += 1000
+        product.save()
+
+        product.refresh_from_db()
+        assert (product.rating_count, product.rating_sum) == (1, 4)
+
+
 # ==========================================
 # 상품 리뷰 테스트
 # ==========================================
@@ -266,6 +266,28 @@ class TestReturnViewFiltering:
         assert return_a.id in return_ids
         assert return_b.id not in return_ids
 
+    def test_seller_list_uses_denormalized_summary(self, api_client, django_assert_num_queries):
+        """판매자 목록은 반품 상품 조회 없이 요약 필드로 응답 (상품 수와 무관한 쿼리 수)"""
+        # Arrange
+        seller = UserFactory(is_seller=True)
+        buyer = UserFactory(is_seller=False)
+        order = OrderFactory.delivered(user=buyer)
+        return_obj = ReturnFactory(order=order, user=buyer)
+        for _ in range(3):
+            order_item = OrderItemFactory(order=order, product=ProductFactory(seller=seller), price=10000, quantity=2)
+            ReturnItemFactory(return_request=return_obj, order_item=order_item, quantity=2)
+
+        api_client.force_authenticate(user=seller)
+
+        # Act (페이지네이션 COUNT + 목록 SELECT)
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse("return-list"))
+
+        # Assert
+        result = get_results(response.data)[0]
+        assert result["item_count"] == 3
+        assert result["items_amount"] == "60000"
+
 
 @pytest.mark.django_db
 class TestReturnViewIntegration:
@@ -0,0 +1,191 @@
+"""EmailDispatchService (이메일 배치 발송) 테스트"""
+
+import json
+import smtplib
+from dataclasses import asdict
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+
+import pytest
+
+from shopping.management.commands.benchmark_email_dispatch import BACKEND_PATH, SimulatedSMTPBackend
+from shopping.models.email_verification import EmailLog
+from shopping.services.email_dispatch_service import EmailDispatchService, EmailEntry, RateLimiter
+from shopping.tasks.email_tasks import send_email_batch
+
+
+@pytest.fixture(autouse=True)
+def fresh_connection():
+    """스레드 로컬 연결을 테스트마다 초기화"""
+    EmailDispatchService.close_connection()
+    yield
+    EmailDispatchService.close_connection()
+
+
+def make_entry(i=0, **kwargs):
+    return EmailEntry(subject=f"제목 {i}", body="본문", to=[f"user{i}@example.com"], **kwargs)
+
+
+@pytest.mark.django_db
+class TestEmailDispatchBatch:
+    """배치 발송 테스트"""
+
+    def test_batch_reuses_single_connection(self, settings):
+        """배치 전체를 연결 하나로 발송"""
+        # Arrange
+        settings.EMAIL_BACKEND = BACKEND_PATH
+        SimulatedSMTPBackend.connections_opened = 0
+        entries = [make_entry(i, html_body="<p>본문</p>") for i in range(5)]
+
+        # Act
+        result = EmailDispatchService.send_batch(entries)
+
+        # Assert
+        assert result.sent == 5
+        assert result.results == [True] * 5
+        assert SimulatedSMTPBackend.connections_opened == 1
+        assert len(mail.outbox) == 5
+        assert mail.outbox[0].alternatives[0][1] == "text/html"
+
+    def test_failure_does_not_stop_batch(self, user, mocker):
+        """한 통의 실패는 기록만 하고 나머지는 발송, EmailLog는 일괄 갱신"""
+        # Arrange
+        ok_log = EmailLog.objects.create(user=user, email_type="marketing", recipient_email="a@example.com", subject="a")
+        bad_log = EmailLog.objects.create(user=user, email_type="marketing", recipient_email="b@example.com", subject="b")
+        mocker.patch.object(EmailDispatchService, "_send_one", side_effect=[None, Exception("550 mailbox unavailable")])
+
+        # Act
+        result = EmailDispatchService.send_batch(
+            [make_entry(0, email_log_id=ok_log.id), make_entry(1, email_log_id=bad_log.id)]
+        )
+
+        # Assert
+        assert result.results == [True, False]
+        ok_log.refresh_from_db()
+        bad_log.refresh_from_db()
+        assert ok_log.status == "sent"
+        assert ok_log.sent_at is not None
+        assert bad_log.status == "failed"
+        assert "550" in bad_log.error_message
+
+    def test_log_update_is_single_query(self, user, django_assert_num_queries):
+        """EmailLog 상태 기록은 SELECT 1회 + UPDATE 1회"""
+        # Arrange
+        logs = [
+            EmailLog.objects.create(user=user, email_type="marketing", recipient_email=f"{i}@example.com", subject="s")
+            for i in range(3)
+        ]
+
+        # Act & Assert
+        with django_assert_num_queries(2):
+            EmailDispatchService.send_batch([make_entry(i, email_log_id=log.id) for i, log in enumerate(logs)])
+
+    def test_reconnects_when_server_disconnects(self, mocker):
+        """idle 타임아웃으로 끊긴 연결은 새 연결로 한 번 재시도"""
+        # Arrange
+        stale = mocker.Mock()
+        stale.send_messages.side_effect = smtplib.SMTPServerDisconnected("idle timeout")
+        fresh = mocker.Mock()
+        mocker.patch("django.core.mail.get_connection", side_effect=[stale, fresh])
+
+        # Act
+        result = EmailDispatchService.send_batch([make_entry()])
+
+        # Assert
+        assert result.sent == 1
+        stale.close.assert_called_once()
+        fresh.send_messages.assert_called_once()
+
+    def test_connection_expires_after_max_age(self, settings):
+        """EMAIL_CONNECTION_MAX_AGE가 지나면 새로 연결"""
+        # Arrange
+        first = EmailDispatchService.get_connection()
+        assert EmailDispatchService.get_connection() is first
+
+        # Act
+        settings.EMAIL_CONNECTION_MAX_AGE = -1
+
+        # Assert
+        assert EmailDispatchService.get_connection() is not first
+
+
+class TestRateLimiter:
+    """발송 속도 제한 테스트"""
+
+    def test_waits_after_burst(self, mocker):
+        """버스트(rate개) 이후에는 토큰이 찰 때까지 대기"""
+        # Arrange
+        mocker.patch("shopping.services.email_dispatch_service.time.monotonic", return_value=100.0)
+        sleep = mocker.patch("shopping.services.email_dispatch_service.time.sleep")
+        limiter = RateLimiter(rate=2)
+
+        # Act
+        waits = [limiter.acquire() for _ in range(3)]
+
+        # Assert
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.5)
+        sleep.assert_called_once()
+
+    def test_zero_rate_is_unlimited(self):
+        """rate 0이면 대기하지 않음"""
+        limiter = RateLimiter(rate=0)
+
+        assert all(limiter.acquire() == 0.0 for _ in range(100))
+
+
+@pytest.mark.django_db
+class TestEmailBatchTask:
+    """배치 컨슈머 태스크 테스트"""
+
+    def test_sends_given_entries(self):
+        """Redis 없이 인자로 받은 메일을 한 배치로 발송"""
+        # Act
+        result = send_email_batch.apply(kwargs={"entries": [{"subject": "s", "body": "b", "to": ["a@example.com"]}]}).get()
+
+        # Assert
+        assert result == {"batches": 1, "sent": 1, "failed": 0}
+        assert mail.outbox[0].to == ["a@example.com"]
+
+    def test_enqueue_without_redis_dispatches_task(self):
+        """Redis 캐시가 아니면 메일 목록을 태스크 인자로 직접 발행"""
+        # Act
+        task_id = EmailDispatchService.enqueue([make_entry(1), make_entry(2)])
+
+        # Assert
+        assert task_id is not None
+        assert len(mail.outbox) == 2
+
+    def test_backlog_larger_than_one_run_is_fully_sent(self, settings, mocker, in_memory_redis):
+        """한 번 실행의 발송 한도보다 많이 쌓여도 새 메일 적재 없이 모두 발송 (컨슈머 재예약)"""
+        # Arrange
+        settings.EMAIL_BATCH_SIZE = 2
+        mocker.patch.object(EmailDispatchService, "_get_redis", return_value=in_memory_redis)
+        for i in range(5):
+            in_memory_redis.rpush(EmailDispatchService.QUEUE_KEY, json.dumps(asdict(make_entry(i))))
+
+        # Act: 한 번에 1배치(2통)만 발송 → 남은 메일은 재예약된 컨슈머가 발송 (eager 실행)
+        result = send_email_batch.apply(kwargs={"max_batches": 1}).get()
+
+        # Assert
+        assert result == {"batches": 1, "sent": 2, "failed": 0}
+        assert in_memory_redis.llen(EmailDispatchService.QUEUE_KEY) == 0
+        assert sorted(message.to[0] for message in mail.outbox) == [f"user{i}@example.com" for i in range(5)]
+
+
+class TestEmailBenchmarkCommand:
+    """벤치마크 명령어 테스트"""
+
+    def test_reports_connection_counts(self):
+        """메일마다 연결 vs 배치 연결 수 비교"""
+        out = StringIO()
+
+        call_command("benchmark_email_dispatch", "--messages", "5", "--handshake-ms", "0", stdout=out)
+
+        output = out.getvalue()
+        assert "per-message" in output
+        lines = {line.split()[0]: line.split() for line in output.splitlines() if line.startswith(("per-message", "batched"))}
+        assert lines["per-message"][3] == "5"
+        assert lines["batched"][3] == "1"
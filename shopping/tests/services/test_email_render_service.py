@@ -0,0 +1,78 @@
+"""EmailRenderService (이메일 템플릿 렌더링) 테스트"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from shopping.services import email_render_service
+from shopping.services.email_render_service import EmailRenderService
+
+
+@pytest.fixture(autouse=True)
+def clear_template_cache():
+    EmailRenderService.clear_cache()
+    yield
+    EmailRenderService.clear_cache()
+
+
+def verification_context(name="홍길동", code="123456"):
+    return {
+        "user": SimpleNamespace(first_name=name, email="hong@example.com"),
+        "verification_url": "https://shop.example.com/verify-email?token=abc",
+        "verification_code": code,
+        "is_resend": False,
+    }
+
+
+class TestEmailRenderService:
+    """템플릿 렌더링 테스트"""
+
+    def test_single_render_produces_text_and_html(self):
+        """HTML 렌더링 결과에서 텍스트 본문 생성"""
+        # Act
+        rendered = EmailRenderService.render("email/verification.html", verification_context())
+
+        # Assert
+        assert "<div" in rendered.html
+        assert "홍길동" in rendered.text
+        assert "123456" in rendered.text
+        assert "https://shop.example.com/verify-email?token=abc" in rendered.text
+        assert "<" not in rendered.text
+        assert "font-family" not in rendered.text  # <style> 제거
+
+    def test_render_many_compiles_template_once(self, mocker):
+        """여러 수신자를 같은 컴파일된 템플릿으로 렌더링"""
+        # Arrange
+        loader = mocker.patch.object(email_render_service, "get_template", wraps=email_render_service.get_template)
+        contexts = [verification_context(name=f"사용자{i}", code=f"00000{i}") for i in range(3)]
+
+        # Act
+        results = list(EmailRenderService.render_many("email/verification.html", contexts))
+        EmailRenderService.render("email/verification.html", verification_context())
+
+        # Assert
+        assert loader.call_count == 1
+        assert [("사용자0" in r.text, "000002" in r.text) for r in (results[0], results[2])] == [(True, False), (False, True)]
+
+    def test_render_many_merges_shared_context(self):
+        """공통 context와 수신자별 context 병합 (수신자 값 우선)"""
+        # Act
+        results = list(
+            EmailRenderService.render_many(
+                "email/verification.html",
+                [{"verification_code": "111111"}, {"verification_code": "222222"}],
+                shared_context=verification_context(),
+            )
+        )
+
+        # Assert
+        assert "111111" in results[0].text
+        assert "222222" in results[1].text
+
+    def test_html_to_text(self):
+        """블록 요소 개행, 목록, 링크 변환"""
+        html = '<h1>제목</h1><p>첫 줄<br>둘째 줄</p><ul><li>항목</li></ul><a href="https://x.io">바로가기</a> &amp;'
+
+        text = EmailRenderService.html_to_text(html)
+
+        assert text == "제목\n첫 줄\n둘째 줄\n- 항목\n\n바로가기 (https://x.io) &\n"
@@ -0,0 +1,160 @@
+"""ImageVariantService (상품 이미지 변형 생성) 테스트"""
+
+import os
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+
+import factory
+import pytest
+
+from shopping.models.product import ProductImage, ProductImageVariant
+from shopping.services.image_variant_service import ImageVariantService
+from shopping.tests.factories import ProductFactory, ProductImageFactory
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """변형 파일은 임시 디렉터리에 저장"""
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.PRODUCT_IMAGE_VARIANT_WIDTHS = [200, 400, 800]
+    settings.PRODUCT_IMAGE_VARIANT_FORMATS = ["webp", "jpeg"]
+    return tmp_path
+
+
+def make_image(width=1000, height=500, **kwargs):
+    return ProductImageFactory(image=factory.django.ImageField(width=width, height=height, format="PNG"), **kwargs)
+
+
+@pytest.mark.django_db
+class TestImageVariantGenerate:
+    """변형 생성 테스트"""
+
+    def test_generates_each_format_and_width(self):
+        """설정된 포맷 × 너비 변형을 비율 유지하여 생성"""
+        # Arrange
+        product_image = make_image()
+
+        # Act
+        result = ImageVariantService.generate(product_image.pk)
+
+        # Assert
+        assert sorted(result.created) == sorted((fmt, w) for w in (200, 400, 800) for fmt in ("webp", "jpeg"))
+        variant = product_image.variants.get(format="webp", width=400)
+        assert variant.height == 200
+        assert variant.file.name.endswith("_400w.webp")
+        assert variant.size == variant.file.size
+
+    def test_is_idempotent(self):
+        """다시 실행하면 이미 만든 변형은 건너뜀"""
+        product_image = make_image()
+        ImageVariantService.generate(product_image.pk)
+
+        result = ImageVariantService.generate(product_image.pk)
+
+        assert result.created == []
+        assert result.skipped == 6
+        assert ProductImageVariant.objects.filter(image=product_image).count() == 6
+
+    def test_does_not_upscale(self):
+        """원본보다 큰 너비는 만들지 않음"""
+        product_image = make_image(width=300, height=300)
+
+        ImageVariantService.generate(product_image.pk)
+
+        assert set(product_image.variants.values_list("width", flat=True)) == {200}
+
+    def test_replaced_source_regenerates_variants(self, media_root):
+        """원본이 바뀌면 이전 변형은 파일과 함께 삭제 후 다시 생성"""
+        # Arrange
+        product_image = make_image()
+        ImageVariantService.generate(product_image.pk)
+        old_path = product_image.variants.get(format="jpeg", width=200).file.path
+        ProductImage.objects.filter(pk=product_image.pk).update(image="product/replaced.png")
+        (media_root / "product").mkdir(exist_ok=True)
+        (media_root / "product" / "replaced.png").write_bytes(open(product_image.image.path, "rb").read())
+
+        # Act
+        result = ImageVariantService.generate(product_image.pk)
+
+        # Assert
+        assert result.removed == 6
+        assert len(result.created) == 6
+        assert set(product_image.variants.values_list("source_name", flat=True)) == {"product/replaced.png"}
+        assert not os.path.exists(old_path)
+
+    def test_upload_schedules_generation_after_commit(self, django_capture_on_commit_callbacks):
+        """업로드 시 커밋 후 태스크 실행, 다른 필드 수정은 다시 예약하지 않음"""
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            product_image = make_image()
+
+        # Assert
+        assert product_image.variants.count() == 6
+
+        reloaded = ProductImage.objects.get(pk=product_image.pk)
+        with django_capture_on_commit_callbacks() as callbacks:
+            reloaded.alt_text = "설명 변경"
+            reloaded.save()
+        assert callbacks == []
+
+    def test_deleting_image_deletes_variant_files(self):
+        """원본 삭제 시 변형 레코드와 파일 함께 삭제"""
+        product_image = make_image()
+        ImageVariantService.generate(product_image.pk)
+        storage = product_image.variants.first().file.storage
+        names = list(product_image.variants.values_list("file", flat=True))
+
+        product_image.delete()
+
+        assert not ProductImageVariant.objects.exists()
+        assert not any(storage.exists(name) for name in names)
+
+
+@pytest.mark.django_db
+class TestImageVariantPick:
+    """변형 선택 테스트"""
+
+    def test_picks_smallest_variant_covering_width(self):
+        """우선 포맷에서 요청 너비 이상인 가장 작은 변형"""
+        product_image = make_image()
+        ImageVariantService.generate(product_image.pk)
+
+        assert ImageVariantService.pick(product_image, 300).width == 400
+        assert ImageVariantService.pick(product_image, 300).format == "webp"
+        assert ImageVariantService.pick(product_image, 2000).width == 800
+
+    def test_falls_back_to_original(self):
+        """변형이 아직 없으면 원본 URL"""
+        product_image = make_image()
+
+        assert ImageVariantService.pick_url(product_image, 400) == product_image.image.url
+
+    def test_product_list_uses_list_variant(self, api_client):
+        """상품 목록 썸네일은 목록 너비 변형 URL"""
+        product = ProductFactory()
+        product_image = make_image(product=product)
+        ImageVariantService.generate(product_image.pk)
+
+        response = api_client.get(reverse("product-list"))
+
+        thumbnail = response.json()["results"][0]["thumbnail_image"]
+        assert thumbnail.endswith("_400w.webp")
+
+
+@pytest.mark.django_db
+class TestBackfillCommand:
+    """백필 명령 테스트"""
+
+    def test_backfill_sync_fills_missing_only(self):
+        """변형이 부족한 이미지만 처리"""
+        done = make_image()
+        ImageVariantService.generate(done.pk)
+        missing = make_image()
+        out = StringIO()
+
+        call_command("backfill_product_image_variants", "--sync", stdout=out)
+
+        assert "대상 이미지: 1개" in out.getvalue()
+        assert missing.variants.count() == 6
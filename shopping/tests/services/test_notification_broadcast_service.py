@@ -0,0 +1,142 @@
+"""NotificationBroadcastService (대량 알림 발송) 테스트"""
+
+from django.core.cache import cache
+from django.db import connection
+
+import pytest
+
+from shopping.models.notification import Notification
+from shopping.models.user import User
+from shopping.services.notification_broadcast_service import (
+    BroadcastTemplate,
+    NotificationBroadcastError,
+    NotificationBroadcastService,
+)
+from shopping.tests.factories import UserFactory
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """진행 상황 검증용 실제 캐시 (테스트 기본값은 DummyCache)"""
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def template():
+    return BroadcastTemplate(
+        notification_type="system",
+        title="{username}님께 드리는 안내",
+        message="{event} 이벤트가 시작되었습니다.",
+        link="/events/{event_id}",
+        context={"event": "가을 세일", "event_id": 7},
+    )
+
+
+@pytest.mark.django_db
+class TestNotificationBroadcast:
+    """대량 발송 테스트 (Celery eager 모드)"""
+
+    def test_broadcast_queryset_in_chunks(self, locmem_cache, template):
+        """사용자 queryset을 청크로 나눠 사용자별로 렌더링"""
+        # Arrange
+        users = UserFactory.create_batch(5)
+
+        # Act
+        result = NotificationBroadcastService.broadcast(
+            User.objects.filter(id__in=[u.id for u in users]), template, chunk_size=2
+        )
+
+        # Assert
+        assert result.total == 5
+        assert result.chunks == 3
+        notifications = Notification.objects.filter(metadata__broadcast_id=result.broadcast_id)
+        assert notifications.count() == 5
+        sample = notifications.get(user=users[0])
+        assert sample.title == f"{users[0].username}님께 드리는 안내"
+        assert sample.message == "가을 세일 이벤트가 시작되었습니다."
+        assert sample.link == "/events/7"
+
+    def test_keyset_iteration_without_server_side_cursors(self, locmem_cache, template, mocker, monkeypatch):
+        """PgBouncer 모드(서버 측 커서 비활성화)에서는 id 기준 keyset으로 나눠 조회"""
+        # Arrange
+        users = UserFactory.create_batch(5)
+        monkeypatch.setitem(connection.settings_dict, "DISABLE_SERVER_SIDE_CURSORS", True)
+        mocker.patch.object(NotificationBroadcastService, "ITERATOR_CHUNK_SIZE", 2)
+        keyset = mocker.spy(NotificationBroadcastService, "_iter_ids_keyset")
+
+        # Act
+        result = NotificationBroadcastService.broadcast(
+            User.objects.filter(id__in=[u.id for u in users]), template, chunk_size=2
+        )
+
+        # Assert
+        assert keyset.call_count == 1
+        assert result.total == 5
+        assert set(
+            Notification.objects.filter(metadata__broadcast_id=result.broadcast_id).values_list("user_id", flat=True)
+        ) == {u.id for u in users}
+
+    def test_progress_tracking(self, locmem_cache, template):
+        """청크 처리 결과가 진행 카운터에 집계"""
+        # Arrange
+        users = UserFactory.create_batch(3)
+
+        # Act
+        result = NotificationBroadcastService.broadcast((u.id for u in users), template, chunk_size=2)
+
+        # Assert
+        progress = NotificationBroadcastService.get_progress(result.broadcast_id)
+        assert progress["status"] == "completed"
+        assert progress["total"] == 3
+        assert progress["processed"] == 3
+        assert progress["created"] == 3
+        assert progress["chunks_done"] == 2
+
+    def test_per_recipient_values(self, locmem_cache):
+        """dict 스트림의 항목별 값으로 렌더링"""
+        # Arrange
+        user = UserFactory()
+        template = BroadcastTemplate(notification_type="point_expiry", title="포인트 만료 예정", message="{amount:,} 포인트")
+
+        # Act
+        NotificationBroadcastService.broadcast([{"user_id": user.id, "amount": 12000}], template)
+
+        # Assert
+        assert Notification.objects.get(user=user).message == "12,000 포인트"
+
+    def test_skips_missing_users(self, locmem_cache, template):
+        """발행 이후 삭제된 사용자는 건너뜀"""
+        # Arrange
+        user = UserFactory()
+        missing_id = user.id + 10_000
+
+        # Act
+        result = NotificationBroadcastService.broadcast([user.id, missing_id], template)
+
+        # Assert
+        progress = NotificationBroadcastService.get_progress(result.broadcast_id)
+        assert progress["processed"] == 2
+        assert progress["created"] == 1
+
+    def test_chunk_uses_single_user_query(self, locmem_cache, template, django_assert_max_num_queries):
+        """청크당 사용자 조회 1회 + bulk INSERT (사용자별 쿼리 없음)"""
+        # Arrange
+        users = UserFactory.create_batch(10)
+
+        # Act & Assert: SELECT users + INSERT + savepoint
+        with django_assert_max_num_queries(4):
+            NotificationBroadcastService.deliver_chunk("manual", [u.id for u in users], template)
+
+        assert Notification.objects.filter(metadata__broadcast_id="manual").count() == 10
+
+    def test_unknown_broadcast(self, locmem_cache):
+        """없는 발송 ID 조회 시 에러"""
+        with pytest.raises(NotificationBroadcastError) as exc_info:
+            NotificationBroadcastService.get_progress("unknown")
+
+        assert exc_info.value.code == "BROADCAST_NOT_FOUND"
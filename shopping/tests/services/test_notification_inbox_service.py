@@ -0,0 +1,176 @@
+"""NotificationInboxService (읽지 않은 알림 카운터 캐시) 테스트"""
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from shopping.models.notification import Notification
+from shopping.services.notification_inbox_service import NotificationInboxService
+from shopping.services.notification_service import NotificationService
+from shopping.tests.factories import UserFactory
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """카운터 검증용 실제 캐시 (테스트 기본값은 DummyCache)"""
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def create_notification(user, title="알림", **kwargs):
+    return Notification.objects.create(user=user, notification_type="order_status", title=title, message="내용", **kwargs)
+
+
+@pytest.mark.django_db
+class TestNotificationInboxCounter:
+    """쓰기 경로별 카운터 갱신 테스트"""
+
+    def test_cache_hit_costs_no_query(self, locmem_cache, user):
+        """캐시가 채워진 뒤 배지 조회는 쿼리 없이 처리"""
+        # Arrange
+        create_notification(user)
+        NotificationService.get_unread(user)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            result = NotificationService.get_unread(user)
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+        assert result.count == 1
+        assert len(result.notifications) == 1
+
+    def test_create_increments_counter(self, locmem_cache, user, django_capture_on_commit_callbacks):
+        """알림 생성 시 카운터 증가 + 최신 목록 갱신"""
+        # Arrange
+        assert NotificationService.get_unread(user).count == 0
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.create(user=user, notification_type="order_status", title="배송 시작")
+
+        # Assert
+        result = NotificationService.get_unread(user)
+        assert result.count == 1
+        assert [n.title for n in result.notifications] == ["배송 시작"]
+
+    def test_bulk_create_increments_each_user(self, locmem_cache, user, django_capture_on_commit_callbacks):
+        """일괄 생성은 사용자별로 카운터 증가"""
+        # Arrange
+        other = UserFactory()
+        NotificationService.get_unread_count(user)
+        NotificationService.get_unread_count(other)
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.bulk_create([user, other, user], notification_type="system", title="공지")
+
+        # Assert
+        assert NotificationService.get_unread_count(user) == 2
+        assert NotificationService.get_unread_count(other) == 1
+
+    def test_mark_as_read_decrements_counter(self, locmem_cache, user, django_capture_on_commit_callbacks):
+        """읽음 처리 수만큼 카운터 감소"""
+        # Arrange
+        first = create_notification(user)
+        create_notification(user)
+        create_notification(user)
+        assert NotificationService.get_unread_count(user) == 3
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.mark_as_read(user, notification_ids=[first.id])
+
+        # Assert
+        assert NotificationService.get_unread_count(user) == 2
+        first.refresh_from_db()
+        assert first.read_at is not None
+
+    def test_mark_single_and_delete(self, locmem_cache, user, django_capture_on_commit_callbacks):
+        """단일 읽음 처리/읽지 않은 알림 삭제 시 카운터 감소, 읽은 알림 정리는 영향 없음"""
+        # Arrange
+        read_target = create_notification(user, title="읽을 알림")
+        delete_target = create_notification(user, title="삭제할 알림")
+        create_notification(user, title="남는 알림")
+        NotificationService.get_unread(user)
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.mark_single_as_read(read_target)
+            NotificationService.delete_by_id(user, delete_target.id)
+            NotificationService.clear_read(user)
+
+        # Assert
+        result = NotificationService.get_unread(user)
+        assert result.count == 1
+        assert [n.title for n in result.notifications] == ["남는 알림"]
+
+    def test_rollback_keeps_counter(self, locmem_cache, user, django_capture_on_commit_callbacks):
+        """커밋되지 않은 생성은 카운터에 반영하지 않음"""
+        # Arrange
+        assert NotificationService.get_unread_count(user) == 0
+
+        # Act: 커밋 콜백을 실행하지 않음 (롤백과 동일)
+        with django_capture_on_commit_callbacks(execute=False):
+            NotificationService.create(user=user, notification_type="system", title="롤백")
+
+        # Assert: 캐시 값 유지
+        assert cache.get(NotificationInboxService._unread_key(user.id)) == 0
+
+
+@pytest.mark.django_db
+class TestNotificationInboxSelfHealing:
+    """캐시 미스/비정상 값 재계산 테스트"""
+
+    def test_missing_counter_is_recounted(self, locmem_cache, user):
+        """카운터가 없으면 DB에서 재계산해 저장"""
+        # Arrange
+        create_notification(user)
+        create_notification(user, is_read=True)
+
+        # Act
+        count = NotificationService.get_unread_count(user)
+
+        # Assert
+        assert count == 1
+        assert cache.get(NotificationInboxService._unread_key(user.id)) == 1
+
+    def test_adjust_skips_missing_counter(self, locmem_cache, user):
+        """키가 없으면 증감을 건너뛰고 다음 조회에서 재계산"""
+        # Arrange
+        create_notification(user)
+
+        # Act
+        NotificationInboxService.adjust({user.id: 5})
+
+        # Assert
+        assert cache.get(NotificationInboxService._unread_key(user.id)) is None
+        assert NotificationService.get_unread_count(user) == 1
+
+    def test_negative_counter_is_recounted(self, locmem_cache, user):
+        """중복 감소로 음수가 된 카운터는 재계산"""
+        # Arrange
+        create_notification(user)
+        cache.set(NotificationInboxService._unread_key(user.id), -2)
+
+        # Act & Assert
+        assert NotificationService.get_unread_count(user) == 1
+
+    def test_limit_above_cached_list_reads_db(self, locmem_cache, user):
+        """캐시 목록보다 큰 limit은 DB에서 조회"""
+        # Arrange
+        for i in range(NotificationInboxService.LATEST_LIMIT + 2):
+            create_notification(user, title=f"알림 {i}")
+
+        # Act
+        result = NotificationService.get_unread(user, limit=NotificationInboxService.LATEST_LIMIT + 5)
+
+        # Assert
+        assert result.count == NotificationInboxService.LATEST_LIMIT + 2
+        assert len(result.notifications) == NotificationInboxService.LATEST_LIMIT + 2
@@ -0,0 +1,97 @@
+"""NumberSequenceService 단위 테스트"""
+
+import threading
+
+import pytest
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from shopping.models.order import Order
+from shopping.services.number_sequence_service import NumberSequenceService
+from shopping.services.order_service import OrderService
+from shopping.tests.factories import CartFactory, CartItemFactory, ProductFactory, ShippingDataBuilder, UserFactory
+
+
+@pytest.mark.django_db
+class TestNumberSequenceService:
+    """번호 발급 테스트"""
+
+    def test_order_number_format(self):
+        """주문번호 형식 (YYYYMMDD + 6자리)"""
+        # Act
+        order_number = NumberSequenceService.next_order_number()
+
+        # Assert
+        assert order_number.startswith(timezone.now().strftime("%Y%m%d"))
+        assert len(order_number) >= 14
+
+    def test_order_insert_without_follow_up_update(self):
+        """주문번호는 INSERT 전에 발급되어 추가 UPDATE가 없음"""
+        # Arrange
+        user = UserFactory.with_points(0)
+        cart = CartFactory(user=user)
+        CartItemFactory(cart=cart, product=ProductFactory(stock=10), quantity=1)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            order = OrderService.create_order_from_cart(user=user, cart=cart, **ShippingDataBuilder.default())
+
+        # Assert
+        table = Order._meta.db_table
+        order_updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith(f'UPDATE "{table}"')]
+        assert order_updates == []
+        assert Order.objects.values_list("order_number", flat=True).get(pk=order.pk) == order.order_number
+
+    def test_explicit_order_number_is_kept(self):
+        """order_number를 지정하면 발급하지 않음"""
+        # Act
+        order = Order.objects.create(user=UserFactory(), order_number="20250101999999")
+
+        # Assert
+        assert order.order_number == "20250101999999"
+
+    def test_counter_fallback_without_sequences(self, mocker):
+        """PostgreSQL이 아니면 카운터 테이블로 1부터 차례로 발급"""
+        # Arrange
+        mocker.patch.object(connection, "vendor", "sqlite")
+
+        # Act
+        values = [NumberSequenceService._next_value(NumberSequenceService.RETURN_SEQUENCE) for _ in range(3)]
+
+        # Assert
+        assert values == [1, 2, 3]
+        assert NumberSequenceService.next_return_number().endswith("000004")
+
+
+@pytest.mark.django_db(transaction=True)
+class TestNumberSequenceConcurrency:
+    """동시 발급 테스트"""
+
+    def test_concurrent_allocation_never_collides(self):
+        """여러 스레드가 동시에 발급해도 번호가 겹치지 않음"""
+        # Arrange
+        numbers = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(5)
+
+        def allocate():
+            try:
+                barrier.wait()
+                allocated = [NumberSequenceService.next_return_number() for _ in range(10)]
+                with lock:
+                    numbers.extend(allocated)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=allocate) for _ in range(5)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(numbers) == 50
+        assert len(set(numbers)) == 50
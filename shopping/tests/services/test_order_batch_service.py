@@ -0,0 +1,270 @@
+"""OrderBatchService 단위 테스트"""
+
+import json
+from dataclasses import asdict
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from shopping.models.order import Order
+from shopping.models.product import Product
+from shopping.services.order_batch_service import OrderBatchEntry, OrderBatchService
+from shopping.services.order_service import OrderService
+from shopping.services.order_status_service import OrderStatusService
+from shopping.tasks.order_tasks import process_order_batch, recover_order_batch
+from shopping.tests.factories import (
+    CartFactory,
+    CartItemFactory,
+    OrderFactory,
+    ProductFactory,
+    ShippingDataBuilder,
+    UserFactory,
+)
+
+
+def _pending_order_with_cart(product, quantity=1, use_points=0, user=None):
+    """장바구니 + pending 주문 생성 후 배치 엔트리 반환"""
+    user = user or UserFactory.with_points(10000)
+    cart = CartFactory(user=user)
+    CartItemFactory(cart=cart, product=product, quantity=quantity)
+    order = OrderFactory(user=user, status="pending", used_points=use_points)
+    return OrderBatchEntry(order_id=order.id, cart_id=cart.id, use_points=use_points)
+
+
+@pytest.mark.django_db
+class TestOrderBatchServiceProcessBatch:
+    """배치 재고 확보 테스트"""
+
+    def test_confirms_all_orders_for_same_product(self):
+        """같은 상품 주문 여러 건을 한 번에 확정"""
+        # Arrange
+        product = ProductFactory(stock=10)
+        entries = [_pending_order_with_cart(product, quantity=2) for _ in range(3)]
+
+        # Act
+        results = OrderBatchService.process_batch(entries)
+
+        # Assert
+        assert [r["status"] for r in results] == ["success"] * 3
+        product.refresh_from_db()
+        assert product.stock == 4
+        for entry in entries:
+            order = Order.objects.get(pk=entry.order_id)
+            assert order.status == "confirmed"
+            assert order.order_items.get().quantity == 2
+
+    def test_locks_products_once_per_batch(self):
+        """상품 락은 배치 전체에서 한 번만 획득"""
+        # Arrange
+        products = [ProductFactory(stock=10) for _ in range(3)]
+        entries = [_pending_order_with_cart(p) for p in products for _ in range(2)]
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            OrderBatchService.process_batch(entries)
+
+        # Assert
+        table = Product._meta.db_table
+        product_locks = [
+            q["sql"] for q in ctx.captured_queries if f'FROM "{table}"' in q["sql"] and "FOR UPDATE" in q["sql"]
+        ]
+        stock_updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith(f'UPDATE "{table}"')]
+        assert len(product_locks) == 1
+        assert len(stock_updates) == 1
+
+    def test_fails_only_orders_exceeding_stock_in_fifo_order(self):
+        """재고를 초과하는 뒤 주문만 실패 (주문 ID 순서대로 배정)"""
+        # Arrange
+        product = ProductFactory(stock=3)
+        first = _pending_order_with_cart(product, quantity=2)
+        second = _pending_order_with_cart(product, quantity=2)
+
+        # Act: 입력 순서와 무관하게 먼저 생성된 주문이 우선
+        results = OrderBatchService.process_batch([second, first])
+
+        # Assert: 결과는 입력 순서
+        assert results[0]["status"] == "failed"
+        assert results[0]["reason"] == "insufficient_stock"
+        assert results[1]["status"] == "success"
+
+        product.refresh_from_db()
+        assert product.stock == 1
+
+        failed_order = Order.objects.get(pk=second.order_id)
+        assert failed_order.status == "failed"
+        assert "재고 부족" in failed_order.failure_reason
+        assert failed_order.order_items.count() == 0
+
+    def test_point_failure_releases_reserved_stock_for_next_order(self):
+        """포인트 실패 주문의 재고는 다음 주문에 배정됨"""
+        # Arrange
+        product = ProductFactory(stock=2)
+        poor_user = UserFactory.with_points(0)
+        failing = _pending_order_with_cart(product, quantity=2, use_points=1000, user=poor_user)
+        succeeding = _pending_order_with_cart(product, quantity=2)
+
+        # Act
+        results = OrderBatchService.process_batch([failing, succeeding])
+
+        # Assert
+        assert results[0]["reason"] == "point_deduction_failed"
+        assert results[1]["status"] == "success"
+        product.refresh_from_db()
+        assert product.stock == 0
+        assert "포인트 사용 실패" in Order.objects.get(pk=failing.order_id).failure_reason
+
+    def test_duplicate_and_processed_entries(self):
+        """중복 엔트리는 한 번만 처리하고, pending이 아닌 주문은 건너뜀"""
+        # Arrange
+        product = ProductFactory(stock=10)
+        entry = _pending_order_with_cart(product, quantity=1)
+        processed = OrderFactory(status="confirmed")
+        processed_entry = OrderBatchEntry(order_id=processed.id, cart_id=entry.cart_id)
+
+        # Act
+        results = OrderBatchService.process_batch([entry, entry, processed_entry])
+
+        # Assert
+        assert [r["status"] for r in results] == ["success", "already_processed"]
+        product.refresh_from_db()
+        assert product.stock == 9
+
+
+@pytest.mark.django_db
+class TestOrderBatchQueue:
+    """대기열 및 컨슈머 테스트"""
+
+    def test_enqueue_returns_none_without_redis(self):
+        """Redis 캐시 백엔드가 아니면 대기열 미사용"""
+        assert OrderBatchService.enqueue(OrderBatchEntry(order_id=1, cart_id=1)) is None
+        assert OrderBatchService.drain() == []
+
+    def test_consumer_drains_until_empty(self):
+        """컨슈머는 대기열이 빌 때까지 배치를 처리"""
+        # Arrange
+        product = ProductFactory(stock=10)
+        entries = [_pending_order_with_cart(product) for _ in range(2)]
+
+        # Act
+        with patch.object(OrderBatchService, "drain", side_effect=[entries, []]):
+            summary = process_order_batch()
+
+        # Assert
+        assert summary == {"batches": 1, "processed": 2, "confirmed": 2, "failed": 0}
+        product.refresh_from_db()
+        assert product.stock == 8
+
+    def test_backlog_larger_than_one_run_is_fully_processed(self, settings, mocker, in_memory_redis):
+        """한 번 실행의 처리 한도보다 많이 쌓여도 새 주문 없이 모두 처리 (컨슈머 재예약)"""
+        # Arrange
+        settings.ORDER_BATCH_MAX_SIZE = 2
+        mocker.patch.object(OrderBatchService, "_get_connection", return_value=in_memory_redis)
+        product = ProductFactory(stock=10)
+        entries = [_pending_order_with_cart(product) for _ in range(5)]
+        for entry in entries:
+            in_memory_redis.rpush(OrderBatchService.QUEUE_KEY, json.dumps(asdict(entry)))
+
+        # Act: 한 번에 1배치(2건)만 처리 → 남은 주문은 재예약된 컨슈머가 처리 (eager 실행)
+        summary = process_order_batch(max_batches=1)
+
+        # Assert
+        assert summary["processed"] == 2
+        assert in_memory_redis.llen(OrderBatchService.QUEUE_KEY) == 0
+        assert set(Order.objects.filter(pk__in=[e.order_id for e in entries]).values_list("status", flat=True)) == {
+            "confirmed"
+        }
+        product.refresh_from_db()
+        assert product.stock == 5
+        assert in_memory_redis.llen(OrderBatchService.PROCESSING_KEY) == 0
+
+    def test_orders_claimed_by_dead_consumer_are_recovered(self, settings, mocker, in_memory_redis):
+        """꺼낸 뒤 커밋 전에 컨슈머가 죽어도 처리 중 리스트에 남아 복구 후 처리됨"""
+        # Arrange
+        settings.ORDER_BATCH_PROCESSING_TIMEOUT = 0
+        mocker.patch.object(OrderBatchService, "_get_connection", return_value=in_memory_redis)
+        product = ProductFactory(stock=10)
+        entries = [_pending_order_with_cart(product) for _ in range(3)]
+        for entry in entries:
+            in_memory_redis.rpush(OrderBatchService.QUEUE_KEY, json.dumps(asdict(entry)))
+
+        # 꺼내기만 하고 처리/ack 전에 종료된 컨슈머
+        assert OrderBatchService.drain() == entries
+        assert in_memory_redis.llen(OrderBatchService.QUEUE_KEY) == 0
+        assert in_memory_redis.llen(OrderBatchService.PROCESSING_KEY) == 3
+
+        # Act: 복구 → 대기열로 되돌리고 컨슈머 예약 (eager 실행)
+        recovered = recover_order_batch()
+
+        # Assert
+        assert recovered == 3
+        assert in_memory_redis.llen(OrderBatchService.PROCESSING_KEY) == 0
+        assert in_memory_redis.hgetall(OrderBatchService.CLAIMED_KEY) == {}
+        assert set(Order.objects.filter(pk__in=[e.order_id for e in entries]).values_list("status", flat=True)) == {
+            "confirmed"
+        }
+
+    def test_recover_skips_orders_still_within_timeout(self, settings, mocker, in_memory_redis):
+        """처리 제한 시간이 지나지 않은 주문(실행 중인 컨슈머)은 되돌리지 않음"""
+        # Arrange
+        settings.ORDER_BATCH_PROCESSING_TIMEOUT = 60
+        mocker.patch.object(OrderBatchService, "_get_connection", return_value=in_memory_redis)
+        in_memory_redis.rpush(OrderBatchService.QUEUE_KEY, json.dumps(asdict(OrderBatchEntry(order_id=1, cart_id=1))))
+        OrderBatchService.drain()
+
+        # Act
+        recovered = OrderBatchService.recover_stale()
+
+        # Assert
+        assert recovered == 0
+        assert in_memory_redis.llen(OrderBatchService.PROCESSING_KEY) == 1
+
+    def test_enqueue_does_not_overwrite_existing_schedule(self, mocker, in_memory_redis):
+        """이미 예약된 컨슈머가 있으면 플래그를 덮어쓰지 않고 그 태스크 ID 반환"""
+        # Arrange
+        mocker.patch.object(OrderBatchService, "_get_connection", return_value=in_memory_redis)
+        in_memory_redis.set(OrderBatchService.SCHEDULE_KEY, "existing-task")
+        apply_async = mocker.patch.object(process_order_batch, "apply_async")
+
+        # Act
+        task_id = OrderBatchService.enqueue(OrderBatchEntry(order_id=1, cart_id=1))
+
+        # Assert
+        assert task_id == "existing-task"
+        assert in_memory_redis.get(OrderBatchService.SCHEDULE_KEY) == "existing-task"
+        apply_async.assert_not_called()
+
+    def test_create_order_hybrid_uses_batch_queue_when_enabled(self, settings):
+        """배치 처리 활성화 시 단건 태스크 대신 대기열에 적재"""
+        # Arrange
+        settings.ORDER_BATCH_ENABLED = True
+        user = UserFactory.with_points(10000)
+        cart = CartFactory(user=user)
+        CartItemFactory(cart=cart, product=ProductFactory(stock=10), quantity=1)
+
+        # Act
+        with patch.object(OrderBatchService, "enqueue", return_value="batch-task-id") as mock_enqueue:
+            order, task_id = OrderService.create_order_hybrid(user=user, cart=cart, **ShippingDataBuilder.default())
+
+        # Assert
+        assert task_id == "batch-task-id"
+        mock_enqueue.assert_called_once_with(OrderBatchEntry(order_id=order.id, cart_id=cart.id, use_points=0))
+        order.refresh_from_db()
+        assert order.status == "pending"
+
+    def test_batch_results_published_to_status_channel(self, settings, django_capture_on_commit_callbacks):
+        """배치 결과는 커밋 후 주문 상태 채널에 기록됨"""
+        # Arrange
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        product = ProductFactory(stock=1)
+        confirmed = _pending_order_with_cart(product, quantity=1)
+        failed = _pending_order_with_cart(product, quantity=1)
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            OrderBatchService.process_batch([confirmed, failed])
+
+        # Assert
+        assert OrderStatusService.get(confirmed.order_id)["status"] == "confirmed"
+        assert OrderStatusService.get(failed.order_id)["status"] == "failed"
@@ -0,0 +1,46 @@
+"""OrderSummaryService 단위 테스트"""
+
+import pytest
+
+from shopping.models.order import Order
+from shopping.services.order_summary_service import OrderSummaryService
+from shopping.tests.factories import OrderFactory, OrderItemFactory, ProductFactory, ProductImageFactory
+
+
+@pytest.mark.django_db
+class TestOrderSummaryService:
+    """주문 요약 계산 테스트"""
+
+    def test_refresh_from_order_items(self):
+        """주문 아이템 기준으로 요약 재계산"""
+        # Arrange
+        product = ProductFactory()
+        ProductImageFactory(product=product, order=1)
+        primary = ProductImageFactory.primary(product=product, order=2)
+        order = OrderFactory()
+        OrderItemFactory(order=order, product=product, product_name="첫 상품")
+        OrderItemFactory(order=order, product_name="두 번째 상품")
+
+        # Act
+        updated = OrderSummaryService.refresh([order])
+
+        # Assert: 대표 이미지(is_primary)가 표시 순서보다 우선
+        assert updated == 1
+        saved = Order.objects.get(pk=order.pk)
+        assert saved.item_count == 2
+        assert saved.first_product_name == "첫 상품"
+        assert saved.thumbnail_image == primary.image.name
+
+    def test_refresh_order_without_items(self):
+        """아이템이 없는 주문은 빈 요약"""
+        # Arrange
+        order = OrderFactory(item_count=5, first_product_name="이전 값")
+
+        # Act
+        OrderSummaryService.refresh([order])
+
+        # Assert
+        saved = Order.objects.get(pk=order.pk)
+        assert saved.item_count == 0
+        assert saved.first_product_name == ""
+        assert saved.thumbnail_image == ""
@@ -1051,7 +1051,7 @@ class TestPointServiceUseFIFOConcurrency:
 class TestPointServiceNotifications:
     """알림 발송 테스트"""
 
-    @patch("shopping.tasks.send_email_notification")
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
     def test_send_expiry_notifications_success(self, mock_send_email):
         """만료 예정 알림 발송 성공"""
         # Arrange
@@ -1078,7 +1078,7 @@ class TestPointServiceNotifications:
         assert point_history.metadata.get("expiry_notified") is True
         assert "notified_at" in point_history.metadata
 
-    @patch("shopping.tasks.send_email_notification")
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
     def test_send_expiry_notifications_multiple_users(self, mock_send_email):
         """여러 사용자에게 알림 발송"""
         # Arrange
@@ -1105,7 +1105,7 @@ class TestPointServiceNotifications:
         assert count == 2
         assert mock_send_email.call_count == 2
 
-    @patch("shopping.tasks.send_email_notification")
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
     def test_send_expiry_notifications_grouping(self, mock_send_email):
         """사용자별 그룹화 확인"""
         # Arrange
@@ -1133,9 +1133,9 @@ class TestPointServiceNotifications:
 
         # 이메일 내용 확인
         call_args = mock_send_email.call_args
-        assert "300" in call_args[0][1]  # subject에 총 포인트
+        assert "300" in call_args[0][0].subject  # subject에 총 포인트
 
-    @patch("shopping.tasks.send_email_notification")
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
     def test_send_expiry_notifications_metadata_update(self, mock_send_email):
         """메타데이터 업데이트 확인"""
         # Arrange
@@ -1156,7 +1156,7 @@ class TestPointServiceNotifications:
         assert point_history.metadata.get("expiry_notified") is True
         assert "notified_at" in point_history.metadata
 
-    @patch("shopping.tasks.send_email_notification")
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
     def test_send_expiry_notifications_error_handling(self, mock_send_email, caplog):
         """알림 발송 실패 시 에러 처리"""
         # Arrange
@@ -1170,46 +1170,86 @@ class TestPointServiceNotifications:
             expires_at=timezone.now() + timedelta(days=5),
         )
 
+        point_history = PointHistory.objects.get(user=user, type="earn")
+
         # 이메일 발송 실패 시뮬레이션
         mock_send_email.side_effect = Exception("Email send failed")
 
         # Act
-        count = service.send_expiry_notifications()
+        count = service.send_expiry_notification_chunk([point_history.pk])
 
         # Assert
         assert count == 0  # 실패 시 카운트 안 함
         log_messages = [record.message for record in caplog.records]
         assert any("알림 발송 실패" in msg for msg in log_messages)
+        point_history.refresh_from_db()
+        assert "expiry_notified" not in point_history.metadata  # 다음 실행에서 다시 발송
+
+    @patch("shopping.tasks.point_tasks.send_expiry_notification_chunk.delay")
+    def test_send_expiry_notifications_splits_into_chunk_tasks(self, mock_delay, settings):
+        """대상 사용자를 EMAIL_BATCH_SIZE명씩 청크 태스크로 나눠 발행 (한 태스크에서 전체 발송하지 않음)"""
+        # Arrange
+        settings.EMAIL_BATCH_SIZE = 2
+        service = PointService()
+        points = [
+            PointHistoryFactory.earn(user=UserFactory(), points=100, expires_at=timezone.now() + timedelta(days=5))
+            for _ in range(5)
+        ]
+
+        # Act
+        count = service.send_expiry_notifications()
+
+        # Assert
+        assert count == 5
+        chunks = [call.args[0] for call in mock_delay.call_args_list]
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert sorted(pk for chunk in chunks for pk in chunk) == sorted(point.pk for point in points)
+
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
+    def test_send_expiry_notification_chunk_skips_already_notified(self, mock_send_email):
+        """청크 재시도 시 이미 알림을 보낸 포인트는 다시 발송하지 않음"""
+        # Arrange
+        service = PointService()
+        point = PointHistoryFactory.earn(user=UserFactory(), points=100, expires_at=timezone.now() + timedelta(days=5))
+        service.send_expiry_notification_chunk([point.pk])
 
-    def test_create_expiry_notification_message(self):
-        """만료 알림 메시지 생성"""
+        # Act
+        count = service.send_expiry_notification_chunk([point.pk])
+
+        # Assert
+        assert count == 0
+        assert mock_send_email.call_count == 1
+
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
+    def test_expiry_notification_renders_text_and_html(self, mock_send_email):
+        """만료 알림 메시지는 한 번의 렌더링으로 텍스트/HTML 모두 생성"""
         # Arrange
         user = UserFactory(username="testuser")
         service = PointService()
 
-        point1 = PointHistoryFactory.earn(
+        PointHistoryFactory.earn(
             user=user,
             points=100,
             expires_at=timezone.now() + timedelta(days=5),
         )
-        point2 = PointHistoryFactory.earn(
+        PointHistoryFactory.earn(
             user=user,
             points=200,
-            expires_at=timezone.now() + timedelta(days=10),
+            expires_at=timezone.now() + timedelta(days=6),
         )
 
-        points = [point1, point2]
-        total = 300
-
         # Act
-        message = service._create_expiry_notification_message(user, points, total)
+        service.send_expiry_notifications()
 
         # Assert
-        assert "testuser" in message
-        assert "300" in message
-        assert "100" in message
-        assert "200" in message
-        assert "만료" in message
+        entry = mock_send_email.call_args.args[0]
+        for body in (entry.body, entry.html_body):
+            assert "testuser" in body
+            assert "300" in body
+            assert "100" in body
+            assert "200" in body
+            assert "만료" in body
+        assert "<" not in entry.body
 
 
 # =============================================================================
@@ -1562,7 +1602,7 @@ class TestPointServiceExpirePointsMetadata:
 class TestPointServiceNotificationsEdgeCases:
     """알림 발송 - 엣지 케이스"""
 
-    @patch("shopping.tasks.send_email_notification")
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
     def test_skip_notification_for_zero_remaining_points(self, mock_send_email):
         """0포인트 남은 경우 알림 미발송"""
         # Arrange
@@ -1585,7 +1625,7 @@ class TestPointServiceNotificationsEdgeCases:
         assert count == 0
         mock_send_email.assert_not_called()
 
-    @patch("shopping.tasks.send_email_notification")
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
     def test_notification_only_for_remaining_points(self, mock_send_email):
         """남은 포인트에 대해서만 알림 발송"""
         # Arrange
@@ -1610,9 +1650,9 @@ class TestPointServiceNotificationsEdgeCases:
 
         # 알림 내용에 남은 70P가 포함되어야 함
         call_args = mock_send_email.call_args
-        assert "70" in call_args[0][1]  # subject에 70 포함
+        assert "70" in call_args[0][0].subject  # subject에 70 포함
 
-    @patch("shopping.tasks.send_email_notification")
+    @patch("shopping.services.email_dispatch_service.EmailDispatchService._send_one")
     def test_notification_groups_multiple_expiring_points(self, mock_send_email):
         """여러 만료 예정 포인트 그룹화하여 1회 알림"""
         # Arrange
@@ -1642,7 +1682,7 @@ class TestPointServiceNotificationsEdgeCases:
         # Assert
         assert count == 1  # 사용자당 1회만 발송
         mock_send_email.assert_called_once()
-        assert "600" in mock_send_email.call_args[0][1]  # 총 600P
+        assert "600" in mock_send_email.call_args[0][0].subject  # 총 600P
 
 
 # =============================================================================
@@ -184,6 +184,72 @@ class TestProductServiceSetPrimaryImage:
         assert primary_images.first().id == image2.id
 
 
+@pytest.mark.django_db
+class TestProductServiceRefreshThumbnails:
+    """목록용 대표 이미지 경로(Product.thumbnail_image) 동기화 테스트"""
+
+    def test_first_image_becomes_thumbnail(self):
+        """대표 이미지가 없으면 표시 순서상 첫 이미지"""
+        product = ProductFactory()
+        second = ProductImageFactory(product=product, order=2)
+        first = ProductImageFactory(product=product, order=1)
+
+        product.refresh_from_db()
+        assert product.thumbnail_image == first.image.name != second.image.name
+
+    def test_set_primary_image_updates_thumbnail(self):
+        """대표 이미지 변경 시 상품의 대표 이미지 경로도 변경"""
+        product = ProductFactory()
+        ProductImageFactory(product=product, order=1)
+        target = ProductImageFactory(product=product, order=2)
+
+        target.is_primary = True
+        ProductService.set_primary_image(target)
+
+        product.refresh_from_db()
+        assert product.thumbnail_image == target.image.name
+
+    def test_image_delete_falls_back(self):
+        """대표 이미지 삭제 시 다음 이미지, 모두 삭제하면 빈 값"""
+        product = ProductFactory()
+        primary = ProductImageFactory.primary(product=product)
+        other = ProductImageFactory(product=product)
+
+        primary.delete()
+        product.refresh_from_db()
+        assert product.thumbnail_image == other.image.name
+
+        other.delete()
+        product.refresh_from_db()
+        assert product.thumbnail_image == ""
+
+    def test_product_save_keeps_thumbnail(self):
+        """상품 수정은 메모리의 이전 대표 이미지 경로로 덮어쓰지 않음"""
+        product = ProductFactory()
+        stale = type(product).objects.get(pk=product.pk)
+        image = ProductImageFactory(product=product)
+
+        stale.price += 1000
+        stale.save()
+
+        product.refresh_from_db()
+        assert product.thumbnail_image == image.image.name
+
+    def test_deferred_product_save_updates_loaded_fields_only(self, django_assert_num_queries):
+        """.only()로 읽은 상품 저장은 지연 필드를 다시 조회하지 않고 읽은 필드만 UPDATE"""
+        product = ProductFactory(stock=10)
+        partial = type(product).objects.only("id", "price").get(pk=product.pk)
+        type(product).objects.filter(pk=product.pk).update(stock=3)
+
+        partial.price += 1000
+        with django_assert_num_queries(1):  # 상품 UPDATE만
+            partial.save()
+
+        product.refresh_from_db()
+        assert product.price == partial.price
+        assert product.stock == 3
+
+
 @pytest.mark.django_db(transaction=True)
 class TestProductServiceSetPrimaryImageConcurrency:
     """대표 이미지 설정 동시성 테스트"""
@@ -0,0 +1,150 @@
+"""ProductViewService (상품 조회수 버퍼 / 인기 급상승) 테스트"""
+
+from django.urls import reverse
+
+import pytest
+
+from shopping.models.product import Product
+from shopping.services.product_view_service import ProductViewService
+from shopping.tests.factories import ProductFactory
+
+
+@pytest.fixture
+def local_buffer():
+    """프로세스 로컬 조회수 버퍼 (Redis 없는 테스트 환경, conftest에서 테스트마다 초기화)"""
+    return ProductViewService._local_counts
+
+
+@pytest.fixture
+def redis_conn(mocker):
+    """Redis 연결 모킹"""
+    conn = mocker.Mock()
+    mocker.patch.object(ProductViewService, "_get_redis", return_value=conn)
+    return conn
+
+
+@pytest.mark.django_db
+class TestProductViewFlush:
+    """조회수 반영 테스트"""
+
+    def test_apply_view_deltas_updates_each_product(self):
+        """상품별 증가분을 한 번에 반영, 0 이하는 무시"""
+        # Arrange
+        first = ProductFactory(view_count=10)
+        second = ProductFactory(view_count=0)
+        untouched = ProductFactory(view_count=5)
+
+        # Act
+        ProductViewService.apply_view_deltas({first.pk: 3, second.pk: 7, untouched.pk: 0})
+
+        # Assert
+        assert Product.objects.get(pk=first.pk).view_count == 13
+        assert Product.objects.get(pk=second.pk).view_count == 7
+        assert Product.objects.get(pk=untouched.pk).view_count == 5
+
+    def test_local_buffer_flush(self, local_buffer):
+        """Redis가 없으면 로컬 버퍼에 모았다가 flush 시 반영"""
+        # Arrange
+        product = ProductFactory(view_count=0)
+        for _ in range(3):
+            ProductViewService.record_view(product.pk)
+
+        # Act
+        flushed = ProductViewService.flush()
+
+        # Assert
+        assert flushed == 1
+        assert Product.objects.get(pk=product.pk).view_count == 3
+        assert not local_buffer
+
+    def test_redis_flush_applies_snapshot(self, redis_conn):
+        """pending 해시를 flushing으로 옮겨 반영 후 삭제"""
+        # Arrange
+        product = ProductFactory(view_count=1)
+        redis_conn.set.return_value = True
+        redis_conn.exists.side_effect = lambda key: key == ProductViewService.PENDING_KEY
+        redis_conn.hgetall.return_value = {str(product.pk).encode(): b"4"}
+        redis_conn.get.return_value = None
+
+        # Act
+        flushed = ProductViewService.flush()
+
+        # Assert
+        assert flushed == 1
+        assert Product.objects.get(pk=product.pk).view_count == 5
+        redis_conn.rename.assert_called_once_with(ProductViewService.PENDING_KEY, ProductViewService.FLUSHING_KEY)
+        redis_conn.delete.assert_any_call(ProductViewService.FLUSHING_KEY)
+        redis_conn.delete.assert_any_call(ProductViewService.FLUSH_LOCK_KEY)
+
+    def test_redis_flush_skips_when_locked(self, redis_conn):
+        """다른 flush가 실행 중이면 반영하지 않음"""
+        redis_conn.set.return_value = None
+
+        assert ProductViewService.flush() == 0
+        redis_conn.hgetall.assert_not_called()
+
+
+class TestProductTrendingDecay:
+    """인기 점수 감쇠 테스트"""
+
+    def test_decays_by_elapsed_half_lives(self, redis_conn, mocker, settings):
+        """반감기만큼 지나면 점수 절반"""
+        # Arrange
+        settings.PRODUCT_TRENDING_HALF_LIFE = 3600
+        mocker.patch("shopping.services.product_view_service.time.time", return_value=10_000.0)
+        redis_conn.get.return_value = b"6400.0"
+        pipe = redis_conn.pipeline.return_value
+
+        # Act
+        ProductViewService._decay_trending(redis_conn)
+
+        # Assert
+        pipe.zunionstore.assert_called_once_with(
+            ProductViewService.TRENDING_KEY, {ProductViewService.TRENDING_KEY: pytest.approx(0.5)}
+        )
+        pipe.execute.assert_called_once()
+
+
+@pytest.mark.django_db
+class TestProductTrendingView:
+    """조회 기록 / 인기 급상승 API 테스트"""
+
+    def test_retrieve_records_view(self, api_client, local_buffer):
+        """상세 조회는 DB에 쓰지 않고 조회수만 기록"""
+        product = ProductFactory(view_count=0)
+
+        api_client.get(reverse("product-detail", kwargs={"pk": product.pk}))
+
+        assert local_buffer[product.pk] == 1
+        assert Product.objects.get(pk=product.pk).view_count == 0
+
+    def test_trending_falls_back_to_view_count(self, api_client):
+        """Redis가 없으면 누적 조회수 순, 판매 중인 상품만"""
+        # Arrange
+        low = ProductFactory(view_count=3)
+        high = ProductFactory(view_count=10)
+        ProductFactory(view_count=50, is_active=False)
+        ProductFactory(view_count=0)
+
+        # Act
+        response = api_client.get(reverse("product-trending"))
+
+        # Assert
+        assert [item["id"] for item in response.json()] == [high.pk, low.pk]
+
+    def test_trending_uses_redis_scores(self, api_client, redis_conn):
+        """Redis 점수 순서대로 반환하고 limit 적용"""
+        # Arrange
+        first, second, third = ProductFactory.create_batch(3)
+        redis_conn.zrevrange.return_value = [
+            (str(second.pk).encode(), 9.5),
+            (str(third.pk).encode(), 4.0),
+            (str(first.pk).encode(), 1.2),
+        ]
+
+        # Act
+        response = api_client.get(reverse("product-trending"), {"limit": 2})
+
+        # Assert
+        assert [item["id"] for item in response.json()] == [second.pk, third.pk]
+        redis_conn.zrevrange.assert_called_once_with(ProductViewService.TRENDING_KEY, 0, 3, withscores=True)
@@ -1,9 +1,12 @@
 """ReturnService 단위 테스트"""
 
+from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from shopping.models.return_request import Return, ReturnItem
@@ -24,40 +27,36 @@ class TestGenerateReturnNumber:
     """교환/환불 번호 생성 테스트"""
 
     def test_generate_return_number_format(self):
-        """번호 형식 검증 (RET + YYYYMMDD + 001)"""
+        """번호 형식 검증 (RET + YYYYMMDD + 000001)"""
         # Act
         return_number = ReturnService.generate_return_number()
 
         # Assert
         today = timezone.now().strftime("%Y%m%d")
         assert return_number.startswith(f"RET{today}")
-        assert len(return_number) == 14  # RET(3) + YYYYMMDD(8) + 001(3)
+        assert len(return_number) == 17  # RET(3) + YYYYMMDD(8) + 000001(6)
 
     def test_generate_return_number_sequential(self):
-        """순차 증가 검증"""
-        # Arrange - DB에 Return 객체를 생성해야 generate_return_number가 올바르게 작동
-        today = timezone.now().strftime("%Y%m%d")
-        number1 = ReturnService.generate_return_number()
-        ReturnFactory(return_number=number1)  # DB에 저장
-
+        """순차 증가 검증 (DB 저장 여부와 무관)"""
         # Act
+        number1 = ReturnService.generate_return_number()
         number2 = ReturnService.generate_return_number()
 
         # Assert
-        assert int(number2[-3:]) == int(number1[-3:]) + 1
+        assert int(number2[-6:]) == int(number1[-6:]) + 1
 
-    def test_generate_return_number_with_existing_returns(self):
-        """기존 번호가 있을 때 다음 번호 생성"""
+    def test_generate_return_number_does_not_read_returns(self):
+        """기존 교환/환불 번호를 조회하지 않음 (Max 집계 제거)"""
         # Arrange
-        today = timezone.now().strftime("%Y%m%d")
-        existing_number = f"RET{today}005"
-        ReturnFactory(return_number=existing_number)
+        ReturnFactory()
 
         # Act
-        new_number = ReturnService.generate_return_number()
+        with CaptureQueriesContext(connection) as ctx:
+            ReturnService.generate_return_number()
 
         # Assert
-        assert new_number == f"RET{today}006"
+        assert len(ctx.captured_queries) == 1
+        assert "nextval" in ctx.captured_queries[0]["sql"]
 
 
 @pytest.mark.django_db
@@ -148,6 +147,34 @@ class TestCreateReturn:
         assert return_obj.refund_amount == Decimal("20000")  # 10000 * 2
         assert return_obj.return_items.count() == 1
 
+    def test_create_return_statement_count_independent_of_items(self):
+        """반품 상품 수와 무관하게 Return INSERT 1회 + ReturnItem bulk INSERT 1회"""
+        # Arrange
+        order = OrderFactory.delivered()
+        order_items = [OrderItemFactory(order=order, price=Decimal("10000"), quantity=2) for _ in range(10)]
+
+        def create(items):
+            return ReturnService.create_return(
+                order=order,
+                user=order.user,
+                type="refund",
+                reason="change_of_mind",
+                reason_detail="단순 변심",
+                return_items_data=[{"order_item": item, "quantity": 1} for item in items],
+            )
+
+        # Act
+        with CaptureQueriesContext(connection) as single:
+            create(order_items[:1])
+        with CaptureQueriesContext(connection) as multiple:
+            return_obj = create(order_items)
+
+        # Assert
+        assert len(multiple.captured_queries) == len(single.captured_queries)
+        assert return_obj.refund_amount == Decimal("100000")
+        assert (return_obj.item_count, return_obj.items_amount) == (10, Decimal("100000"))
+        assert return_obj.return_items.count() == 10
+
     def test_create_exchange_success(self):
         """교환 신청 생성 성공"""
         # Arrange
@@ -516,7 +543,7 @@ class TestCompleteRefund:
             product.refresh_from_db()
             assert product.stock == initial_stock + 2
 
-    def test_complete_refund_with_account(self):
+    def test_complete_refund_with_account(self, django_capture_on_commit_callbacks):
         """계좌 환불 (복호화 테스트)"""
         # Arrange - 실제 환불 시나리오처럼 OrderItem과 ReturnItem 생성
         product = ProductFactory(stock=10)
@@ -543,8 +570,9 @@ class TestCompleteRefund:
         with patch("shopping.utils.toss_payment.TossPaymentClient") as mock_toss:
             mock_instance = mock_toss.return_value
 
-            # Act
-            ReturnService.complete_refund(return_obj)
+            # Act (PG 환불은 커밋 후 실행)
+            with django_capture_on_commit_callbacks(execute=True):
+                ReturnService.complete_refund(return_obj)
 
             # Assert - 복호화된 계좌번호가 API에 전달되었는지 확인
             call_args = mock_instance.cancel_payment.call_args
@@ -561,7 +589,7 @@ class TestCompleteRefund:
             # accountNumber는 복호화된 값이어야 함
             assert "accountNumber" in refund_account
 
-    def test_complete_refund_notification_sent(self):
+    def test_complete_refund_notification_sent(self, django_capture_on_commit_callbacks):
         """환불 완료 시 알림 발송 확인"""
         # Arrange
         return_obj = ReturnFactory.received(type="refund")
@@ -570,7 +598,8 @@ class TestCompleteRefund:
         # Mock 토스 API
         with patch("shopping.utils.toss_payment.TossPaymentClient"):
             # Act
-            ReturnService.complete_refund(return_obj)
+            with django_capture_on_commit_callbacks(execute=True):
+                ReturnService.complete_refund(return_obj)
 
             # Assert
             from shopping.models import Notification
@@ -638,6 +667,176 @@ class TestCompleteRefund:
             log_messages = [record.message for record in caplog.records]
             assert any("환불 완료" in msg for msg in log_messages)
 
+    def test_complete_refund_defers_pg_call_until_commit(self, django_capture_on_commit_callbacks):
+        """토스 API는 트랜잭션 안에서 호출하지 않고 커밋 후 호출"""
+        # Arrange
+        return_obj = ReturnFactory.received(type="refund", refund_amount=Decimal("30000"))
+        PaymentFactory(order=return_obj.order, status="done", payment_key="test_key_123")
+
+        with patch("shopping.utils.toss_payment.TossPaymentClient") as mock_toss:
+            # Act
+            with django_capture_on_commit_callbacks(execute=False) as callbacks:
+                ReturnService.complete_refund(return_obj)
+
+            # Assert
+            assert not mock_toss.return_value.cancel_payment.called
+            return_obj.refresh_from_db()
+            assert (return_obj.status, return_obj.refund_status) == ("completed", "pending")
+
+            for callback in callbacks:
+                callback()
+            assert mock_toss.return_value.cancel_payment.call_count == 1
+
+        return_obj.refresh_from_db()
+        assert return_obj.refund_status == "succeeded"
+
+    def test_complete_refund_restores_stock_in_one_update(self):
+        """여러 아이템의 재고 복구는 같은 상품끼리 합산해 UPDATE 1회로 반영"""
+        # Arrange
+        product_a = ProductFactory(stock=10)
+        product_b = ProductFactory(stock=3)
+        order = OrderFactory.delivered()
+        return_obj = ReturnFactory.received(type="refund", order=order, refund_amount=Decimal("0"))
+        for product, quantity in ((product_a, 2), (product_a, 1), (product_b, 4)):
+            order_item = OrderItemFactory(order=order, product=product, quantity=quantity)
+            ReturnItemFactory(return_request=return_obj, order_item=order_item, quantity=quantity)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            ReturnService.complete_refund(return_obj)
+
+        # Assert
+        product_a.refresh_from_db()
+        product_b.refresh_from_db()
+        assert (product_a.stock, product_b.stock) == (13, 7)
+
+        stock_updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('UPDATE "shopping_product"')]
+        assert len(stock_updates) == 1
+
+    def test_complete_refund_twice_restores_stock_once(self):
+        """오래된 객체로 다시 완료 처리해도 DB 상태 기준으로 거부 (재고 중복 복구 방지)"""
+        # Arrange
+        product = ProductFactory(stock=10)
+        order = OrderFactory.delivered()
+        order_item = OrderItemFactory(order=order, product=product, quantity=2)
+        return_obj = ReturnFactory.received(type="refund", order=order, refund_amount=Decimal("0"))
+        ReturnItemFactory(return_request=return_obj, order_item=order_item, quantity=2)
+        stale_obj = Return.objects.get(pk=return_obj.pk)
+
+        ReturnService.complete_refund(return_obj)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            ReturnService.complete_refund(stale_obj)
+
+        product.refresh_from_db()
+        assert product.stock == 12
+
+
+@pytest.mark.django_db
+class TestProcessRefund:
+    """PG 환불 단계 (process_refund / refund_return_payment) 테스트"""
+
+    @pytest.fixture
+    def pending_return(self):
+        return_obj = ReturnFactory.completed(type="refund", refund_status="pending", refund_amount=Decimal("30000"))
+        PaymentFactory(order=return_obj.order, status="done", payment_key="test_key_123")
+        return return_obj
+
+    def test_success(self, pending_return):
+        """환불 성공 시 succeeded + 멱등키 전달 + 알림"""
+        with patch("shopping.utils.toss_payment.TossPaymentClient") as mock_toss:
+            # Act
+            result = ReturnService.process_refund(pending_return.pk)
+
+            # Assert
+            call_kwargs = mock_toss.return_value.cancel_payment.call_args.kwargs
+            assert call_kwargs["idempotency_key"] == f"refund-{pending_return.return_number}"
+
+        assert result.refund_status == "succeeded"
+        assert result.refund_attempts == 1
+        assert result.refunded_at is not None
+
+        from shopping.models import Notification
+
+        assert Notification.objects.filter(user=pending_return.user, title="환불 완료").exists()
+
+    def test_not_pending_is_skipped(self, pending_return):
+        """pending이 아닌 건은 토스 API를 호출하지 않음 (중복 처리 방지)"""
+        Return.objects.filter(pk=pending_return.pk).update(refund_status="processing")
+
+        with patch("shopping.utils.toss_payment.TossPaymentClient") as mock_toss:
+            result = ReturnService.process_refund(pending_return.pk)
+
+            assert result is None
+            assert not mock_toss.return_value.cancel_payment.called
+
+    def test_server_error_stays_pending(self, pending_return):
+        """토스 서버/네트워크 오류는 pending 유지 (재시도 대상)"""
+        from shopping.utils.toss_payment import TossPaymentError
+
+        with patch("shopping.utils.toss_payment.TossPaymentClient") as mock_toss:
+            mock_toss.return_value.cancel_payment.side_effect = TossPaymentError(
+                code="NETWORK_ERROR", message="timeout", status_code=500
+            )
+
+            result = ReturnService.process_refund(pending_return.pk)
+
+        assert result.refund_status == "pending"
+        assert result.refund_error == "[NETWORK_ERROR] timeout"
+
+    def test_client_error_fails_without_retry(self, pending_return):
+        """재시도로 해결되지 않는 오류(4xx)는 failed"""
+        from shopping.utils.toss_payment import TossPaymentError
+
+        with patch("shopping.utils.toss_payment.TossPaymentClient") as mock_toss:
+            mock_toss.return_value.cancel_payment.side_effect = TossPaymentError(
+                code="NOT_CANCELABLE_AMOUNT", message="취소 불가 금액", status_code=400
+            )
+
+            result = ReturnService.process_refund(pending_return.pk)
+
+        assert result.refund_status == "failed"
+
+    def test_task_retries_until_max_attempts(self, pending_return):
+        """일시적 오류가 계속되면 최대 시도 횟수까지 재시도 예약 후 failed"""
+        from celery.exceptions import Retry
+
+        from shopping.tasks.payment_tasks import refund_return_payment
+        from shopping.utils.toss_payment import TossPaymentError
+
+        with patch("shopping.utils.toss_payment.TossPaymentClient") as mock_toss:
+            mock_toss.return_value.cancel_payment.side_effect = TossPaymentError(
+                code="NETWORK_ERROR", message="timeout", status_code=500
+            )
+
+            # Act & Assert
+            for _ in range(ReturnService.REFUND_MAX_ATTEMPTS - 1):
+                with pytest.raises(Retry):
+                    refund_return_payment.apply(args=[pending_return.pk])
+
+            result = refund_return_payment.apply(args=[pending_return.pk]).get()
+
+        assert result == {"status": "failed", "return_id": pending_return.pk}
+        pending_return.refresh_from_db()
+        assert pending_return.refund_attempts == ReturnService.REFUND_MAX_ATTEMPTS
+
+    def test_stale_refunds_are_requeued(self, pending_return):
+        """오래 대기/정체된 환불은 재처리 대상 (processing은 pending으로 복구)"""
+        # Arrange
+        stalled = ReturnFactory.completed(type="refund", refund_status="processing")
+        fresh = ReturnFactory.completed(type="refund", refund_status="pending")
+        old = timezone.now() - timedelta(hours=1)
+        Return.objects.filter(pk__in=[pending_return.pk, stalled.pk]).update(updated_at=old)
+
+        # Act
+        return_ids = ReturnService.get_retryable_refund_ids(stale_after=timedelta(minutes=10))
+
+        # Assert
+        assert sorted(return_ids) == sorted([pending_return.pk, stalled.pk])
+        assert fresh.pk not in return_ids
+        stalled.refresh_from_db()
+        assert stalled.refund_status == "pending"
 
 
 @pytest.mark.django_db
@@ -740,3 +939,25 @@ class TestCompleteExchange:
             )
 
         assert "반품 도착 상태에서만 교환 처리할 수 있습니다" in str(exc_info.value)
+
+    def test_complete_exchange_out_of_stock(self):
+        """교환 상품 재고가 없으면 ValueError, 반품 재고도 롤백"""
+        # Arrange
+        original_product = ProductFactory(stock=10)
+        exchange_product = ProductFactory(stock=0)
+        order = OrderFactory.delivered()
+        order_item = OrderItemFactory(order=order, product=original_product, quantity=1)
+        return_obj = ReturnFactory.received(type="exchange", order=order, exchange_product=exchange_product)
+        ReturnItemFactory(return_request=return_obj, order_item=order_item, quantity=1)
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            ReturnService.complete_exchange(
+                return_obj,
+                exchange_tracking_number="987654321098",
+                exchange_shipping_company="CJ대한통운",
+            )
+
+        assert "재고가 부족합니다" in str(exc_info.value)
+        original_product.refresh_from_db()
+        assert original_product.stock == 10
@@ -61,7 +61,7 @@ class TestSendExpiryNotificationTaskHappyPath:
         # Assert
         assert result["status"] == "success"
         assert result["notification_count"] == 5
-        assert "5명에게 만료 예정 알림을 발송했습니다" in result["message"]
+        assert "5명에게 만료 예정 알림 발송을 예약했습니다" in result["message"]
         mock_service.assert_called_once()
 
 
@@ -0,0 +1,117 @@
+"""Celery 큐 토폴로지 및 큐 대기 시간 측정 테스트"""
+
+import time
+from io import StringIO
+from types import SimpleNamespace
+
+import pytest
+from celery.app.task import Context
+from django.core.management import call_command
+
+from myproject.celery import TASK_PRIORITIES, WORKER_PROFILES, app
+from shopping.utils import queue_metrics
+from shopping.utils.queue_metrics import (
+    get_latency_stats,
+    percentile,
+    record_queue_latency,
+    reset_latency,
+    stamp_enqueued_at,
+)
+
+
+@pytest.fixture
+def clean_samples():
+    """프로세스 로컬 샘플 초기화 (테스트 캐시는 DummyCache → 로컬 샘플 사용)"""
+    queue_metrics._local_samples.clear()
+    yield
+    queue_metrics._local_samples.clear()
+
+
+class TestQueueTopology:
+    """큐 라우팅/워커 프로필 설정 테스트"""
+
+    def test_every_queue_has_exactly_one_profile(self):
+        """모든 큐는 하나의 워커 프로필에만 속함"""
+        profiled = [queue for profile in WORKER_PROFILES.values() for queue in profile["queues"]]
+
+        assert sorted(profiled) == sorted(app.conf.task_queues)
+
+    def test_prefetch_multiplier_matches_worker_flags(self):
+        """설정값과 워커 실행 옵션(--prefetch-multiplier=1) 일치"""
+        assert app.conf.worker_prefetch_multiplier == 1
+
+    def test_routes_assign_queue_and_priority(self):
+        """결제는 최우선, 이메일은 알림 큐(IO 워커)로 라우팅"""
+        router = app.amqp.router
+
+        payment = router.route({}, "shopping.tasks.payment_tasks.finalize_payment_confirm")
+        email = router.route({}, "shopping.tasks.email_tasks.send_email_task")
+
+        assert payment["priority"] == TASK_PRIORITIES["payment"]
+        assert email["queue"].name == "notifications"
+        assert email["priority"] > payment["priority"]
+
+
+class TestQueueLatencyMetrics:
+    """큐 대기 시간 기록 테스트"""
+
+    def test_percentile_nearest_rank(self):
+        """nearest-rank 백분위수"""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+    def test_stamp_resolves_queue_from_routing_key(self):
+        """발행 시 헤더에 발행 시각과 큐 이름 기록"""
+        headers = {}
+
+        stamp_enqueued_at(headers=headers, routing_key="payment.critical")
+
+        assert headers["enqueued_queue"] == "payment_critical"
+        assert headers["enqueued_at"] <= time.time()
+
+    def test_prerun_records_latency_per_queue(self, clean_samples):
+        """실행 직전에 큐별 대기 시간 기록"""
+        # Arrange
+        request = Context(enqueued_at=time.time() - 0.5, enqueued_queue="notifications")
+        task = SimpleNamespace(request=request)
+
+        # Act
+        record_queue_latency(task=task)
+
+        # Assert
+        stats = get_latency_stats("notifications")
+        assert stats["samples"] == 1
+        assert stats["p50_ms"] >= 500
+
+    def test_prerun_ignores_messages_without_header(self, clean_samples):
+        """eager 실행 등 헤더가 없으면 기록하지 않음"""
+        record_queue_latency(task=SimpleNamespace(request=Context()))
+
+        assert queue_metrics._local_samples == {}
+
+    def test_reset_latency(self, clean_samples):
+        """샘플 초기화"""
+        queue_metrics.record_latency("points", 0.1)
+
+        reset_latency(["points"])
+
+        assert get_latency_stats("points")["samples"] == 0
+
+
+class TestBenchmarkCommand:
+    """벤치마크 명령어 테스트"""
+
+    def test_reports_every_profile_queue(self, clean_samples):
+        """프로필별 큐 대기 시간 표 출력 (eager 모드)"""
+        out = StringIO()
+
+        call_command("benchmark_celery_queues", "--tasks", "1", "--work-ms", "0", stdout=out)
+
+        output = out.getvalue()
+        for profile in WORKER_PROFILES.values():
+            for queue in profile["queues"]:
+                assert queue in output
+        assert "p99(ms)" in output
@@ -0,0 +1,81 @@
+"""역할/연결 방식별 DB 설정 (myproject.settings.components.database) 테스트"""
+
+from django.core.exceptions import ImproperlyConfigured
+
+import pytest
+
+from myproject.settings.components import database
+from myproject.settings.components.database import ROLE_PRESETS, get_database_config
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ("DJANGO_PROCESS_ROLE", "DB_CONNECTION_MODE", "DB_CONN_MAX_AGE", "DB_POOL_MIN_SIZE", "DB_POOL_MAX_SIZE"):
+        monkeypatch.delenv(name, raising=False)
+
+
+class TestDatabaseConfig:
+    """get_database_config 테스트"""
+
+    def test_persistent_mode_uses_role_conn_max_age(self):
+        """기본(persistent)은 역할별 CONN_MAX_AGE 영구 연결"""
+        config = get_database_config(role="worker")
+
+        assert config["CONN_MAX_AGE"] == ROLE_PRESETS["worker"]["conn_max_age"]
+        assert config["OPTIONS"]["application_name"] == "shopping-worker"
+        assert "pool" not in config["OPTIONS"]
+
+    def test_role_and_mode_from_environment(self, monkeypatch):
+        """역할/방식은 환경변수로 지정"""
+        monkeypatch.setenv("DJANGO_PROCESS_ROLE", "beat")
+        monkeypatch.setenv("DB_CONN_MAX_AGE", "0")
+
+        config = get_database_config()
+
+        assert config["OPTIONS"]["application_name"] == "shopping-beat"
+        assert config["CONN_MAX_AGE"] == 0
+
+    def test_pool_mode(self, mocker, monkeypatch):
+        """pool 방식은 풀 크기 지정 + CONN_MAX_AGE=0"""
+        # Arrange
+        mocker.patch.object(database, "psycopg3_available", return_value=True)
+        monkeypatch.setenv("DB_POOL_MAX_SIZE", "8")
+
+        # Act
+        config = get_database_config(role="web", mode="pool")
+
+        # Assert
+        assert config["CONN_MAX_AGE"] == 0
+        assert config["OPTIONS"]["pool"]["min_size"] == ROLE_PRESETS["web"]["pool_min_size"]
+        assert config["OPTIONS"]["pool"]["max_size"] == 8
+
+    def test_pool_mode_requires_psycopg3(self, mocker):
+        """psycopg 3가 없으면 pool 방식 사용 불가"""
+        mocker.patch.object(database, "psycopg3_available", return_value=False)
+
+        with pytest.raises(ImproperlyConfigured):
+            get_database_config(mode="pool")
+
+    def test_pgbouncer_mode(self, mocker):
+        """pgbouncer 방식은 서버 측 커서와 시작 파라미터, prepared statement 비활성화"""
+        mocker.patch.object(database, "psycopg3_available", return_value=True)
+
+        config = get_database_config(mode="pgbouncer")
+
+        assert config["DISABLE_SERVER_SIDE_CURSORS"] is True
+        assert "options" not in config["OPTIONS"]
+        assert config["OPTIONS"]["prepare_threshold"] is None
+
+    def test_pgbouncer_mode_with_psycopg2(self, mocker):
+        """psycopg2에는 prepare_threshold 옵션을 넘기지 않음 (알 수 없는 DSN 파라미터)"""
+        mocker.patch.object(database, "psycopg3_available", return_value=False)
+
+        config = get_database_config(mode="pgbouncer")
+
+        assert "prepare_threshold" not in config["OPTIONS"]
+
+    @pytest.mark.parametrize("kwargs", [{"role": "scheduler"}, {"mode": "session"}])
+    def test_unknown_role_or_mode(self, kwargs):
+        """알 수 없는 역할/방식은 설정 오류"""
+        with pytest.raises(ImproperlyConfigured):
+            get_database_config(**kwargs)
@@ -0,0 +1,289 @@
+"""
+읽기 replica 라우팅 테스트 (shopping.db_router)
+
+- TestReplicaRouter / TestReplicaReadMixin: DB 없이 라우팅 결정만 검증 (기본 테스트 설정)
+- TestReplicaRoutingApi: primary/replica를 서로 다른 DB로 둔 설정에서만 실행
+    pytest --ds=myproject.settings.test_replica shopping/tests/test_db_router.py
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import OperationalError, connections
+from django.test import RequestFactory
+from django.urls import reverse
+
+import pytest
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from shopping import db_router
+from shopping.db_router import ReplicaHealth, ReplicaRouter, use_replica
+from shopping.middleware import ReplicaRoutingMiddleware
+from shopping.models.product import Category, Product
+from shopping.models.user import User
+from shopping.views.mixins import ReplicaReadMixin
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+requires_replica = pytest.mark.skipif(
+    "replica" not in settings.DATABASES,
+    reason="replica DB가 설정된 환경에서만 실행 (--ds=myproject.settings.test_replica)",
+)
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """sticky 기록 확인용 실제 캐시 (테스트 기본값은 DummyCache)"""
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_replica_health():
+    ReplicaHealth.reset()
+    yield
+    ReplicaHealth.reset()
+
+
+@pytest.fixture
+def replica_enabled(mocker):
+    """replica 설정 + 정상 상태로 간주 (라우팅 결정만 검증)"""
+    mocker.patch.object(db_router, "replica_configured", return_value=True)
+    mocker.patch.object(ReplicaHealth, "get_lag", return_value=0.0)
+
+
+def make_request(user_id=None):
+    user = SimpleNamespace(pk=user_id, is_authenticated=user_id is not None)
+    return SimpleNamespace(user=user)
+
+
+class TestReplicaRouter:
+    """라우팅 결정 테스트"""
+
+    def test_reads_use_primary_without_replica_config(self, mocker):
+        """replica 미설정 시 use_replica 안에서도 primary"""
+        mocker.patch.object(db_router, "replica_configured", return_value=False)
+
+        with use_replica():
+            assert Product.objects.all().db == "default"
+
+    def test_reads_inside_block_use_replica(self, replica_enabled):
+        """use_replica 블록 안의 읽기만 replica"""
+        with use_replica():
+            assert Product.objects.all().db == "replica"
+        assert Product.objects.all().db == "default"
+
+    def test_nested_blocks_keep_replica_until_outermost_exit(self, replica_enabled):
+        """중첩 블록은 바깥 블록이 끝날 때까지 replica 유지"""
+        with use_replica():
+            with use_replica():
+                pass
+            assert Product.objects.all().db == "replica"
+
+    def test_writes_always_use_primary(self, replica_enabled):
+        """쓰기 쿼리셋은 블록 안에서도 primary"""
+        with use_replica():
+            assert Product.objects.select_for_update().db == "default"
+
+    def test_read_after_write_uses_primary(self, replica_enabled):
+        """같은 요청에서 쓰기 이후의 읽기는 primary (read-your-writes)"""
+        with use_replica():
+            ReplicaRouter().db_for_write(Product)
+            assert Product.objects.all().db == "default"
+
+    def test_reads_inside_transaction_use_primary(self, replica_enabled, mocker):
+        """primary 트랜잭션 안의 읽기는 primary"""
+        mocker.patch.object(connections["default"], "in_atomic_block", True)
+
+        with use_replica():
+            assert Product.objects.all().db == "default"
+
+    def test_recent_writer_is_pinned_to_primary(self, replica_enabled, locmem_cache):
+        """최근 쓰기한 사용자는 다음 요청에서도 primary"""
+        # Arrange
+        db_router.pin_primary(user_id=7)
+
+        # Act & Assert
+        with use_replica(make_request(user_id=7)):
+            assert Product.objects.all().db == "default"
+        with use_replica(make_request(user_id=8)):
+            assert Product.objects.all().db == "replica"
+
+    def test_lagging_replica_falls_back_to_primary(self, mocker, settings):
+        """복제 지연이 REPLICA_MAX_LAG_SECONDS를 넘으면 primary"""
+        # Arrange
+        settings.REPLICA_MAX_LAG_SECONDS = 10
+        mocker.patch.object(db_router, "replica_configured", return_value=True)
+        mocker.patch.object(ReplicaHealth, "get_lag", return_value=30.0)
+
+        # Act & Assert
+        with use_replica():
+            assert Product.objects.all().db == "default"
+
+    def test_unreachable_replica_falls_back_to_primary(self, mocker):
+        """replica 연결 실패 시 primary, 확인 주기 동안 재확인하지 않음"""
+        # Arrange
+        mocker.patch.object(db_router, "replica_configured", return_value=True)
+        get_lag = mocker.patch.object(ReplicaHealth, "get_lag", side_effect=OperationalError("down"))
+
+        # Act
+        with use_replica():
+            first = Product.objects.all().db
+            second = Product.objects.all().db
+
+        # Assert
+        assert (first, second) == ("default", "default")
+        assert get_lag.call_count == 1
+
+    def test_replica_reads_wraps_service_methods(self, replica_enabled):
+        """replica_reads 서비스의 공개 staticmethod는 replica 범위에서 실행"""
+
+        @db_router.replica_reads
+        class QueryService:
+            @staticmethod
+            def get_db():
+                return Product.objects.all().db
+
+        assert QueryService.get_db() == "replica"
+        assert db_router.current_state() is None
+
+
+class TestReplicaRoutingMiddleware:
+    """sticky 기록 미들웨어 테스트"""
+
+    def test_write_request_pins_user(self, replica_enabled, locmem_cache):
+        """쓰기가 있었던 인증 사용자의 요청 이후 primary 고정"""
+        # Arrange
+        request = make_request(user_id=3)
+
+        def get_response(request):
+            ReplicaRouter().db_for_write(Product)
+            return "ok"
+
+        # Act
+        ReplicaRoutingMiddleware(get_response)(request)
+
+        # Assert
+        assert cache.get(db_router.STICKY_KEY.format(user_id=3)) == 1
+        assert db_router.current_state() is None
+
+    def test_read_request_does_not_pin_user(self, replica_enabled, locmem_cache):
+        """읽기만 한 요청은 sticky 기록 없음"""
+        ReplicaRoutingMiddleware(lambda request: "ok")(make_request(user_id=3))
+
+        assert cache.get(db_router.STICKY_KEY.format(user_id=3)) is None
+
+
+class ReplicaProbeView(ReplicaReadMixin, APIView):
+    """라우팅 확인용 뷰 (첫 호출에서 replica 장애를 흉내)"""
+
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    replica_actions = ("get",)
+    calls = []
+
+    def get(self, request):
+        db = Product.objects.all().db
+        self.calls.append(db)
+        if db == "replica":
+            raise OperationalError("replica connection lost")
+        return Response({"db": db})
+
+    def post(self, request):
+        return Response({"db": Product.objects.all().db})
+
+
+class TestReplicaReadMixin:
+    """ReplicaReadMixin 테스트"""
+
+    def setup_method(self):
+        ReplicaProbeView.calls = []
+
+    def test_replica_failure_retries_on_primary(self, replica_enabled):
+        """replica 쿼리 실패 시 replica를 제외하고 primary로 재시도"""
+        # Act
+        response = ReplicaProbeView.as_view()(RequestFactory().get("/probe/"))
+
+        # Assert
+        assert response.status_code == 200
+        assert ReplicaProbeView.calls == ["replica", "default"]
+        assert ReplicaHealth.is_available() is False
+
+    def test_unsafe_method_is_not_routed(self, replica_enabled):
+        """replica_actions에 없는 요청(POST)은 primary"""
+        response = ReplicaProbeView.as_view()(RequestFactory().post("/probe/"))
+
+        assert response.data == {"db": "default"}
+
+
+@requires_replica
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+class TestReplicaRoutingApi:
+    """primary/replica가 다른 DB인 환경의 API 라우팅 테스트"""
+
+    @pytest.fixture
+    def catalog(self, db):
+        """primary에 상품을 만들고 replica로 복제한 뒤, primary에서만 이름 변경 (복제 지연 상태)"""
+        seller = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pass1234!", is_seller=True, is_email_verified=True
+        )
+        category = Category.objects.create(name="카테고리", slug="category")
+        product = Product.objects.create(
+            name="복제된 이름",
+            slug="replicated",
+            category=category,
+            seller=seller,
+            price=Decimal("10000"),
+            stock=10,
+            sku="REPLICA-001",
+            is_active=True,
+        )
+        for model in (User, Category, Product):
+            model.objects.using("replica").bulk_create(list(model.objects.all()))
+
+        Product.objects.filter(pk=product.pk).update(name="최신 이름")
+        return product
+
+    def product_names(self, client):
+        response = client.get(reverse("product-list"))
+        assert response.status_code == 200
+        return [item["name"] for item in response.json()["results"]]
+
+    def test_product_list_reads_replica(self, api_client, catalog):
+        """상품 목록은 replica에서 조회"""
+        assert self.product_names(api_client) == ["복제된 이름"]
+
+    def test_product_detail_reads_replica(self, api_client, catalog):
+        """상품 상세도 replica에서 조회"""
+        response = api_client.get(reverse("product-detail", args=[catalog.pk]))
+
+        assert response.json()["name"] == "복제된 이름"
+
+    def test_recent_writer_reads_primary(self, api_client, catalog, locmem_cache):
+        """쓰기 직후의 사용자는 primary에서 조회 (read-your-writes)"""
+        # Arrange
+        buyer = User.objects.create_user(username="buyer", email="buyer@example.com", password="pass1234!")
+        api_client.force_authenticate(user=buyer)
+        db_router.pin_primary(buyer.pk)
+
+        # Act & Assert
+        assert self.product_names(api_client) == ["최신 이름"]
+
+    def test_unavailable_replica_falls_back_to_primary(self, api_client, catalog, mocker):
+        """replica 연결 실패 시 primary에서 조회"""
+        mocker.patch.object(ReplicaHealth, "get_lag", side_effect=OperationalError("down"))
+
+        assert self.product_names(api_client) == ["최신 이름"]
+
+    def test_lagging_replica_falls_back_to_primary(self, api_client, catalog, mocker, settings):
+        """복제 지연이 허용치를 넘으면 primary에서 조회"""
+        settings.REPLICA_MAX_LAG_SECONDS = 1
+        mocker.patch.object(ReplicaHealth, "get_lag", return_value=5.0)
+
+        assert self.product_names(api_client) == ["최신 이름"]
@@ -0,0 +1,186 @@
+"""요청 성능 계측 (PerformanceMetricsMiddleware / request_metrics) 테스트"""
+
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+from rest_framework import serializers
+
+from shopping.models.product import Product
+from shopping.utils import request_metrics
+from shopping.utils.renderers import TimedJSONRenderer
+from shopping.utils.request_metrics import profile_request
+
+LOCMEM_CACHES = {"default": {"BACKEND": "shopping.utils.cache_backends.InstrumentedLocMemCache"}}
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    request_metrics.reset()
+    yield
+    request_metrics.reset()
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """히트/미스 검증용 계측 캐시 (테스트 기본값은 DummyCache)"""
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestProfileRequest:
+    """요청 단위 계측 테스트"""
+
+    def test_counts_queries_and_db_time(self):
+        with profile_request() as profile:
+            Product.objects.count()
+            list(Product.objects.all())
+
+        assert profile.queries == 2
+        assert profile.db_time > 0
+
+    def test_counts_cache_hits_and_misses(self, locmem_cache):
+        cache.set("a", 1)
+
+        with profile_request() as profile:
+            cache.get("a")
+            cache.get("missing")
+            cache.get_many(["a", "b", "c"])
+
+        assert (profile.cache_hits, profile.cache_misses) == (2, 3)
+
+    def test_cache_get_keeps_default(self, locmem_cache):
+        """미스 판정용 sentinel이 호출자에게 새지 않음"""
+        with profile_request():
+            assert cache.get("missing", "fallback") == "fallback"
+            assert cache.get("missing") is None
+
+    def test_renderer_time_counted(self, mocker):
+        """응답 렌더링 시간을 직렬화 시간으로 집계"""
+        clock = iter([10.0, 10.5])
+        with profile_request() as profile:
+            mocker.patch("shopping.utils.request_metrics.time.perf_counter", side_effect=lambda: next(clock))
+            content = TimedJSONRenderer().render([{"value": 1}, {"value": 2}])
+            mocker.stopall()
+
+        assert content == b'[{"value":1},{"value":2}]'
+        assert profile.serializer_time == pytest.approx(0.5)
+
+    def test_serializer_classes_untouched(self):
+        """serializer.data는 계측하지 않음 (serializer 클래스 변경 없음, 렌더링 한 곳에서만 측정)"""
+
+        class PlainSerializer(serializers.Serializer):
+            value = serializers.IntegerField()
+
+        with profile_request() as profile:
+            PlainSerializer({"value": 1}).data
+
+        assert profile.serializer_time == 0
+
+    def test_uninstrumented_cache_backend_not_counted(self, settings):
+        """CACHES에 계측 백엔드를 지정하지 않으면 히트/미스를 집계하지 않음"""
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+        with profile_request() as profile:
+            cache.get("missing")
+
+        assert profile.cache_misses == 0
+
+    def test_no_accounting_outside_profile(self, locmem_cache):
+        with profile_request() as profile:
+            pass
+        cache.get("missing")
+        Product.objects.count()
+
+        assert (profile.queries, profile.cache_misses) == (0, 0)
+
+
+@pytest.mark.django_db
+class TestPerformanceMetricsMiddleware:
+    """미들웨어 집계 / Prometheus 출력 테스트"""
+
+    def test_aggregates_per_url_name(self, api_client, product):
+        # Act
+        for _ in range(3):
+            api_client.get(reverse("product-list"))
+
+        # Assert
+        totals = request_metrics.snapshot()
+        assert totals["product-list|GET|count"] == 3
+        assert totals["product-list|GET|queries"] > 0
+        assert totals["product-list|GET|serializer_seconds"] > 0
+
+    def test_prometheus_format(self, api_client, product):
+        # Arrange
+        api_client.get(reverse("product-list"))
+
+        # Act
+        output = request_metrics.render_prometheus()
+
+        # Assert
+        assert "# TYPE http_request_duration_seconds histogram" in output
+        assert 'http_request_duration_seconds_count{endpoint="product-list",method="GET"} 1' in output
+        assert 'http_request_duration_seconds_bucket{endpoint="product-list",method="GET",le="+Inf"} 1' in output
+        assert 'http_request_db_queries_total{endpoint="product-list",method="GET"}' in output
+
+    def test_server_timing_header(self, api_client, settings, product):
+        settings.REQUEST_METRICS_SERVER_TIMING = True
+
+        response = api_client.get(reverse("product-list"))
+
+        assert "db;dur=" in response["Server-Timing"]
+
+    def test_slow_request_logged(self, api_client, settings, caplog):
+        settings.REQUEST_METRICS_SLOW_MS = -1
+
+        with caplog.at_level("WARNING", logger="shopping.middleware"):
+            api_client.get(reverse("product-list"))
+
+        assert "느린 요청: GET product-list" in caplog.text
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    """/api/metrics/ 접근 제어 테스트"""
+
+    def test_anonymous_forbidden(self, api_client):
+        assert api_client.get(reverse("metrics")).status_code == 403
+
+    def test_bearer_token(self, api_client, settings):
+        settings.METRICS_TOKEN = "scrape-secret"
+
+        response = api_client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer scrape-secret")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+
+    def test_wrong_token_forbidden(self, api_client, settings):
+        settings.METRICS_TOKEN = "scrape-secret"
+
+        response = api_client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong")
+
+        assert response.status_code == 403
+
+    def test_staff_session(self, api_client, user):
+        user.is_staff = True
+        user.save()
+        api_client.force_login(user)
+
+        assert api_client.get(reverse("metrics")).status_code == 200
+
+
+@pytest.mark.django_db
+class TestAssertMaxQueries:
+    """쿼리 예산 헬퍼 테스트"""
+
+    def test_reports_repeated_queries(self, assert_max_queries, product):
+        with pytest.raises(pytest.fail.Exception) as exc_info:
+            with assert_max_queries(1):
+                for _ in range(3):
+                    Product.objects.filter(pk=product.pk).exists()
+
+        assert "쿼리 예산 초과 (1): 3 > 1" in str(exc_info.value)
+        assert "3x" in str(exc_info.value)
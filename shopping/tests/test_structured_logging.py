@@ -0,0 +1,155 @@
+"""구조화/비차단 로깅 (shopping.utils.structured_logging) 테스트"""
+
+import json
+import logging
+import sys
+import threading
+from io import StringIO
+
+from django.core.management import call_command
+
+import pytest
+
+from shopping.tests.conftest import PROPAGATE_LOGGERS
+from shopping.utils.structured_logging import (
+    SAMPLED,
+    DeferredQueueHandler,
+    JSONFormatter,
+    SamplingFilter,
+    configure_logging,
+    stop_listeners,
+)
+
+TEST_LOGGER = "tests.structured_logging"
+
+
+@pytest.fixture
+def restore_logging(settings):
+    """전역 로깅 설정을 테스트 후 원래대로 복구"""
+    yield
+    configure_logging(settings.LOGGING)
+    for name in PROPAGATE_LOGGERS:
+        logging.getLogger(name).propagate = True
+
+
+def make_record(msg="메시지 %s", args=(1,), level=logging.INFO, **extra):
+    record = logging.LogRecord(TEST_LOGGER, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJSONFormatter:
+    def test_outputs_message_and_extra_fields(self):
+        output = json.loads(JSONFormatter().format(make_record(order_id=42, sampled=True)))
+
+        assert output["message"] == "메시지 1"
+        assert output["level"] == "INFO"
+        assert output["logger"] == TEST_LOGGER
+        assert output["order_id"] == 42
+        assert "sampled" not in output
+
+    def test_includes_exception_text(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(TEST_LOGGER, logging.ERROR, __file__, 1, "실패", (), sys.exc_info())
+
+        output = json.loads(JSONFormatter().format(record))
+
+        assert "ValueError: boom" in output["exc_info"]
+
+
+class TestSamplingFilter:
+    def test_drops_only_marked_info_records(self):
+        sampling = SamplingFilter(rate=0.0)
+
+        assert sampling.filter(make_record(**SAMPLED)) is False
+        assert sampling.filter(make_record()) is True
+        assert sampling.filter(make_record(level=logging.WARNING, **SAMPLED)) is True
+
+    def test_decision_is_shared_between_handlers(self, mocker):
+        """같은 레코드는 콘솔/파일 핸들러에서 같은 결정"""
+        mocker.patch("shopping.utils.structured_logging.random.random", side_effect=[0.05, 0.95])
+        record = make_record(**SAMPLED)
+
+        assert SamplingFilter(rate=0.1).filter(record) is True
+        assert SamplingFilter(rate=0.1).filter(record) is True
+
+
+class TestQueuedLogging:
+    def config(self, stream, sample_rate=1.0):
+        return {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "queued_handlers": ["target"],
+            "filters": {"sampling": {"()": SamplingFilter, "rate": sample_rate}},
+            "formatters": {"json": {"()": JSONFormatter}},
+            "handlers": {
+                "target": {
+                    "class": "logging.StreamHandler",
+                    "stream": stream,
+                    "formatter": "json",
+                    "filters": ["sampling"],
+                }
+            },
+            "loggers": {TEST_LOGGER: {"handlers": ["target"], "level": "INFO", "propagate": False}},
+        }
+
+    def test_handler_replaced_and_records_written_by_listener(self, restore_logging):
+        # Arrange
+        stream = StringIO()
+        configure_logging(self.config(stream))
+        logger = logging.getLogger(TEST_LOGGER)
+
+        # Act
+        logger.info("주문 생성 완료: order_id=%s", 7)
+        stop_listeners()
+
+        # Assert
+        assert [type(handler) for handler in logger.handlers] == [DeferredQueueHandler]
+        assert json.loads(stream.getvalue())["message"] == "주문 생성 완료: order_id=7"
+
+    def test_message_formatted_off_request_thread(self, restore_logging):
+        """메시지 조합은 리스너 스레드에서 수행"""
+
+        class Probe:
+            thread = None
+
+            def __str__(self):
+                Probe.thread = threading.current_thread()
+                return "probe"
+
+        stream = StringIO()
+        configure_logging(self.config(stream))
+
+        logging.getLogger(TEST_LOGGER).info("값=%s", Probe())
+        stop_listeners()
+
+        assert Probe.thread is not None
+        assert Probe.thread is not threading.current_thread()
+
+    def test_sampled_records_not_enqueued(self, restore_logging):
+        """샘플링 필터는 큐 적재 전에 적용"""
+        stream = StringIO()
+        configure_logging(self.config(stream, sample_rate=0.0))
+        logger = logging.getLogger(TEST_LOGGER)
+
+        logger.info("상품별 로그", extra=SAMPLED)
+        logger.info("단계 로그")
+        stop_listeners()
+
+        messages = [json.loads(line)["message"] for line in stream.getvalue().splitlines()]
+        assert messages == ["단계 로그"]
+
+
+class TestLoggingBenchmarkCommand:
+    def test_reports_modes(self, restore_logging):
+        out = StringIO()
+
+        call_command("benchmark_logging", "--requests", "20", "--items", "2", "--sample-rate", "0", stdout=out)
+
+        lines = {line.split()[0]: line.split() for line in out.getvalue().splitlines() if line.startswith(("sync", "queued"))}
+        # 요청당 INFO: 단계 3줄 + 상품별 2줄 x 2개 = 7줄, 샘플링 0이면 단계 3줄만
+        assert lines["sync-fstring"][3] == "140"
+        assert lines["queued-lazy"][3] == "140"
+        assert lines["queued-sampled"][3] == "60"
@@ -0,0 +1,156 @@
+"""GCRA 기반 rate limiting (shopping.throttles) 테스트"""
+
+from django.contrib.auth.models import AnonymousUser
+
+import pytest
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from shopping import throttles
+from shopping.throttles import GCRAAnonRateThrottle, GCRARateThrottle, GCRAUserRateThrottle, LoginRateThrottle
+
+
+class FivePerMinuteAnonThrottle(GCRAAnonRateThrottle):
+    scope = "test_anon"
+    rate = "5/min"
+
+
+class FivePerMinuteUserThrottle(GCRAUserRateThrottle):
+    scope = "test_user"
+    rate = "5/min"
+
+
+@pytest.fixture
+def clock(mocker):
+    """프로세스 로컬 제한의 시각 고정"""
+    now = {"value": 1000.0}
+    mocker.patch("shopping.throttles.time.monotonic", side_effect=lambda: now["value"])
+    return now
+
+
+def make_request(ip="10.0.0.1", user=None):
+    request = APIRequestFactory().get("/", REMOTE_ADDR=ip)
+    request.user = user or AnonymousUser()
+    return request
+
+
+def hit(throttle_class, request):
+    throttle = throttle_class()
+    return throttle.allow_request(request, APIView()), throttle
+
+
+class TestLocalGCRA:
+    """Redis가 없을 때의 프로세스 로컬 제한 테스트"""
+
+    def test_allows_burst_then_blocks(self, clock):
+        """기간 내 num_requests개까지 허용, 이후 차단"""
+        request = make_request()
+
+        results = [hit(FivePerMinuteAnonThrottle, request)[0] for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+
+    def test_wait_returns_emission_interval(self, clock):
+        """차단 시 다음 허용까지 요청 간격(60초 / 5)만큼 대기"""
+        request = make_request()
+        for _ in range(5):
+            hit(FivePerMinuteAnonThrottle, request)
+
+        allowed, throttle = hit(FivePerMinuteAnonThrottle, request)
+
+        assert allowed is False
+        assert throttle.wait() == pytest.approx(12.0)
+
+    def test_recovers_one_slot_per_interval(self, clock):
+        """요청 간격이 지나면 한 건씩 다시 허용"""
+        request = make_request()
+        for _ in range(5):
+            hit(FivePerMinuteAnonThrottle, request)
+
+        clock["value"] += 12.0
+
+        assert hit(FivePerMinuteAnonThrottle, request)[0] is True
+        assert hit(FivePerMinuteAnonThrottle, request)[0] is False
+
+    def test_keys_are_isolated(self, clock):
+        """IP/사용자별로 따로 제한"""
+        for _ in range(5):
+            hit(FivePerMinuteAnonThrottle, make_request(ip="10.0.0.1"))
+
+        assert hit(FivePerMinuteAnonThrottle, make_request(ip="10.0.0.1"))[0] is False
+        assert hit(FivePerMinuteAnonThrottle, make_request(ip="10.0.0.2"))[0] is True
+
+    def test_user_throttle_keys_by_user_id(self, clock, mocker):
+        """인증 사용자는 IP가 달라도 사용자 ID로 제한"""
+        user = mocker.Mock(is_authenticated=True, pk=42)
+        for i in range(5):
+            hit(FivePerMinuteUserThrottle, make_request(ip=f"10.0.0.{i}", user=user))
+
+        assert hit(FivePerMinuteUserThrottle, make_request(ip="10.0.1.1", user=user))[0] is False
+
+    def test_memory_is_constant_per_key(self, clock):
+        """키당 TAT 값 하나만 저장"""
+        request = make_request()
+        for _ in range(5):
+            hit(FivePerMinuteAnonThrottle, request)
+
+        assert list(throttles._local_tats) == ["throttle_test_anon_10.0.0.1"]
+
+
+class TestRedisGCRA:
+    """Redis Lua 스크립트 경로 테스트"""
+
+    @pytest.fixture
+    def script(self, mocker):
+        conn = mocker.Mock()
+        script = mocker.Mock()
+        conn.register_script.return_value = script
+        mocker.patch.object(GCRARateThrottle, "_get_redis", return_value=conn)
+        mocker.patch.object(GCRARateThrottle, "_script", None)
+        return script
+
+    def test_passes_interval_and_burst(self, script):
+        """요청 간격(ms)과 버스트 수를 스크립트 인자로 전달"""
+        script.return_value = [1, 0]
+
+        allowed, _ = hit(FivePerMinuteAnonThrottle, make_request())
+
+        assert allowed is True
+        assert script.call_args.kwargs["keys"] == ["throttle_test_anon_10.0.0.1"]
+        assert script.call_args.kwargs["args"] == [12000, 5]
+
+    def test_denied_reports_retry_after(self, script):
+        """차단 시 스크립트가 돌려준 ms를 초로 변환"""
+        script.return_value = [0, 1500]
+
+        allowed, throttle = hit(FivePerMinuteAnonThrottle, make_request())
+
+        assert allowed is False
+        assert throttle.wait() == pytest.approx(1.5)
+
+    def test_redis_error_falls_back_to_local(self, script, clock):
+        """Redis 장애 시 프로세스 로컬 제한으로 대체"""
+        script.side_effect = ConnectionError("redis down")
+
+        results = [hit(FivePerMinuteAnonThrottle, make_request())[0] for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+
+
+class TestScopedThrottles:
+    """기존 스코프 클래스 호환성 테스트"""
+
+    def test_scoped_classes_use_gcra(self):
+        assert issubclass(LoginRateThrottle, GCRARateThrottle)
+        assert LoginRateThrottle.scope == "login"
+
+    def test_no_rate_means_unlimited(self):
+        """DEFAULT_THROTTLE_RATES에 없는 rate(None)는 제한하지 않음"""
+
+        class Unlimited(GCRAAnonRateThrottle):
+            rate = None
+
+            def get_rate(self):
+                return None
+
+        assert all(hit(Unlimited, make_request())[0] for _ in range(10))
@@ -444,3 +444,233 @@ class WishlistTestCase(TestCase):
         # 다른 사용자의 찜 목록 조회 (비어있어야 함)
         response = self.client.get(self.wishlist_url)
         self.assertEqual(response.data["count"], 0)
+
+    def test_move_to_cart_keeps_same_named_products(self):
+        """이동한 상품과 이름만 같은 다른 찜 상품은 찜 목록에 남음 (상품 ID 기준 제거)"""
+        from shopping.services.wishlist_service import WishlistService
+
+        same_name = Product.objects.create(
+            name=self.product1.name,
+            slug="notebook-2",
+            price=Decimal("700000"),
+            stock=3,
+            category=self.category,
+            seller=self.user,
+            sku="NOTE002",
+        )
+        self.user.add_to_wishlist(self.product1)
+        self.user.add_to_wishlist(same_name)
+
+        result = WishlistService.move_to_cart(self.user, [self.product1.id], remove_from_wishlist=True)
+
+        self.assertEqual(result.added_items, [self.product1.name])
+        self.assertFalse(self.user.is_in_wishlist(self.product1))
+        self.assertTrue(self.user.is_in_wishlist(same_name))
+
+    def test_move_to_cart_query_count_independent_of_items(self):
+        """이동할 상품 수와 무관하게 쿼리 수 일정 (상품별 get_or_create 없음)"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from shopping.models.cart import Cart, CartItem
+        from shopping.services.wishlist_service import WishlistService
+
+        products = [self.product1, self.product2, self.product3]
+        for product in products:
+            self.user.add_to_wishlist(product)
+        Cart.get_or_create_active_cart(self.user)
+
+        def move(product_ids):
+            CartItem.objects.filter(cart__user=self.user).delete()
+            with CaptureQueriesContext(connection) as ctx:
+                result = WishlistService.move_to_cart(self.user, product_ids)
+            return result, len(ctx.captured_queries)
+
+        _, single = move([self.product1.id])
+        result, multiple = move([product.id for product in products])
+
+        self.assertEqual(single, multiple)
+        self.assertCountEqual(result.added_items, [self.product1.name, self.product2.name])
+        self.assertEqual(result.out_of_stock, [self.product3.name])
+
+    def test_move_to_cart_reports_items_already_in_cart(self):
+        """이미 장바구니에 있는 상품은 수량 변경 없이 already_in_cart로 분류"""
+        from shopping.models.cart import Cart, CartItem
+        from shopping.services.wishlist_service import WishlistService
+
+        self.user.add_to_wishlist(self.product1)
+        self.user.add_to_wishlist(self.product2)
+        cart, _ = Cart.get_or_create_active_cart(self.user)
+        CartItem.objects.create(cart=cart, product=self.product1, quantity=3)
+
+        result = WishlistService.move_to_cart(self.user, [self.product1.id, self.product2.id], remove_from_wishlist=True)
+
+        self.assertEqual(result.already_in_cart, [self.product1.name])
+        self.assertEqual(result.added_items, [self.product2.name])
+        self.assertEqual(CartItem.objects.get(cart=cart, product=self.product1).quantity, 3)
+        # 장바구니에 새로 담긴 상품만 찜 목록에서 제거
+        self.assertTrue(self.user.is_in_wishlist(self.product1))
+        self.assertFalse(self.user.is_in_wishlist(self.product2))
+
+    # 최근 찜한 순 정렬 / 키셋 페이지네이션
+
+    def _wish_in_order(self, products):
+        """products 순서대로 1분 간격으로 찜한 것처럼 added_at 지정"""
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from shopping.models.wishlist import WishlistItem
+
+        base = timezone.now() - timedelta(hours=1)
+        for minutes, product in enumerate(products):
+            self.user.add_to_wishlist(product)
+            WishlistItem.objects.filter(user=self.user, product=product).update(added_at=base + timedelta(minutes=minutes))
+
+    def test_list_wishlist_ordered_by_recently_wished(self):
+        """기본 정렬은 최근 찜한 순이며 찜한 일시를 함께 반환"""
+        self._login()
+        self._wish_in_order([self.product2, self.product3, self.product1])
+
+        response = self.client.get(self.wishlist_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [p["id"] for p in response.data["results"]]
+        self.assertEqual(ids, [self.product1.id, self.product3.id, self.product2.id])
+        self.assertIsNotNone(response.data["results"][0]["added_at"])
+
+    def test_list_wishlist_keyset_pagination(self):
+        """커서를 따라가면 중복/누락 없이 전체 찜 목록을 순회하고 페이지마다 쿼리 수가 같음"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        extra_products = [
+            Product.objects.create(
+                name=f"추가 상품 {i}",
+                slug=f"extra-{i}",
+                price=Decimal("10000"),
+                stock=1,
+                category=self.category,
+                seller=self.user,
+                sku=f"EXTRA{i:03d}",
+            )
+            for i in range(4)
+        ]
+        products = [self.product1, self.product2, self.product3, *extra_products]
+        self._wish_in_order(products)
+        self._login()
+
+        seen = []
+        query_counts = []
+        url = f"{self.wishlist_url}?page_size=2"
+        while url:
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data["count"], len(products))
+            seen.extend(p["id"] for p in response.data["results"])
+            query_counts.append(len(ctx.captured_queries))
+            url = response.data["next"]
+
+        self.assertEqual(seen, [product.id for product in reversed(products)])
+        # 마지막 페이지(1개)를 제외한 페이지의 쿼리 수 동일 (OFFSET 없는 커서 조회)
+        self.assertEqual(len(set(query_counts[:-1])), 1)
+
+    def test_list_wishlist_page_query_uses_cursor_not_offset(self):
+        """다음 페이지 조회는 OFFSET 없이 added_at 기준으로 이어서 조회"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self._wish_in_order([self.product1, self.product2, self.product3])
+        self._login()
+
+        first = self.client.get(f"{self.wishlist_url}?page_size=1")
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(first.data["next"])
+
+        self.assertEqual([p["id"] for p in second.data["results"]], [self.product2.id])
+        list_sql = [q["sql"] for q in ctx.captured_queries if "shopping_wishlist" in q["sql"] and "LIMIT" in q["sql"]]
+        self.assertTrue(list_sql)
+        self.assertNotIn("OFFSET", list_sql[0])
+
+    def test_list_wishlist_cursor_pagination_with_tied_sort_keys(self):
+        """정렬 키가 모두 같아도 (정렬 키, id) 커서로 OFFSET 없이 중복/누락 없이 순회"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from django.utils import timezone
+
+        from shopping.models.wishlist import WishlistItem
+
+        products = [self.product1, self.product2, self.product3]
+        for product in products:
+            self.user.add_to_wishlist(product)
+        # 0018 백필처럼 모든 added_at이 같은 값, 가격도 모두 같은 값
+        WishlistItem.objects.filter(user=self.user).update(added_at=timezone.now())
+        Product.objects.filter(pk__in=[p.pk for p in products]).update(price=Decimal("10000"))
+        self._login()
+
+        for ordering, expected in (
+            ("-added_at", sorted((p.id for p in products), reverse=True)),
+            ("price", sorted(p.id for p in products)),
+        ):
+            seen = []
+            url = f"{self.wishlist_url}?ordering={ordering}&page_size=1"
+            while url:
+                with CaptureQueriesContext(connection) as ctx:
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                seen.extend(p["id"] for p in response.data["results"])
+                list_sql = [q["sql"] for q in ctx.captured_queries if "shopping_wishlist" in q["sql"] and "LIMIT" in q["sql"]]
+                self.assertTrue(all("OFFSET" not in sql for sql in list_sql))
+                url = response.data["next"]
+
+            self.assertEqual(seen, expected, ordering)
+
+    # 통계 캐시
+
+    def test_wishlist_stats_cached_and_invalidated_on_change(self):
+        """통계는 캐시에서 읽고 찜 추가/제거/장바구니 이동 시 다시 집계"""
+        from django.core.cache import cache
+        from django.test import override_settings
+
+        from shopping.services.wishlist_service import WishlistService
+
+        with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}):
+            cache.clear()
+            self.user.add_to_wishlist(self.product1)
+            self.assertEqual(WishlistService.get_stats(self.user).total_count, 1)
+
+            # 캐시 적중 시 쿼리 없음
+            with self.assertNumQueries(0):
+                self.assertEqual(WishlistService.get_stats(self.user).total_count, 1)
+
+            # 찜 추가 → 무효화
+            WishlistService.add(self.user, self.product2.id)
+            self.assertEqual(WishlistService.get_stats(self.user).total_count, 2)
+
+            # 장바구니 이동 후 찜 제거 → 무효화
+            WishlistService.move_to_cart(self.user, [self.product2.id], remove_from_wishlist=True)
+            self.assertEqual(WishlistService.get_stats(self.user).total_count, 1)
+
+            # 전체 삭제 → 무효화
+            WishlistService.clear(self.user)
+            self.assertEqual(WishlistService.get_stats(self.user).total_count, 0)
+            cache.clear()
+
+
+class WishlistMoveToCartBenchmarkTestCase(TestCase):
+    """benchmark_wishlist_move_to_cart 명령 테스트"""
+
+    def test_reports_modes(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        out = StringIO()
+
+        call_command("benchmark_wishlist_move_to_cart", "--items", "20", "--repeat", "1", stdout=out)
+
+        lines = {line.split()[0]: line.split() for line in out.getvalue().splitlines() if line.startswith(("per-row", "set"))}
+        self.assertLess(int(lines["set-based"][2]), int(lines["per-row"][2]))
+        # 측정 데이터는 롤백
+        self.assertFalse(Product.objects.filter(sku__startswith="BW-").exists())
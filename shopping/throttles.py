@@ -8,11 +8,160 @@ API 엔드포인트 Rate Limiting (속도 제한) 클래스
 - 이메일 인증: 엄격한 제한으로 스팸 방지
 - 전역 제한: 모든 API 요청에 대한 기본 제한
 
-모든 throttle 클래스는 최적의 성능과 분산 rate limiting 지원을 위해
-Redis 캐시 백엔드를 사용합니다.
+DRF SimpleRateThrottle의 문제:
+- 키마다 요청 시각 리스트를 캐시에 저장하고 매 요청 읽기-수정-쓰기
+  (user_global 1000/hour면 요청마다 최대 1000개 float 직렬화)
+- 읽기와 쓰기 사이에 다른 워커의 요청이 끼어들면 카운트 유실 (gunicorn 워커 간 경쟁)
+
+GCRA(Generic Cell Rate Algorithm) 방식:
+- 키마다 "이론상 다음 도착 시각(TAT)" 하나만 저장 → 키당 O(1) 메모리/연산
+- Redis Lua 스크립트 한 번으로 판정과 갱신을 원자적으로 처리 (시각은 Redis 서버 TIME 사용)
+- 기간 내 num_requests개까지 버스트 허용, 이후에는 duration / num_requests 간격으로 허용
+- Redis 캐시 백엔드가 아니거나(테스트, 로컬) Redis 장애 시 프로세스 로컬 제한으로 대체
+
+스코프와 속도 설정(DEFAULT_THROTTLE_RATES), 캐시 키 규칙은 DRF와 동일합니다.
 """
 
-from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+import logging
+import threading
+import time
+
+from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle, UserRateThrottle
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: 제한 키 / ARGV[1]: 요청 간격(ms) / ARGV[2]: 버스트 허용 수
+# 반환: {허용 여부(1/0), 재시도까지 남은 ms}
+GCRA_LUA = """
+redis.replicate_commands()
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+
+local new_tat = tat + interval
+local allow_at = new_tat - burst * interval
+if allow_at > now then
+    return {0, allow_at - now}
+end
+
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return {1, 0}
+"""
+
+# 로컬 제한 저장소 (키 → TAT 초), 키 수가 LOCAL_PRUNE_THRESHOLD를 넘으면 만료된 키 정리
+LOCAL_PRUNE_THRESHOLD = 10000
+_local_tats: dict[str, float] = {}
+_local_lock = threading.Lock()
+
+
+def reset_local_limits() -> None:
+    """프로세스 로컬 제한 상태 초기화 (테스트용)"""
+    with _local_lock:
+        _local_tats.clear()
+
+
+class GCRARateThrottle(SimpleRateThrottle):
+    """
+    GCRA 기반 throttle 기반 클래스
+
+    SimpleRateThrottle의 scope / rate / get_cache_key 규칙은 그대로 사용하고
+    allow_request와 wait만 교체합니다. 직접 사용하지 않고
+    GCRAAnonRateThrottle / GCRAUserRateThrottle을 상속해서 사용합니다.
+    """
+
+    _script = None
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        interval = self.duration / self.num_requests
+        allowed, self.retry_after = self._hit_redis(self.key, interval, self.num_requests)
+        if allowed is None:
+            allowed, self.retry_after = self._hit_local(self.key, interval, self.num_requests)
+        return allowed
+
+    def wait(self):
+        """다음 요청이 허용될 때까지 남은 시간(초)"""
+        return getattr(self, "retry_after", None)
+
+    @staticmethod
+    def _get_redis():
+        """Redis 연결 반환 (Redis 캐시 백엔드가 아니면 None)"""
+        try:
+            from django_redis import get_redis_connection
+
+            return get_redis_connection("default")
+        except (ImportError, NotImplementedError):
+            return None
+
+    @classmethod
+    def _hit_redis(cls, key, interval, burst):
+        """
+        Redis Lua 스크립트로 판정
+
+        Returns:
+            (허용 여부, 재시도 대기 초) - Redis를 쓸 수 없으면 (None, None)
+        """
+        conn = cls._get_redis()
+        if conn is None:
+            return None, None
+
+        try:
+            if GCRARateThrottle._script is None:
+                GCRARateThrottle._script = conn.register_script(GCRA_LUA)
+            allowed, retry_after_ms = GCRARateThrottle._script(
+                keys=[key], args=[max(1, round(interval * 1000)), burst], client=conn
+            )
+        except Exception as e:
+            logger.warning(f"Redis rate limit 실패, 로컬 제한으로 대체: key={key}, error={e}")
+            return None, None
+
+        return bool(allowed), (retry_after_ms / 1000 if not allowed else None)
+
+    @staticmethod
+    def _hit_local(key, interval, burst):
+        """
+        프로세스 로컬 판정 (Redis와 같은 GCRA, 워커 간 공유되지 않음)
+
+        Returns:
+            (허용 여부, 재시도 대기 초)
+        """
+        now = time.monotonic()
+        with _local_lock:
+            tat = max(_local_tats.get(key, now), now)
+            new_tat = tat + interval
+            allow_at = new_tat - burst * interval
+            if allow_at > now:
+                return False, allow_at - now
+
+            if len(_local_tats) >= LOCAL_PRUNE_THRESHOLD and key not in _local_tats:
+                for expired in [k for k, v in _local_tats.items() if v <= now]:
+                    del _local_tats[expired]
+            _local_tats[key] = new_tat
+            return True, None
+
+
+class GCRAAnonRateThrottle(GCRARateThrottle, AnonRateThrottle):
+    """비인증 요청 GCRA throttle (IP 주소 기준, AnonRateThrottle과 같은 키)"""
+
+    scope = "anon"
+
+
+class GCRAUserRateThrottle(GCRARateThrottle, UserRateThrottle):
+    """사용자 GCRA throttle (인증 시 사용자 ID, 아니면 IP 기준, UserRateThrottle과 같은 키)"""
+
+    scope = "user"
 
 
 # ============================================================
@@ -20,7 +169,7 @@ from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
 # ============================================================
 
 
-class LoginRateThrottle(AnonRateThrottle):
+class LoginRateThrottle(GCRAAnonRateThrottle):
     """
     로그인 엔드포인트 속도 제한
 
@@ -32,7 +181,7 @@ class LoginRateThrottle(AnonRateThrottle):
     scope = "login"
 
 
-class RegisterRateThrottle(AnonRateThrottle):
+class RegisterRateThrottle(GCRAAnonRateThrottle):
     """
     회원가입 엔드포인트 속도 제한
 
@@ -44,7 +193,7 @@ class RegisterRateThrottle(AnonRateThrottle):
     scope = "register"
 
 
-class TokenRefreshRateThrottle(UserRateThrottle):
+class TokenRefreshRateThrottle(GCRAUserRateThrottle):
     """
     토큰 갱신 엔드포인트 속도 제한
 
@@ -56,7 +205,7 @@ class TokenRefreshRateThrottle(UserRateThrottle):
     scope = "token_refresh"
 
 
-class PasswordResetRateThrottle(AnonRateThrottle):
+class PasswordResetRateThrottle(GCRAAnonRateThrottle):
     """
     비밀번호 재설정 엔드포인트 속도 제한
 
@@ -73,7 +222,7 @@ class PasswordResetRateThrottle(AnonRateThrottle):
 # ============================================================
 
 
-class EmailVerificationRateThrottle(UserRateThrottle):
+class EmailVerificationRateThrottle(GCRAUserRateThrottle):
     """
     이메일 인증 발송 엔드포인트 속도 제한
 
@@ -85,7 +234,7 @@ class EmailVerificationRateThrottle(UserRateThrottle):
     scope = "email_verification"
 
 
-class EmailVerificationResendRateThrottle(UserRateThrottle):
+class EmailVerificationResendRateThrottle(GCRAUserRateThrottle):
     """
     이메일 인증 재발송 엔드포인트 속도 제한
 
@@ -102,7 +251,7 @@ class EmailVerificationResendRateThrottle(UserRateThrottle):
 # ============================================================
 
 
-class PaymentRequestRateThrottle(UserRateThrottle):
+class PaymentRequestRateThrottle(GCRAUserRateThrottle):
     """
     결제 요청 엔드포인트 속도 제한
 
@@ -114,7 +263,7 @@ class PaymentRequestRateThrottle(UserRateThrottle):
     scope = "payment_request"
 
 
-class PaymentConfirmRateThrottle(UserRateThrottle):
+class PaymentConfirmRateThrottle(GCRAUserRateThrottle):
     """
     결제 승인 엔드포인트 속도 제한
 
@@ -126,7 +275,7 @@ class PaymentConfirmRateThrottle(UserRateThrottle):
     scope = "payment_confirm"
 
 
-class PaymentCancelRateThrottle(UserRateThrottle):
+class PaymentCancelRateThrottle(GCRAUserRateThrottle):
     """
     결제 취소 엔드포인트 속도 제한
 
@@ -143,7 +292,7 @@ class PaymentCancelRateThrottle(UserRateThrottle):
 # ============================================================
 
 
-class OrderCreateRateThrottle(UserRateThrottle):
+class OrderCreateRateThrottle(GCRAUserRateThrottle):
     """
     주문 생성 엔드포인트 속도 제한
 
@@ -155,7 +304,7 @@ class OrderCreateRateThrottle(UserRateThrottle):
     scope = "order_create"
 
 
-class OrderCancelRateThrottle(UserRateThrottle):
+class OrderCancelRateThrottle(GCRAUserRateThrottle):
     """
     주문 취소 엔드포인트 속도 제한
 
@@ -172,7 +321,7 @@ class OrderCancelRateThrottle(UserRateThrottle):
 # ============================================================
 
 
-class GlobalAnonRateThrottle(AnonRateThrottle):
+class GlobalAnonRateThrottle(GCRAAnonRateThrottle):
     """
     비인증 사용자 전역 속도 제한
 
@@ -184,7 +333,7 @@ class GlobalAnonRateThrottle(AnonRateThrottle):
     scope = "anon_global"
 
 
-class GlobalUserRateThrottle(UserRateThrottle):
+class GlobalUserRateThrottle(GCRAUserRateThrottle):
     """
     인증 사용자 전역 속도 제한
 
@@ -201,7 +350,7 @@ class GlobalUserRateThrottle(UserRateThrottle):
 # ============================================================
 
 
-class WebhookRateThrottle(AnonRateThrottle):
+class WebhookRateThrottle(GCRAAnonRateThrottle):
     """
     웹훅 엔드포인트 속도 제한
 
@@ -65,6 +65,7 @@ from shopping.webhooks.toss_webhook_view import toss_webhook
 
 # Point view
 from .views import point_views
+from .views.metrics_views import metrics
 from .views.notification_views import NotificationViewSet
 from .views.product_qa_views import MyQuestionViewSet, ProductQuestionViewSet
 
@@ -250,6 +251,8 @@ urlpatterns = [
     path("points/statistics/", point_views.point_statistics, name="point_statistics"),
     # 웹훅(Webhook) URLs
     path("webhooks/toss/", toss_webhook, name="toss-webhook"),
+    # 성능 메트릭 (Prometheus)
+    path("metrics/", metrics, name="metrics"),
     # 찜하기(Wishlist) 관련 URLs
     path("wishlist/", WishlistViewSet.as_view({"get": "list"}), name="wishlist-list"),
     path(
@@ -316,6 +319,9 @@ urlpatterns = [
 웹훅:
 - POST   /api/webhooks/toss/         - 토스페이먼츠 웹훅 수신
 
+성능 메트릭:
+- GET    /api/metrics/               - 요청 메트릭 (Prometheus text format)
+
 회원가입 및 로그인:
 - POST   /api/auth/register/         - 회원가입 (새 사용자 생성 + 토큰 발급)
 - POST   /api/auth/login/            - 로그인 (인증 + 토큰 발급)
@@ -0,0 +1,64 @@
+"""
+요청 계측 캐시 백엔드
+
+CACHES의 BACKEND로 지정하면 계측 중인 요청(request_metrics.profile_request)에서
+get / get_many의 히트/미스를 RequestProfile에 집계합니다.
+계측 중이 아니면 원래 백엔드와 동일하게 동작합니다.
+
+설정 예시:
+    CACHES = {
+        "default": {
+            "BACKEND": "shopping.utils.cache_backends.InstrumentedRedisCache",
+            "LOCATION": "redis://127.0.0.1:6379/1",
+            "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        }
+    }
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+
+from .request_metrics import current_profile, suspend_profile
+
+_MISS = object()
+
+
+class CacheMetricsMixin:
+    """캐시 백엔드의 get / get_many에 히트/미스 집계 추가"""
+
+    def get(self, key: Any, default: Any = None, version: int | None = None, **kwargs: Any) -> Any:
+        profile = current_profile()
+        if profile is None:
+            return super().get(key, default, version=version, **kwargs)
+
+        # 저장된 값이 default와 같아도 히트로 판정되도록 sentinel로 조회
+        value = super().get(key, _MISS, version=version, **kwargs)
+        if value is _MISS:
+            profile.cache_misses += 1
+            return default
+        profile.cache_hits += 1
+        return value
+
+    def get_many(self, keys: Any, version: int | None = None, **kwargs: Any) -> dict[str, Any]:
+        profile = current_profile()
+        if profile is None:
+            return super().get_many(keys, version=version, **kwargs)
+
+        keys = list(keys)
+        with suspend_profile():
+            result = super().get_many(keys, version=version, **kwargs)
+        profile.cache_hits += len(result)
+        profile.cache_misses += len(keys) - len(result)
+        return result
+
+
+class InstrumentedRedisCache(CacheMetricsMixin, RedisCache):
+    """django_redis RedisCache + 히트/미스 계측 (get_redis_connection 등 django_redis API 그대로 사용)"""
+
+
+class InstrumentedLocMemCache(CacheMetricsMixin, LocMemCache):
+    """로컬 메모리 캐시 + 히트/미스 계측"""
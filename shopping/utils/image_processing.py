@@ -0,0 +1,77 @@
+"""
+상품 이미지 변형 렌더링 (Pillow)
+
+ImageVariantService가 프로세스 풀에서 실행하는 순수 함수만 둡니다.
+spawn 방식의 자식 프로세스에서 Django 설정 없이 import 되어야 하므로
+이 모듈에서는 Django/모델을 import 하지 않습니다.
+
+사용 예시:
+    >>> rendered = render_variants(original_bytes, [("webp", 400), ("jpeg", 400)])
+    >>> rendered[0].width, rendered[0].format
+    (400, 'webp')
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import NamedTuple
+
+from PIL import Image, ImageOps
+
+# 포맷별 Pillow 저장 옵션
+SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+
+
+class RenderedVariant(NamedTuple):
+    """렌더링 결과 (프로세스 간 전달되므로 bytes/int/str만 보관)"""
+
+    format: str
+    width: int
+    height: int
+    content: bytes
+
+
+def render_variants(data: bytes, specs: list[tuple[str, int]]) -> list[RenderedVariant]:
+    """
+    원본 이미지 하나로 여러 변형을 생성
+
+    원본 디코딩은 한 번만 하고, 큰 너비부터 줄여 가며 직전 결과를 다시 축소합니다.
+    원본보다 큰 너비는 확대하지 않고 건너뜁니다.
+
+    Args:
+        data: 원본 이미지 바이트
+        specs: [(포맷, 너비), ...] (포맷: SAVE_OPTIONS의 키)
+
+    Returns:
+        list: 생성된 변형 (원본보다 큰 너비는 제외)
+    """
+    with Image.open(BytesIO(data)) as original:
+        # EXIF 회전 정보 반영 후 색 공간 정리 (JPEG는 알파 채널 미지원)
+        source = ImageOps.exif_transpose(original)
+        if source.mode not in ("RGB", "RGBA"):
+            source = source.convert("RGBA" if "transparency" in source.info or source.mode in ("LA", "P") else "RGB")
+
+        rendered = []
+        base = source
+        for width in sorted({width for _, width in specs}, reverse=True):
+            if width > source.width:
+                continue
+            height = max(1, round(source.height * width / source.width))
+            base = base.resize((width, height), Image.Resampling.LANCZOS)
+
+            for fmt in [fmt for fmt, spec_width in specs if spec_width == width]:
+                image = base
+                if fmt == "jpeg" and image.mode == "RGBA":
+                    background = Image.new("RGB", image.size, (255, 255, 255))
+                    background.paste(image, mask=image.getchannel("A"))
+                    image = background
+                buffer = BytesIO()
+                image.save(buffer, **SAVE_OPTIONS[fmt])
+                rendered.append(RenderedVariant(fmt, width, height, buffer.getvalue()))
+
+    return rendered
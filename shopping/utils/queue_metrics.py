@@ -0,0 +1,179 @@
+"""
+Celery 큐별 대기 시간(latency) / 적체량(backlog) 측정 유틸리티
+
+측정 방식:
+- 발행 시 before_task_publish 시그널에서 메시지 헤더에 발행 시각(enqueued_at)과 큐 이름 기록
+- 워커가 태스크를 꺼내 실행하기 직전(task_prerun) 현재 시각과의 차이를 큐별로 기록
+- 샘플은 Redis 리스트에 큐별 최근 MAX_SAMPLES개만 보관 (Redis가 없으면 프로세스 메모리)
+- 적체량은 브로커에 passive queue_declare로 남은 메시지 수를 조회
+
+사용 예시:
+    >>> from shopping.utils.queue_metrics import get_latency_stats, get_backlog
+    >>> get_latency_stats("payment_critical")
+    {'samples': 120, 'p50_ms': 3.2, 'p99_ms': 41.0, 'max_ms': 55.3}
+    >>> get_backlog(["payment_critical", "notifications"])
+    {'payment_critical': 0, 'notifications': 42}
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+LATENCY_KEY = "celery_metrics:latency:{queue}"
+MAX_SAMPLES = 1000
+
+# Redis를 사용할 수 없을 때의 프로세스 로컬 샘플
+_local_samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+
+
+def _get_connection() -> Any | None:
+    """Redis 연결 반환 (Redis 캐시 백엔드가 아니면 None)"""
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default")
+    except (ImportError, NotImplementedError):
+        return None
+
+
+def _resolve_queue(routing_key: str | None) -> str:
+    """라우팅 키로 큐 이름 조회 (task_queues 설정 기준, 없으면 라우팅 키 그대로)"""
+    from celery import current_app
+
+    for name, queue in current_app.amqp.queues.items():
+        if queue.routing_key == routing_key:
+            return name
+    return routing_key or current_app.conf.task_default_queue
+
+
+# ===== 시그널 핸들러 =====
+
+
+def stamp_enqueued_at(headers: dict[str, Any] | None = None, routing_key: str | None = None, **kwargs: Any) -> None:
+    """before_task_publish: 발행 시각과 큐 이름을 메시지 헤더에 기록"""
+    if headers is None:
+        return
+    headers.setdefault("enqueued_at", time.time())
+    headers.setdefault("enqueued_queue", _resolve_queue(routing_key))
+
+
+def record_queue_latency(task: Any = None, **kwargs: Any) -> None:
+    """task_prerun: 발행 → 실행 시작까지의 대기 시간 기록"""
+    if task is None:
+        return
+
+    enqueued_at = task.request.get("enqueued_at")
+    if enqueued_at is None:  # eager 실행 또는 헤더 없는 메시지
+        return
+
+    queue = task.request.get("enqueued_queue") or (task.request.delivery_info or {}).get("routing_key", "unknown")
+    record_latency(queue, max(time.time() - float(enqueued_at), 0.0))
+
+
+# ===== 기록/조회 =====
+
+
+def record_latency(queue: str, seconds: float) -> None:
+    """
+    큐 대기 시간 샘플 기록
+
+    측정 실패가 태스크 실행을 막지 않도록 Redis 오류는 경고 로그만 남깁니다.
+    """
+    conn = _get_connection()
+    if conn is None:
+        _local_samples[queue].append(seconds)
+        return
+
+    key = LATENCY_KEY.format(queue=queue)
+    try:
+        pipe = conn.pipeline()
+        pipe.lpush(key, f"{seconds:.6f}")
+        pipe.ltrim(key, 0, MAX_SAMPLES - 1)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"큐 대기 시간 기록 실패: queue={queue}, error={e}")
+
+
+def get_latency_samples(queue: str) -> list[float]:
+    """큐의 최근 대기 시간 샘플 (초)"""
+    conn = _get_connection()
+    if conn is None:
+        return list(_local_samples.get(queue, ()))
+
+    return [float(value) for value in conn.lrange(LATENCY_KEY.format(queue=queue), 0, -1)]
+
+
+def reset_latency(queues: Iterable[str]) -> None:
+    """대기 시간 샘플 초기화 (벤치마크 시작 전 사용)"""
+    queues = list(queues)
+    conn = _get_connection()
+    if conn is None:
+        for queue in queues:
+            _local_samples.pop(queue, None)
+        return
+
+    if queues:
+        conn.delete(*[LATENCY_KEY.format(queue=queue) for queue in queues])
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    백분위수 계산 (nearest-rank)
+
+    Args:
+        values: 샘플 목록 (정렬 여부 무관)
+        pct: 0 ~ 100
+
+    Returns:
+        float: 백분위수 값 (샘플이 없으면 0.0)
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_latency(samples: list[float]) -> dict[str, Any]:
+    """대기 시간 샘플 요약 (ms 단위)"""
+    return {
+        "samples": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+        "max_ms": round(max(samples, default=0.0) * 1000, 2),
+    }
+
+
+def get_latency_stats(queue: str) -> dict[str, Any]:
+    """큐 대기 시간 통계 (p50/p99/max)"""
+    return summarize_latency(get_latency_samples(queue))
+
+
+def get_backlog(queues: Iterable[str]) -> dict[str, int | None]:
+    """
+    큐별 대기 중인 메시지 수
+
+    Returns:
+        {queue: 메시지 수} (조회 실패 시 None)
+    """
+    from celery import current_app
+
+    backlog: dict[str, int | None] = {}
+    with current_app.connection_for_read() as conn:
+        channel = conn.default_channel
+        for queue in queues:
+            try:
+                _, message_count, _ = channel.queue_declare(queue=queue, passive=True)
+                backlog[queue] = message_count
+            except Exception as e:
+                logger.warning(f"큐 적체량 조회 실패: queue={queue}, error={e}")
+                backlog[queue] = None
+    return backlog
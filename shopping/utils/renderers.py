@@ -0,0 +1,24 @@
+"""
+요청 계측 렌더러
+
+REST_FRAMEWORK의 DEFAULT_RENDERER_CLASSES로 지정하면 계측 중인 요청(request_metrics.profile_request)에서
+응답 데이터를 JSON으로 직렬화하는 시간을 RequestProfile.serializer_time에 집계합니다.
+serializer 클래스는 변경하지 않고 모든 API 응답이 거치는 렌더링 한 곳에서만 측정합니다.
+계측 중이 아니면 JSONRenderer와 동일하게 동작합니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from rest_framework.renderers import JSONRenderer
+
+from .request_metrics import time_serializer
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """JSONRenderer + 응답 직렬화 시간 계측"""
+
+    def render(self, data: Any, accepted_media_type: str | None = None, renderer_context: dict | None = None) -> bytes:
+        with time_serializer():
+            return super().render(data, accepted_media_type, renderer_context)
@@ -0,0 +1,287 @@
+"""
+요청 단위 성능 계측 및 URL 이름별 집계 유틸리티
+
+측정 항목 (요청 1건 기준):
+- 전체 처리 시간 (미들웨어 진입 → 응답 렌더링 완료)
+- DB 쿼리 수 / DB 시간 (connection.execute_wrapper)
+- 캐시 히트 / 미스 (CACHES에 지정한 계측 백엔드, shopping.utils.cache_backends)
+- 직렬화 시간 (응답 데이터 JSON 렌더링 시간, DEFAULT_RENDERER_CLASSES에 지정한 shopping.utils.renderers.TimedJSONRenderer)
+
+집계 방식:
+- 요청 결과는 프로세스 메모리 버퍼에 URL 이름(view_name) + HTTP 메서드별로 누적
+- FLUSH_INTERVAL초마다 Redis 해시(HINCRBYFLOAT 파이프라인)로 옮겨 워커 간 합산
+  (Redis가 없으면 프로세스 메모리에 누적)
+- render_prometheus()로 Prometheus text format 출력 (prometheus_client)
+
+사용 예시:
+    >>> from shopping.utils.request_metrics import profile_request
+    >>> with profile_request() as profile:
+    ...     Product.objects.count()
+    >>> profile.queries
+    1
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.db import connections
+from prometheus_client import CollectorRegistry, generate_latest
+from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+logger = logging.getLogger(__name__)
+
+METRICS_KEY = "request_metrics"
+FLUSH_INTERVAL = 10  # 초
+
+# 처리 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_current: ContextVar[RequestProfile | None] = ContextVar("request_profile", default=None)
+
+# 플러시 대기 중인 증가분 / Redis가 없을 때의 누적값 ("endpoint|method|metric" → 값)
+_pending: dict[str, float] = defaultdict(float)
+_local_totals: dict[str, float] = defaultdict(float)
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+@dataclass
+class RequestProfile:
+    """요청 1건의 계측 결과"""
+
+    queries: int = 0
+    db_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    serializer_time: float = 0.0
+    _serializer_depth: int = field(default=0, repr=False)
+
+
+def current_profile() -> RequestProfile | None:
+    """현재 계측 중인 요청의 RequestProfile (계측 중이 아니면 None)"""
+    return _current.get()
+
+
+@contextmanager
+def profile_request() -> Iterator[RequestProfile]:
+    """
+    블록 안에서 실행된 DB 쿼리 / 캐시 조회 / 직렬화 시간 계측
+
+    Yields:
+        RequestProfile: 블록 종료 시점까지 누적된 계측 결과
+    """
+    profile = RequestProfile()
+    token = _current.set(profile)
+
+    def db_wrapper(execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            profile.queries += 1
+            profile.db_time += time.perf_counter() - start
+
+    try:
+        with ExitStack() as stack:
+            for conn in connections.all():
+                stack.enter_context(conn.execute_wrapper(db_wrapper))
+            yield profile
+    finally:
+        _current.reset(token)
+
+
+# ===== 캐시 / 직렬화 계측 훅 =====
+
+
+@contextmanager
+def suspend_profile() -> Iterator[None]:
+    """
+    블록 안에서는 계측하지 않음
+
+    캐시 get_many 기본 구현(BaseCache.get_many)처럼 내부에서 get을 다시 호출하는 경로의 중복 집계 방지
+    """
+    token = _current.set(None)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def time_serializer() -> Iterator[None]:
+    """
+    응답 직렬화 시간 집계 (계측 중인 요청에서만 동작)
+
+    렌더러 안에서 다시 렌더링하는 경우(BrowsableAPIRenderer 등)는 바깥 시간에 포함되므로 가장 바깥 호출만 집계합니다.
+    """
+    profile = _current.get()
+    if profile is None or profile._serializer_depth:
+        yield
+        return
+
+    profile._serializer_depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.serializer_time += time.perf_counter() - start
+        profile._serializer_depth -= 1
+
+
+# ===== 집계 =====
+
+
+def record(endpoint: str, method: str, latency: float, profile: RequestProfile) -> None:
+    """요청 1건의 계측 결과를 집계 버퍼에 누적 (FLUSH_INTERVAL마다 Redis로 플러시)"""
+    prefix = f"{endpoint}|{method}|"
+    increments = {
+        "count": 1,
+        "latency_sum": latency,
+        "queries": profile.queries,
+        "db_seconds": profile.db_time,
+        "cache_hits": profile.cache_hits,
+        "cache_misses": profile.cache_misses,
+        "serializer_seconds": profile.serializer_time,
+    }
+    for bucket in LATENCY_BUCKETS:
+        if latency <= bucket:
+            increments[f"le_{bucket}"] = 1
+
+    with _lock:
+        for metric, value in increments.items():
+            _pending[prefix + metric] += value
+
+    if time.monotonic() - _last_flush >= FLUSH_INTERVAL:
+        flush()
+
+
+def flush() -> None:
+    """버퍼의 증가분을 Redis 해시로 이동 (Redis가 없거나 실패하면 프로세스 누적값에 합산)"""
+    global _last_flush
+
+    with _lock:
+        _last_flush = time.monotonic()
+        if not _pending:
+            return
+        increments = dict(_pending)
+        _pending.clear()
+
+    conn = _get_connection()
+    if conn is not None:
+        try:
+            pipe = conn.pipeline(transaction=False)
+            for name, value in increments.items():
+                pipe.hincrbyfloat(METRICS_KEY, name, value)
+            pipe.execute()
+            return
+        except Exception as e:
+            logger.warning(f"요청 메트릭 Redis 플러시 실패, 프로세스 메모리에 누적: {e}")
+
+    with _lock:
+        for name, value in increments.items():
+            _local_totals[name] += value
+
+
+def snapshot() -> dict[str, float]:
+    """전체 누적값 ("endpoint|method|metric" → 값), 현재 프로세스 버퍼 포함"""
+    flush()
+    totals = defaultdict(float)
+
+    conn = _get_connection()
+    if conn is not None:
+        try:
+            for name, value in conn.hgetall(METRICS_KEY).items():
+                name = name.decode() if isinstance(name, bytes) else name
+                totals[name] += float(value)
+        except Exception as e:
+            logger.warning(f"요청 메트릭 Redis 조회 실패: {e}")
+
+    with _lock:
+        for name, value in _local_totals.items():
+            totals[name] += value
+    return dict(totals)
+
+
+def reset() -> None:
+    """누적값 초기화 (테스트/벤치마크용)"""
+    with _lock:
+        _pending.clear()
+        _local_totals.clear()
+
+    conn = _get_connection()
+    if conn is not None:
+        conn.delete(METRICS_KEY)
+
+
+def _get_connection() -> Any | None:
+    """Redis 연결 반환 (Redis 캐시 백엔드가 아니면 None)"""
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default")
+    except (ImportError, NotImplementedError):
+        return None
+
+
+# ===== Prometheus 출력 =====
+
+_COUNTERS = (
+    ("queries", "http_request_db_queries", "DB queries executed while handling requests"),
+    ("db_seconds", "http_request_db_seconds", "Time spent in DB queries"),
+    ("cache_hits", "http_request_cache_hits", "Cache lookups that hit"),
+    ("cache_misses", "http_request_cache_misses", "Cache lookups that missed"),
+    ("serializer_seconds", "http_request_serializer_seconds", "Time spent serializing response data"),
+)
+_LABELS = ["endpoint", "method"]
+
+
+class _SnapshotCollector:
+    """
+    워커 간 합산된 누적값(snapshot)을 메트릭으로 내보내는 collector
+
+    누적값은 Redis에서 모든 워커의 합계로 관리하므로 프로세스별 Histogram/Counter 객체 대신
+    스크레이프 시점의 합계로 MetricFamily를 만듭니다.
+    """
+
+    def collect(self):
+        series: dict[tuple[str, str], dict[str, float]] = defaultdict(dict)
+        for name, value in snapshot().items():
+            endpoint, method, metric = name.rsplit("|", 2)
+            series[(endpoint, method)][metric] = value
+
+        duration = HistogramMetricFamily(
+            "http_request_duration_seconds", "Request latency by URL name", labels=_LABELS
+        )
+        for (endpoint, method), metrics in sorted(series.items()):
+            buckets = [(str(bucket), metrics.get(f"le_{bucket}", 0)) for bucket in LATENCY_BUCKETS]
+            buckets.append(("+Inf", metrics.get("count", 0)))
+            duration.add_metric([endpoint, method], buckets, sum_value=metrics.get("latency_sum", 0))
+        yield duration
+
+        for metric, name, help_text in _COUNTERS:
+            counter = CounterMetricFamily(name, help_text, labels=_LABELS)
+            for (endpoint, method), metrics in sorted(series.items()):
+                counter.add_metric([endpoint, method], metrics.get(metric, 0))
+            yield counter
+
+
+_registry = CollectorRegistry(auto_describe=False)
+_registry.register(_SnapshotCollector())
+
+
+def render_prometheus() -> str:
+    """
+    누적값을 Prometheus text format으로 출력
+
+    라벨: endpoint (URL 이름), method (HTTP 메서드)
+    """
+    return generate_latest(_registry).decode()
@@ -0,0 +1,187 @@
+"""
+비차단(Non-blocking) 구조화 로깅 유틸리티
+
+기존 방식의 문제:
+- 요청 스레드에서 FileHandler가 직접 디스크에 기록 (트랜잭션 안에서 I/O 대기)
+- f-string 로그 메시지는 레벨로 걸러져도 항상 먼저 조합됨
+
+구성:
+- configure_logging: Django LOGGING_CONFIG 진입점. dictConfig 적용 후 LOGGING["queued_handlers"]에
+  지정한 핸들러를 QueueHandler로 교체하고, 실제 핸들러는 QueueListener 스레드에서 실행
+- QueueHandler는 레코드를 포맷하지 않고 그대로 큐에 넣음 → 메시지 조합(msg % args)과 JSON 직렬화는
+  리스너 스레드에서 처리 (요청 스레드는 큐 적재만)
+- JSONFormatter: 한 줄에 JSON 객체 하나 (extra로 넘긴 필드 포함)
+- SamplingFilter: extra=SAMPLED로 표시한 고빈도 INFO/DEBUG 레코드를 rate 비율만 남김
+  (WARNING 이상은 표시와 관계없이 항상 기록)
+
+사용 예시:
+    from shopping.utils.structured_logging import SAMPLED
+
+    logger.info("주문 생성 시작: order_id=%s", order.id)                 # 지연 포맷
+    logger.info("재고 차감: product_id=%s", product.pk, extra=SAMPLED)  # 샘플링 대상
+
+Note:
+    큐에 넣은 뒤 리스너 스레드에서 포맷하므로, 로그 인자로는 이후 변경될 수 있는 객체 대신
+    id, 문자열, 숫자 같은 값을 넘깁니다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import json
+import logging
+import logging.config
+import logging.handlers
+import os
+import queue
+import random
+from datetime import datetime, timezone
+from typing import Any
+
+# 고빈도 INFO 이벤트 표시 (logger.info(..., extra=SAMPLED))
+SAMPLED = {"sampled": True}
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드와 구분)
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None)).keys()
+    | {"message", "asctime", "sampled", "taskName"}
+)
+
+_listeners: list[tuple[logging.handlers.QueueListener, logging.handlers.QueueHandler]] = []
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    JSON 한 줄 포맷터
+
+    출력 필드: ts, level, logger, message, module, process, thread
+    + extra로 넘긴 필드, 예외가 있으면 exc_info
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "process": record.process,
+            "thread": record.thread,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    고빈도 로그 샘플링 필터
+
+    extra=SAMPLED로 표시된 INFO 이하 레코드만 rate 확률로 통과시킵니다.
+    여러 핸들러에 붙어 있어도 레코드당 한 번만 결정합니다 (콘솔/파일 출력 일치).
+    """
+
+    def __init__(self, rate: float = 1.0, name: str = ""):
+        super().__init__(name)
+        self.rate = float(rate)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or not getattr(record, "sampled", False):
+            return True
+
+        keep = getattr(record, "_sample_keep", None)
+        if keep is None:
+            keep = self.rate >= 1.0 or random.random() < self.rate
+            record._sample_keep = keep
+        return keep
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    포맷하지 않고 레코드를 그대로 넣는 QueueHandler
+
+    표준 QueueHandler.prepare()는 호출 스레드에서 메시지를 조합합니다.
+    같은 프로세스 안의 큐만 사용하므로 msg/args를 유지하고,
+    스택 프레임을 붙잡지 않도록 예외 정보만 텍스트로 바꿉니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            record = copy.copy(record)
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(config: dict[str, Any]) -> None:
+    """
+    LOGGING_CONFIG 진입점 (settings.LOGGING_CONFIG = "shopping.utils.structured_logging.configure_logging")
+
+    Args:
+        config: LOGGING 설정. 표준 dictConfig 키 외에
+            queued_handlers(핸들러 이름 목록)를 지정하면 해당 핸들러를 리스너 스레드로 옮깁니다.
+    """
+    config = dict(config)
+    queued = config.pop("queued_handlers", [])
+    stop_listeners()
+    logging.config.dictConfig(config)
+
+    handlers = {name: logging._handlers.get(name) for name in queued}
+    for name, target in handlers.items():
+        if target is not None:
+            _install_queue(target)
+
+
+def _install_queue(target: logging.Handler) -> None:
+    """target 핸들러를 쓰는 모든 로거에서 QueueHandler로 교체하고 리스너 시작"""
+    queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+    queue_handler.setLevel(target.level)
+    # 필터는 호출 스레드에서 적용 (샘플링으로 버릴 레코드는 큐에 넣지 않음)
+    queue_handler.filters, target.filters = target.filters, []
+
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        if target in logger.handlers:
+            logger.handlers = [queue_handler if handler is target else handler for handler in logger.handlers]
+
+    listener = logging.handlers.QueueListener(queue_handler.queue, target, respect_handler_level=True)
+    listener.start()
+    _listeners.append((listener, queue_handler))
+
+
+def stop_listeners() -> None:
+    """리스너 종료 (큐에 남은 레코드를 모두 기록한 뒤 반환)"""
+    while _listeners:
+        listener, _ = _listeners.pop()
+        if listener._thread is not None:
+            listener.stop()
+
+
+def _restart_listeners_after_fork() -> None:
+    """
+    fork된 자식 프로세스(Celery prefork, gunicorn preload)에서 리스너 재시작
+
+    리스너 스레드는 fork 시 복제되지 않으므로 새 큐와 스레드를 만듭니다.
+    """
+    for listener, queue_handler in _listeners:
+        new_queue = queue.SimpleQueue()
+        queue_handler.queue = listener.queue = new_queue
+        listener._thread = None
+        listener.start()
+
+
+atexit.register(stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
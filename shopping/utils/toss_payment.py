@@ -106,6 +106,7 @@ class TossPaymentClient:
         cancel_reason: str,
         cancel_amount: int | None = None,
         refund_account: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         """
         결제 취소 요청
@@ -115,6 +116,7 @@ class TossPaymentClient:
             cancel_reason: 취소 사유
             cancel_amount: 취소 금액 (None이면 전체 취소)
             refund_account: 환불 계좌 정보 (가상계좌 결제시)
+            idempotency_key: 멱등키 (재시도 시 같은 키로 보내면 중복 취소되지 않음)
 
         Returns:
             토스페이먼츠 응답 데이터
@@ -142,8 +144,12 @@ class TossPaymentClient:
         if refund_account:
             data["refundReceiveAccount"] = refund_account
 
+        headers = self.headers
+        if idempotency_key:
+            headers = {**self.headers, "Idempotency-Key": idempotency_key}
+
         try:
-            response = requests.post(url, json=data, headers=self.headers, timeout=30)
+            response = requests.post(url, json=data, headers=headers, timeout=30)
 
             if response.status_code == 200:
                 return response.json()
@@ -0,0 +1,37 @@
+"""
+성능 메트릭 엔드포인트 (Prometheus scrape 대상)
+
+PerformanceMetricsMiddleware가 URL 이름별로 집계한 요청 처리 시간, DB 쿼리 수/시간,
+캐시 히트/미스, 직렬화 시간을 Prometheus text format으로 반환합니다.
+
+접근 제어:
+- METRICS_TOKEN 설정 시 Authorization: Bearer <METRICS_TOKEN> 헤더로 접근 (스크레이퍼용)
+- 관리자(is_staff) 세션 로그인 사용자
+"""
+
+import hmac
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+
+from ..utils.request_metrics import render_prometheus
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _has_metrics_access(request: HttpRequest) -> bool:
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if token:
+        header = request.headers.get("Authorization", "")
+        if hmac.compare_digest(header.encode(), f"Bearer {token}".encode()):
+            return True
+    return request.user.is_authenticated and request.user.is_staff
+
+
+@require_GET
+def metrics(request: HttpRequest) -> HttpResponse:
+    """요청 메트릭 (Prometheus text format)"""
+    if not _has_metrics_access(request):
+        return HttpResponseForbidden()
+    return HttpResponse(render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
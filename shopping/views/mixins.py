@@ -2,9 +2,13 @@
 
 import logging
 
-from rest_framework import status
+from django.db import OperationalError
+
+from rest_framework import permissions, status
 from rest_framework.response import Response
 
+from shopping.db_router import ReplicaHealth, use_replica
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,3 +46,40 @@ class EmailVerificationRequiredMixin:
                 status=status.HTTP_403_FORBIDDEN,
             )
         return None
+
+
+class ReplicaReadMixin:
+    """
+    읽기 전용 액션의 조회를 replica로 보내는 Mixin (shopping.db_router)
+
+    인증/권한 확인(initial) 이후의 핸들러 실행 구간만 replica를 사용하므로
+    인증 사용자 조회는 항상 primary에서 합니다.
+    replica 쿼리가 OperationalError로 실패하면 replica를 제외하고 primary로 한 번 재시도합니다.
+
+    replica_actions: ViewSet은 액션 이름(list, retrieve, ...), APIView는 HTTP 메서드 이름(get)
+    """
+
+    replica_actions: tuple[str, ...] = ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        method = request.method.lower()
+        action = getattr(self, "action", None) or method
+        if request.method in permissions.SAFE_METHODS and action in self.replica_actions:
+            setattr(self, method, self._replica_handler(getattr(self, method)))
+
+    @staticmethod
+    def _replica_handler(handler):
+        def wrapped(request, *args, **kwargs):
+            try:
+                with use_replica(request) as state:
+                    return handler(request, *args, **kwargs)
+            except OperationalError as e:
+                if not state.used_replica:
+                    raise
+                logger.warning(f"replica 조회 실패, primary로 재시도: path={request.path}, error={e}")
+                ReplicaHealth.mark_down()
+                return handler(request, *args, **kwargs)
+
+        return wrapped
@@ -21,6 +21,7 @@ from ..serializers.notification_serializers import (
     NotificationSerializer,
 )
 from ..services.notification_service import NotificationService, NotificationServiceError
+from .mixins import ReplicaReadMixin
 
 
 # ===== Swagger 문서화용 응답 Serializers =====
@@ -69,7 +70,7 @@ class ErrorResponseSerializer(drf_serializers.Serializer):
         tags=["Notifications"],
     ),
 )
-class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
+class NotificationViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """
     알림 ViewSet
 
@@ -86,6 +87,8 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
 
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # 상세 조회는 읽음 처리(쓰기)를 하므로 목록만 replica 사용
+    replica_actions = ("list",)
 
     def get_queryset(self) -> Any:
         """현재 사용자의 알림만 조회"""
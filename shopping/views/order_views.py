@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any
 
-from django.db.models import Count
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
 
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from rest_framework import filters, permissions, serializers as drf_serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import BaseRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer, ValidationError
@@ -18,6 +21,7 @@ from ..models.order import Order
 from ..permissions import IsOrderOwnerOrAdmin
 from ..serializers.order_serializers import OrderCreateSerializer, OrderDetailSerializer, OrderListSerializer
 from ..services.order_service import OrderService, OrderServiceError
+from ..services.order_status_service import OrderStatusService
 from ..throttles import OrderCancelRateThrottle, OrderCreateRateThrottle
 
 logger = logging.getLogger(__name__)
@@ -53,6 +57,34 @@ class OrderErrorResponseSerializer(drf_serializers.Serializer):
     verification_url = drf_serializers.CharField(required=False)
 
 
+class OrderStatusResponseSerializer(drf_serializers.Serializer):
+    """주문 처리 상태 응답"""
+
+    order_id = drf_serializers.IntegerField()
+    order_number = drf_serializers.CharField(allow_null=True)
+    status = drf_serializers.CharField(help_text="주문 상태 (pending → confirmed/failed)")
+    failure_reason = drf_serializers.CharField(help_text="실패 사유 (failed일 때)")
+    is_processing = drf_serializers.BooleanField(help_text="비동기 처리 진행 중 여부")
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    SSE(text/event-stream) 렌더러
+
+    스트림 본문은 StreamingHttpResponse가 직접 생성하며,
+    이 렌더러는 Accept 협상과 에러 응답(JSON 본문) 렌더링에만 사용됩니다.
+    """
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data: Any, accepted_media_type: str | None = None, renderer_context: dict | None = None) -> bytes:
+        if data is None:
+            return b""
+        return json.dumps(data, ensure_ascii=False).encode(self.charset)
+
+
 class OrderPagination(PageNumberPagination):
     """주문 목록 페이지네이션"""
 
@@ -108,6 +140,8 @@ class OrderViewSet(viewsets.ModelViewSet):
     - POST   /api/orders/           - 주문 생성
     - GET    /api/orders/{id}/      - 주문 상세 조회
     - POST   /api/orders/{id}/cancel/ - 주문 취소
+    - GET    /api/orders/{id}/status/ - 주문 처리 상태 (캐시 조회, 롱폴링)
+    - GET    /api/orders/{id}/status/stream/ - 주문 처리 상태 (SSE)
 
     권한:
     - 인증된 사용자만 접근 가능
@@ -137,18 +171,17 @@ class OrderViewSet(viewsets.ModelViewSet):
 
         성능 최적화:
         - select_related("user"): N+1 방지
-        - prefetch_related("order_items__product"): 주문 아이템 최적화
-        - annotate(item_count): 아이템 개수 미리 계산
+        - 목록: Order 컬럼(item_count, first_product_name 등 요약 포함)만 조회
+          → (user_id, created_at) 인덱스 스캔 1회
+        - 상세/기타 액션: prefetch_related("order_items__product")로 주문 아이템 최적화
 
         보안:
         - 관리자: 전체 주문 조회
         - 일반 사용자: 본인 주문만 조회
         """
-        queryset = (
-            Order.objects.select_related("user")
-            .prefetch_related("order_items__product")
-            .annotate(item_count=Count("order_items"))
-        )
+        queryset = Order.objects.select_related("user")
+        if self.action != "list":
+            queryset = queryset.prefetch_related("order_items__product")
 
         if self.request.user.is_staff or self.request.user.is_superuser:
             return queryset
@@ -211,7 +244,7 @@ class OrderViewSet(viewsets.ModelViewSet):
                     "status": "pending",
                     "task_id": task_id,
                     "message": "주문 처리 중입니다. 잠시 후 주문 내역에서 확인해주세요.",
-                    "status_url": f"/api/orders/{order.id}/",
+                    "status_url": f"/api/orders/{order.id}/status/",
                 },
                 status=status.HTTP_202_ACCEPTED,
             )
@@ -254,6 +287,122 @@ class OrderViewSet(viewsets.ModelViewSet):
             logger.warning(f"주문 취소 실패: order_id={order.id}, user_id={request.user.id}, error={str(e)}")
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    def _get_status_snapshot(self, pk: str | None) -> dict[str, Any] | None:
+        """
+        권한이 확인된 주문 상태 스냅샷 반환
+
+        get_object()를 사용하지 않으므로 get_queryset의 prefetch 쿼리가 실행되지 않습니다.
+        본인 주문이 아니면 존재 여부를 노출하지 않도록 None을 반환합니다.
+        """
+        try:
+            order_id = int(pk)
+        except (TypeError, ValueError):
+            return None
+
+        snapshot = OrderStatusService.get(order_id)
+        if snapshot is None:
+            return None
+
+        user = self.request.user
+        if snapshot["user_id"] != user.id and not (user.is_staff or user.is_superuser):
+            return None
+
+        return snapshot
+
+    @staticmethod
+    def _status_payload(snapshot: dict[str, Any]) -> dict[str, Any]:
+        """스냅샷에서 응답 본문 생성 (user_id 제외)"""
+        return {
+            "order_id": snapshot["order_id"],
+            "order_number": snapshot["order_number"],
+            "status": snapshot["status"],
+            "failure_reason": snapshot["failure_reason"],
+            "is_processing": snapshot["status"] in OrderStatusService.PROCESSING_STATUSES,
+        }
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="wait",
+                type=int,
+                description=f"상태가 바뀔 때까지 대기할 최대 시간(초, 최대 {OrderStatusService.MAX_WAIT_SECONDS})",
+            ),
+            OpenApiParameter(
+                name="since",
+                type=str,
+                description="클라이언트가 알고 있는 상태 (기본: pending에서 벗어날 때까지 대기)",
+            ),
+        ],
+        responses={
+            200: OrderStatusResponseSerializer,
+            404: OrderErrorResponseSerializer,
+        },
+        summary="주문 처리 상태를 조회한다.",
+        description="""처리 내용:
+- 주문 생성 후 비동기 처리 결과(confirmed/failed)를 반환한다.
+- 주문 상세 조회 대신 캐시 키 하나만 조회한다.
+- wait 파라미터를 지정하면 상태가 바뀔 때까지 대기한다. (롱폴링)
+- 프로세스당 동시 대기 요청 수를 넘으면 대기 없이 현재 상태를 반환한다.""",
+        tags=["Orders"],
+    )
+    @action(detail=True, methods=["get"], url_path="status")
+    def order_status(self, request: Request, pk: str | None = None) -> Response:
+        """주문 처리 상태 조회 (롱폴링 지원)"""
+        snapshot = self._get_status_snapshot(pk)
+        if snapshot is None:
+            return Response({"error": "주문을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            wait = float(request.query_params.get("wait", 0))
+        except ValueError:
+            wait = 0
+
+        if wait > 0:
+            snapshot = OrderStatusService.wait(
+                snapshot["order_id"],
+                since_status=request.query_params.get("since"),
+                timeout=wait,
+            )
+
+        return Response(self._status_payload(snapshot))
+
+    @extend_schema(
+        responses={
+            (200, "text/event-stream"): OrderStatusResponseSerializer,
+            404: OrderErrorResponseSerializer,
+        },
+        summary="주문 처리 상태를 스트리밍한다.",
+        description="""처리 내용:
+- Server-Sent Events로 주문 상태 변경을 전달한다.
+- 처리가 끝나거나 최대 대기 시간이 지나면 스트림을 종료한다.
+- ASGI 서버에서만 상태 변경을 따라가며, WSGI로 요청하면 현재 상태 이벤트 하나만 보내고 종료한다.""",
+        tags=["Orders"],
+    )
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="status/stream",
+        renderer_classes=[EventStreamRenderer],
+    )
+    def order_status_stream(self, request: Request, pk: str | None = None) -> StreamingHttpResponse | Response:
+        """주문 처리 상태 스트리밍 (SSE)"""
+        snapshot = self._get_status_snapshot(pk)
+        if snapshot is None:
+            return Response({"error": "주문을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        # WSGI는 비동기 이터레이터를 끝까지 모은 뒤 응답하므로 ASGI에서만 상태 변경을 따라감
+        follow = isinstance(request._request, ASGIRequest)
+
+        async def event_stream():
+            async for latest in OrderStatusService.stream(snapshot["order_id"], snapshot, follow=follow):
+                data = json.dumps(self._status_payload(latest), ensure_ascii=False)
+                yield f"event: status\ndata: {data}\n\n"
+
+        response = StreamingHttpResponse(event_stream(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # Nginx 버퍼링 비활성화
+        return response
+
     def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """주문 목록 조회"""
         queryset = self.filter_queryset(self.get_queryset())
@@ -27,7 +27,7 @@ from ..serializers.payment_serializers import (
 from ..services.payment_service import PaymentConfirmError, PaymentService
 from ..throttles import PaymentCancelRateThrottle, PaymentConfirmRateThrottle, PaymentRequestRateThrottle
 from ..utils.toss_payment import TossPaymentClient, TossPaymentError, get_error_message
-from .mixins import EmailVerificationRequiredMixin
+from .mixins import EmailVerificationRequiredMixin, ReplicaReadMixin
 
 logger = logging.getLogger(__name__)
 
@@ -247,7 +247,7 @@ class PaymentConfirmView(EmailVerificationRequiredMixin, APIView):
 
         except PaymentConfirmError as e:
             # 결제 승인 에러 (중복 결제, 잘못된 상태 등)
-            logger.warning(f"Payment confirm error: {str(e)}")
+            logger.warning("Payment confirm error: %s", str(e))
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -256,7 +256,7 @@ class PaymentConfirmView(EmailVerificationRequiredMixin, APIView):
         except TossPaymentError as e:
             # Toss API 에러 (Celery eager mode에서 태스크 즉시 실행 시 발생)
             # 프로덕션에서는 태스크가 백그라운드에서 실행되므로 여기 도달하지 않음
-            logger.error(f"Toss API error in task: {str(e)}")
+            logger.error("Toss API error in task: %s", str(e))
 
             # 결제 실패 처리
             payment.refresh_from_db()
@@ -277,7 +277,7 @@ class PaymentConfirmView(EmailVerificationRequiredMixin, APIView):
 
         except Exception as e:
             # 기타 에러
-            logger.error(f"Payment confirm error: {str(e)}")
+            logger.error("Payment confirm error: %s", str(e))
 
             # 결제 실패 처리
             payment.mark_as_failed(str(e))
@@ -361,11 +361,11 @@ class PaymentCancelView(APIView):
             from ..services.payment_service import PaymentCancelError
 
             if isinstance(e, PaymentCancelError):
-                logger.error(f"Payment cancel error: {str(e)}")
+                logger.error("Payment cancel error: %s", str(e))
                 return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
             # 기타 예외
-            logger.error(f"Unexpected error in payment cancel: {str(e)}")
+            logger.error("Unexpected error in payment cancel: %s", str(e))
             return Response(
                 {"error": "결제 취소 중 오류가 발생했습니다.", "message": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -451,8 +451,10 @@ class PaymentFailView(APIView):
         # 보안: 본인의 결제만 실패 처리 가능
         if payment.order.user != request.user:
             logger.warning(
-                f"타인의 결제 실패 처리 시도: user_id={request.user.id}, "
-                f"payment_id={payment.id}, payment_user_id={payment.order.user.id}"
+                "타인의 결제 실패 처리 시도: user_id=%s, payment_id=%s, payment_user_id=%s",
+                request.user.id,
+                payment.id,
+                payment.order.user.id,
             )
             return Response(
                 {"error": "결제 정보를 찾을 수 없습니다."},
@@ -475,7 +477,7 @@ class PaymentFailView(APIView):
                 },
             )
 
-            logger.info(f"결제 실패 처리 완료 - Payment ID: {payment.id}, " f"Code: {fail_code}, Message: {fail_message}")
+            logger.info("결제 실패 처리 완료 - Payment ID: %s, Code: %s, Message: %s", payment.id, fail_code, fail_message)
 
             return Response(
                 {
@@ -492,7 +494,7 @@ class PaymentFailView(APIView):
 
         except Exception as e:
             # 예외 발생 시 로그 기록
-            logger.error(f"결제 실패 처리 중 오류 발생: {str(e)}")
+            logger.error("결제 실패 처리 중 오류 발생: %s", str(e))
 
             return Response(
                 {
@@ -534,7 +536,7 @@ class PaymentDetailView(APIView):
         return Response(serializer.data)
 
 
-class PaymentListView(APIView):
+class PaymentListView(ReplicaReadMixin, APIView):
     """
     결제 목록 조회 API
 
@@ -542,6 +544,7 @@ class PaymentListView(APIView):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    replica_actions = ("get",)
 
     @extend_schema(
         parameters=[
@@ -629,8 +632,8 @@ def payment_test_page(request, order_id):
     """
     결제 테스트 페이지 - 포인트 정보 표시
 
-    Note: order_number는 Order 생성 시 post_save signal에서 자동으로 생성됩니다.
-          (signals.py의 generate_order_number 참조)
+    Note: order_number는 Order 저장(INSERT) 전에 자동으로 발급됩니다.
+          (NumberSequenceService.next_order_number 참조)
     """
     # 관리자는 모든 주문 접근 가능
     if request.user.is_staff or request.user.is_superuser:
@@ -667,7 +670,7 @@ def payment_success(request):
     amount = request.GET.get("amount")
 
     if not all([payment_key, order_id, amount]):
-        logger.warning(f"결제 성공 콜백 파라미터 누락: payment_key={payment_key}, " f"order_id={order_id}, amount={amount}")
+        logger.warning("결제 성공 콜백 파라미터 누락: payment_key=%s, order_id=%s, amount=%s", payment_key, order_id, amount)
         return render(
             request,
             "shopping/payment_fail.html",
@@ -688,8 +691,10 @@ def payment_success(request):
         )
 
         logger.info(
-            f"템플릿 결제 성공 처리 완료: payment_id={payment.id}, "
-            f"order_id={result['payment'].order.id}, user_id={request.user.id}"
+            "템플릿 결제 성공 처리 완료: payment_id=%s, order_id=%s, user_id=%s",
+            payment.id,
+            result["payment"].order.id,
+            request.user.id,
         )
 
         return render(
@@ -703,7 +708,7 @@ def payment_success(request):
         )
 
     except Payment.DoesNotExist:
-        logger.error(f"결제 정보를 찾을 수 없음: order_id={order_id}")
+        logger.error("결제 정보를 찾을 수 없음: order_id=%s", order_id)
         return render(
             request,
             "shopping/payment_fail.html",
@@ -711,7 +716,7 @@ def payment_success(request):
         )
 
     except (PaymentConfirmError, TossPaymentError) as e:
-        logger.error(f"결제 승인 실패: order_id={order_id}, error={str(e)}")
+        logger.error("결제 승인 실패: order_id=%s, error=%s", order_id, str(e))
         return render(
             request,
             "shopping/payment_fail.html",
@@ -719,7 +724,7 @@ def payment_success(request):
         )
 
     except Exception as e:
-        logger.error(f"결제 성공 처리 중 예상치 못한 오류: order_id={order_id}, error={str(e)}")
+        logger.error("결제 성공 처리 중 예상치 못한 오류: order_id=%s, error=%s", order_id, str(e))
         return render(
             request,
             "shopping/payment_fail.html",
@@ -739,16 +744,16 @@ def payment_fail(request):
     message = request.GET.get("message")
     order_id = request.GET.get("orderId")
 
-    logger.warning(f"결제 실패 콜백 수신: code={code}, message={message}, order_id={order_id}")
+    logger.warning("결제 실패 콜백 수신: code=%s, message=%s, order_id=%s", code, message, order_id)
 
     # Payment 상태 업데이트
     if order_id:
         try:
             payment = Payment.objects.get(toss_order_id=order_id)
             payment.mark_as_failed(message)
-            logger.info(f"결제 실패 상태 업데이트: payment_id={payment.id}, order_id={order_id}")
+            logger.info("결제 실패 상태 업데이트: payment_id=%s, order_id=%s", payment.id, order_id)
         except Payment.DoesNotExist:
-            logger.error(f"결제 정보를 찾을 수 없음: order_id={order_id}")
+            logger.error("결제 정보를 찾을 수 없음: order_id=%s", order_id)
 
     return render(
         request,
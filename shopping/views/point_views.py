@@ -20,6 +20,7 @@ from ..serializers.point_serializers import (
 )
 from ..services.point_query_service import DateParseError, PointQueryService
 from ..services.point_service import PointService
+from .mixins import ReplicaReadMixin
 
 logger = logging.getLogger(__name__)
 
@@ -152,10 +153,11 @@ class PointCancelSuccessResponseSerializer(drf_serializers.Serializer):
 
 
 @extend_schema(tags=["Points"])
-class MyPointView(APIView):
+class MyPointView(ReplicaReadMixin, APIView):
     """내 포인트 정보 조회 API"""
 
     permission_classes = [permissions.IsAuthenticated]
+    replica_actions = ("get",)
 
     @extend_schema(
         responses={200: MyPointResponseSerializer},
@@ -176,10 +178,11 @@ class MyPointView(APIView):
 
 
 @extend_schema(tags=["Points"])
-class PointHistoryListView(APIView):
+class PointHistoryListView(ReplicaReadMixin, APIView):
     """포인트 이력 목록 조회"""
 
     permission_classes = [permissions.IsAuthenticated]
+    replica_actions = ("get",)
 
     @extend_schema(
         parameters=[
@@ -259,10 +262,11 @@ class PointCheckView(APIView):
 
 
 @extend_schema(tags=["Points"])
-class ExpiringPointsView(APIView):
+class ExpiringPointsView(ReplicaReadMixin, APIView):
     """만료 예정 포인트 조회"""
 
     permission_classes = [permissions.IsAuthenticated]
+    replica_actions = ("get",)
 
     @extend_schema(
         parameters=[
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Count, F, Prefetch, QuerySet
 from django.utils.text import slugify
 
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from rest_framework import filters, permissions, serializers as drf_serializers, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -28,6 +29,9 @@ from shopping.serializers import (
 
 # 권한
 from shopping.permissions import IsSeller, IsSellerAndOwner
+from shopping.services.category_tree_service import CategoryTreeService
+from shopping.services.product_view_service import ProductViewService
+from shopping.views.mixins import ReplicaReadMixin
 
 
 # ===== Swagger 문서화용 응답 Serializers =====
@@ -128,10 +132,11 @@ class ProductPagination(PageNumberPagination):
         tags=["Products"],
     ),
 )
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """상품 CRUD 및 검색/필터링 ViewSet"""
 
     queryset = Product.objects.all()
+    replica_actions = ("list", "retrieve", "trending")
     pagination_class = ProductPagination
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsSellerAndOwner]
 
@@ -189,8 +194,9 @@ class ProductViewSet(viewsets.ModelViewSet):
 
         성능 최적화:
         - select_related: seller, category (JOIN 최적화)
-        - prefetch_related: images, reviews (N+1 문제 방지)
         - annotate: avg_rating, review_cnt, wishlist_cnt, is_wished (집계)
+        - 대표 이미지는 Product.thumbnail_image 사용 (이미지 prefetch 없음)
+        - 상세 조회(retrieve)는 get_detail_queryset() 사용
 
         필터링:
         - category: 카테고리 및 하위 카테고리 포함
@@ -201,13 +207,15 @@ class ProductViewSet(viewsets.ModelViewSet):
         """
         from django.db.models import Case, When, Value, BooleanField
 
+        if self.action == "retrieve":
+            return self.get_detail_queryset()
+
         # 현재 사용자 ID (인증되지 않은 경우 None)
         user_id = self.request.user.id if self.request.user.is_authenticated else None
 
         queryset = (
             Product.objects.filter(is_active=True)
             .select_related("seller", "category")
-            .prefetch_related("images", "reviews")
             .annotate(
                 # 평균 평점과 리뷰 수를 미리 계산
                 avg_rating=Avg("reviews__rating"),
@@ -223,17 +231,13 @@ class ProductViewSet(viewsets.ModelViewSet):
             )
         )
 
-        # 카테고리 필터링
+        # 카테고리 필터링 (하위 카테고리 포함)
         category_id = self.request.query_params.get("category", None)
         if category_id:
-            try:
-                # 하위 카테고리도 포함하여 필터링
-                category = Category.objects.get(pk=category_id)
-                # 현재 카테고리와 모든 하위 카테고리의 상품 조회
-                categories = category.get_descendants(include_self=True)
-                queryset = queryset.filter(category__in=categories)
-            except Category.DoesNotExist:
-                pass
+            # 캐시된 서브트리 범위로 카테고리 조회 없이 lft/rght 범위 조건만 추가
+            category_range = CategoryTreeService.get_range(category_id)
+            if category_range is not None:
+                queryset = queryset.filter(category_range.filter_q())
 
         # 가격 범위 필터링
         min_price = self.request.query_params.get("min_price", None)
@@ -266,6 +270,33 @@ class ProductViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def get_detail_queryset(self) -> QuerySet[Product]:
+        """
+        상품 상세 조회 쿼리셋 (고정 4쿼리 + 판매자 상품 수 캐시 미스 시 1쿼리)
+
+        - 상품 + 판매자 + 카테고리 + 상위 카테고리: JOIN 1쿼리 (목록용 집계/찜 JOIN 없음)
+        - 이미지, 이미지 변형: prefetch 2쿼리
+        - 최근 리뷰 10개 + 작성자: prefetch 1쿼리 (상품별 개수 제한은 윈도 함수로 처리)
+        - 평점/리뷰 수는 Product.rating_count/rating_sum, 판매자 상품 수는 캐시 사용
+        """
+        recent_reviews = ProductReview.objects.select_related("user").order_by("-created_at")[
+            : ProductDetailSerializer.RECENT_REVIEW_LIMIT
+        ]
+        return (
+            Product.objects.filter(is_active=True)
+            .select_related("seller", "category__parent")
+            .prefetch_related(
+                "images__variants",
+                Prefetch("reviews", queryset=recent_reviews, to_attr="recent_review_list"),
+            )
+        )
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """상품 상세 조회 (조회수는 Redis에 모아 주기적으로 반영, 응답 경로에 DB 쓰기 없음)"""
+        response = super().retrieve(request, *args, **kwargs)
+        ProductViewService.record_view(response.data["id"])
+        return response
+
     def perform_create(self, serializer: Serializer) -> None:
         """
         상품 생성 시 추가 처리
@@ -434,6 +465,36 @@ class ProductViewSet(viewsets.ModelViewSet):
         serializer = ProductListSerializer(best_products, many=True)
         return Response(serializer.data)
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name="limit", type=int, description="조회할 상품 수 (기본 12, 최대 50)"),
+        ],
+        responses={200: ProductListSerializer(many=True)},
+        summary="인기 급상승 상품 목록을 조회한다.",
+        description="""처리 내용:
+- 최근 조회일수록 큰 비중을 두는 시간 감쇠 조회 점수 순으로 반환한다.
+- 판매 중인 상품만 포함한다.
+- 최대 50개 상품을 반환한다.""",
+        tags=["Products"],
+    )
+    @action(detail=False, methods=["get"])
+    def trending(self, request: Request) -> Response:
+        try:
+            limit = min(max(int(request.query_params.get("limit", 12)), 1), 50)
+        except ValueError:
+            limit = 12
+
+        # 비활성 상품이 섞여 있을 수 있으므로 여유 있게 가져와 점수 순서대로 자름
+        scores = dict(ProductViewService.get_trending(limit * 2))
+        products = sorted(
+            self.get_queryset().filter(pk__in=scores),
+            key=lambda product: scores[product.pk],
+            reverse=True,
+        )[:limit]
+
+        serializer = ProductListSerializer(products, many=True, context={"request": request})
+        return Response(serializer.data)
+
     @extend_schema(
         responses={
             200: ProductListSerializer(many=True),
@@ -483,10 +544,11 @@ class ProductViewSet(viewsets.ModelViewSet):
         tags=["Categories"],
     ),
 )
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class CategoryViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """카테고리 조회 전용 ViewSet (읽기 전용)"""
 
     queryset = Category.objects.all()
+    replica_actions = ("list", "retrieve", "tree", "products")
     permission_classes = [permissions.AllowAny]  # 누구나 조회 가능
 
     def get_serializer_class(self) -> type[BaseSerializer]:
@@ -506,12 +568,12 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
 
         - 활성 카테고리만 표시 (is_active=True)
         - select_related: parent (JOIN 최적화)
-        - annotate: products_count (상품 개수 집계)
+        - annotate: products_count (카테고리별 활성 상품 수 카운터, 상품 테이블 집계 없음)
         """
         return (
             Category.objects.filter(is_active=True)
             .select_related("parent")
-            .annotate(products_count=Count("products", filter=Q(products__is_active=True)))
+            .annotate(products_count=F("active_product_count"))
         )
 
     @extend_schema(
@@ -525,43 +587,8 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     )
     @action(detail=False, methods=["get"])
     def tree(self, request: Request) -> Response:
-        from django.core.cache import cache
-        from mptt.templatetags.mptt_tags import cache_tree_children
-
-        # 캐시 키
-        cache_key = "category_tree_v2"
-
-        # 캐시에서 먼저 조회
-        tree = cache.get(cache_key)
-
-        if tree is None:
-            # 캐시 미스 - DB에서 새로 생성
-            # 모든 활성 카테고리를 한 번에 가져오고 상품 수 annotate
-            # Note: 모델에 product_count @property가 있으므로 다른 이름 사용
-            categories = Category.objects.filter(is_active=True).annotate(
-                products_count=Count("products", filter=Q(products__is_active=True))
-            )
-
-            # MPTT 내장 함수로 트리 캐싱 (매우 빠름!)
-            # 이 함수는 각 카테고리에 get_children() 메서드로 접근 가능한 캐시를 추가
-            root_nodes = cache_tree_children(categories)
-
-            def serialize_category(category: Category) -> dict[str, Any]:
-                """카테고리를 딕셔너리로 직렬화 (재귀)"""
-                return {
-                    "id": category.id,
-                    "name": category.name,
-                    "slug": category.slug,
-                    "product_count": category.products_count,  # annotate된 필드 사용
-                    "children": [serialize_category(child) for child in category.get_children()],  # 이미 캐싱됨!
-                }
-
-            # 최상위 카테고리들을 직렬화
-            tree = [serialize_category(cat) for cat in root_nodes]
-
-            # Redis에 캐싱 (1시간)
-            # 신호(signal)로 자동 무효화되므로 긴 TTL 사용 가능
-            cache.set(cache_key, tree, 60 * 60)
+        # 캐시된 트리 (상품 수는 카테고리별 카운터, 상품 변경 시 트리를 다시 빌드하지 않음)
+        tree = CategoryTreeService.get_tree()
 
         return Response(tree)
 
@@ -578,19 +605,18 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     def products(self, request: Request, pk: int | None = None) -> Response:
         from django.db.models import Case, When, Value, BooleanField
 
-        category = self.get_object()
-
-        # 현재 카테고리와 모든 하위 카테고리 가져오기
-        categories = category.get_descendants(include_self=True)
+        # 캐시된 서브트리 범위 사용 (카테고리 조회 없음, 비활성/없는 카테고리는 404)
+        category_range = CategoryTreeService.get_range(pk)
+        if category_range is None or not category_range.is_active:
+            raise NotFound("카테고리를 찾을 수 없습니다.")
 
         # 현재 사용자 ID
         user_id = request.user.id if request.user.is_authenticated else None
 
-        # 해당 카테고리들의 상품 조회 (ProductViewSet과 동일한 annotate 적용)
+        # 현재 카테고리와 모든 하위 카테고리의 상품 조회 (ProductViewSet과 동일한 annotate 적용)
         products = (
-            Product.objects.filter(category__in=categories, is_active=True)
+            Product.objects.filter(category_range.filter_q(), is_active=True)
             .select_related("seller", "category")
-            .prefetch_related("images", "reviews")
             .annotate(
                 avg_rating=Avg("reviews__rating"),
                 review_cnt=Count("reviews", distinct=True),
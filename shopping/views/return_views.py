@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from django.db.models import Exists, OuterRef
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import serializers as drf_serializers
 from rest_framework import status, viewsets
@@ -11,7 +12,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 
-from shopping.models import Return
+from shopping.models import Return, ReturnItem
 from shopping.serializers.return_serializers import (
     ReturnApproveSerializer,
     ReturnCompleteSerializer,
@@ -154,19 +155,16 @@ class ReturnViewSet(viewsets.ModelViewSet):
 
         # 판매자인 경우: 본인 상품에 대한 교환/환불 조치
         if user.is_seller:
-            queryset = (
-                Return.objects.filter(return_items__order_item__product__seller=user)
-                .distinct()
-                .select_related("order", "exchange_product", "user")
-                .prefetch_related("return_items__order_item__product")
-            )
+            # JOIN + DISTINCT 대신 EXISTS (반품 상품이 여러 개여도 Return 행 중복 없음)
+            seller_items = ReturnItem.objects.filter(return_request=OuterRef("pk"), order_item__product__seller=user)
+            queryset = Return.objects.filter(Exists(seller_items)).select_related("order", "exchange_product", "user")
         else:
             # 일반 사용자: 본인이 신청한 교환/환불만
-            queryset = (
-                Return.objects.filter(user=user)
-                .select_related("order", "exchange_product")
-                .prefetch_related("return_items__order_item__product")
-            )
+            queryset = Return.objects.filter(user=user).select_related("order", "exchange_product")
+
+        # 목록은 Return에 비정규화된 요약(item_count, items_amount)만 사용 → 반품 상품 prefetch 불필요
+        if self.action != "list":
+            queryset = queryset.prefetch_related("return_items__order_item__product")
 
         # 필터링
         status_filter = self.request.query_params.get("status")
@@ -8,10 +8,14 @@ from __future__ import annotations
 
 from typing import Any
 
+from django.db.models import Q
+
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 
 from rest_framework import permissions, serializers as drf_serializers, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, _reverse_ordering
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
@@ -39,6 +43,8 @@ class WishlistListResponseSerializer(drf_serializers.Serializer):
     """찜 목록 조회 응답"""
 
     count = drf_serializers.IntegerField()
+    next = drf_serializers.URLField(allow_null=True)
+    previous = drf_serializers.URLField(allow_null=True)
     results = WishlistProductSerializer(many=True)
 
 
@@ -116,6 +122,8 @@ class WishlistListResponseSerializer(drf_serializers.Serializer):
     """찜 목록 조회 응답"""
 
     count = drf_serializers.IntegerField()
+    next = drf_serializers.URLField(allow_null=True)
+    previous = drf_serializers.URLField(allow_null=True)
     results = WishlistProductSerializer(many=True)
 
 
@@ -180,6 +188,109 @@ class WishlistMoveToCartRequestSerializer(drf_serializers.Serializer):
     remove_from_wishlist = drf_serializers.BooleanField(default=False, help_text="장바구니 추가 후 찜 목록에서 제거 여부")
 
 
+class WishlistCursorPagination(CursorPagination):
+    """
+    찜 목록 키셋(cursor) 페이지네이션
+
+    OFFSET 없이 마지막 항목의 정렬 값 이후만 조회하므로
+    찜 항목이 수천 개여도 페이지 위치와 관계없이 조회 비용이 일정합니다.
+    정렬은 WishlistService.get_list가 정한 순서(정렬 키 + id 보조 키)를 그대로 사용합니다.
+
+    DRF 기본 구현은 첫 번째 정렬 키만 커서 위치로 쓰고 같은 값이 이어지면 OFFSET으로 건너뛰므로,
+    가격/이름처럼 겹치는 값이 많은 정렬에서는 깊은 페이지일수록 느려집니다.
+    여기서는 커서 위치를 (정렬 키, id) 쌍으로 저장하고 두 값으로 이어서 조회해 OFFSET이 항상 0입니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-added_at", "-id")
+
+    # 커서 위치 문자열의 정렬 키 / id 구분자 (id는 정수이므로 마지막 구분자로 분리)
+    POSITION_SEPARATOR = "|"
+
+    def get_ordering(self, request: Request, queryset: Any, view: Any) -> tuple[str, ...]:
+        """서비스 쿼리셋의 정렬을 커서 기준으로 사용"""
+        return tuple(queryset.query.order_by) or self.ordering
+
+    def paginate_queryset(self, queryset: Any, request: Request, view: Any = None) -> list[Any] | None:
+        """
+        (정렬 키, id) 복합 키셋으로 한 페이지 조회
+
+        DRF CursorPagination.paginate_queryset과 같은 흐름이며,
+        커서 위치 필터만 첫 번째 정렬 키 단독 비교에서 복합 키 비교로 바꿨습니다.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = queryset.filter(self._keyset_filter(current_position, reverse))
+
+        # 위치가 항목마다 고유하므로 이 클래스가 만든 커서의 offset은 항상 0
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = list(results[: self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def _get_position_from_instance(self, instance: Any, ordering: tuple[str, ...]) -> str:
+        """커서 위치 = "정렬 키 값|id" """
+        value = super()._get_position_from_instance(instance, ordering)
+        return f"{value}{self.POSITION_SEPARATOR}{instance.pk}"
+
+    def _keyset_filter(self, position: str, reverse: bool) -> Q:
+        """(정렬 키, id)가 커서 위치 다음인 항목 조건 (id 보조 키는 정렬 키와 같은 방향)"""
+        value, _, pk = position.rpartition(self.POSITION_SEPARATOR)
+        if not pk.isdigit():
+            raise NotFound(self.invalid_cursor_message)
+
+        order = self.ordering[0]
+        field = order.lstrip("-")
+        lookup = "lt" if reverse != order.startswith("-") else "gt"
+        return Q(**{f"{field}__{lookup}": value}) | Q(**{field: value, f"id__{lookup}": int(pk)})
+
+
 class WishlistViewSet(GenericViewSet):
     """
     찜하기(위시리스트) 관리 ViewSet
@@ -199,6 +310,7 @@ class WishlistViewSet(GenericViewSet):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = WishlistCursorPagination
 
     def get_queryset(self) -> Any:
         """현재 사용자의 찜한 상품 쿼리셋 반환"""
@@ -211,10 +323,10 @@ class WishlistViewSet(GenericViewSet):
         parameters=[
             OpenApiParameter(
                 name="ordering",
-                description="정렬 (기본: -created_at)",
+                description="정렬 (기본: -added_at, 최근 찜한 순)",
                 required=False,
                 type=str,
-                enum=["created_at", "-created_at", "price", "-price", "name"],
+                enum=["added_at", "-added_at", "created_at", "-created_at", "price", "-price", "name"],
             ),
             OpenApiParameter(
                 name="is_available",
@@ -228,13 +340,26 @@ class WishlistViewSet(GenericViewSet):
                 required=False,
                 type=str,
             ),
+            OpenApiParameter(
+                name="cursor",
+                description="다음/이전 페이지 커서 (응답의 next/previous 링크에 포함)",
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name="page_size",
+                description="페이지 크기 (기본 20, 최대 100)",
+                required=False,
+                type=int,
+            ),
 
         ],
         responses={200: WishlistListResponseSerializer},
         summary="찜 목록을 조회한다.",
         description="""처리 내용:
 - 현재 사용자의 찜 목록을 반환한다.
-- 정렬 및 필터링을 적용한다.""",
+- 정렬 및 필터링을 적용한다.
+- 커서(키셋) 방식으로 페이지를 나눈다.""",
         tags=["Wishlist"],
     )
     @action(detail=False, methods=["get"])
@@ -246,12 +371,21 @@ class WishlistViewSet(GenericViewSet):
         # 서비스 호출
         queryset = WishlistService.get_list(request.user, filters)
 
+        paginator = self.paginator
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = WishlistProductSerializer(page, many=True)
 
-        serializer = WishlistProductSerializer(queryset, many=True)
+        # 필터가 없으면 캐시된 통계의 전체 개수 사용 (매 페이지 COUNT 생략)
+        if filters.is_available is None and filters.on_sale is None:
+            count = WishlistService.get_stats(request.user).total_count
+        else:
+            count = queryset.count()
 
         return Response(
             {
-                "count": queryset.count(),
+                "count": count,
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
                 "results": serializer.data,
             }
         )
@@ -607,7 +741,7 @@ class WishlistViewSet(GenericViewSet):
         """요청에서 필터 옵션 파싱"""
         is_available = request.query_params.get("is_available")
         on_sale = request.query_params.get("on_sale")
-        ordering = request.query_params.get("ordering", "-created_at")
+        ordering = request.query_params.get("ordering", WishlistService.DEFAULT_ORDERING)
 
         return WishlistFilter(
             is_available=True if is_available == "true" else (False if is_available == "false" else None),
@@ -90,7 +90,7 @@ def toss_webhook(request: Request) -> Response:
             return Response({"error": "Invalid signature"}, status=status.HTTP_401_UNAUTHORIZED)
 
     except Exception as e:
-        logger.error(f"Webhook signature verification error: {str(e)}")
+        logger.error("Webhook signature verification error: %s", str(e))
         return Response(
             {"error": "Signature verification failed"},
             status=status.HTTP_400_BAD_REQUEST,
@@ -100,7 +100,7 @@ def toss_webhook(request: Request) -> Response:
     serializer = PaymentWebhookSerializer(data=webhook_data)
 
     if not serializer.is_valid():
-        logger.error(f"Invalid webhook data: {serializer.errors}")
+        logger.error("Invalid webhook data: %s", serializer.errors)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     # 지원하지 않는 이벤트는 무시
@@ -123,12 +123,12 @@ def toss_webhook(request: Request) -> Response:
 
         elif event_type == "PAYMENT.PARTIAL_CANCELED":
             # 부분 취소는 향후 지원
-            logger.info(f"Partial cancel event received: {event_data}")
+            logger.info("Partial cancel event received: %s", event_data)
 
         return Response({"message": "Webhook processed"}, status=status.HTTP_200_OK)
 
     except Exception as e:
-        logger.error(f"Webhook processing error: {str(e)}")
+        logger.error("Webhook processing error: %s", str(e))
         return Response({"error": "Processing failed"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
@@ -146,17 +146,17 @@ def handle_payment_done(event_data: dict[str, Any]) -> None:
     try:
         payment = Payment.objects.select_for_update().get(toss_order_id=order_id)
     except Payment.DoesNotExist:
-        logger.error(f"Payment not found for order_id: {order_id}")
+        logger.error("Payment not found for order_id: %s", order_id)
         return
 
     # 이미 처리된 결제인지 확인 (중복 방지)
     if payment.is_paid:
-        logger.info(f"Payment already processed: {order_id}")
+        logger.info("Payment already processed: %s", order_id)
         return
 
     # 최종 상태 보호 - 취소/실패된 결제는 재승인 불가
     if payment.status in ["canceled", "aborted"]:
-        logger.info(f"Payment in final state {payment.status}, ignoring DONE event: {order_id}")
+        logger.info("Payment in final state %s, ignoring DONE event: %s", payment.status, order_id)
         return
 
     # Payment 정보 업데이트
@@ -167,7 +167,7 @@ def handle_payment_done(event_data: dict[str, Any]) -> None:
 
     # 이미 paid 상태면 스킵 (confirm API에서 이미 처리)
     if order.status == "paid":
-        logger.info(f"Order already paid: {order_id}")
+        logger.info("Order already paid: %s", order_id)
         return
 
     # 재고 차감 및 sold_count 증가 (결제 완료 시점)
@@ -211,7 +211,7 @@ def handle_payment_done(event_data: dict[str, Any]) -> None:
             # 주문에 적립 포인트 기록
             order.earned_points = points_to_add
             order.save(update_fields=["earned_points"])
-            logger.info(f"Webhook 포인트 적립: order={order_id}, points={points_to_add}")
+            logger.info("Webhook 포인트 적립: order=%s, points=%s", order_id, points_to_add)
 
     # 웹훅 로그
     PaymentLog.objects.create(
@@ -221,7 +221,7 @@ def handle_payment_done(event_data: dict[str, Any]) -> None:
         data=event_data,
     )
 
-    logger.info(f"Payment done webhook processed: {order_id}")
+    logger.info("Payment done webhook processed: %s", order_id)
 
 
 @transaction.atomic
@@ -235,17 +235,17 @@ def handle_payment_canceled(event_data: dict[str, Any]) -> None:
     try:
         payment = Payment.objects.select_for_update().get(toss_order_id=order_id)
     except Payment.DoesNotExist:
-        logger.error(f"Payment not found for order_id: {order_id}")
+        logger.error("Payment not found for order_id: %s", order_id)
         return
 
     # 이미 취소된 결제인지 확인
     if payment.is_canceled:
-        logger.info(f"Payment already canceled: {order_id}")
+        logger.info("Payment already canceled: %s", order_id)
         return
 
     # 최종 상태 보호 - 실패한 결제는 취소 불필요
     if payment.status in ["aborted"]:
-        logger.info(f"Payment already failed (aborted), ignoring CANCELED event: {order_id}")
+        logger.info("Payment already failed (aborted), ignoring CANCELED event: %s", order_id)
         return
 
     # Payment 정보 업데이트
@@ -256,7 +256,7 @@ def handle_payment_canceled(event_data: dict[str, Any]) -> None:
 
     # 이미 cancelled 상태면 스킵
     if order.status == "canceled":
-        logger.info(f"Order already cancelled: {order_id}")
+        logger.info("Order already cancelled: %s", order_id)
         return
 
     # 재고 복구 (paid 상태였던 경우만)
@@ -293,7 +293,7 @@ def handle_payment_canceled(event_data: dict[str, Any]) -> None:
         data=event_data,
     )
 
-    logger.info(f"Payment canceled webhook processed: {order_id}")
+    logger.info("Payment canceled webhook processed: %s", order_id)
 
 
 def handle_payment_failed(event_data: dict[str, Any]) -> None:
@@ -306,17 +306,17 @@ def handle_payment_failed(event_data: dict[str, Any]) -> None:
     try:
         payment = Payment.objects.get(toss_order_id=order_id)
     except Payment.DoesNotExist:
-        logger.error(f"Payment not found for order_id: {order_id}")
+        logger.error("Payment not found for order_id: %s", order_id)
         return
 
     # 이미 실패 처리된 경우 스킵
     if payment.status in ["aborted", "failed"]:
-        logger.info(f"Payment already failed: {order_id}")
+        logger.info("Payment already failed: %s", order_id)
         return
 
     # 최종 상태 보호 - 완료/취소된 결제는 실패 처리 불가
     if payment.status in ["done", "canceled"]:
-        logger.info(f"Payment in final state {payment.status}, ignoring FAILED event: {order_id}")
+        logger.info("Payment in final state %s, ignoring FAILED event: %s", payment.status, order_id)
         return
 
     # Payment 실패 처리
@@ -330,4 +330,4 @@ def handle_payment_failed(event_data: dict[str, Any]) -> None:
         data=event_data,
     )
 
-    logger.info(f"Payment failed webhook processed: {order_id}")
+    logger.info("Payment failed webhook processed: %s", order_id)